@@ -29,8 +29,17 @@ import src.backend.models.lookups  # noqa: F401
 import src.backend.models.core  # noqa: F401
 import src.backend.models.business  # noqa: F401
 
+from src.backend.models.search import SEARCH_INDEX_TABLE
+
 target_metadata = Base.metadata
 
+
+def include_name(name, type_, parent_names):
+    """Exclude the full-text search index (and FTS5 shadow tables) from autogenerate."""
+    if type_ == "table":
+        return not (name or "").startswith(SEARCH_INDEX_TABLE)
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -78,7 +87,8 @@ def run_migrations_online() -> None:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
-            render_as_batch=True
+            render_as_batch=True,
+            include_name=include_name,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,38 @@
+"""Add product_bom_rollups table
+
+Revision ID: 5b1e7c3d9a24
+Revises: c98ad17d30ad
+Create Date: 2026-10-16 10:12:41.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7c3d9a24'
+down_revision: Union[str, Sequence[str], None] = 'c98ad17d30ad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create product_bom_rollups table (materialized BOM cost/price/weight)."""
+    op.create_table('product_bom_rollups',
+    sa.Column('product_id', sa.Integer(), nullable=False, comment='Product whose BOM is rolled up'),
+    sa.Column('cost', sa.Numeric(precision=15, scale=2), nullable=False, comment='Rolled-up unit cost'),
+    sa.Column('price', sa.Numeric(precision=15, scale=2), nullable=False, comment='Rolled-up unit sale price'),
+    sa.Column('weight', sa.Numeric(precision=10, scale=3), nullable=True, comment='Rolled-up unit weight in kg'),
+    sa.Column('levels', sa.Integer(), nullable=False, comment='BOM depth'),
+    sa.Column('total_components', sa.Integer(), nullable=False, comment='Distinct components across all BOM levels'),
+    sa.Column('computed_at', sa.DateTime(timezone=True), nullable=False, comment='UTC timestamp of the computation'),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], name=op.f('fk_product_bom_rollups_product_id_products'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('product_id', name=op.f('pk_product_bom_rollups'))
+    )
+
+
+def downgrade() -> None:
+    """Drop product_bom_rollups table."""
+    op.drop_table('product_bom_rollups')
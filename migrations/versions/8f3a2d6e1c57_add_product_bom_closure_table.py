@@ -0,0 +1,72 @@
+"""Add product_bom_closure table
+
+Revision ID: 8f3a2d6e1c57
+Revises: 5b1e7c3d9a24
+Create Date: 2026-10-16 11:40:05.000000
+
+"""
+from collections import Counter, defaultdict
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3a2d6e1c57'
+down_revision: Union[str, Sequence[str], None] = '5b1e7c3d9a24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create product_bom_closure table and backfill it from product_components."""
+    closure = op.create_table('product_bom_closure',
+    sa.Column('ancestor_id', sa.Integer(), nullable=False, comment='Product whose BOM contains the descendant'),
+    sa.Column('descendant_id', sa.Integer(), nullable=False, comment='Product contained at any BOM level'),
+    sa.Column('path_count', sa.Integer(), nullable=False, comment='Number of distinct BOM paths ancestor -> descendant'),
+    sa.ForeignKeyConstraint(['ancestor_id'], ['products.id'], name=op.f('fk_product_bom_closure_ancestor_id_products'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['descendant_id'], ['products.id'], name=op.f('fk_product_bom_closure_descendant_id_products'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id', name=op.f('pk_product_bom_closure'))
+    )
+    op.create_index(op.f('ix_product_bom_closure_descendant_id'), 'product_bom_closure', ['descendant_id'], unique=False)
+
+    # Backfill: contar caminos ancestro -> descendiente en memoria (el BOM es un DAG)
+    edges = op.get_bind().execute(
+        sa.text("SELECT parent_id, component_id FROM product_components")
+    ).all()
+    children = defaultdict(list)
+    for parent_id, component_id in edges:
+        children[parent_id].append(component_id)
+
+    descendants: dict[int, Counter] = {}
+
+    def explode(root_id: int) -> Counter:
+        stack = [root_id]
+        while stack:
+            node_id = stack[-1]
+            pending = [c for c in children[node_id] if c not in descendants]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            counts = Counter()
+            for child_id in children[node_id]:
+                counts[child_id] += 1
+                counts.update(descendants[child_id])
+            descendants[node_id] = counts
+        return descendants[root_id]
+
+    rows = [
+        {"ancestor_id": ancestor_id, "descendant_id": descendant_id, "path_count": count}
+        for ancestor_id in list(children)
+        for descendant_id, count in explode(ancestor_id).items()
+    ]
+    if rows:
+        op.bulk_insert(closure, rows)
+
+
+def downgrade() -> None:
+    """Drop product_bom_closure table."""
+    op.drop_index(op.f('ix_product_bom_closure_descendant_id'), table_name='product_bom_closure')
+    op.drop_table('product_bom_closure')
@@ -0,0 +1,37 @@
+"""Add full-text search_index
+
+Revision ID: d4e9b1a7c3f0
+Revises: 8f3a2d6e1c57
+Create Date: 2026-10-16 14:05:12.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from src.backend.models.search import _MYSQL_DDL, _SQLITE_DDL, SEARCH_INDEX_TABLE
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e9b1a7c3f0'
+down_revision: Union[str, Sequence[str], None] = '8f3a2d6e1c57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create search_index (FTS5 on SQLite, FULLTEXT on MySQL).
+
+    Existing rows are indexed with ``python -m scripts.rebuild_search_index``
+    once the schema is at head (the extractors read the ORM models).
+    """
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        op.execute(_SQLITE_DDL)
+    elif bind.dialect.name == "mysql":
+        op.execute(_MYSQL_DDL)
+
+
+def downgrade() -> None:
+    """Drop search_index."""
+    op.execute(f"DROP TABLE IF EXISTS {SEARCH_INDEX_TABLE}")
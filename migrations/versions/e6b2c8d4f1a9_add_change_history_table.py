@@ -0,0 +1,39 @@
+"""Add change_history table
+
+Revision ID: e6b2c8d4f1a9
+Revises: d4e9b1a7c3f0
+Create Date: 2026-10-16 16:20:40.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b2c8d4f1a9'
+down_revision: Union[str, Sequence[str], None] = 'd4e9b1a7c3f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the append-only change_history table."""
+    op.create_table('change_history',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('entity_type', sa.String(length=20), nullable=False, comment='Entity type'),
+    sa.Column('entity_id', sa.Integer(), nullable=False, comment='Entity ID'),
+    sa.Column('action', sa.String(length=10), nullable=False, comment='create, update or delete'),
+    sa.Column('changes', sa.JSON(), nullable=False, comment='Field -> [old, new]'),
+    sa.Column('user_id', sa.Integer(), nullable=True, comment='User ID who made the change'),
+    sa.Column('ts', sa.DateTime(timezone=True), nullable=False, comment='UTC timestamp of the change'),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_change_history'))
+    )
+    op.create_index('ix_change_history_entity', 'change_history', ['entity_type', 'entity_id', 'ts'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop change_history table."""
+    op.drop_index('ix_change_history_entity', table_name='change_history')
+    op.drop_table('change_history')
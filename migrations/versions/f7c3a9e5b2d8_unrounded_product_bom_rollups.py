@@ -0,0 +1,48 @@
+"""Store product BOM rollups unrounded and drop total_components
+
+Revision ID: f7c3a9e5b2d8
+Revises: e6b2c8d4f1a9
+Create Date: 2026-10-17 10:05:12.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c3a9e5b2d8'
+down_revision: Union[str, Sequence[str], None] = 'e6b2c8d4f1a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_table(money: sa.Numeric, weight: sa.Numeric, *extra: sa.Column) -> None:
+    op.create_table('product_bom_rollups',
+    sa.Column('product_id', sa.Integer(), nullable=False, comment='Product whose BOM is rolled up'),
+    sa.Column('cost', money, nullable=False, comment='Rolled-up unit cost'),
+    sa.Column('price', money, nullable=False, comment='Rolled-up unit sale price'),
+    sa.Column('weight', weight, nullable=True, comment='Rolled-up unit weight in kg'),
+    sa.Column('levels', sa.Integer(), nullable=False, comment='BOM depth'),
+    *extra,
+    sa.Column('computed_at', sa.DateTime(timezone=True), nullable=False, comment='UTC timestamp of the computation'),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], name=op.f('fk_product_bom_rollups_product_id_products'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('product_id', name=op.f('pk_product_bom_rollups'))
+    )
+
+
+def upgrade() -> None:
+    """Recreate product_bom_rollups with 10-decimal values (rows are derived and recomputed on read)."""
+    op.drop_table('product_bom_rollups')
+    _create_table(sa.Numeric(precision=30, scale=10), sa.Numeric(precision=25, scale=10))
+
+
+def downgrade() -> None:
+    """Recreate product_bom_rollups with rounded values and total_components."""
+    op.drop_table('product_bom_rollups')
+    _create_table(
+        sa.Numeric(precision=15, scale=2),
+        sa.Numeric(precision=10, scale=3),
+        sa.Column('total_components', sa.Integer(), nullable=False, comment='Distinct components across all BOM levels'),
+    )
@@ -0,0 +1,6 @@
+"""
+Benchmarks de rendimiento para App-AKGroup.
+
+Cada módulo se ejecuta con ``python -m scripts.benchmarks.<nombre>`` y crea
+su propia base SQLite temporal, por lo que no toca app_akgroup.db.
+"""
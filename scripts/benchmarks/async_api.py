@@ -0,0 +1,147 @@
+"""
+Benchmark: endpoints sync (threadpool) vs async (AsyncSession).
+
+Compara req/s y p99 de ``GET /api/v1/companies`` y ``GET /api/v1/quotes/{id}``
+con los handlers ``def`` originales (Session + threadpool de Starlette,
+limitado a 40 hilos) y con los handlers ``async def`` actuales.
+
+Uso:
+    python -m scripts.benchmarks.async_api --concurrency 200 --requests 2000
+"""
+
+import argparse
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+from scripts.benchmarks.common import (
+    print_results,
+    quiet_logs,
+    run_load,
+    use_temp_database,
+)
+
+use_temp_database("async_api")
+
+from fastapi import Depends, FastAPI  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+import src.backend.models  # noqa: E402,F401
+from src.backend.api.dependencies import get_database  # noqa: E402
+from src.backend.database import SessionLocal, engine  # noqa: E402
+from src.backend.main import app as async_app  # noqa: E402
+from src.backend.models.base import Base  # noqa: E402
+from src.backend.models.business.quotes import Quote, QuoteProduct  # noqa: E402
+from src.backend.models.core.companies import Company  # noqa: E402
+from src.backend.models.core.products import Product  # noqa: E402
+from src.backend.models.core.staff import Staff  # noqa: E402
+from src.backend.models.lookups import City, CompanyType, Country, Currency, QuoteStatus  # noqa: E402
+from src.backend.repositories.business.quote_repository import QuoteRepository  # noqa: E402
+from src.backend.repositories.core.company_repository import CompanyRepository  # noqa: E402
+from src.backend.services.business.quote_service import QuoteService  # noqa: E402
+from src.backend.services.core.company_service import CompanyService  # noqa: E402
+from src.shared.schemas.business.quote import QuoteResponse  # noqa: E402
+from src.shared.schemas.core.company import CompanyResponse  # noqa: E402
+
+
+def seed(companies: int = 200, quote_lines: int = 20) -> int:
+    """Crea empresas y una cotización con líneas. Retorna el id de la cotización."""
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    session.info["user_id"] = 1
+
+    company_type = CompanyType(name="CLIENT")
+    country = Country(name="Chile", iso_code_alpha2="CL", iso_code_alpha3="CHL")
+    session.add_all([company_type, country])
+    session.flush()
+    city = City(name="Santiago", country_id=country.id)
+    staff = Staff(username="bench", first_name="Bench", last_name="User", email="bench@test.com")
+    currency = Currency(code="CLP", name="Chilean Peso", symbol="$")
+    status = QuoteStatus(code="draft", name="Draft")
+    session.add_all([city, staff, currency, status])
+    session.flush()
+
+    session.add_all([
+        Company(
+            name=f"Empresa {i:04d}",
+            trigram="".join(chr(65 + i // 26 ** k % 26) for k in (2, 1, 0)),
+            company_type_id=company_type.id,
+            country_id=country.id,
+            city_id=city.id,
+        )
+        for i in range(companies)
+    ])
+    products = [
+        Product(product_type="article", reference=f"BENCH-{i:03d}", designation_es=f"Producto {i}")
+        for i in range(quote_lines)
+    ]
+    session.add_all(products)
+    session.flush()
+
+    first_company = session.query(Company).first()
+    quote = Quote(
+        quote_number="Q-BENCH-001",
+        subject="Benchmark",
+        company_id=first_company.id,
+        staff_id=staff.id,
+        currency_id=currency.id,
+        status_id=status.id,
+        quote_date=date.today(),
+    )
+    session.add(quote)
+    session.flush()
+    session.add_all([
+        QuoteProduct(
+            quote_id=quote.id,
+            product_id=product.id,
+            sequence=i + 1,
+            quantity=Decimal("1"),
+            unit_price=Decimal("10.00"),
+            subtotal=Decimal("10.00"),
+        )
+        for i, product in enumerate(products)
+    ])
+    session.commit()
+    quote_id = quote.id
+    session.close()
+    return quote_id
+
+
+def build_sync_app() -> FastAPI:
+    """App con los handlers ``def`` originales sobre Session síncrona."""
+    sync_app = FastAPI()
+
+    @sync_app.get("/api/v1/companies/", response_model=list[CompanyResponse])
+    def get_companies(skip: int = 0, limit: int = 100, db: Session = Depends(get_database)):
+        return CompanyService(CompanyRepository(db), db).get_all(skip=skip, limit=limit)
+
+    @sync_app.get("/api/v1/quotes/{quote_id}", response_model=QuoteResponse)
+    def get_quote(quote_id: int, db: Session = Depends(get_database)):
+        return QuoteService(QuoteRepository(db), db).get_with_products(quote_id)
+
+    return sync_app
+
+
+async def main(concurrency: int, total: int) -> None:
+    quiet_logs()
+    quote_id = seed()
+    sync_app = build_sync_app()
+
+    results = []
+    for path in ("/api/v1/companies/", f"/api/v1/quotes/{quote_id}"):
+        for label, app in (("sync", sync_app), ("async", async_app)):
+            # Calentamiento: pools de conexión e imports perezosos
+            await run_load(app, path, "warmup", concurrency=4, total=20)
+            results.append(
+                await run_load(app, path, f"{label:<5} GET {path}", concurrency, total)
+            )
+
+    print_results(f"concurrency={concurrency} requests={total}", results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.requests))
@@ -0,0 +1,88 @@
+"""
+Benchmark: costo de la auditoría (created_by_id/updated_by_id) en el flush.
+
+Mide el CPU de un flush de 10.000 notas (TimestampMixin + AuditMixin, sin
+índice de búsqueda) en dos escenarios:
+
+- insert: ``create_many`` de notas nuevas;
+- update: notas cargadas y modificadas (10.000 filas dirty).
+
+Cada escenario se corre con ``session.info["user_id"]`` (auditoría activa)
+y sin él (la auditoría no hace nada): la diferencia es lo que cuesta
+completar las columnas de auditoría.
+
+Uso:
+    python -m scripts.benchmarks.audit_flush --rows 10000 --iterations 5
+"""
+
+import argparse
+import statistics
+import time
+
+from scripts.benchmarks.common import quiet_logs, use_temp_database
+
+use_temp_database("audit_flush")
+
+import src.backend.models  # noqa: E402,F401
+from sqlalchemy import delete, select  # noqa: E402
+
+from src.backend.database import SessionLocal, engine  # noqa: E402
+from src.backend.models.base import Base  # noqa: E402
+from src.backend.models.core.notes import Note  # noqa: E402
+from src.backend.repositories.core.note_repository import NoteRepository  # noqa: E402
+
+
+def new_notes(rows: int) -> list[Note]:
+    return [Note(entity_type="company", entity_id=i + 1, content=f"Nota {i}") for i in range(rows)]
+
+
+def flush_insert(rows: int, user_id: int | None) -> float:
+    """CPU (s) de ``create_many`` de ``rows`` notas."""
+    session = SessionLocal()
+    session.info["user_id"] = user_id
+    notes = new_notes(rows)
+    start = time.process_time()
+    NoteRepository(session).create_many(notes)
+    elapsed = time.process_time() - start
+    session.rollback()
+    session.close()
+    return elapsed
+
+
+def flush_update(user_id: int | None) -> float:
+    """CPU (s) del flush de todas las notas cargadas y modificadas."""
+    session = SessionLocal()
+    session.info["user_id"] = user_id
+    for note in session.scalars(select(Note)):
+        note.content = f"{note.content} (editada)"
+    start = time.process_time()
+    session.flush()
+    elapsed = time.process_time() - start
+    session.rollback()
+    session.close()
+    return elapsed
+
+
+def main(rows: int, iterations: int) -> None:
+    quiet_logs()
+    Base.metadata.create_all(engine)
+    with SessionLocal() as session:
+        session.execute(delete(Note))
+        session.add_all(new_notes(rows))
+        session.commit()
+
+    print(f"\n{f'flush de {rows} notas':<30} {'CPU ms':>9}")
+    for label, run in (("insert", lambda user: flush_insert(rows, user)), ("update", flush_update)):
+        run(None)  # Calentamiento
+        for user_id in (None, 1):
+            cpu = statistics.median(run(user_id) for _ in range(iterations)) * 1000
+            audit = "con user_id" if user_id else "sin user_id"
+            print(f"{f'  {label} {audit}':<30} {cpu:>9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.iterations)
@@ -0,0 +1,99 @@
+"""
+Benchmark: carga de CompanyDetailView con clientes por petición vs pool compartido.
+
+Reproduce las peticiones que hace ``CompanyDetailView.load_company`` (empresa,
+direcciones, contactos, RUTs y plantas) contra un backend ejecutándose:
+
+- ``por llamada``: como antes, un ``httpx.AsyncClient`` nuevo para la empresa
+  (``CompanyAPI()`` por carga) y otro para las cuatro listas, así que cada
+  carga abre conexiones TCP nuevas.
+- ``pool compartido``: todas las peticiones por ``http_client_manager``, que
+  reutiliza conexiones keep-alive entre cargas.
+- ``bundle``: una sola petición a ``/companies/{id}/bundle`` por el pool
+  compartido (como carga la vista ahora).
+
+A diferencia de los otros benchmarks usa un servidor real (no ASGITransport),
+porque lo que se mide es el costo de abrir conexiones.
+
+Uso:
+    python -m scripts.dev_backend          # en otra terminal
+    python -m scripts.benchmarks.client_pooling --company-id 1 --loads 200
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from scripts.benchmarks.common import LoadResult, print_results, quiet_logs
+from src.frontend.services.api.http_client import HTTPClientManager
+
+LIST_PATHS = (
+    "/api/v1/addresses/company/{id}",
+    "/api/v1/contacts/company/{id}",
+    "/api/v1/company-ruts/company/{id}",
+    "/api/v1/plants/company/{id}",
+)
+
+
+async def load_with_new_clients(base_url: str, company_id: int) -> None:
+    """Una carga de la vista abriendo clientes nuevos (comportamiento anterior)."""
+    async with httpx.AsyncClient(base_url=base_url, follow_redirects=True) as client:
+        (await client.get(f"/api/v1/companies/{company_id}")).raise_for_status()
+    async with httpx.AsyncClient(base_url=base_url, follow_redirects=True) as client:
+        for path in LIST_PATHS:
+            await client.get(path.format(id=company_id))
+
+
+async def load_with_shared_pool(manager: HTTPClientManager, company_id: int) -> None:
+    """Una carga de la vista con el cliente compartido."""
+    client = await manager.get_client()
+    (await client.get(f"/api/v1/companies/{company_id}")).raise_for_status()
+    for path in LIST_PATHS:
+        await client.get(path.format(id=company_id))
+
+
+async def load_bundle(manager: HTTPClientManager, company_id: int) -> None:
+    """Una carga de la vista con GET /companies/{id}/bundle."""
+    client = await manager.get_client()
+    response = await client.get(
+        f"/api/v1/companies/{company_id}/bundle", params={"include": "addresses,contacts,ruts,plants"}
+    )
+    response.raise_for_status()
+
+
+async def measure(label: str, load, loads: int) -> LoadResult:
+    """Ejecuta ``loads`` cargas secuenciales (como un usuario navegando) y mide cada una."""
+    await load()  # Calentamiento
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(loads):
+        load_start = time.perf_counter()
+        await load()
+        latencies.append(time.perf_counter() - load_start)
+    return LoadResult(label, loads, 0, time.perf_counter() - start, latencies)
+
+
+async def main(base_url: str, company_id: int, loads: int) -> None:
+    quiet_logs()
+    manager = HTTPClientManager(base_url=base_url)
+    try:
+        results = [
+            await measure("por llamada (antes)", lambda: load_with_new_clients(base_url, company_id), loads),
+            await measure("pool compartido", lambda: load_with_shared_pool(manager, company_id), loads),
+            await measure("bundle (1 petición)", lambda: load_bundle(manager, company_id), loads),
+        ]
+    finally:
+        await manager.aclose()
+
+    print_results(f"CompanyDetailView: {loads} cargas (req/s = cargas/s)", results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--company-id", type=int, default=1)
+    parser.add_argument("--loads", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.base_url, args.company_id, args.loads))
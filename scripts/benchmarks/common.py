@@ -0,0 +1,133 @@
+"""
+Utilidades compartidas por los benchmarks.
+
+Provee una base SQLite temporal, un generador de carga concurrente sobre una
+app ASGI (httpx + ASGITransport, sin levantar uvicorn) y el formateo de
+resultados.
+"""
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass
+
+
+def use_temp_database(name: str) -> str:
+    """
+    Apunta la configuración a una base SQLite temporal.
+
+    Debe llamarse ANTES de importar cualquier módulo de ``src.backend``, ya
+    que los engines se crean al importar.
+
+    Args:
+        name: Nombre base del archivo
+
+    Returns:
+        Ruta del archivo SQLite creado
+    """
+    path = os.path.join(tempfile.mkdtemp(prefix="akgroup-bench-"), f"{name}.db")
+    os.environ["DATABASE_TYPE"] = "sqlite"
+    os.environ["SQLITE_PATH"] = path
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    return path
+
+
+def quiet_logs() -> None:
+    """Silencia loguru para que el logging no domine las mediciones."""
+    from loguru import logger
+
+    logger.remove()
+
+
+@dataclass
+class LoadResult:
+    """Resultado de una corrida de carga."""
+
+    label: str
+    requests: int
+    errors: int
+    elapsed: float
+    latencies: list[float]
+
+    @property
+    def rps(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Percentil p (0-100) de latencia en milisegundos."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+        return ordered[index] * 1000
+
+    def row(self) -> str:
+        return (
+            f"{self.label:<38} {self.rps:>9.1f} "
+            f"{statistics.median(self.latencies) * 1000 if self.latencies else 0:>9.2f} "
+            f"{self.percentile(99):>9.2f} {self.errors:>6}"
+        )
+
+
+HEADER = f"{'escenario':<38} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'err':>6}"
+
+
+async def run_load(
+    app,
+    path: str,
+    label: str,
+    concurrency: int = 100,
+    total: int = 1000,
+    method: str = "GET",
+    json_factory=None,
+) -> LoadResult:
+    """
+    Lanza ``total`` requests contra ``app`` con ``concurrency`` en vuelo.
+
+    Args:
+        app: Aplicación ASGI
+        path: Ruta a consultar
+        label: Nombre del escenario para el reporte
+        concurrency: Requests simultáneas
+        total: Requests totales
+        method: Método HTTP
+        json_factory: Callable(i) -> body JSON, para POST
+
+    Returns:
+        LoadResult con latencias individuales
+    """
+    import httpx
+
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker():
+            nonlocal errors
+            for i in counter:
+                body = json_factory(i) if json_factory else None
+                start = time.perf_counter()
+                response = await client.request(method, path, json=body)
+                latencies.append(time.perf_counter() - start)
+                if response.status_code >= 400:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return LoadResult(label, total, errors, elapsed, latencies)
+
+
+def print_results(title: str, results: list[LoadResult]) -> None:
+    """Imprime una tabla con los resultados."""
+    print(f"\n{title}")
+    print(HEADER)
+    print("-" * len(HEADER))
+    for result in results:
+        print(result.row())
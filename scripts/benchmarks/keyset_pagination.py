@@ -0,0 +1,120 @@
+"""
+Benchmark: paginación OFFSET vs keyset (cursor) en páginas profundas.
+
+Siembra ``--rows`` cotizaciones (1M por defecto) con inserciones Core en
+bloque y mide la latencia de leer una página de ``--limit`` filas a
+distintas profundidades con QuoteRepository.get_all (OFFSET) y
+QuoteRepository.get_page (keyset).
+
+Uso:
+    python -m scripts.benchmarks.keyset_pagination --rows 1000000
+"""
+
+import argparse
+import time
+from datetime import date, timedelta
+
+from scripts.benchmarks.common import quiet_logs, use_temp_database
+
+use_temp_database("keyset_pagination")
+
+from sqlalchemy import insert  # noqa: E402
+
+import src.backend.models  # noqa: E402,F401
+from src.backend.database import SessionLocal, engine  # noqa: E402
+from src.backend.models.base import Base  # noqa: E402
+from src.backend.models.business.quotes import Quote  # noqa: E402
+from src.backend.models.core.companies import Company  # noqa: E402
+from src.backend.models.core.staff import Staff  # noqa: E402
+from src.backend.models.lookups import CompanyType, Currency, QuoteStatus  # noqa: E402
+from src.backend.repositories.business.quote_repository import QuoteRepository  # noqa: E402
+from src.backend.repositories.pagination import encode_cursor  # noqa: E402
+
+
+def seed(rows: int, batch: int = 50_000) -> None:
+    """Inserta ``rows`` cotizaciones repartidas en ~3 años de fechas."""
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    session.info["user_id"] = 1
+
+    company_type = CompanyType(name="CLIENT")
+    staff = Staff(username="bench", first_name="Bench", last_name="User", email="bench@test.com")
+    currency = Currency(code="CLP", name="Chilean Peso", symbol="$")
+    status = QuoteStatus(code="draft", name="Draft")
+    session.add_all([company_type, staff, currency, status])
+    session.flush()
+    company = Company(name="Bench SpA", trigram="BEN", company_type_id=company_type.id)
+    session.add(company)
+    session.commit()
+
+    base = {
+        "subject": "Benchmark",
+        "company_id": company.id,
+        "staff_id": staff.id,
+        "currency_id": currency.id,
+        "status_id": status.id,
+        "subtotal": 0,
+        "tax_percentage": 19,
+        "tax_amount": 0,
+        "total": 0,
+        "exchange_rate": None,
+    }
+    start_date = date(2023, 1, 1)
+    with engine.begin() as conn:
+        for offset in range(0, rows, batch):
+            conn.execute(
+                insert(Quote),
+                [
+                    {
+                        **base,
+                        "quote_number": f"C-{i:08d}",
+                        "quote_date": start_date + timedelta(days=i % 1000),
+                    }
+                    for i in range(offset, min(offset + batch, rows))
+                ],
+            )
+    session.close()
+
+
+def timed(fn, repeat: int = 3) -> float:
+    """Mejor tiempo (ms) de ``repeat`` ejecuciones."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(rows: int, limit: int) -> None:
+    quiet_logs()
+    print(f"Sembrando {rows:,} cotizaciones...")
+    seed(rows)
+
+    session = SessionLocal()
+    repo = QuoteRepository(session)
+
+    # Cursor equivalente a cada profundidad: (quote_date, id) de la fila anterior
+    ordered = session.query(Quote.quote_date, Quote.id).order_by(
+        Quote.quote_date.desc(), Quote.id.desc()
+    )
+
+    print(f"\n{'profundidad':>12} {'OFFSET ms':>11} {'keyset ms':>11}")
+    depths = [limit * 10 ** k for k in range(8) if limit * 10 ** k < rows - limit]
+    for depth in depths + [rows - limit]:
+        row = ordered.offset(depth - 1).limit(1).one()
+        cursor = encode_cursor(row.quote_date, row.id)
+        offset_ms = timed(lambda: repo.get_all(skip=depth, limit=limit))
+        keyset_ms = timed(lambda: repo.get_page(limit=limit, after=cursor))
+        session.expunge_all()
+        print(f"{depth:>12,} {offset_ms:>11.2f} {keyset_ms:>11.2f}")
+
+    session.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+    main(args.rows, args.limit)
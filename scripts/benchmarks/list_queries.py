@@ -0,0 +1,155 @@
+"""
+Benchmark: queries SQL por endpoint de listado.
+
+Siembra productos con lookups y BOM, cotizaciones, órdenes y empresas con
+RUTs y plantas, y pide cada listado. La cantidad de queries sale del header
+``Server-Timing`` (InstrumentationMiddleware), así que el número incluye las
+cargas lazy que dispara la serialización.
+
+Un listado bien cargado hace un número constante de queries sin importar
+cuántas filas retorna; si crece con ``--rows`` hay una carga fila por fila.
+
+Uso:
+    python -m scripts.benchmarks.list_queries --rows 50
+"""
+
+import argparse
+import asyncio
+import re
+from datetime import date
+from decimal import Decimal
+
+from scripts.benchmarks.common import quiet_logs, use_temp_database
+
+use_temp_database("list_queries")
+
+import httpx  # noqa: E402
+
+import src.backend.models  # noqa: E402,F401
+from src.backend.database import SessionLocal, engine  # noqa: E402
+from src.backend.main import app  # noqa: E402
+from src.backend.models.base import Base  # noqa: E402
+from src.backend.models.business.orders import Order  # noqa: E402
+from src.backend.models.business.quotes import Quote  # noqa: E402
+from src.backend.models.core.companies import Company, CompanyRut, Plant  # noqa: E402
+from src.backend.models.core.products import Product, ProductComponent  # noqa: E402
+from src.backend.models.core.staff import Staff  # noqa: E402
+from src.backend.models.lookups import (  # noqa: E402
+    CompanyType,
+    Currency,
+    FamilyType,
+    Matter,
+    OrderStatus,
+    PaymentStatus,
+    QuoteStatus,
+    SalesType,
+)
+
+ENDPOINTS = [
+    "/api/v1/products/?limit={rows}",
+    "/api/v1/products/?limit={rows}&sort=reference",
+    "/api/v1/products/type/article?limit={rows}",
+    "/api/v1/quotes/?limit={rows}",
+    "/api/v1/quotes/?limit={rows}&sort=total",
+    "/api/v1/quotes/status/1?limit={rows}",
+    "/api/v1/orders/?limit={rows}",
+    "/api/v1/orders/?limit={rows}&sort=total",
+    "/api/v1/orders/status/1?limit={rows}",
+    "/api/v1/companies/?limit={rows}",
+]
+
+_QUERIES_RE = re.compile(r'desc="(\d+) queries"')
+
+
+def _trigram(index: int) -> str:
+    """Trigram único de solo letras (AAA, AAB, ...)."""
+    return "".join(chr(ord("A") + index // 26 ** power % 26) for power in (2, 1, 0))
+
+
+def _rut(number: int) -> str:
+    """RUT con su dígito verificador (módulo 11)."""
+    total = sum(int(digit) * (2 + i % 6) for i, digit in enumerate(reversed(str(number))))
+    check = {11: "0", 10: "K"}.get(11 - total % 11, str(11 - total % 11))
+    return f"{number}-{check}"
+
+
+def seed(rows: int) -> None:
+    """Crea ``rows`` filas de cada entidad, repartidas entre varias empresas y lookups."""
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    session.info["user_id"] = 1
+
+    company_type = CompanyType(name="CLIENT")
+    staff = Staff(username="bench", first_name="Bench", last_name="User", email="bench@test.com")
+    currency = Currency(code="CLP", name="Chilean Peso", symbol="$")
+    quote_status = QuoteStatus(code="draft", name="Draft")
+    order_status = OrderStatus(code="open", name="Open")
+    payment_status = PaymentStatus(code="pending", name="Pending")
+    families = [FamilyType(name=f"Familia {i}") for i in range(5)]
+    matters = [Matter(name=f"Materia {i}") for i in range(5)]
+    sales_types = [SalesType(name=f"Venta {i}") for i in range(5)]
+    session.add_all([company_type, staff, currency, quote_status, order_status, payment_status,
+                     *families, *matters, *sales_types])
+    session.flush()
+
+    companies = [
+        Company(name=f"Empresa {i}", trigram=_trigram(i), company_type_id=company_type.id)
+        for i in range(rows)
+    ]
+    session.add_all(companies)
+    session.flush()
+    for i, company in enumerate(companies):
+        session.add(CompanyRut(rut=_rut(76000000 + i), company_id=company.id, is_main=True))
+        session.add(Plant(name=f"Planta {i}", company_id=company.id))
+
+    products = [
+        Product(
+            product_type="article",
+            reference=f"BENCH-{i:05d}",
+            designation_es=f"Producto {i}",
+            family_type_id=families[i % 5].id,
+            matter_id=matters[i % 5].id,
+            sales_type_id=sales_types[i % 5].id,
+            company_id=companies[i % rows].id,
+        )
+        for i in range(rows)
+    ]
+    session.add_all(products)
+    session.flush()
+    for parent, component in zip(products, products[1:]):
+        session.add(ProductComponent(parent_id=parent.id, component_id=component.id, quantity=Decimal("2")))
+
+    for i in range(rows):
+        session.add(Quote(
+            quote_number=f"Q-BENCH-{i:05d}", subject=f"Cotización {i}", company_id=companies[i].id,
+            staff_id=staff.id, currency_id=currency.id, status_id=quote_status.id,
+            quote_date=date(2025, 1, 1), total=Decimal("119000.00"),
+        ))
+        session.add(Order(
+            order_number=f"O-BENCH-{i:05d}", company_id=companies[i].id, staff_id=staff.id,
+            currency_id=currency.id, status_id=order_status.id, payment_status_id=payment_status.id,
+            order_date=date(2025, 1, 1), total=Decimal("119000.00"),
+        ))
+    session.commit()
+    session.close()
+
+
+async def main(rows: int) -> None:
+    quiet_logs()
+    seed(rows)
+
+    print(f"\n{'endpoint':<52} {'filas':>6} {'queries':>8}")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for template in ENDPOINTS:
+            path = template.format(rows=rows)
+            response = await client.get(path)
+            response.raise_for_status()
+            queries = _QUERIES_RE.search(response.headers["server-timing"]).group(1)
+            print(f"{path:<52} {len(response.json()):>6} {queries:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows))
@@ -0,0 +1,195 @@
+"""
+Benchmark: CPU por página de 1000 filas, entidades ORM vs filas Core.
+
+Para empresas, productos y cotizaciones compara:
+
+- ORM: ``repository.get_list`` materializa entidades (identity map, loaders
+  del perfil LIST) y cada una se valida con ``model_validate``.
+- filas: ``repository.get_list_rows`` ejecuta un select Core de las columnas
+  del schema y la página se valida de una vez con
+  ``TypeAdapter(list[schema])``.
+
+El listado de productos responde ``ProductResponse`` con empresa, lookups y
+BOM anidados, que no salen de una fila plana: se mide con
+``ProductBaseResponse`` en ambos caminos para dimensionar la ganancia.
+
+Uso:
+    python -m scripts.benchmarks.list_rows --iterations 20
+"""
+
+import argparse
+import statistics
+import time
+from datetime import date
+from decimal import Decimal
+
+from scripts.benchmarks.common import quiet_logs, use_temp_database
+
+use_temp_database("list_rows")
+
+import src.backend.models  # noqa: E402,F401
+from src.backend.database import SessionLocal, engine  # noqa: E402
+from src.backend.models.base import Base  # noqa: E402
+from src.backend.models.business.quotes import Quote  # noqa: E402
+from src.backend.models.core.companies import Company  # noqa: E402
+from src.backend.models.core.products import Product  # noqa: E402
+from src.backend.models.core.staff import Staff  # noqa: E402
+from src.backend.models.lookups import City, CompanyType, Country, Currency, FamilyType, QuoteStatus  # noqa: E402
+from src.backend.repositories.business.quote_repository import QuoteRepository  # noqa: E402
+from src.backend.repositories.core.company_repository import CompanyRepository  # noqa: E402
+from src.backend.repositories.core.product_repository import ProductRepository  # noqa: E402
+from src.backend.services.base import list_adapter  # noqa: E402
+from src.backend.services.business.quote_service import QuoteService  # noqa: E402
+from src.backend.services.core.company_service import CompanyService  # noqa: E402
+from src.shared.schemas.business.quote import QuoteListResponse  # noqa: E402
+from src.shared.schemas.core.company import CompanyResponse  # noqa: E402
+from src.shared.schemas.core.product import ProductBaseResponse, ProductResponse  # noqa: E402
+
+ROWS = 1000
+
+
+class ProductRowRepository(ProductRepository):
+    """ProductRepository con fast path de filas para ProductBaseResponse."""
+
+    list_schema = ProductBaseResponse
+
+
+def seed(rows: int = ROWS) -> None:
+    """Crea ``rows`` empresas, productos y cotizaciones."""
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    session.info["user_id"] = 1
+
+    company_type = CompanyType(name="CLIENT")
+    country = Country(name="Chile", iso_code_alpha2="CL", iso_code_alpha3="CHL")
+    staff = Staff(username="bench", first_name="Bench", last_name="User", email="bench@test.com")
+    currency = Currency(code="CLP", name="Chilean Peso", symbol="$")
+    status = QuoteStatus(code="draft", name="Draft")
+    family = FamilyType(name="Familia")
+    session.add_all([company_type, country, staff, currency, status, family])
+    session.flush()
+    city = City(name="Santiago", country_id=country.id)
+    session.add(city)
+    session.flush()
+
+    companies = [
+        Company(
+            name=f"Empresa {i}",
+            trigram="".join(chr(ord("A") + i // 26 ** power % 26) for power in (2, 1, 0)),
+            main_address=f"Av. Principal {i}",
+            company_type_id=company_type.id,
+            country_id=country.id,
+            city_id=city.id,
+        )
+        for i in range(rows)
+    ]
+    session.add_all(companies)
+    session.flush()
+
+    session.add_all([
+        Product(
+            product_type="article",
+            reference=f"BENCH-{i:05d}",
+            designation_es=f"Producto de prueba número {i} con descripción larga",
+            cost_price=Decimal("1234.5678"),
+            sale_price=Decimal("2345.67"),
+            family_type_id=family.id,
+            company_id=companies[i].id,
+        )
+        for i in range(rows)
+    ])
+    session.add_all([
+        Quote(
+            quote_number=f"Q-BENCH-{i:05d}",
+            subject=f"Cotización de prueba {i}",
+            company_id=companies[i].id,
+            staff_id=staff.id,
+            currency_id=currency.id,
+            status_id=status.id,
+            quote_date=date(2025, 1, 1),
+            subtotal=Decimal("100000.00"),
+            tax_amount=Decimal("19000.00"),
+            total=Decimal("119000.00"),
+        )
+        for i in range(rows)
+    ])
+    session.commit()
+    session.close()
+
+
+def companies_orm(session):
+    companies, _ = CompanyRepository(session).get_list(limit=ROWS)
+    return [CompanyResponse.model_validate(CompanyService._enrich_company_response(c)) for c in companies]
+
+
+def companies_rows(session):
+    rows, _ = CompanyRepository(session).get_list_rows(limit=ROWS)
+    return list_adapter(CompanyResponse).validate_python(rows)
+
+
+def products_endpoint(session):
+    products, _ = ProductRepository(session).get_list(limit=ROWS)
+    return [ProductResponse.model_validate(p) for p in products]
+
+
+def products_orm(session):
+    products, _ = ProductRepository(session).get_list(limit=ROWS)
+    return [ProductBaseResponse.model_validate(p) for p in products]
+
+
+def products_rows(session):
+    rows, _ = ProductRowRepository(session).get_list_rows(limit=ROWS)
+    return list_adapter(ProductBaseResponse).validate_python(rows)
+
+
+def quotes_orm(session):
+    quotes, _ = QuoteRepository(session).get_list(limit=ROWS)
+    return [QuoteService._convert_to_list_response(q) for q in quotes]
+
+
+def quotes_rows(session):
+    rows, _ = QuoteRepository(session).get_list_rows(limit=ROWS)
+    return list_adapter(QuoteListResponse).validate_python(rows)
+
+
+SCENARIOS = [
+    ("empresas", [("ORM", companies_orm), ("filas", companies_rows)]),
+    ("productos", [("ORM ProductResponse (endpoint)", products_endpoint),
+                   ("ORM ProductBaseResponse", products_orm),
+                   ("filas ProductBaseResponse", products_rows)]),
+    ("cotizaciones", [("ORM", quotes_orm), ("filas", quotes_rows)]),
+]
+
+
+def measure(build, iterations: int) -> tuple[float, float]:
+    """Mediana (CPU ms, wall ms) de armar una página en una sesión nueva."""
+    cpu, wall = [], []
+    for _ in range(iterations):
+        session = SessionLocal()
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        items = build(session)
+        cpu.append(time.process_time() - cpu_start)
+        wall.append(time.perf_counter() - wall_start)
+        session.close()
+        assert len(items) == ROWS, f"{build.__name__} retornó {len(items)} filas"
+    return statistics.median(cpu) * 1000, statistics.median(wall) * 1000
+
+
+def main(iterations: int) -> None:
+    quiet_logs()
+    seed()
+
+    print(f"\n{'página de 1000 filas':<40} {'CPU ms':>9} {'wall ms':>9}")
+    for entity, paths in SCENARIOS:
+        print(entity)
+        for label, build in paths:
+            build(SessionLocal())  # Calentamiento (compilación de queries, schemas)
+            cpu, wall = measure(build, iterations)
+            print(f"{'  ' + label:<40} {cpu:>9.2f} {wall:>9.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,147 @@
+"""
+Benchmark: serialización JSON y compresión de listados grandes.
+
+Para una página de 1000 productos y una de 1000 cotizaciones mide:
+
+- CPU de serialización: ``JSONResponse.render`` (json.dumps, lo que usaba la
+  API) vs ``FastJSONResponse.render`` (orjson o pydantic_core) sobre el mismo
+  contenido que reciben del endpoint.
+- Bytes enviados y latencia de la petición completa sin comprimir, con GZip
+  y con Brotli (si el paquete ``brotli`` está instalado).
+
+Uso:
+    python -m scripts.benchmarks.response_encoding --iterations 50
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import date
+from decimal import Decimal
+
+from scripts.benchmarks.common import quiet_logs, use_temp_database
+
+use_temp_database("response_encoding")
+
+import httpx  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+import src.backend.models  # noqa: E402,F401
+from src.backend.api import compression  # noqa: E402
+from src.backend.api.responses import FastJSONResponse, orjson  # noqa: E402
+from src.backend.database import SessionLocal, engine  # noqa: E402
+from src.backend.main import app  # noqa: E402
+from src.backend.models.base import Base  # noqa: E402
+from src.backend.models.business.quotes import Quote  # noqa: E402
+from src.backend.models.core.companies import Company  # noqa: E402
+from src.backend.models.core.products import Product  # noqa: E402
+from src.backend.models.core.staff import Staff  # noqa: E402
+from src.backend.models.lookups import CompanyType, Currency, QuoteStatus  # noqa: E402
+
+PAGES = {
+    "1000 productos": "/api/v1/products/?limit=1000",
+    "1000 cotizaciones": "/api/v1/quotes/?limit=1000",
+}
+
+
+def seed(rows: int = 1000) -> None:
+    """Crea ``rows`` productos y ``rows`` cotizaciones."""
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    session.info["user_id"] = 1
+
+    company_type = CompanyType(name="CLIENT")
+    staff = Staff(username="bench", first_name="Bench", last_name="User", email="bench@test.com")
+    currency = Currency(code="CLP", name="Chilean Peso", symbol="$")
+    status = QuoteStatus(code="draft", name="Draft")
+    session.add_all([company_type, staff, currency, status])
+    session.flush()
+    company = Company(name="Empresa Benchmark", trigram="BEN", company_type_id=company_type.id)
+    session.add(company)
+    session.flush()
+
+    session.add_all([
+        Product(
+            product_type="article",
+            reference=f"BENCH-{i:05d}",
+            designation_es=f"Producto de prueba número {i} con descripción larga",
+            cost_price=Decimal("1234.5678"),
+            sale_price=Decimal("2345.67"),
+        )
+        for i in range(rows)
+    ])
+    session.add_all([
+        Quote(
+            quote_number=f"Q-BENCH-{i:05d}",
+            subject=f"Cotización de prueba {i}",
+            company_id=company.id,
+            staff_id=staff.id,
+            currency_id=currency.id,
+            status_id=status.id,
+            quote_date=date(2025, 1, 1),
+            subtotal=Decimal("100000.00"),
+            tax_amount=Decimal("19000.00"),
+            total=Decimal("119000.00"),
+        )
+        for i in range(rows)
+    ])
+    session.commit()
+    session.close()
+
+
+def render_cpu(response_class, content, iterations: int) -> float:
+    """CPU media (ms) de ``response_class.render`` sobre ``content``."""
+    renderer = response_class.__new__(response_class)
+    start = time.process_time()
+    for _ in range(iterations):
+        renderer.render(content)
+    return (time.process_time() - start) / iterations * 1000
+
+
+async def fetch(client: httpx.AsyncClient, path: str, encoding: str, iterations: int) -> tuple[int, float, float]:
+    """Retorna (bytes recibidos, latencia p50 ms, CPU media ms) de la petición completa."""
+    headers = {"Accept-Encoding": encoding}
+    await client.get(path, headers=headers)  # Calentamiento
+    latencies, size = [], 0
+    cpu_start = time.process_time()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = await client.get(path, headers=headers)
+        latencies.append(time.perf_counter() - start)
+        size = response.num_bytes_downloaded
+        response.raise_for_status()
+    cpu = (time.process_time() - cpu_start) / iterations * 1000
+    return size, statistics.median(latencies) * 1000, cpu
+
+
+async def main(iterations: int) -> None:
+    quiet_logs()
+    seed()
+
+    encodings = ["identity", "gzip"] + (["br"] if compression.brotli is not None else [])
+    print(f"\nserializador: {'orjson' if orjson is not None else 'pydantic_core'} | "
+          f"brotli: {'sí' if compression.brotli is not None else 'no instalado'}")
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for label, path in PAGES.items():
+            content = json.loads((await client.get(path)).content)
+            assert len(content) == 1000, f"{path} retornó {len(content)} filas"
+
+            print(f"\n{label} ({path})")
+            print(f"{'render':<28} {'CPU ms':>9}")
+            print(f"{'  json.dumps (antes)':<28} {render_cpu(JSONResponse, content, iterations):>9.2f}")
+            print(f"{'  FastJSONResponse':<28} {render_cpu(FastJSONResponse, content, iterations):>9.2f}")
+
+            print(f"{'petición completa':<28} {'bytes':>9} {'p50 ms':>9} {'CPU ms':>9}")
+            for encoding in encodings:
+                size, p50, cpu = await fetch(client, path, encoding, iterations)
+                print(f"{'  ' + encoding:<28} {size:>9} {p50:>9.2f} {cpu:>9.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,172 @@
+"""
+Benchmark: creación concurrente de cotizaciones por política de numeración.
+
+Lanza N ``QuoteService.create`` en paralelo (un hilo y una sesión por
+cotización, todas con el mismo trigrama y año) con cada política de
+``SequenceService`` (gapless, atomic, block). Tras asignar el número, cada
+transacción se mantiene abierta ``--hold-ms`` para simular el resto del
+request (líneas, totales) antes del commit. Con gapless la fila de la
+secuencia queda bloqueada durante todo ese tiempo.
+
+Además de req/s y latencias, verifica que no haya números duplicados y
+reporta los huecos de cada política.
+
+SQLite admite un solo escritor y SequenceService usa gapless para todas las
+políticas en SQLite, así que la comparación solo es significativa en MySQL:
+
+    DATABASE_TYPE=mysql MYSQL_DATABASE=akgroup_bench python -m scripts.benchmarks.sequence_allocation
+
+(usar una base de pruebas: el benchmark crea tablas e inserta datos).
+
+Uso:
+    python -m scripts.benchmarks.sequence_allocation --parallel 50 --hold-ms 20
+"""
+
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from scripts.benchmarks.common import LoadResult, print_results, quiet_logs, use_temp_database
+
+if os.environ.get("DATABASE_TYPE") != "mysql":
+    use_temp_database("sequence_allocation")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import src.backend.models  # noqa: E402,F401
+from src.backend.config.settings import settings  # noqa: E402
+from src.backend.database import engine as app_engine  # noqa: E402
+from src.backend.models.base import Base  # noqa: E402
+from src.backend.models.core.companies import Company  # noqa: E402
+from src.backend.models.core.staff import Staff  # noqa: E402
+from src.backend.models.lookups import CompanyType, Currency, QuoteStatus  # noqa: E402
+from src.backend.repositories.business.quote_repository import QuoteRepository  # noqa: E402
+from src.backend.services.business.quote_service import QuoteService  # noqa: E402
+from src.backend.services.core.sequence_service import (  # noqa: E402
+    GAP_POLICY_ATOMIC,
+    GAP_POLICY_BLOCK,
+    GAP_POLICY_GAPLESS,
+)
+from src.shared.schemas.business.quote import QuoteCreate  # noqa: E402
+
+
+def build_engine():
+    """
+    Engine para el benchmark.
+
+    La app usa StaticPool en SQLite (una sola conexión compartida), que no
+    admite transacciones concurrentes desde varios hilos: en SQLite se usa
+    un engine propio con una conexión por hilo.
+    """
+    if settings.database_type != "sqlite":
+        return app_engine
+    return create_engine(
+        settings.database_url,
+        connect_args={"check_same_thread": False, "timeout": 60},
+        pool_size=64,
+    )
+
+
+def seed(SessionFactory) -> dict:
+    """Crea los lookups, empresa y vendedor. Retorna los ids para QuoteCreate."""
+    session = SessionFactory()
+    session.info["user_id"] = 1
+
+    company_type = CompanyType(name="CLIENT")
+    staff = Staff(username="bench", first_name="Bench", last_name="User", email="bench@test.com")
+    currency = Currency(code="CLP", name="Chilean Peso", symbol="$")
+    status = QuoteStatus(code="draft", name="Draft")
+    session.add_all([company_type, staff, currency, status])
+    session.flush()
+
+    company = Company(name="Benchmark SpA", trigram="BEN", company_type_id=company_type.id)
+    session.add(company)
+    session.commit()
+
+    ids = {
+        "company_id": company.id,
+        "staff_id": staff.id,
+        "currency_id": currency.id,
+        "status_id": status.id,
+    }
+    session.close()
+    return ids
+
+
+def create_quotes(SessionFactory, ids: dict, policy: str, parallel: int, hold: float) -> tuple[LoadResult, list[int]]:
+    """Crea ``parallel`` cotizaciones a la vez con la política dada."""
+    settings.sequence_gap_policy = policy
+    latencies: list[float] = []
+    numbers: list[int] = []
+    errors = 0
+    lock = threading.Lock()
+    barrier = threading.Barrier(parallel)
+
+    def create(i: int) -> None:
+        nonlocal errors
+        session = SessionFactory()
+        barrier.wait()
+        start = time.perf_counter()
+        try:
+            quote = QuoteService(QuoteRepository(session), session).create(
+                QuoteCreate(quote_number="STRING", subject=f"{policy} {i}", quote_date=date.today(), **ids),
+                user_id=1,
+            )
+            time.sleep(hold)
+            session.commit()
+            with lock:
+                numbers.append(int(quote.quote_number.rsplit("-", 1)[1]))
+        except Exception:
+            session.rollback()
+            with lock:
+                errors += 1
+        finally:
+            session.close()
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=parallel) as pool:
+        list(pool.map(create, range(parallel)))
+    elapsed = time.perf_counter() - start
+
+    return LoadResult(f"{policy:<8} x{parallel}", parallel, errors, elapsed, latencies), numbers
+
+
+def main(parallel: int, hold_ms: float, block_size: int) -> None:
+    quiet_logs()
+    engine = build_engine()
+    Base.metadata.create_all(engine)
+    SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
+    ids = seed(SessionFactory)
+    settings.sequence_block_size = block_size
+
+    results = []
+    for policy in (GAP_POLICY_GAPLESS, GAP_POLICY_ATOMIC, GAP_POLICY_BLOCK):
+        result, numbers = create_quotes(SessionFactory, ids, policy, parallel, hold_ms / 1000)
+        results.append(result)
+
+        duplicates = len(numbers) - len(set(numbers))
+        gaps = (max(numbers) - min(numbers) + 1 - len(numbers)) if numbers else 0
+        print(f"{policy:<8} números {min(numbers, default=0)}..{max(numbers, default=0)} "
+              f"duplicados={duplicates} huecos={gaps}")
+
+    print_results(
+        f"{settings.database_type} parallel={parallel} hold={hold_ms}ms block={block_size}",
+        results,
+    )
+    if settings.database_type == "sqlite":
+        print("\nSQLite: todas las políticas usan gapless (un solo escritor).")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--parallel", type=int, default=50)
+    parser.add_argument("--hold-ms", type=float, default=20.0)
+    parser.add_argument("--block-size", type=int, default=20)
+    args = parser.parse_args()
+    main(args.parallel, args.hold_ms, args.block_size)
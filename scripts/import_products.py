@@ -0,0 +1,69 @@
+"""
+Importa productos desde un archivo Excel (.xlsx) o CSV.
+
+Uso:
+    python -m scripts.import_products catalogo.xlsx
+    python -m scripts.import_products catalogo.csv --chunk-size 2000 --dry-run
+
+La primera fila es la cabecera con nombres de campos de ProductCreate
+(reference, designation_es, product_type, sale_price, ...). Las lookups se
+pueden dar por nombre: family_type, matter, sales_type.
+
+Mismo proceso que POST /api/v1/import/products: las filas con error se
+informan al final y no detienen la importación.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from src.backend.database.session import SessionLocal
+from src.backend.repositories.core.product_repository import ProductRepository
+from src.backend.services.core.product_import_service import (
+    DEFAULT_CHUNK_SIZE,
+    IMPORT_FORMATS,
+    ProductImportService,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Importa productos desde xlsx o CSV")
+    parser.add_argument("path", type=Path, help="Archivo .xlsx o .csv")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="Formato (default: según extensión)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Filas por bloque")
+    parser.add_argument("--user-id", type=int, default=1, help="Usuario para auditoría")
+    parser.add_argument("--dry-run", action="store_true", help="Valida e inserta sin hacer commit")
+    parser.add_argument("--show-errors", type=int, default=20, help="Errores a mostrar")
+    args = parser.parse_args()
+
+    file_format = args.format or args.path.suffix.lstrip(".").lower()
+
+    start = time.perf_counter()
+    session = SessionLocal()
+    try:
+        service = ProductImportService(ProductRepository(session), session)
+        with args.path.open("rb") as stream:
+            result = service.import_file(stream, file_format, args.user_id, chunk_size=args.chunk_size)
+        if args.dry_run:
+            session.rollback()
+        else:
+            session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"{'🔎 Simulación' if args.dry_run else '✅ Importación'} terminada en {elapsed:.1f}s")
+    print(f"   Filas: {result.total_rows} | creados: {result.created} | con error: {result.failed}")
+    if result.ignored_columns:
+        print(f"   Columnas ignoradas: {', '.join(result.ignored_columns)}")
+    for error in result.errors[: args.show_errors]:
+        print(f"   ❌ fila {error.row} ({error.reference or '-'}): {'; '.join(error.errors)}")
+    if result.failed > args.show_errors:
+        print(f"   ... y {result.failed - args.show_errors} fila(s) más con error")
+
+
+if __name__ == "__main__":
+    main()
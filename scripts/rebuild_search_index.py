@@ -0,0 +1,22 @@
+"""
+Reconstruye el índice de búsqueda full-text (search_index).
+
+Uso:
+    python -m scripts.rebuild_search_index
+
+Necesario después de aplicar la migración que crea el índice sobre una base
+con datos, o tras cargas masivas que no pasan por el ORM.
+"""
+
+from src.backend.database.session import session_scope
+from src.backend.repositories.search_repository import SearchRepository
+
+
+def main() -> None:
+    with session_scope() as session:
+        total = SearchRepository(session).rebuild()
+    print(f"✅ Índice de búsqueda reconstruido: {total} documento(s)")
+
+
+if __name__ == "__main__":
+    main()
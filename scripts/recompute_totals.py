@@ -0,0 +1,67 @@
+"""
+Recalcula los totales de cotizaciones y órdenes en la base de datos.
+
+Uso:
+    python -m scripts.recompute_totals
+    python -m scripts.recompute_totals --documents orders --company-id 5
+    python -m scripts.recompute_totals --from 2025-01-01 --to 2025-06-30 --dry-run
+
+Recalcula subtotales de línea, subtotal, impuesto y total con dos UPDATE por
+tipo de documento (QuoteService/OrderService.recalculate_all_totals), sin
+cargar las líneas en memoria. Útil tras corregir precios o porcentajes de
+impuesto directamente en la base.
+"""
+
+import argparse
+import time
+from datetime import date
+
+from src.backend.database.session import SessionLocal
+from src.backend.repositories.business.order_repository import OrderRepository
+from src.backend.repositories.business.quote_repository import QuoteRepository
+from src.backend.services.business.order_service import OrderService
+from src.backend.services.business.quote_service import QuoteService
+
+DOCUMENTS = ("quotes", "orders")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recalcula totales de cotizaciones y órdenes")
+    parser.add_argument("--documents", choices=(*DOCUMENTS, "all"), default="all", help="Documentos a recalcular")
+    parser.add_argument("--company-id", type=int, help="Solo documentos de esta empresa")
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat, help="Desde (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat, help="Hasta (YYYY-MM-DD)")
+    parser.add_argument("--user-id", type=int, default=1, help="Usuario para auditoría")
+    parser.add_argument("--dry-run", action="store_true", help="Recalcula sin hacer commit")
+    args = parser.parse_args()
+
+    documents = DOCUMENTS if args.documents == "all" else (args.documents,)
+    filters = {"company_id": args.company_id, "date_from": args.date_from, "date_to": args.date_to}
+
+    start = time.perf_counter()
+    session = SessionLocal()
+    counts = {}
+    try:
+        if "quotes" in documents:
+            service = QuoteService(QuoteRepository(session), session)
+            counts["cotizaciones"] = service.recalculate_all_totals(args.user_id, **filters)
+        if "orders" in documents:
+            service = OrderService(OrderRepository(session), session)
+            counts["órdenes"] = service.recalculate_all_totals(args.user_id, **filters)
+        if args.dry_run:
+            session.rollback()
+        else:
+            session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"{'🔎 Simulación' if args.dry_run else '✅ Recálculo'} terminado en {elapsed:.1f}s")
+    print("   " + " | ".join(f"{name}: {count}" for name, count in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
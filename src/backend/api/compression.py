@@ -0,0 +1,141 @@
+"""
+Compresión de respuestas (Brotli o GZip) según Accept-Encoding.
+
+Reutiliza los responders de Starlette: IdentityResponder decide cuándo
+comprimir (cuerpo >= ``minimum_size``, sin Content-Encoding previo, no
+event-stream) y GZipResponder/BrotliResponder solo aplican el algoritmo.
+
+Brotli comprime JSON bastante mejor que GZip con un costo de CPU similar en
+calidades bajas, pero requiere el paquete ``brotli``; si no está instalado
+se ofrece solo GZip.
+
+Los ETag fuertes se vuelven débiles (``W/"..."``) al comprimir, porque el
+cuerpo enviado ya no es byte a byte el que originó el ETag. etag_matches
+usa comparación débil, así que las revalidaciones siguen dando 304.
+"""
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depende del entorno
+    brotli = None
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """
+    Codificaciones que acepta el cliente (descarta las con ``q=0``).
+
+    Args:
+        accept_encoding: Valor del header Accept-Encoding
+
+    Returns:
+        Conjunto de codificaciones en minúsculas
+
+    Example:
+        >>> accepted_encodings("gzip, br;q=0")
+        {'gzip'}
+    """
+    encodings = set()
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name.strip() and quality > 0:
+            encodings.add(name.strip().lower())
+    return encodings
+
+
+def _weaken_etag(message: Message) -> None:
+    """Convierte un ETag fuerte del mensaje de inicio en débil."""
+    headers = MutableHeaders(raw=message["headers"])
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class CompressedGZipResponder(GZipResponder):
+    """GZipResponder de Starlette que además debilita el ETag."""
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        """Comprime un trozo del cuerpo con GZip."""
+        _weaken_etag(self.initial_message)
+        return super().apply_compression(body, more_body=more_body)
+
+
+class BrotliResponder(IdentityResponder):
+    """Responder que comprime el cuerpo con Brotli."""
+
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = 4) -> None:
+        """
+        Inicializa el responder.
+
+        Args:
+            app: Aplicación ASGI
+            minimum_size: Tamaño mínimo del cuerpo para comprimir
+            quality: Calidad Brotli (0-11; 4-5 es buen equilibrio para JSON dinámico)
+        """
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        """Comprime un trozo del cuerpo (cierra el stream en el último)."""
+        _weaken_etag(self.initial_message)
+        output = self.compressor.process(body)
+        return output + (self.compressor.flush() if more_body else self.compressor.finish())
+
+
+class CompressionMiddleware:
+    """
+    Comprime respuestas con Brotli o GZip según lo que acepte el cliente.
+
+    Example:
+        app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        """
+        Inicializa el middleware.
+
+        Args:
+            app: Aplicación ASGI
+            minimum_size: Bytes mínimos del cuerpo para comprimir
+            gzip_level: Nivel GZip (1-9)
+            brotli_quality: Calidad Brotli (0-11)
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encodings = accepted_encodings(Headers(scope=scope).get("Accept-Encoding", ""))
+        responder: ASGIApp
+        if brotli is not None and "br" in encodings:
+            responder = BrotliResponder(self.app, self.minimum_size, quality=self.brotli_quality)
+        elif "gzip" in encodings:
+            responder = CompressedGZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+
+        await responder(scope, receive, send)
@@ -5,20 +5,38 @@ Proporciona funciones de dependency injection para la API,
 incluyendo sesión de base de datos y autenticación.
 """
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from dataclasses import dataclass
+from typing import Any, Literal
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.backend.database.session import get_db
+from src.backend.database.routing import mark_read_only
+from src.backend.database.session import AsyncSessionLocal, get_db
 from src.backend.utils.logger import logger
 
+# Header con el cursor de la página siguiente en los listados keyset
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
-def get_database() -> Generator[Session, None, None]:
+# Header con el total de filas que cumplen el filtro en los listados ordenados
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+# Métodos cuyas sesiones pueden leer de una réplica (hasta que escriban)
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+
+
+def get_database(request: Request) -> Generator[Session, None, None]:
     """
     Dependency para obtener sesión de base de datos.
 
-    Maneja automáticamente commit/rollback de transacciones.
+    Maneja automáticamente commit/rollback de transacciones. En requests
+    GET/HEAD la sesión lee de una réplica hasta su primera escritura
+    (ver database.routing).
+
+    Args:
+        request: Request actual (su método decide si puede usar réplica)
 
     Yields:
         Session: Sesión de SQLAlchemy
@@ -30,6 +48,8 @@ def get_database() -> Generator[Session, None, None]:
             return db.execute(stmt).scalars().all()
     """
     db = next(get_db())
+    if request.method in READ_ONLY_METHODS:
+        mark_read_only(db)
     try:
         yield db
         db.commit()
@@ -40,6 +60,38 @@ def get_database() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_database(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency para obtener sesión asíncrona de base de datos.
+
+    Equivalente async de get_database(): hace commit al terminar el
+    endpoint y rollback si ocurre una excepción, y en GET/HEAD lee de una
+    réplica. Los endpoints que la usan deben ser ``async def`` y no ocupan
+    hilos del threadpool.
+
+    Args:
+        request: Request actual
+
+    Yields:
+        AsyncSession: Sesión asíncrona de SQLAlchemy
+
+    Example:
+        @router.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_async_database)):
+            result = await db.execute(select(Item))
+            return result.scalars().all()
+    """
+    async with AsyncSessionLocal() as db:
+        if request.method in READ_ONLY_METHODS:
+            mark_read_only(db.sync_session)
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+
 def get_current_user_id() -> int:
     """
     Dependency para obtener ID del usuario actual.
@@ -107,3 +159,175 @@ def validate_pagination(
         )
 
     return skip, limit
+
+
+def use_keyset(skip: int, after: str | None) -> bool:
+    """
+    Indica si un listado debe paginarse por cursor.
+
+    La primera página (skip=0) y cualquier request con ``after`` usan keyset;
+    un ``skip`` > 0 sin cursor mantiene la paginación OFFSET existente.
+
+    Args:
+        skip: Offset solicitado
+        after: Cursor solicitado
+
+    Returns:
+        True si se debe usar get_page()
+    """
+    return after is not None or skip == 0
+
+
+def set_next_cursor(response: Response, next_cursor: str | None) -> None:
+    """
+    Expone el cursor de la página siguiente en el header X-Next-Cursor.
+
+    El cuerpo de los listados sigue siendo una lista para no romper a los
+    clientes existentes; el header se omite en la última página.
+
+    Args:
+        response: Response de FastAPI
+        next_cursor: Cursor retornado por get_page()
+
+    Example:
+        @router.get("/items")
+        def get_items(response: Response, after: str | None = None):
+            items, cursor = service.get_page(limit=100, after=after)
+            set_next_cursor(response, cursor)
+            return items
+    """
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
+
+@dataclass(frozen=True)
+class ListParams:
+    """
+    Parámetros del contrato de listados (?sort=&order=&q=).
+
+    Attributes:
+        sort: Columna de orden (validada por el repositorio)
+        descending: Orden descendente (None = orden por defecto)
+        search: Texto a buscar
+        with_total: Responder con total aunque no se pida orden ni búsqueda
+    """
+
+    sort: str | None = None
+    descending: bool | None = None
+    search: str | None = None
+    with_total: bool = False
+
+    @property
+    def requested(self) -> bool:
+        """True si el cliente pidió orden, búsqueda o el total (listado con total)."""
+        return (
+            self.sort is not None
+            or self.descending is not None
+            or bool(self.search)
+            or self.with_total
+        )
+
+    def requested_with(self, filters: dict[str, Any]) -> bool:
+        """
+        True si se pidió orden, búsqueda o alguno de ``filters``.
+
+        Los filtros que solo aplica get_list() también obligan a responder
+        con get_list(): sin orden ni búsqueda, el listado por cursor u
+        OFFSET los ignoraría y retornaría todas las filas.
+
+        Args:
+            filters: Filtros del endpoint (None = no enviado)
+        """
+        return self.requested or any(value is not None for value in filters.values())
+
+
+def list_params(
+    sort: str | None = Query(None, description="Columna de orden"),
+    order: Literal["asc", "desc"] | None = Query(None, description="Dirección del orden"),
+    q: str | None = Query(None, description="Texto a buscar"),
+    with_total: bool = Query(False, description="Responder con el total (X-Total-Count)"),
+) -> ListParams:
+    """
+    Dependency con los parámetros de orden y búsqueda de un listado.
+
+    Cuando el cliente los envía, el endpoint responde la página pedida con
+    OFFSET y el total en el header X-Total-Count (ver set_total_count); sin
+    ellos se mantiene el comportamiento anterior del listado. ``with_total``
+    pide ese mismo listado con el orden por defecto del repositorio: ``order``
+    sin ``sort`` invierte la dirección por defecto.
+
+    Example:
+        @router.get("/items")
+        def get_items(response: Response, params: ListParams = Depends(list_params)):
+            if params.requested:
+                items, total = service.get_list(
+                    sort=params.sort, descending=params.descending, search=params.search
+                )
+                set_total_count(response, total)
+    """
+    return ListParams(
+        sort=sort,
+        descending=None if order is None else order == "desc",
+        search=q,
+        with_total=with_total,
+    )
+
+
+def set_total_count(response: Response, total: int) -> None:
+    """
+    Expone el total de filas del listado en el header X-Total-Count.
+
+    Args:
+        response: Response de FastAPI
+        total: Total retornado por get_list()
+    """
+    response.headers[TOTAL_COUNT_HEADER] = str(total)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Indica si el header If-None-Match del cliente coincide con el ETag.
+
+    Acepta listas separadas por coma, ``*`` y ETags débiles (``W/"..."``),
+    con la comparación débil que exige RFC 9110 para If-None-Match.
+
+    Args:
+        if_none_match: Valor del header (None si no se envió)
+        etag: ETag actual entre comillas
+
+    Returns:
+        True si el cliente ya tiene esta versión
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag.removeprefix("W/"):
+            return True
+    return False
+
+
+def etag_response(request: Request, body: bytes, etag: str) -> Response:
+    """
+    Respuesta JSON con ETag, o 304 sin cuerpo si el cliente ya la tiene.
+
+    ``Cache-Control: no-cache`` permite guardar la respuesta pero obliga a
+    revalidarla en cada uso, lo que es barato con el 304.
+
+    Args:
+        request: Request de FastAPI (para leer If-None-Match)
+        body: Cuerpo JSON ya serializado
+        etag: ETag del cuerpo
+
+    Returns:
+        Response 200 con el cuerpo o 304 Not Modified
+
+    Example:
+        cached = lookup_cache.get_or_encode(key, load)
+        return etag_response(request, cached.body, cached.etag)
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,112 @@
+"""
+Instrumentación de requests: latencia por ruta, queries SQL y Server-Timing.
+
+InstrumentationMiddleware abre un RequestMetrics para cada request (los
+hooks de utils/metrics.py suman ahí las queries), agrega el header
+``Server-Timing`` a la respuesta y al terminar vuelca todo en el registro
+que expone ``/metrics``.
+
+``Server-Timing`` se escribe al iniciar la respuesta: en las respuestas
+transmitidas (exportaciones) no incluye las queries hechas durante la
+transmisión, que sí se cuentan en ``/metrics``.
+"""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.backend.utils.logger import logger
+from src.backend.utils.metrics import (
+    MetricsRegistry,
+    RequestMetrics,
+    end_request,
+    metrics_registry,
+    server_timing,
+    start_request,
+)
+
+# Etiqueta de los requests que no coinciden con ninguna ruta (404)
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Plantilla de la ruta que atendió el request.
+
+    El router de Starlette deja la ruta en el scope al resolverla; se usa su
+    plantilla (``/api/v1/quotes/{quote_id}``) para no crear una serie por id.
+
+    Args:
+        scope: Scope ASGI ya procesado por el router
+
+    Returns:
+        Plantilla de la ruta, o UNMATCHED_ROUTE
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class InstrumentationMiddleware:
+    """
+    Mide cada request HTTP y cuenta sus queries SQL.
+
+    Debe ser el middleware más externo para que la latencia incluya a los
+    demás (compresión, CORS).
+
+    Example:
+        instrument_engine(engine)
+        app.add_middleware(InstrumentationMiddleware, n_plus_one_threshold=10)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        registry: MetricsRegistry = metrics_registry,
+        n_plus_one_threshold: int = 10,
+        server_timing_header: bool = True,
+    ) -> None:
+        """
+        Inicializa el middleware.
+
+        Args:
+            app: Aplicación ASGI
+            registry: Registro donde se acumulan las métricas
+            n_plus_one_threshold: Repeticiones de una query a partir de las
+                cuales se avisa un posible N+1 (0 = sin detección)
+            server_timing_header: Si se agrega el header Server-Timing
+        """
+        self.app = app
+        self.registry = registry
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.server_timing_header = server_timing_header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics(path=scope["path"], n_plus_one_threshold=self.n_plus_one_threshold)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing_header:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", server_timing(time.perf_counter() - start, metrics))
+            await send(message)
+
+        token = start_request(metrics)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_request(token)
+            duration = time.perf_counter() - start
+            self.registry.observe_request(scope["method"], route_template(scope), status_code, duration, metrics)
+            logger.debug(
+                f"{scope['method']} {scope['path']} -> {status_code} en {duration * 1000:.1f} ms "
+                f"({metrics.query_count} queries, {metrics.query_time * 1000:.1f} ms en BD)"
+            )
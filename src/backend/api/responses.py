@@ -0,0 +1,89 @@
+"""
+Clase de respuesta JSON por defecto de la API.
+
+Los listados grandes (hasta ``max_pagination_limit`` filas) pasan buena parte
+del tiempo de respuesta en ``json.dumps``. FastJSONResponse serializa con
+orjson cuando está instalado y, si no, con ``pydantic_core.to_json``; ambos
+escriben UTF-8 directamente desde Rust/C.
+
+FastAPI ya convierte el resultado de los endpoints a tipos JSON antes de
+llegar aquí, así que el ``default`` solo aplica a respuestas construidas a
+mano con valores como Decimal o fechas de pendulum.
+"""
+
+import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """
+    Convierte tipos que orjson no serializa por sí mismo.
+
+    Sigue las mismas reglas que la API ya usa: Decimal como string (igual
+    que los schemas de Pydantic) y fechas en ISO 8601. Las subclases de
+    datetime (pendulum.DateTime, pendulum.Date) no son nativas para orjson.
+
+    Args:
+        obj: Valor no serializable por orjson
+
+    Returns:
+        Valor equivalente serializable
+
+    Raises:
+        TypeError: Si el tipo no está soportado
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, datetime.timedelta):
+        return obj.total_seconds()
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Tipo no serializable a JSON: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serializa contenido a JSON (UTF-8, sin espacios).
+
+    Args:
+        content: Dicts, listas, schemas o valores simples
+
+    Returns:
+        Cuerpo JSON en bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return to_json(content, fallback=_default)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse que serializa con orjson (o pydantic_core como respaldo).
+
+    Se usa como ``default_response_class`` de la app; los endpoints no
+    necesitan cambios.
+
+    Example:
+        app = FastAPI(default_response_class=FastJSONResponse)
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serializa el contenido de la respuesta."""
+        return dumps(content)
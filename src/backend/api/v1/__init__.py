@@ -18,6 +18,11 @@ from src.backend.api.v1.deliveries import deliveries_router
 from src.backend.api.v1.invoices import invoices_router
 from src.backend.api.v1.lookups import lookups_router
 from src.backend.api.v1.plants import router as plants_router
+from src.backend.api.v1.search import router as search_router
+from src.backend.api.v1.history import router as history_router
+from src.backend.api.v1.stats import router as stats_router
+from src.backend.api.v1.imports import router as imports_router
+from src.backend.api.v1.exports import router as exports_router
 
 __all__ = [
     "companies_router",
@@ -34,4 +39,9 @@ __all__ = [
     "deliveries_router",
     "invoices_router",
     "lookups_router",
+    "search_router",
+    "history_router",
+    "stats_router",
+    "imports_router",
+    "exports_router",
 ]
@@ -6,15 +6,34 @@ Proporciona operaciones CRUD sobre empresas.
 
 
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.backend.api.dependencies import get_database, get_current_user_id, validate_pagination
-from src.backend.services.core.company_service import CompanyService
-from src.backend.repositories.core.company_repository import CompanyRepository
-from src.shared.schemas.core.company import CompanyCreate, CompanyUpdate, CompanyResponse
-from src.shared.schemas.base import MessageResponse
+from src.backend.api.dependencies import (
+    ListParams,
+    get_async_database,
+    get_current_user_id,
+    get_database,
+    list_params,
+    set_total_count,
+)
+from src.backend.repositories.core.company_repository import (
+    AsyncCompanyRepository,
+    CompanyRepository,
+)
+from src.backend.services.core.company_service import (
+    AsyncCompanyService,
+    CompanyService,
+)
 from src.backend.utils.logger import logger
+from src.shared.schemas.base import MessageResponse
+from src.shared.schemas.core.company import (
+    CompanyCreate,
+    CompanyResponse,
+    CompanyUpdate,
+)
+from src.shared.schemas.core.company_bundle import CompanyBundleResponse
 
 router = APIRouter(prefix="/companies", tags=["companies"])
 
@@ -33,22 +52,51 @@ def get_company_service(db: Session = Depends(get_database)) -> CompanyService:
     return CompanyService(repository=repository, session=db)
 
 
+def get_async_company_service(
+    db: AsyncSession = Depends(get_async_database),
+) -> AsyncCompanyService:
+    """
+    Dependency para obtener instancia de AsyncCompanyService.
+
+    Usada por los endpoints de lectura, que corren en el event loop en
+    lugar de ocupar un hilo del threadpool.
+
+    Args:
+        db: Sesión asíncrona de base de datos
+
+    Returns:
+        Instancia configurada de AsyncCompanyService
+    """
+    repository = AsyncCompanyRepository(db)
+    return AsyncCompanyService(repository=repository, session=db)
+
+
 @router.get("/", response_model=list[CompanyResponse])
-def get_companies(
+async def get_companies(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     company_type_id: int | None = None,
     is_active: bool | None = None,
-    service: CompanyService = Depends(get_company_service),
+    country_id: int | None = None,
+    params: ListParams = Depends(list_params),
+    service: AsyncCompanyService = Depends(get_async_company_service),
 ):
     """
     Obtiene todas las empresas con paginación y filtros opcionales.
 
+    Con ``sort``, ``order``, ``q``, ``with_total`` o ``country_id`` se
+    responde solo la página pedida, con el total de filas en el header
+    ``X-Total-Count``. Columnas ordenables: id, name, trigram,
+    company_type_id, is_active, created_at; ``q`` busca en nombre y trigram.
+
     Args:
         skip: Número de registros a saltar (default: 0)
         limit: Número máximo de registros (default: 100, max: 1000)
         company_type_id: Filtrar por tipo de empresa (1=CLIENT, 2=SUPPLIER)
         is_active: Filtrar por estado (True=activas, False=inactivas, None=todas)
+        country_id: Filtrar por país
+        params: Orden y búsqueda (sort, order, q, with_total)
         service: Servicio de empresas
 
     Returns:
@@ -58,42 +106,50 @@ def get_companies(
         GET /api/v1/companies?skip=0&limit=50
         GET /api/v1/companies?company_type_id=1  # Solo clientes
         GET /api/v1/companies?company_type_id=1&is_active=true  # Solo clientes activos
+        GET /api/v1/companies?sort=name&order=desc&q=ak&skip=50&limit=25
     """
     logger.info(
         f"GET /companies - skip={skip}, limit={limit}, "
-        f"company_type_id={company_type_id}, is_active={is_active}"
+        f"company_type_id={company_type_id}, is_active={is_active}, {params}"
     )
 
+    # company_type_id e is_active también los aplica el listado sin orden
+    if params.requested_with({"country_id": country_id}):
+        companies, total = await service.get_list(
+            filters={"company_type_id": company_type_id, "is_active": is_active, "country_id": country_id},
+            sort=params.sort,
+            descending=params.descending,
+            search=params.search,
+            skip=skip,
+            limit=limit,
+        )
+        set_total_count(response, total)
+        logger.info(f"Retornando {len(companies)} de {total} empresa(s)")
+        return companies
+
     # Si se especifica tipo, filtrar por tipo
     if company_type_id is not None:
-        companies = service.get_by_type(
+        companies = await service.get_by_type(
             company_type_id=company_type_id,
             skip=skip,
             limit=limit,
             is_active=is_active
         )
+    elif is_active is not None:
+        # Filtrar solo por estado (activas o inactivas) en la query
+        companies = await service.get_by_status(is_active, skip=skip, limit=limit)
     else:
-        # Si solo se filtra por is_active
-        if is_active is not None:
-            if is_active:
-                companies = service.get_active_companies(skip=skip, limit=limit)
-            else:
-                # Necesitaríamos un método get_inactive_companies
-                # Por ahora, obtener todas y filtrar
-                all_companies = service.get_all(skip=0, limit=1000)
-                companies = [c for c in all_companies if not c.is_active][skip:skip+limit]
-        else:
-            companies = service.get_all(skip=skip, limit=limit)
+        companies = await service.get_all(skip=skip, limit=limit)
 
     logger.info(f"Retornando {len(companies)} empresa(s)")
     return companies
 
 
 @router.get("/active", response_model=list[CompanyResponse])
-def get_active_companies(
+async def get_active_companies(
     skip: int = 0,
     limit: int = 100,
-    service: CompanyService = Depends(get_company_service),
+    service: AsyncCompanyService = Depends(get_async_company_service),
 ):
     """
     Obtiene solo las empresas activas.
@@ -111,16 +167,16 @@ def get_active_companies(
     """
     logger.info(f"GET /companies/active - skip={skip}, limit={limit}")
 
-    companies = service.get_active_companies(skip=skip, limit=limit)
+    companies = await service.get_by_status(True, skip=skip, limit=limit)
 
     logger.info(f"Retornando {len(companies)} empresa(s) activa(s)")
     return companies
 
 
 @router.get("/search/{name}", response_model=list[CompanyResponse])
-def search_companies(
+async def search_companies(
     name: str,
-    service: CompanyService = Depends(get_company_service),
+    service: AsyncCompanyService = Depends(get_async_company_service),
 ):
     """
     Busca empresas por nombre (búsqueda parcial).
@@ -137,16 +193,16 @@ def search_companies(
     """
     logger.info(f"GET /companies/search/{name}")
 
-    companies = service.search_by_name(name)
+    companies = await service.search_by_name(name)
 
     logger.info(f"Búsqueda '{name}' retornó {len(companies)} empresa(s)")
     return companies
 
 
 @router.get("/trigram/{trigram}", response_model=CompanyResponse)
-def get_company_by_trigram(
+async def get_company_by_trigram(
     trigram: str,
-    service: CompanyService = Depends(get_company_service),
+    service: AsyncCompanyService = Depends(get_async_company_service),
 ):
     """
     Obtiene una empresa por su trigram.
@@ -166,16 +222,16 @@ def get_company_by_trigram(
     """
     logger.info(f"GET /companies/trigram/{trigram}")
 
-    company = service.get_by_trigram(trigram)
+    company = await service.get_by_trigram(trigram)
 
     logger.info(f"Empresa encontrada: {company.name}")
     return company
 
 
 @router.get("/{company_id}", response_model=CompanyResponse)
-def get_company(
+async def get_company(
     company_id: int,
-    service: CompanyService = Depends(get_company_service),
+    service: AsyncCompanyService = Depends(get_async_company_service),
 ):
     """
     Obtiene una empresa por ID.
@@ -195,12 +251,48 @@ def get_company(
     """
     logger.info(f"GET /companies/{company_id}")
 
-    company = service.get_by_id(company_id)
+    company = await service.get_by_id(company_id)
 
     logger.info(f"Empresa encontrada: {company.name}")
     return company
 
 
+@router.get("/{company_id}/bundle", response_model=CompanyBundleResponse)
+async def get_company_bundle(
+    company_id: int,
+    include: str | None = Query(
+        None,
+        description="Secciones separadas por coma: addresses,contacts,ruts,plants,notes (default: todas)",
+    ),
+    service: AsyncCompanyService = Depends(get_async_company_service),
+):
+    """
+    Obtiene una empresa con sus direcciones, contactos, RUTs, plantas y notas.
+
+    Una sola petición para la pantalla de detalle. Cada sección tiene el
+    mismo formato que su endpoint individual; las no pedidas son null.
+
+    Args:
+        company_id: ID de la empresa
+        include: Secciones a incluir, separadas por coma
+        service: Servicio de empresas
+
+    Returns:
+        Empresa y secciones pedidas
+
+    Raises:
+        400: Si se pide una sección desconocida
+        404: Si no se encuentra la empresa
+
+    Example:
+        GET /api/v1/companies/123/bundle?include=addresses,contacts
+    """
+    logger.info(f"GET /companies/{company_id}/bundle include={include}")
+
+    sections = None if include is None else [s.strip() for s in include.split(",") if s.strip()]
+    return await service.get_bundle(company_id, sections)
+
+
 @router.get("/{company_id}/with-plants", response_model=CompanyResponse)
 def get_company_with_plants(
     company_id: int,
@@ -0,0 +1,133 @@
+"""
+Endpoints REST para exportación de listados a CSV y Excel.
+
+Exporta el listado completo con los mismos parámetros que el endpoint de
+listado de la entidad (``sort``, ``order``, ``q`` y sus filtros):
+
+    curl -o cotizaciones.xlsx "http://localhost:8000/api/v1/export/quotes.xlsx?status_id=2&sort=total&order=desc"
+    curl -o productos.csv "http://localhost:8000/api/v1/export/products.csv?is_active=true"
+
+La respuesta se transmite mientras se leen las filas de la base, sin armar el
+archivo completo en memoria.
+"""
+
+from collections.abc import Iterator
+from datetime import date
+from enum import Enum
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from src.backend.api.dependencies import ListParams, list_params
+from src.backend.database.routing import mark_read_only
+from src.backend.database.session import SessionLocal
+from src.backend.services.export_service import ExportService
+from src.backend.utils.logger import logger
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+class ExportEntity(str, Enum):
+    """Listados exportables."""
+
+    PRODUCTS = "products"
+    QUOTES = "quotes"
+    ORDERS = "orders"
+    INVOICES_SII = "invoices-sii"
+    INVOICES_EXPORT = "invoices-export"
+
+
+class ExportFormat(str, Enum):
+    """Formatos de exportación."""
+
+    CSV = "csv"
+    XLSX = "xlsx"
+
+
+def open_export_session() -> Session:
+    """
+    Dependency que abre la sesión de una exportación.
+
+    No es un generador como get_database: FastAPI cierra esas dependencias
+    antes de transmitir el cuerpo de un StreamingResponse, y la exportación
+    sigue leyendo filas mientras transmite. El endpoint cierra la sesión al
+    terminar la transmisión. Solo lee, así que puede ir a una réplica.
+
+    Returns:
+        Sesión nueva, a cargo del llamador
+    """
+    session = SessionLocal()
+    mark_read_only(session)
+    return session
+
+
+@router.get("/{entity}.{file_format}", response_class=StreamingResponse)
+def export_list(
+    entity: ExportEntity,
+    file_format: ExportFormat,
+    params: ListParams = Depends(list_params),
+    company_id: int | None = Query(None, description="Filtro por empresa (cotizaciones, órdenes, facturas)"),
+    status_id: int | None = Query(None, description="Filtro por estado (cotizaciones, órdenes)"),
+    order_id: int | None = Query(None, description="Filtro por orden (facturas)"),
+    payment_status_id: int | None = Query(None, description="Filtro por estado de pago (facturas)"),
+    is_active: bool | None = Query(None, description="Filtro por activo (productos)"),
+    product_type: str | None = Query(None, description="Filtro por tipo (productos)"),
+    session: Session = Depends(open_export_session),
+) -> StreamingResponse:
+    """
+    Exporta un listado completo a CSV o xlsx.
+
+    Los filtros que no corresponden a la entidad responden 400, igual que
+    un orden no permitido.
+
+    Args:
+        entity: Listado a exportar
+        file_format: csv o xlsx
+        params: Orden y búsqueda, como en el listado
+        company_id, status_id, order_id, payment_status_id, is_active,
+        product_type: Filtros de igualdad del listado
+        session: Sesión propia de la exportación
+
+    Returns:
+        Archivo transmitido como attachment
+    """
+    logger.info(f"GET /export/{entity.value}.{file_format.value}")
+    filters = {
+        "company_id": company_id,
+        "status_id": status_id,
+        "order_id": order_id,
+        "payment_status_id": payment_status_id,
+        "is_active": is_active,
+        "product_type": product_type,
+    }
+    try:
+        chunks = ExportService(session).export(
+            entity.value,
+            file_format.value,
+            filters=filters,
+            sort=params.sort,
+            descending=params.descending,
+            search=params.search,
+        )
+    except Exception:
+        session.close()
+        raise
+
+    def stream() -> Iterator[bytes]:
+        try:
+            yield from chunks
+        finally:
+            session.close()
+
+    filename = f"{entity.value}-{date.today().isoformat()}.{file_format.value}"
+    return StreamingResponse(
+        stream(),
+        media_type=MEDIA_TYPES[file_format.value],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,65 @@
+"""
+Endpoint REST del historial de cambios.
+
+Expone los cambios campo a campo registrados para cotizaciones, órdenes y
+facturas (ver src.backend.models.history).
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from src.backend.api.dependencies import get_database
+from src.backend.repositories.history_repository import HistoryRepository
+from src.backend.services.history_service import HistoryService
+from src.shared.schemas.history import ChangeHistoryResponse
+from src.backend.utils.logger import logger
+
+router = APIRouter(prefix="/history", tags=["history"])
+
+
+def get_history_service(db: Session = Depends(get_database)) -> HistoryService:
+    """
+    Dependency para obtener instancia de HistoryService.
+
+    Args:
+        db: Sesión de base de datos
+
+    Returns:
+        Instancia configurada de HistoryService
+    """
+    return HistoryService(HistoryRepository(db))
+
+
+@router.get("/{entity_type}/{entity_id}", response_model=list[ChangeHistoryResponse])
+def get_history(
+    entity_type: str,
+    entity_id: int,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    service: HistoryService = Depends(get_history_service),
+):
+    """
+    Obtiene el historial de cambios de una entidad.
+
+    Los cambios se escriben en segundo plano después del commit, así que
+    pueden tardar hasta un segundo en aparecer.
+
+    Args:
+        entity_type: Tipo de entidad (quote, order, invoice_sii, invoice_export)
+        entity_id: ID de la entidad
+        skip: Número de registros a saltar
+        limit: Número máximo de registros
+        service: Servicio de historial
+
+    Returns:
+        Cambios del más reciente al más antiguo
+
+    Example:
+        GET /api/v1/history/quote/42?limit=20
+    """
+    logger.info(f"GET /history/{entity_type}/{entity_id} - skip={skip}, limit={limit}")
+
+    changes = service.get_history(entity_type, entity_id, skip=skip, limit=limit)
+
+    logger.info(f"Retornando {len(changes)} cambio(s)")
+    return changes
@@ -0,0 +1,192 @@
+"""
+Endpoints REST para importación masiva de productos y empresas.
+
+El archivo se envía como cuerpo crudo de la petición (no multipart), con
+``Content-Type`` text/csv o el de xlsx, o indicando ``?format=``:
+
+    curl -X POST --data-binary @catalogo.xlsx \\
+         -H "Content-Type: application/vnd.openxmlformats-officedocument.spreadsheetml.sheet" \\
+         http://localhost:8000/api/v1/import/products
+"""
+
+from collections.abc import AsyncGenerator
+from tempfile import SpooledTemporaryFile
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session
+
+from src.backend.api.dependencies import get_current_user_id, get_database
+from src.backend.repositories.core.company_repository import CompanyRepository
+from src.backend.repositories.core.product_repository import ProductRepository
+from src.backend.services.core.bulk_import import DEFAULT_CHUNK_SIZE
+from src.backend.services.core.company_import_service import CompanyImportService
+from src.backend.services.core.product_import_service import ProductImportService
+from src.backend.utils.logger import logger
+from src.shared.schemas.core.product_import import (
+    CompanyImportResult,
+    ProductImportResult,
+)
+
+router = APIRouter(prefix="/import", tags=["import"])
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Cuerpos más grandes se vuelcan a disco en lugar de quedar en memoria
+UPLOAD_SPOOL_SIZE = 10 * 1024 * 1024
+
+
+def get_product_import_service(db: Session = Depends(get_database)) -> ProductImportService:
+    """
+    Dependency para obtener instancia de ProductImportService.
+
+    Args:
+        db: Sesión de base de datos
+
+    Returns:
+        Instancia configurada de ProductImportService
+    """
+    return ProductImportService(ProductRepository(db), db)
+
+
+def get_company_import_service(db: Session = Depends(get_database)) -> CompanyImportService:
+    """
+    Dependency para obtener instancia de CompanyImportService.
+
+    Args:
+        db: Sesión de base de datos
+
+    Returns:
+        Instancia configurada de CompanyImportService
+    """
+    return CompanyImportService(CompanyRepository(db), db)
+
+
+async def read_upload(request: Request) -> AsyncGenerator[SpooledTemporaryFile, None]:
+    """
+    Dependency que guarda el cuerpo de la petición en un archivo temporal.
+
+    Lee el cuerpo en trozos (sin cargarlo entero en memoria) y lo deja
+    posicionado al inicio. El archivo se cierra al terminar la petición.
+
+    Yields:
+        Archivo temporal con el contenido subido
+    """
+    upload = SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE)
+    try:
+        async for chunk in request.stream():
+            upload.write(chunk)
+        upload.seek(0)
+        yield upload
+    finally:
+        upload.close()
+
+
+def detect_format(content_type: str | None, head: bytes) -> str:
+    """
+    Deduce el formato del archivo subido.
+
+    Args:
+        content_type: Header Content-Type de la petición
+        head: Primeros bytes del cuerpo
+
+    Returns:
+        "xlsx" o "csv"
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type == XLSX_CONTENT_TYPE:
+        return "xlsx"
+    if media_type in ("text/csv", "application/csv", "text/plain"):
+        return "csv"
+    # Sin Content-Type útil: un .xlsx es un zip
+    return "xlsx" if head.startswith(b"PK\x03\x04") else "csv"
+
+
+@router.post("/products", response_model=ProductImportResult)
+def import_products(
+    request: Request,
+    format: Literal["csv", "xlsx"] | None = Query(None, description="Formato (default: según Content-Type)"),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=10000, description="Filas por bloque de inserción"),
+    upload: SpooledTemporaryFile = Depends(read_upload),
+    service: ProductImportService = Depends(get_product_import_service),
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    Importa productos desde un archivo CSV o Excel (.xlsx).
+
+    La primera fila es la cabecera con nombres de campos de ProductCreate.
+    Las lookups se pueden dar por nombre (``family_type``, ``matter``,
+    ``sales_type``). Las filas con error no detienen la importación: se
+    informan en ``errors`` y el resto se guarda.
+
+    Args:
+        format: csv o xlsx (si no se indica, se deduce)
+        chunk_size: Filas por bloque de inserción
+        upload: Cuerpo de la petición
+        user_id: ID del usuario que importa
+
+    Returns:
+        Resumen con creados, rechazados y errores por fila
+
+    Raises:
+        400: Si el archivo no se puede leer
+
+    Example:
+        POST /api/v1/import/products?format=csv
+        Body:
+        reference;designation_es;product_type;sale_price;family_type
+        PROD-001;Tornillo M6;article;150.00;Mecánico
+    """
+    file_format = format or detect_format(request.headers.get("content-type"), upload.read(4))
+    upload.seek(0)
+    logger.info(f"POST /import/products - formato={file_format}")
+
+    result = service.import_file(upload, file_format, user_id, chunk_size=chunk_size)
+
+    logger.info(f"Importación: {result.created} creado(s), {result.failed} con error")
+    return result
+
+
+@router.post("/companies", response_model=CompanyImportResult)
+def import_companies(
+    request: Request,
+    format: Literal["csv", "xlsx"] | None = Query(None, description="Formato (default: según Content-Type)"),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=10000, description="Filas por bloque de inserción"),
+    upload: SpooledTemporaryFile = Depends(read_upload),
+    service: CompanyImportService = Depends(get_company_import_service),
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    Importa empresas desde un archivo CSV o Excel (.xlsx).
+
+    La primera fila es la cabecera con nombres de campos de CompanyCreate.
+    El tipo de empresa y el país se pueden dar por nombre (``company_type``,
+    ``country``). Las filas con error no detienen la importación: se
+    informan en ``errors`` y el resto se guarda.
+
+    Args:
+        format: csv o xlsx (si no se indica, se deduce)
+        chunk_size: Filas por bloque de inserción
+        upload: Cuerpo de la petición
+        user_id: ID del usuario que importa
+
+    Returns:
+        Resumen con creadas, rechazadas y errores por fila
+
+    Raises:
+        400: Si el archivo no se puede leer
+
+    Example:
+        POST /api/v1/import/companies?format=csv
+        Body:
+        name;trigram;company_type;country;website
+        Minera Norte SpA;MNO;CLIENT;Chile;https://mineranorte.cl
+    """
+    file_format = format or detect_format(request.headers.get("content-type"), upload.read(4))
+    upload.seek(0)
+    logger.info(f"POST /import/companies - formato={file_format}")
+
+    result = service.import_file(upload, file_format, user_id, chunk_size=chunk_size)
+
+    logger.info(f"Importación: {result.created} creada(s), {result.failed} con error")
+    return result
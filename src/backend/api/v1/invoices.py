@@ -4,10 +4,10 @@ FastAPI routes for Invoice endpoints.
 Provides REST API for managing InvoiceSII and InvoiceExport.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
 
-from src.backend.api.dependencies import get_database as get_db
+from src.backend.api.dependencies import get_database as get_db, set_next_cursor, use_keyset
 from src.backend.repositories.business.invoice_repository import InvoiceSIIRepository, InvoiceExportRepository
 from src.backend.services.business.invoice_service import InvoiceSIIService, InvoiceExportService
 from src.shared.schemas.business.invoice import (
@@ -46,16 +46,24 @@ def get_invoice_export_service(db: Session = Depends(get_db)) -> InvoiceExportSe
 
 @invoices_sii_router.get("/", response_model=list[InvoiceSIIListResponse])
 def get_invoices_sii(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after: str | None = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     service: InvoiceSIIService = Depends(get_invoice_sii_service),
 ) -> list[InvoiceSIIListResponse]:
-    """Get all SII invoices with pagination."""
-    logger.info(f"GET /invoices-sii - skip={skip}, limit={limit}")
+    """Get all SII invoices with pagination (keyset cursor in X-Next-Cursor)."""
+    logger.info(f"GET /invoices-sii - skip={skip}, limit={limit}, after={after}")
     try:
-        invoices = service.get_all(skip=skip, limit=limit)
+        if use_keyset(skip, after):
+            invoices, next_cursor = service.get_page(limit=limit, after=after)
+            set_next_cursor(response, next_cursor)
+        else:
+            invoices = service.get_all(skip=skip, limit=limit)
         logger.success(f"Retrieved {len(invoices)} SII invoice(s)")
         return invoices
+    except ValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error retrieving SII invoices: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
@@ -185,16 +193,24 @@ def delete_invoice_sii(
 
 @invoices_export_router.get("/", response_model=list[InvoiceExportListResponse])
 def get_invoices_export(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after: str | None = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     service: InvoiceExportService = Depends(get_invoice_export_service),
 ) -> list[InvoiceExportListResponse]:
-    """Get all export invoices with pagination."""
-    logger.info(f"GET /invoices-export - skip={skip}, limit={limit}")
+    """Get all export invoices with pagination (keyset cursor in X-Next-Cursor)."""
+    logger.info(f"GET /invoices-export - skip={skip}, limit={limit}, after={after}")
     try:
-        invoices = service.get_all(skip=skip, limit=limit)
+        if use_keyset(skip, after):
+            invoices, next_cursor = service.get_page(limit=limit, after=after)
+            set_next_cursor(response, next_cursor)
+        else:
+            invoices = service.get_all(skip=skip, limit=limit)
         logger.success(f"Retrieved {len(invoices)} export invoice(s)")
         return invoices
+    except ValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -16,12 +16,16 @@ Provides CRUD operations for all 12 lookup tables:
 - Payment Statuses (GET, POST, PUT, DELETE)
 
 Total: 84+ endpoints for comprehensive lookup management.
+
+List endpoints and GET /lookups/snapshot are served from an in-process
+cache (see services/lookups/lookup_cache.py) with an ETag; clients that
+send If-None-Match get 304 Not Modified when nothing changed.
 """
 
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Request, status, Query
 from sqlalchemy.orm import Session
 
-from src.backend.api.dependencies import get_database, get_current_user_id
+from src.backend.api.dependencies import etag_response, get_database, get_current_user_id
 from src.backend.services.lookups.lookup_service import (
     CountryService,
     CityService,
@@ -36,6 +40,7 @@ from src.backend.services.lookups.lookup_service import (
     OrderStatusService,
     PaymentStatusService,
 )
+from src.backend.services.lookups.lookup_cache import build_lookup_snapshot, lookup_cache
 from src.backend.repositories.lookups.lookup_repository import (
     CountryRepository,
     CityRepository,
@@ -87,6 +92,7 @@ from src.shared.schemas.lookups.lookup import (
     PaymentStatusCreate,
     PaymentStatusUpdate,
     PaymentStatusResponse,
+    LookupSnapshot,
 )
 from src.shared.schemas.base import MessageResponse
 from src.backend.utils.logger import logger
@@ -96,6 +102,34 @@ from src.backend.utils.logger import logger
 lookups_router = APIRouter(prefix="/lookups", tags=["lookups"])
 
 
+@lookups_router.get("/snapshot", response_model=LookupSnapshot)
+def get_lookup_snapshot(
+    request: Request,
+    db: Session = Depends(get_database),
+):
+    """
+    Get all 12 lookup tables in one versioned payload.
+
+    Lets the client load every catalog with one request at startup and
+    revalidate it later with If-None-Match. ``version`` changes only when
+    some lookup row changes.
+
+    Args:
+        request: Incoming request (If-None-Match)
+        db: Database session
+
+    Returns:
+        LookupSnapshot (304 Not Modified if the client's ETag is current)
+
+    Example:
+        GET /api/v1/lookups/snapshot
+        GET /api/v1/lookups/snapshot  (If-None-Match: "<etag>") -> 304
+    """
+    logger.info("GET /lookups/snapshot")
+    cached = lookup_cache.get_or_encode(("snapshot",), lambda: build_lookup_snapshot(db))
+    return etag_response(request, cached.body, cached.etag)
+
+
 # ========== COUNTRIES SUB-ROUTER ==========
 countries_router = APIRouter(prefix="/countries", tags=["countries"])
 
@@ -116,6 +150,7 @@ def get_country_service(db: Session = Depends(get_database)) -> CountryService:
 
 @countries_router.get("/", response_model=list[CountryResponse])
 def get_countries(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     service: CountryService = Depends(get_country_service),
@@ -124,17 +159,19 @@ def get_countries(
     Get all countries with pagination.
 
     Args:
+        request: Incoming request (If-None-Match)
         skip: Number of records to skip
         limit: Maximum number of records to return
         service: CountryService instance
 
     Returns:
-        List of CountryResponse objects
+        List of CountryResponse objects (304 Not Modified if the client's ETag is current)
     """
     logger.info(f"GET /lookups/countries - skip={skip}, limit={limit}")
-    countries = service.get_all(skip=skip, limit=limit)
-    logger.info(f"Returning {len(countries)} country(ies)")
-    return countries
+    cached = lookup_cache.get_or_encode(
+        ("countries", skip, limit), lambda: service.get_all(skip=skip, limit=limit)
+    )
+    return etag_response(request, cached.body, cached.etag)
 
 
 @countries_router.get("/{country_id}", response_model=CountryResponse)
@@ -250,6 +287,7 @@ def get_city_service(db: Session = Depends(get_database)) -> CityService:
 
 @cities_router.get("/", response_model=list[CityResponse])
 def get_cities(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     country_id: int = Query(None, description="Filter by country ID"),
@@ -259,22 +297,24 @@ def get_cities(
     Get all cities with pagination and optional country filter.
 
     Args:
+        request: Incoming request (If-None-Match)
         skip: Number of records to skip
         limit: Maximum number of records to return
         country_id: Optional country ID filter
         service: CityService instance
 
     Returns:
-        List of CityResponse objects
+        List of CityResponse objects (304 Not Modified if the client's ETag is current)
     """
     logger.info(f"GET /lookups/cities - skip={skip}, limit={limit}, country_id={country_id}")
-    if country_id:
-        cities = service.get_by_country(country_id)
-        logger.info(f"Returning {len(cities)} city(ies) for country {country_id}")
-        return cities[skip : skip + limit]
-    cities = service.get_all(skip=skip, limit=limit)
-    logger.info(f"Returning {len(cities)} city(ies)")
-    return cities
+
+    def load() -> list[CityResponse]:
+        if country_id:
+            return service.get_by_country(country_id)[skip : skip + limit]
+        return service.get_all(skip=skip, limit=limit)
+
+    cached = lookup_cache.get_or_encode(("cities", country_id or None, skip, limit), load)
+    return etag_response(request, cached.body, cached.etag)
 
 
 @cities_router.get("/{city_id}", response_model=CityResponse)
@@ -388,6 +428,7 @@ def get_company_type_service(db: Session = Depends(get_database)) -> CompanyType
 
 @company_types_router.get("/", response_model=list[CompanyTypeResponse])
 def get_company_types(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     service: CompanyTypeService = Depends(get_company_type_service),
@@ -396,17 +437,19 @@ def get_company_types(
     Get all company types with pagination.
 
     Args:
+        request: Incoming request (If-None-Match)
         skip: Number of records to skip
         limit: Maximum number of records to return
         service: CompanyTypeService instance
 
     Returns:
-        List of CompanyTypeResponse objects
+        List of CompanyTypeResponse objects (304 Not Modified if the client's ETag is current)
     """
     logger.info(f"GET /lookups/company-types - skip={skip}, limit={limit}")
-    company_types = service.get_all(skip=skip, limit=limit)
-    logger.info(f"Returning {len(company_types)} company type(s)")
-    return company_types
+    cached = lookup_cache.get_or_encode(
+        ("company-types", skip, limit), lambda: service.get_all(skip=skip, limit=limit)
+    )
+    return etag_response(request, cached.body, cached.etag)
 
 
 @company_types_router.get("/{company_type_id}", response_model=CompanyTypeResponse)
@@ -524,6 +567,7 @@ def get_incoterms_service(db: Session = Depends(get_database)) -> IncotermServic
 
 @incoterms_router.get("/", response_model=list[IncotermResponse])
 def get_incoterms(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     service: IncotermService = Depends(get_incoterms_service),
@@ -532,17 +576,19 @@ def get_incoterms(
     Get all Incoterm with pagination.
 
     Args:
+        request: Incoming request (If-None-Match)
         skip: Number of records to skip
         limit: Maximum number of records to return
         service: IncotermService instance
 
     Returns:
-        List of IncotermResponse objects
+        List of IncotermResponse objects (304 Not Modified if the client's ETag is current)
     """
     logger.info(f"GET /lookups/incoterms - skip={skip}, limit={limit}")
-    incoterms = service.get_all(skip=skip, limit=limit)
-    logger.info(f"Returning {len(incoterms)} Incoterm(s)")
-    return incoterms
+    cached = lookup_cache.get_or_encode(
+        ("incoterms", skip, limit), lambda: service.get_all(skip=skip, limit=limit)
+    )
+    return etag_response(request, cached.body, cached.etag)
 
 
 @incoterms_router.get("/{incoterm_id}", response_model=IncotermResponse)
@@ -658,6 +704,7 @@ def get_currency_service(db: Session = Depends(get_database)) -> CurrencyService
 
 @currencies_router.get("/", response_model=list[CurrencyResponse])
 def get_currencies(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     service: CurrencyService = Depends(get_currency_service),
@@ -666,17 +713,19 @@ def get_currencies(
     Get all currencies with pagination.
 
     Args:
+        request: Incoming request (If-None-Match)
         skip: Number of records to skip
         limit: Maximum number of records to return
         service: CurrencyService instance
 
     Returns:
-        List of CurrencyResponse objects
+        List of CurrencyResponse objects (304 Not Modified if the client's ETag is current)
     """
     logger.info(f"GET /lookups/currencies - skip={skip}, limit={limit}")
-    currencies = service.get_all(skip=skip, limit=limit)
-    logger.info(f"Returning {len(currencies)} currency(ies)")
-    return currencies
+    cached = lookup_cache.get_or_encode(
+        ("currencies", skip, limit), lambda: service.get_all(skip=skip, limit=limit)
+    )
+    return etag_response(request, cached.body, cached.etag)
 
 
 @currencies_router.get("/{currency_id}", response_model=CurrencyResponse)
@@ -792,6 +841,7 @@ def get_unit_service(db: Session = Depends(get_database)) -> UnitService:
 
 @units_router.get("/", response_model=list[UnitResponse])
 def get_units(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     service: UnitService = Depends(get_unit_service),
@@ -800,17 +850,19 @@ def get_units(
     Get all units with pagination.
 
     Args:
+        request: Incoming request (If-None-Match)
         skip: Number of records to skip
         limit: Maximum number of records to return
         service: UnitService instance
 
     Returns:
-        List of UnitResponse objects
+        List of UnitResponse objects (304 Not Modified if the client's ETag is current)
     """
     logger.info(f"GET /lookups/units - skip={skip}, limit={limit}")
-    units = service.get_all(skip=skip, limit=limit)
-    logger.info(f"Returning {len(units)} unit(s)")
-    return units
+    cached = lookup_cache.get_or_encode(
+        ("units", skip, limit), lambda: service.get_all(skip=skip, limit=limit)
+    )
+    return etag_response(request, cached.body, cached.etag)
 
 
 @units_router.get("/{unit_id}", response_model=UnitResponse)
@@ -924,6 +976,7 @@ def get_family_type_service(db: Session = Depends(get_database)) -> FamilyTypeSe
 
 @family_types_router.get("/", response_model=list[FamilyTypeResponse])
 def get_family_types(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     service: FamilyTypeService = Depends(get_family_type_service),
@@ -932,17 +985,19 @@ def get_family_types(
     Get all family types with pagination.
 
     Args:
+        request: Incoming request (If-None-Match)
         skip: Number of records to skip
         limit: Maximum number of records to return
         service: FamilyTypeService instance
 
     Returns:
-        List of FamilyTypeResponse objects
+        List of FamilyTypeResponse objects (304 Not Modified if the client's ETag is current)
     """
     logger.info(f"GET /lookups/family-types - skip={skip}, limit={limit}")
-    family_types = service.get_all(skip=skip, limit=limit)
-    logger.info(f"Returning {len(family_types)} family type(s)")
-    return family_types
+    cached = lookup_cache.get_or_encode(
+        ("family-types", skip, limit), lambda: service.get_all(skip=skip, limit=limit)
+    )
+    return etag_response(request, cached.body, cached.etag)
 
 
 @family_types_router.get("/{family_type_id}", response_model=FamilyTypeResponse)
@@ -1060,6 +1115,7 @@ def get_matter_service(db: Session = Depends(get_database)) -> MatterService:
 
 @matters_router.get("/", response_model=list[MatterResponse])
 def get_matters(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     service: MatterService = Depends(get_matter_service),
@@ -1068,17 +1124,19 @@ def get_matters(
     Get all matters with pagination.
 
     Args:
+        request: Incoming request (If-None-Match)
         skip: Number of records to skip
         limit: Maximum number of records to return
         service: MatterService instance
 
     Returns:
-        List of MatterResponse objects
+        List of MatterResponse objects (304 Not Modified if the client's ETag is current)
     """
     logger.info(f"GET /lookups/matters - skip={skip}, limit={limit}")
-    matters = service.get_all(skip=skip, limit=limit)
-    logger.info(f"Returning {len(matters)} matter(s)")
-    return matters
+    cached = lookup_cache.get_or_encode(
+        ("matters", skip, limit), lambda: service.get_all(skip=skip, limit=limit)
+    )
+    return etag_response(request, cached.body, cached.etag)
 
 
 @matters_router.get("/{matter_id}", response_model=MatterResponse)
@@ -1192,6 +1250,7 @@ def get_sales_type_service(db: Session = Depends(get_database)) -> SalesTypeServ
 
 @sales_types_router.get("/", response_model=list[SalesTypeResponse])
 def get_sales_types(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     service: SalesTypeService = Depends(get_sales_type_service),
@@ -1200,17 +1259,19 @@ def get_sales_types(
     Get all sales types with pagination.
 
     Args:
+        request: Incoming request (If-None-Match)
         skip: Number of records to skip
         limit: Maximum number of records to return
         service: SalesTypeService instance
 
     Returns:
-        List of SalesTypeResponse objects
+        List of SalesTypeResponse objects (304 Not Modified if the client's ETag is current)
     """
     logger.info(f"GET /lookups/sales-types - skip={skip}, limit={limit}")
-    sales_types = service.get_all(skip=skip, limit=limit)
-    logger.info(f"Returning {len(sales_types)} sales type(s)")
-    return sales_types
+    cached = lookup_cache.get_or_encode(
+        ("sales-types", skip, limit), lambda: service.get_all(skip=skip, limit=limit)
+    )
+    return etag_response(request, cached.body, cached.etag)
 
 
 @sales_types_router.get("/{sales_type_id}", response_model=SalesTypeResponse)
@@ -1326,6 +1387,7 @@ def get_quote_status_service(db: Session = Depends(get_database)) -> QuoteStatus
 
 @quote_statuses_router.get("/", response_model=list[QuoteStatusResponse])
 def get_quote_statuses(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     service: QuoteStatusService = Depends(get_quote_status_service),
@@ -1334,17 +1396,19 @@ def get_quote_statuses(
     Get all quote statuses with pagination.
 
     Args:
+        request: Incoming request (If-None-Match)
         skip: Number of records to skip
         limit: Maximum number of records to return
         service: QuoteStatusService instance
 
     Returns:
-        List of QuoteStatusResponse objects
+        List of QuoteStatusResponse objects (304 Not Modified if the client's ETag is current)
     """
     logger.info(f"GET /lookups/quote-statuses - skip={skip}, limit={limit}")
-    quote_statuses = service.get_all(skip=skip, limit=limit)
-    logger.info(f"Returning {len(quote_statuses)} quote status(es)")
-    return quote_statuses
+    cached = lookup_cache.get_or_encode(
+        ("quote-statuses", skip, limit), lambda: service.get_all(skip=skip, limit=limit)
+    )
+    return etag_response(request, cached.body, cached.etag)
 
 
 @quote_statuses_router.get("/{quote_status_id}", response_model=QuoteStatusResponse)
@@ -1462,6 +1526,7 @@ def get_order_status_service(db: Session = Depends(get_database)) -> OrderStatus
 
 @order_statuses_router.get("/", response_model=list[OrderStatusResponse])
 def get_order_statuses(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     service: OrderStatusService = Depends(get_order_status_service),
@@ -1470,17 +1535,19 @@ def get_order_statuses(
     Get all order statuses with pagination.
 
     Args:
+        request: Incoming request (If-None-Match)
         skip: Number of records to skip
         limit: Maximum number of records to return
         service: OrderStatusService instance
 
     Returns:
-        List of OrderStatusResponse objects
+        List of OrderStatusResponse objects (304 Not Modified if the client's ETag is current)
     """
     logger.info(f"GET /lookups/order-statuses - skip={skip}, limit={limit}")
-    order_statuses = service.get_all(skip=skip, limit=limit)
-    logger.info(f"Returning {len(order_statuses)} order status(es)")
-    return order_statuses
+    cached = lookup_cache.get_or_encode(
+        ("order-statuses", skip, limit), lambda: service.get_all(skip=skip, limit=limit)
+    )
+    return etag_response(request, cached.body, cached.etag)
 
 
 @order_statuses_router.get("/{order_status_id}", response_model=OrderStatusResponse)
@@ -1598,6 +1665,7 @@ def get_payment_status_service(db: Session = Depends(get_database)) -> PaymentSt
 
 @payment_statuses_router.get("/", response_model=list[PaymentStatusResponse])
 def get_payment_statuses(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     service: PaymentStatusService = Depends(get_payment_status_service),
@@ -1606,17 +1674,19 @@ def get_payment_statuses(
     Get all payment statuses with pagination.
 
     Args:
+        request: Incoming request (If-None-Match)
         skip: Number of records to skip
         limit: Maximum number of records to return
         service: PaymentStatusService instance
 
     Returns:
-        List of PaymentStatusResponse objects
+        List of PaymentStatusResponse objects (304 Not Modified if the client's ETag is current)
     """
     logger.info(f"GET /lookups/payment-statuses - skip={skip}, limit={limit}")
-    payment_statuses = service.get_all(skip=skip, limit=limit)
-    logger.info(f"Returning {len(payment_statuses)} payment status(es)")
-    return payment_statuses
+    cached = lookup_cache.get_or_encode(
+        ("payment-statuses", skip, limit), lambda: service.get_all(skip=skip, limit=limit)
+    )
+    return etag_response(request, cached.body, cached.etag)
 
 
 @payment_statuses_router.get("/{payment_status_id}", response_model=PaymentStatusResponse)
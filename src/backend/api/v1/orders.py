@@ -5,10 +5,17 @@ Provides REST API for managing orders including CRUD operations,
 filtering by company/status, and creating orders from quotes.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
 
-from src.backend.api.dependencies import get_database as get_db
+from src.backend.api.dependencies import (
+    ListParams,
+    get_database as get_db,
+    list_params,
+    set_next_cursor,
+    set_total_count,
+    use_keyset,
+)
 from src.backend.repositories.business.order_repository import OrderRepository
 from src.backend.services.business.order_service import OrderService
 from src.shared.schemas.business.order import (
@@ -19,6 +26,7 @@ from src.shared.schemas.business.order import (
     OrderProductCreate,
     OrderProductUpdate,
     OrderProductResponse,
+    OrderProductBatch,
 )
 from src.backend.exceptions.service import ValidationException
 from src.backend.exceptions.repository import NotFoundException
@@ -43,28 +51,69 @@ def get_order_service(db: Session = Depends(get_db)) -> OrderService:
 
 @router.get("/", response_model=list[OrderListResponse])
 def get_orders(
+    response: Response,
     skip: int = Query(0, ge=0, description="Pagination offset"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
+    after: str | None = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    company_id: int | None = Query(None, description="Filter by company"),
+    status_id: int | None = Query(None, description="Filter by status"),
+    params: ListParams = Depends(list_params),
     service: OrderService = Depends(get_order_service),
 ) -> list[OrderListResponse]:
     """
     Get all orders with pagination.
 
-    Returns a list of orders ordered by order date (newest first).
+    Returns a list of orders ordered by order date (newest first). The first
+    page and any request with ``after`` use keyset pagination and return the
+    next page cursor in the ``X-Next-Cursor`` header.
+
+    With ``sort``, ``order``, ``q``, ``with_total`` or a filter only the
+    requested page is returned (OFFSET) and the total row count comes in the
+    ``X-Total-Count`` header.
+    Sortable columns: id, order_number, order_date, required_date,
+    company_id, status_id, total; ``q`` searches order, PO and project
+    numbers.
 
     Args:
-        skip: Number of records to skip
+        skip: Number of records to skip (ignored when ``after`` is given)
         limit: Maximum number of records to return
+        after: Opaque cursor for the next page
+        company_id: Company filter
+        status_id: Status filter
+        params: Sort and search (sort, order, q, with_total)
         service: Order service instance
 
     Returns:
         List of orders
     """
-    logger.info(f"GET /orders - skip={skip}, limit={limit}")
+    logger.info(f"GET /orders - skip={skip}, limit={limit}, after={after}, {params}")
+    filters = {"company_id": company_id, "status_id": status_id}
     try:
-        orders = service.get_all(skip=skip, limit=limit)
+        if params.requested_with(filters):
+            orders, total = service.get_list(
+                filters=filters,
+                sort=params.sort,
+                descending=params.descending,
+                search=params.search,
+                skip=skip,
+                limit=limit,
+            )
+            set_total_count(response, total)
+            logger.success(f"Retrieved {len(orders)} of {total} order(s)")
+            return orders
+        if use_keyset(skip, after):
+            orders, next_cursor = service.get_page(limit=limit, after=after)
+            set_next_cursor(response, next_cursor)
+        else:
+            orders = service.get_all(skip=skip, limit=limit)
         logger.success(f"Retrieved {len(orders)} order(s)")
         return orders
+    except ValidationException as e:
+        logger.warning(f"Validation error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error retrieving orders: {e}")
         raise HTTPException(
@@ -572,3 +621,53 @@ def remove_order_product(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error removing product: {str(e)}"
         )
+
+
+@router.post("/{order_id}/products:batch", response_model=OrderResponse)
+def apply_order_products_batch(
+    order_id: int,
+    batch: OrderProductBatch,
+    user_id: int = Query(..., description="User changing the products"),
+    service: OrderService = Depends(get_order_service),
+) -> OrderResponse:
+    """
+    Create, update and delete many order products in one request.
+
+    All changes are applied in one transaction with a single totals
+    recalculation. New lines without ``sequence`` are appended after the
+    last existing line, in list order.
+
+    Args:
+        order_id: Order ID
+        batch: Lines to create, update and delete
+        user_id: User changing the products
+        service: Order service instance
+
+    Returns:
+        Order with its products and recalculated totals
+
+    Example:
+        POST /api/v1/orders/123/products:batch?user_id=1
+        {
+            "create": [{"product_id": 10, "quantity": 5, "unit_price": 1500}],
+            "update": [{"id": 44, "quantity": 2}],
+            "delete": [45]
+        }
+    """
+    logger.info(f"POST /orders/{order_id}/products:batch")
+    try:
+        order = service.apply_products_batch(order_id, batch, user_id)
+        logger.success(f"Product batch applied to order_id={order_id}")
+        return order
+    except NotFoundException as e:
+        logger.warning(f"Order or product not found: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except ValidationException as e:
+        logger.warning(f"Validation error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
@@ -5,10 +5,19 @@ Proporciona operaciones CRUD sobre productos y gestión de BOM.
 """
 
 
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Response, status, Query
 from sqlalchemy.orm import Session
 
-from src.backend.api.dependencies import get_database, get_current_user_id
+from src.backend.api.dependencies import (
+    ListParams,
+    get_database,
+    get_current_user_id,
+    list_params,
+    set_next_cursor,
+    set_total_count,
+    use_keyset,
+)
+from src.backend.models.core.products import ProductType
 from src.backend.services.core.product_service import ProductService
 from src.backend.repositories.core.product_repository import (
     ProductRepository,
@@ -21,6 +30,7 @@ from src.shared.schemas.core.product import (
     ProductComponentCreate,
     ProductComponentUpdate,
     ProductComponentResponse,
+    ProductWithBOMResponse,
 )
 from src.shared.schemas.base import MessageResponse
 from src.backend.utils.logger import logger
@@ -49,28 +59,67 @@ def get_product_service(db: Session = Depends(get_database)) -> ProductService:
 
 @router.get("/", response_model=list[ProductResponse])
 def get_products(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    after: str | None = Query(None, description="Cursor del header X-Next-Cursor de la página anterior"),
+    is_active: bool | None = None,
+    product_type: ProductType | None = None,
+    params: ListParams = Depends(list_params),
     service: ProductService = Depends(get_product_service),
 ):
     """
     Obtiene todos los productos con paginación.
 
+    La primera página y cualquier request con ``after`` se paginan por
+    cursor (keyset); el cursor de la página siguiente viene en el header
+    ``X-Next-Cursor``. Un ``skip`` > 0 sin cursor mantiene OFFSET.
+
+    Con ``sort``, ``order``, ``q``, ``with_total`` o un filtro se responde
+    solo la página pedida (OFFSET), con el total de filas en el header
+    ``X-Total-Count``. Columnas ordenables: id, reference, product_type,
+    family_type_id, sale_price, cost_price, is_active, created_at; ``q``
+    busca en referencia y designaciones.
+
     Args:
         skip: Número de registros a saltar (default: 0)
         limit: Número máximo de registros (default: 100)
+        after: Cursor opaco de la página siguiente
+        is_active: Filtrar por estado
+        product_type: Filtrar por tipo: article, nomenclature, service
+        params: Orden y búsqueda (sort, order, q, with_total)
         db: Sesión de base de datos
 
     Returns:
         Lista de productos
 
     Example:
-        GET /api/v1/products?skip=0&limit=50
+        GET /api/v1/products?limit=50
+        GET /api/v1/products?limit=50&after=WzUwXQ
+        GET /api/v1/products?sort=reference&order=asc&q=torn&skip=25&limit=25
     """
-    logger.info(f"GET /products - skip={skip}, limit={limit}")
+    logger.info(f"GET /products - skip={skip}, limit={limit}, after={after}, {params}")
+
+    filters = {"is_active": is_active, "product_type": product_type}
+    if params.requested_with(filters):
+        products, total = service.get_list(
+            filters=filters,
+            sort=params.sort,
+            descending=params.descending,
+            search=params.search,
+            skip=skip,
+            limit=limit,
+        )
+        set_total_count(response, total)
+        logger.info(f"Retornando {len(products)} de {total} producto(s)")
+        return products
 
     # Service injected via dependency
-    products = service.get_all(skip=skip, limit=limit)
+    if use_keyset(skip, after):
+        products, next_cursor = service.get_page(limit=limit, after=after)
+        set_next_cursor(response, next_cursor)
+    else:
+        products = service.get_all(skip=skip, limit=limit)
 
     logger.info(f"Retornando {len(products)} producto(s)")
     return products
@@ -195,7 +244,7 @@ def get_product(
     return product
 
 
-@router.get("/{product_id}/with-components", response_model=ProductResponse)
+@router.get("/{product_id}/with-components", response_model=ProductWithBOMResponse)
 def get_product_with_components(
     product_id: int,
     service: ProductService = Depends(get_product_service),
@@ -203,12 +252,15 @@ def get_product_with_components(
     """
     Obtiene un producto con sus componentes (BOM) cargados.
 
+    Incluye el resumen del BOM completo (niveles, total de componentes y
+    costo/precio/peso acumulados), calculado desde un único query recursivo.
+
     Args:
         product_id: ID del producto
         db: Sesión de base de datos
 
     Returns:
-        Producto con componentes
+        Producto con componentes y resumen del BOM
 
     Raises:
         404: Si no se encuentra el producto
@@ -219,7 +271,7 @@ def get_product_with_components(
     logger.info(f"GET /products/{product_id}/with-components")
 
     # Service injected via dependency
-    product = service.get_with_components(product_id)
+    product = service.get_with_bom(product_id)
 
     logger.info(f"Producto encontrado con {len(product.components)} componente(s)")
     return product
@@ -520,13 +572,39 @@ def remove_component(
     )
 
 
+@router.get("/{product_id}/where-used", response_model=list[ProductResponse])
+def get_product_where_used(
+    product_id: int,
+    service: ProductService = Depends(get_product_service),
+):
+    """
+    Obtiene los productos que usan este producto en cualquier nivel de su BOM.
+
+    Args:
+        product_id: ID del componente
+        db: Sesión de base de datos
+
+    Returns:
+        Lista de productos (NOMENCLATURE) que lo contienen
+
+    Example:
+        GET /api/v1/products/5/where-used
+    """
+    logger.info(f"GET /products/{product_id}/where-used")
+
+    products = service.get_where_used(product_id)
+
+    logger.info(f"Producto {product_id} usado en {len(products)} producto(s)")
+    return products
+
+
 @router.get("/{product_id}/bom-cost")
 def calculate_bom_cost(
     product_id: int,
     service: ProductService = Depends(get_product_service),
 ):
     """
-    Calcula el costo total de un producto incluyendo su BOM (recursivo).
+    Calcula el costo total de un producto incluyendo su BOM (todos los niveles).
 
     Args:
         product_id: ID del producto
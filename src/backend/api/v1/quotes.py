@@ -4,12 +4,22 @@ REST API endpoints for Quote and QuoteProduct.
 Provides CRUD operations and custom endpoints for quote management.
 """
 
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.backend.api.dependencies import get_database, get_current_user_id
-from src.backend.services.business.quote_service import QuoteService
-from src.backend.repositories.business.quote_repository import QuoteRepository
+from src.backend.api.dependencies import (
+    ListParams,
+    get_async_database,
+    get_database,
+    get_current_user_id,
+    list_params,
+    set_next_cursor,
+    set_total_count,
+    use_keyset,
+)
+from src.backend.services.business.quote_service import AsyncQuoteService, QuoteService
+from src.backend.repositories.business.quote_repository import AsyncQuoteRepository, QuoteRepository
 from src.shared.schemas.business.quote import (
     QuoteCreate,
     QuoteUpdate,
@@ -18,6 +28,7 @@ from src.shared.schemas.business.quote import (
     QuoteProductCreate,
     QuoteProductUpdate,
     QuoteProductResponse,
+    QuoteProductBatch,
 )
 from src.shared.schemas.base import MessageResponse
 from src.backend.utils.logger import logger
@@ -39,41 +50,96 @@ def get_quote_service(db: Session = Depends(get_database)) -> QuoteService:
     return QuoteService(repository=repository, session=db)
 
 
+def get_async_quote_service(
+    db: AsyncSession = Depends(get_async_database),
+) -> AsyncQuoteService:
+    """
+    Dependency to get AsyncQuoteService instance for the read endpoints.
+
+    Args:
+        db: Async database session
+
+    Returns:
+        Configured AsyncQuoteService instance
+    """
+    repository = AsyncQuoteRepository(db)
+    return AsyncQuoteService(repository=repository, session=db)
+
+
 # ============================================================================
 # QUOTE ENDPOINTS
 # ============================================================================
 
 @router.get("/", response_model=list[QuoteListResponse])
-def get_quotes(
+async def get_quotes(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
-    service: QuoteService = Depends(get_quote_service),
+    after: str | None = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    company_id: int | None = Query(None, description="Filter by company"),
+    status_id: int | None = Query(None, description="Filter by status"),
+    params: ListParams = Depends(list_params),
+    service: AsyncQuoteService = Depends(get_async_quote_service),
 ):
     """
     Get all quotes with pagination.
 
+    The first page and any request with ``after`` use keyset pagination and
+    return the next page cursor in the ``X-Next-Cursor`` header. ``skip`` > 0
+    without a cursor keeps the legacy OFFSET behaviour.
+
+    With ``sort``, ``order``, ``q``, ``with_total`` or a filter only the
+    requested page is returned (OFFSET) and the total row count comes in the
+    ``X-Total-Count`` header.
+    Sortable columns: id, quote_number, quote_date, valid_until, company_id,
+    status_id, total; ``q`` searches quote number and subject.
+
     Args:
         skip: Number of records to skip (pagination offset)
         limit: Maximum number of records to return
+        after: Opaque cursor for the next page
+        company_id: Company filter
+        status_id: Status filter
+        params: Sort and search (sort, order, q, with_total)
 
     Returns:
         List of quotes (summary view without products)
 
     Example:
-        GET /api/v1/quotes?skip=0&limit=50
+        GET /api/v1/quotes?limit=50
+        GET /api/v1/quotes?limit=50&after=WyIyMDI1LTAx...
+        GET /api/v1/quotes?sort=total&order=desc&q=bomba&skip=25&limit=25
     """
-    logger.info(f"GET /quotes - skip={skip}, limit={limit}")
-    quotes = service.get_all(skip=skip, limit=limit)
+    logger.info(f"GET /quotes - skip={skip}, limit={limit}, after={after}, {params}")
+    filters = {"company_id": company_id, "status_id": status_id}
+    if params.requested_with(filters):
+        quotes, total = await service.get_list(
+            filters=filters,
+            sort=params.sort,
+            descending=params.descending,
+            search=params.search,
+            skip=skip,
+            limit=limit,
+        )
+        set_total_count(response, total)
+        logger.info(f"Returning {len(quotes)} of {total} quote(s)")
+        return quotes
+
+    if use_keyset(skip, after):
+        quotes, next_cursor = await service.get_page(limit=limit, after=after)
+        set_next_cursor(response, next_cursor)
+    else:
+        quotes = await service.get_all(skip=skip, limit=limit)
     logger.info(f"Returning {len(quotes)} quote(s)")
     return quotes
 
 
 @router.get("/company/{company_id}", response_model=list[QuoteListResponse])
-def get_quotes_by_company(
+async def get_quotes_by_company(
     company_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    service: QuoteService = Depends(get_quote_service),
+    service: AsyncQuoteService = Depends(get_async_quote_service),
 ):
     """
     Get all quotes for a specific company.
@@ -90,17 +156,17 @@ def get_quotes_by_company(
         GET /api/v1/quotes/company/5?skip=0&limit=10
     """
     logger.info(f"GET /quotes/company/{company_id}")
-    quotes = service.get_by_company(company_id, skip, limit)
+    quotes = await service.get_by_company(company_id, skip, limit)
     logger.info(f"Returning {len(quotes)} quote(s) for company_id={company_id}")
     return quotes
 
 
 @router.get("/status/{status_id}", response_model=list[QuoteListResponse])
-def get_quotes_by_status(
+async def get_quotes_by_status(
     status_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    service: QuoteService = Depends(get_quote_service),
+    service: AsyncQuoteService = Depends(get_async_quote_service),
 ):
     """
     Get quotes by status.
@@ -114,17 +180,17 @@ def get_quotes_by_status(
         List of quotes with the specified status
     """
     logger.info(f"GET /quotes/status/{status_id}")
-    quotes = service.get_by_status(status_id, skip, limit)
+    quotes = await service.get_by_status(status_id, skip, limit)
     logger.info(f"Returning {len(quotes)} quote(s) with status_id={status_id}")
     return quotes
 
 
 @router.get("/staff/{staff_id}", response_model=list[QuoteListResponse])
-def get_quotes_by_staff(
+async def get_quotes_by_staff(
     staff_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    service: QuoteService = Depends(get_quote_service),
+    service: AsyncQuoteService = Depends(get_async_quote_service),
 ):
     """
     Get quotes assigned to a staff member.
@@ -138,17 +204,17 @@ def get_quotes_by_staff(
         List of quotes assigned to the staff member
     """
     logger.info(f"GET /quotes/staff/{staff_id}")
-    quotes = service.get_by_staff(staff_id, skip, limit)
+    quotes = await service.get_by_staff(staff_id, skip, limit)
     logger.info(f"Returning {len(quotes)} quote(s) for staff_id={staff_id}")
     return quotes
 
 
 @router.get("/search", response_model=list[QuoteListResponse])
-def search_quotes(
+async def search_quotes(
     subject: str = Query(..., min_length=1, description="Text to search in subject"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    service: QuoteService = Depends(get_quote_service),
+    service: AsyncQuoteService = Depends(get_async_quote_service),
 ):
     """
     Search quotes by subject (partial match, case-insensitive).
@@ -165,15 +231,15 @@ def search_quotes(
         GET /api/v1/quotes/search?subject=equipment&skip=0&limit=10
     """
     logger.info(f"GET /quotes/search?subject={subject}")
-    quotes = service.search_by_subject(subject, skip, limit)
+    quotes = await service.search_by_subject(subject, skip, limit)
     logger.info(f"Search returned {len(quotes)} quote(s)")
     return quotes
 
 
 @router.get("/number/{quote_number}", response_model=QuoteResponse)
-def get_quote_by_number(
+async def get_quote_by_number(
     quote_number: str,
-    service: QuoteService = Depends(get_quote_service),
+    service: AsyncQuoteService = Depends(get_async_quote_service),
 ):
     """
     Get quote by unique quote number.
@@ -191,15 +257,15 @@ def get_quote_by_number(
         GET /api/v1/quotes/number/Q-2025-001
     """
     logger.info(f"GET /quotes/number/{quote_number}")
-    quote = service.get_by_quote_number(quote_number)
+    quote = await service.get_by_quote_number(quote_number)
     logger.info(f"Quote found: {quote.subject}")
     return quote
 
 
 @router.get("/{quote_id}", response_model=QuoteResponse)
-def get_quote(
+async def get_quote(
     quote_id: int,
-    service: QuoteService = Depends(get_quote_service),
+    service: AsyncQuoteService = Depends(get_async_quote_service),
 ):
     """
     Get quote by ID with all products.
@@ -217,7 +283,7 @@ def get_quote(
         GET /api/v1/quotes/123
     """
     logger.info(f"GET /quotes/{quote_id}")
-    quote = service.get_with_products(quote_id)
+    quote = await service.get_with_products(quote_id)
     logger.info(f"Quote found: {quote.quote_number}")
     return quote
 
@@ -427,6 +493,47 @@ def add_product_to_quote(
     return product
 
 
+@router.post("/{quote_id}/products:batch", response_model=QuoteResponse)
+def apply_quote_products_batch(
+    quote_id: int,
+    batch: QuoteProductBatch,
+    service: QuoteService = Depends(get_quote_service),
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    Create, update and delete many quote products in one request.
+
+    All changes are applied in one transaction with a single totals
+    recalculation. New lines without ``sequence`` are appended after the
+    last existing line, in list order.
+
+    Args:
+        quote_id: Quote ID
+        batch: Lines to create, update and delete
+        service: Quote service
+        user_id: Current user ID
+
+    Returns:
+        Quote with its products and recalculated totals
+
+    Raises:
+        404: If the quote or a listed line is not found
+        400: If a line is listed more than once
+
+    Example:
+        POST /api/v1/quotes/123/products:batch
+        {
+            "create": [{"product_id": 10, "quantity": 5, "unit_price": 1500}],
+            "update": [{"id": 44, "discount_percentage": 10}],
+            "delete": [45]
+        }
+    """
+    logger.info(f"POST /quotes/{quote_id}/products:batch")
+    quote = service.apply_products_batch(quote_id, batch, user_id)
+    logger.success(f"Product batch applied to quote_id={quote_id}")
+    return quote
+
+
 @router.put("/products/{product_id}", response_model=QuoteProductResponse)
 def update_quote_product(
     product_id: int,
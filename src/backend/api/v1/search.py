@@ -0,0 +1,64 @@
+"""
+Endpoint REST de búsqueda full-text unificada.
+
+Un solo endpoint que busca en empresas, productos, contactos, usuarios,
+notas y cotizaciones con ranking por relevancia.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from src.backend.api.dependencies import get_database
+from src.backend.repositories.search_repository import SearchRepository
+from src.backend.services.search_service import MAX_SEARCH_LIMIT, SearchService
+from src.shared.schemas.search import SearchHit
+from src.backend.utils.logger import logger
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+def get_search_service(db: Session = Depends(get_database)) -> SearchService:
+    """
+    Dependency para obtener instancia de SearchService.
+
+    Args:
+        db: Sesión de base de datos
+
+    Returns:
+        Instancia configurada de SearchService
+    """
+    return SearchService(SearchRepository(db))
+
+
+@router.get("/", response_model=list[SearchHit])
+def search(
+    q: str = Query(..., min_length=1, description="Texto a buscar"),
+    types: list[str] | None = Query(None, description="Tipos de entidad a incluir"),
+    limit: int = Query(20, ge=1, le=MAX_SEARCH_LIMIT),
+    service: SearchService = Depends(get_search_service),
+):
+    """
+    Busca en todas las entidades indexadas.
+
+    Cada palabra se busca como prefijo y todas deben coincidir; los
+    resultados se ordenan por relevancia (coincidencias en el título
+    pesan más).
+
+    Args:
+        q: Texto a buscar
+        types: Tipos de entidad (company, product, contact, staff, note, quote)
+        limit: Máximo de resultados
+        service: Servicio de búsqueda
+
+    Returns:
+        Lista de resultados de distintos tipos
+
+    Example:
+        GET /api/v1/search?q=torn m6&types=product&limit=10
+    """
+    logger.info(f"GET /search - q='{q}', types={types}, limit={limit}")
+
+    hits = service.search(q, entity_types=types, limit=limit)
+
+    logger.info(f"Retornando {len(hits)} resultado(s)")
+    return hits
@@ -0,0 +1,56 @@
+"""
+Endpoints REST de estadísticas agregadas.
+
+Provee los KPIs del dashboard en una sola llamada.
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from src.backend.api.dependencies import get_database
+from src.backend.repositories.stats_repository import StatsRepository
+from src.backend.services.stats_service import StatsService
+from src.shared.schemas.stats import DashboardStats
+from src.backend.utils.logger import logger
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+def get_stats_service(db: Session = Depends(get_database)) -> StatsService:
+    """
+    Dependency para obtener instancia de StatsService.
+
+    Args:
+        db: Sesión de base de datos
+
+    Returns:
+        Instancia configurada de StatsService
+    """
+    return StatsService(StatsRepository(db))
+
+
+@router.get("/dashboard", response_model=DashboardStats)
+def get_dashboard_stats(
+    refresh: bool = False,
+    service: StatsService = Depends(get_stats_service),
+):
+    """
+    Obtiene los KPIs del dashboard.
+
+    Clientes, proveedores, productos, cotizaciones abiertas, órdenes,
+    facturas vencidas y facturación de los últimos 12 meses. El resultado
+    se cachea unos segundos (settings.dashboard_cache_ttl).
+
+    Args:
+        refresh: Ignorar la caché y recalcular
+        service: Servicio de estadísticas
+
+    Returns:
+        KPIs del dashboard
+
+    Example:
+        GET /api/v1/stats/dashboard
+        GET /api/v1/stats/dashboard?refresh=true
+    """
+    logger.info(f"GET /stats/dashboard - refresh={refresh}")
+    return service.get_dashboard(refresh=refresh)
@@ -5,12 +5,22 @@ Este paquete provee conexión a base de datos, gestión de sesiones,
 y configuración del engine.
 """
 
+from src.backend.database.async_engine import async_engine
 from src.backend.database.engine import engine
-from src.backend.database.session import SessionLocal, get_db, session_scope
+from src.backend.database.session import (
+    AsyncSessionLocal,
+    SessionLocal,
+    get_async_db,
+    get_db,
+    session_scope,
+)
 
 __all__ = [
     "engine",
+    "async_engine",
     "SessionLocal",
+    "AsyncSessionLocal",
     "get_db",
+    "get_async_db",
     "session_scope",
 ]
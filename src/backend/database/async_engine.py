@@ -0,0 +1,76 @@
+"""
+Configuración del engine asíncrono de base de datos.
+
+Provee un AsyncEngine paralelo al engine síncrono de engine.py, usando
+aiosqlite (desarrollo) o aiomysql (producción). Los endpoints async lo usan
+para no ocupar un hilo del threadpool de Starlette por cada request.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.backend.config.settings import get_settings
+
+settings = get_settings()
+
+
+def create_async_db_engine(database_url: str | None = None) -> AsyncEngine:
+    """
+    Crea el engine asíncrono basado en la configuración.
+
+    Args:
+        database_url: URL async a conectar (default: la base primaria de settings)
+
+    Returns:
+        AsyncEngine: Engine asíncrono de SQLAlchemy configurado
+
+    Note:
+        Para SQLite no se usa StaticPool (como en el engine síncrono):
+        cada request async obtiene su propia conexión aiosqlite del pool
+        para que las lecturas concurrentes no se serialicen en una sola.
+    """
+    database_url = database_url or settings.async_database_url
+
+    if settings.database_type == "sqlite":
+        engine = create_async_engine(
+            database_url,
+            echo=settings.database_echo,
+        )
+
+        # Enable foreign key constraints for SQLite
+        @event.listens_for(engine.sync_engine, "connect")
+        def set_sqlite_pragma(dbapi_conn, connection_record):
+            cursor = dbapi_conn.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+
+    elif settings.database_type == "mysql":
+        engine = create_async_engine(
+            database_url,
+            echo=settings.database_echo,
+            pool_size=settings.mysql_pool_size,
+            max_overflow=settings.mysql_max_overflow,
+            pool_recycle=settings.mysql_pool_recycle,
+            pool_pre_ping=True,  # Verify connections before use
+            connect_args={
+                "connect_timeout": settings.mysql_connect_timeout,
+                "charset": "utf8mb4",
+            },
+        )
+
+        # Log successful MySQL connections
+        @event.listens_for(engine.sync_engine, "connect")
+        def receive_connect(dbapi_conn, connection_record):
+            from src.backend.utils.logger import logger
+
+            logger.debug("MySQL async connection established")
+
+    else:
+        raise ValueError(f"Unsupported database type: {settings.database_type}")
+
+    return engine
+
+
+# Create global async engine instances
+async_engine = create_async_db_engine()
+async_replica_engines = [create_async_db_engine(url) for url in settings.async_database_replica_urls]
@@ -2,7 +2,8 @@
 Configuración del engine de base de datos.
 
 Provee el engine de SQLAlchemy configurado basado en los settings de la aplicación.
-Soporta tanto SQLite (desarrollo) como MySQL (producción).
+Soporta tanto SQLite (desarrollo) como MySQL (producción), más un engine por
+cada réplica de lectura configurada en ``database_replica_urls``.
 """
 
 from sqlalchemy import create_engine, event
@@ -13,14 +14,17 @@ from src.backend.config.settings import get_settings
 settings = get_settings()
 
 
-def create_db_engine():
+def create_db_engine(database_url: str | None = None):
     """
     Crea el engine de base de datos basado en la configuración.
 
+    Args:
+        database_url: URL a conectar (default: la base primaria de settings)
+
     Returns:
         Engine: Engine de SQLAlchemy configurado
     """
-    database_url = settings.database_url
+    database_url = database_url or settings.database_url
 
     if settings.database_type == "sqlite":
         # SQLite configuration
@@ -67,5 +71,6 @@ def create_db_engine():
     return engine
 
 
-# Create global engine instance
+# Create global engine instances
 engine = create_db_engine()
+replica_engines = [create_db_engine(url) for url in settings.database_replica_urls]
@@ -0,0 +1,97 @@
+"""
+Sesión que reparte las lecturas entre la base primaria y réplicas.
+
+``RoutingSession`` envía los SELECT a una réplica solo si la sesión fue
+marcada de solo lectura (``mark_read_only``: requests GET/HEAD,
+exportaciones) y todavía no escribió. Todo lo demás va a la primaria:
+
+- flush, INSERT/UPDATE/DELETE y ``SELECT ... FOR UPDATE``;
+- cualquier lectura posterior a la primera escritura de la sesión, para
+  que la misma request lea lo que acaba de escribir (read-after-write);
+- sesiones sin marcar (POST/PUT/DELETE, scripts, tests) o devueltas a la
+  primaria con ``use_primary`` (lecturas de las que se materializan datos);
+- ``session.connection()`` / ``get_bind()`` sin statement.
+
+La réplica se elige al azar la primera vez y se mantiene por el resto de
+la sesión, así una request no mezcla réplicas con distinto retraso. Una
+request GET puede leer datos con el retraso de replicación respecto de
+una escritura hecha en una request anterior.
+
+Sin réplicas configuradas la sesión se comporta como ``Session``.
+"""
+
+import random
+from collections.abc import Sequence
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+READ_ONLY_KEY = "read_only"
+
+
+def mark_read_only(session: Session) -> None:
+    """
+    Permite que las lecturas de la sesión vayan a una réplica.
+
+    Args:
+        session: Sesión (o ``AsyncSession.sync_session``) a marcar
+    """
+    session.info[READ_ONLY_KEY] = True
+
+
+def use_primary(session: Session) -> None:
+    """
+    Envía las lecturas siguientes de la sesión a la primaria.
+
+    Para lecturas de las que se calculan datos que luego se guardan (p. ej.
+    acumulados de BOM): calcular desde una réplica atrasada guardaría en la
+    primaria un valor que no corresponde a sus datos.
+
+    Args:
+        session: Sesión (o ``AsyncSession.sync_session``)
+    """
+    session.info[READ_ONLY_KEY] = False
+
+
+class RoutingSession(Session):
+    """
+    Session con enrutamiento de lecturas a réplicas.
+
+    Attributes:
+        replicas: Engines de las réplicas de lectura
+        replica: Réplica elegida por esta sesión (None hasta la primera lectura)
+        wrote: Si la sesión ya escribió (desde entonces todo va a la primaria)
+
+    Example:
+        SessionLocal = sessionmaker(class_=RoutingSession, bind=engine, replicas=replica_engines)
+        session = SessionLocal()
+        mark_read_only(session)
+        session.execute(select(Company))  # réplica
+    """
+
+    def __init__(self, *args, replicas: Sequence[Engine] = (), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = list(replicas)
+        self.replica: Engine | None = None
+        self.wrote = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        """Engine para ``clause``: una réplica para lecturas, la primaria para el resto."""
+        if self._reads_from_replica(clause):
+            if self.replica is None:
+                self.replica = random.choice(self.replicas)
+            return self.replica
+        if self._flushing or (clause is not None and not getattr(clause, "is_select", False)):
+            self.wrote = True
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def _reads_from_replica(self, clause) -> bool:
+        """Si ``clause`` es una lectura que puede ir a la réplica."""
+        return (
+            bool(self.replicas)
+            and self.info.get(READ_ONLY_KEY, False)
+            and not self.wrote
+            and not self._flushing
+            and getattr(clause, "is_select", False)
+            and getattr(clause, "_for_update_arg", None) is None
+        )
@@ -3,21 +3,39 @@ Database session management.
 
 Provides session factory and dependency injection utilities
 for database access throughout the application.
+
+Sessions are RoutingSession instances: once marked read-only they read
+from a replica (if any are configured) until they write.
 """
 
 from contextlib import contextmanager
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
 
-from src.backend.database.engine import engine
+from src.backend.database.async_engine import async_engine, async_replica_engines
+from src.backend.database.engine import engine, replica_engines
+from src.backend.database.routing import RoutingSession
 
 # Session factory
 SessionLocal = sessionmaker(
+    class_=RoutingSession,
     autocommit=False,
     autoflush=False,
     bind=engine,
     expire_on_commit=False,  # Don't expire objects after commit
+    replicas=replica_engines,
+)
+
+# Async session factory (same semantics as SessionLocal)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+    replicas=[replica.sync_engine for replica in async_replica_engines],
 )
 
 
@@ -49,6 +67,23 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency injection function for async database sessions.
+
+    Yields:
+        AsyncSession: SQLAlchemy async session
+
+    Example:
+        @app.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(Item))
+            return result.scalars().all()
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 @contextmanager
 def session_scope():
     """
@@ -9,9 +9,13 @@ from typing import Any
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from src.backend.api import error_handlers
+from src.backend.api.compression import CompressionMiddleware
+from src.backend.api.dependencies import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
+from src.backend.api.instrumentation import InstrumentationMiddleware
+from src.backend.api.responses import FastJSONResponse
 from src.backend.api.v1 import (  # noqa: F401
     companies,
     products,
@@ -27,14 +31,22 @@ from src.backend.api.v1 import (  # noqa: F401
     deliveries,
     invoices,
     lookups,
+    search,
+    history,
+    stats,
+    imports,
+    exports,
 )
 from src.backend.config.settings import settings
-from src.backend.database.engine import engine
+from src.backend.database.async_engine import async_engine, async_replica_engines
+from src.backend.database.engine import engine, replica_engines
 from src.backend.models.base.base import Base
+from src.backend.models.history import history_writer
 from src.backend.exceptions.base import AppException, DatabaseException
 from src.backend.exceptions.repository import NotFoundException, DuplicateException
 from src.backend.exceptions.service import ValidationException, BusinessRuleException
 from src.backend.utils.logger import logger
+from src.backend.utils.metrics import instrument_engine, metrics_registry
 
 # Import all models for table creation
 from src.backend.models.core import (  # noqa: F401
@@ -63,6 +75,8 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("🚀 Iniciando aplicación FastAPI")
     logger.info(f"📊 Base de datos: {settings.database_type}")
+    if replica_engines:
+        logger.info(f"📚 Réplicas de lectura: {len(replica_engines)}")
     logger.info(f"🔧 Entorno: {settings.environment}")
 
     # Crear tablas si no existen (solo para desarrollo)
@@ -71,11 +85,18 @@ async def lifespan(app: FastAPI):
         Base.metadata.create_all(bind=engine)
         logger.success("✅ Tablas creadas exitosamente")
 
+    # Historial de cambios: INSERT por lotes fuera del ciclo de la request
+    history_writer.start(engine)
+
     yield
 
     # Shutdown
     logger.info("🛑 Cerrando aplicación FastAPI")
-    engine.dispose()
+    history_writer.stop()
+    for db_engine in (engine, *replica_engines):
+        db_engine.dispose()
+    for async_db_engine in (async_engine, *async_replica_engines):
+        await async_db_engine.dispose()
     logger.success("✅ Conexiones de base de datos cerradas")
 
 
@@ -110,6 +131,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=FastJSONResponse,
     lifespan=lifespan,
 )
 
@@ -118,6 +140,14 @@ app = FastAPI(
 # MIDDLEWARE
 # ============================================================================
 
+# Comprimir respuestas grandes (listados de hasta max_pagination_limit filas)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.gzip_compresslevel,
+    brotli_quality=settings.brotli_quality,
+)
+
 # Configurar CORS
 app.add_middleware(
     CORSMiddleware,
@@ -125,8 +155,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, "ETag", "Server-Timing"],
 )
 
+# Medir latencia y queries SQL por request (último agregado = más externo)
+if settings.metrics_enabled:
+    for db_engine in (engine, *replica_engines):
+        instrument_engine(db_engine)
+    for db_engine in (async_engine, *async_replica_engines):
+        instrument_engine(db_engine.sync_engine)
+    app.add_middleware(
+        InstrumentationMiddleware,
+        n_plus_one_threshold=settings.n_plus_one_threshold,
+    )
+
 
 # ============================================================================
 # EXCEPTION HANDLERS
@@ -229,6 +271,36 @@ app.include_router(
     tags=["lookups"]
 )
 
+app.include_router(
+    search.router,
+    prefix="/api/v1",
+    tags=["search"]
+)
+
+app.include_router(
+    history.router,
+    prefix="/api/v1",
+    tags=["history"]
+)
+
+app.include_router(
+    stats.router,
+    prefix="/api/v1",
+    tags=["stats"]
+)
+
+app.include_router(
+    imports.router,
+    prefix="/api/v1",
+    tags=["import"]
+)
+
+app.include_router(
+    exports.router,
+    prefix="/api/v1",
+    tags=["export"]
+)
+
 
 # ============================================================================
 # ENDPOINTS RAÍZ
@@ -298,6 +370,29 @@ def health_check() -> dict[str, Any]:
     }
 
 
+@app.get("/metrics", tags=["health"], response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    """
+    Métricas del proceso en formato de texto de Prometheus.
+
+    Latencia por ruta (histograma), requests por código de respuesta,
+    queries SQL y tiempo en BD por ruta, y avisos de N+1.
+
+    Returns:
+        Texto de exposición de Prometheus
+
+    Example:
+        GET /metrics
+        Response:
+        akgroup_http_requests_total{method="GET",route="/api/v1/products/",status="200"} 42
+        ...
+    """
+    return PlainTextResponse(
+        metrics_registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc: Any) -> JSONResponse:
     """
@@ -74,6 +74,8 @@ from .core import (
     NotePriority,
     PriceCalculationMode,
     Product,
+    ProductBOMClosure,
+    ProductBOMRollup,
     ProductComponent,
     ProductType,
     Service,
@@ -95,6 +97,10 @@ from .business import (
     Transport,
 )
 
+# ========== ÍNDICE DE BÚSQUEDA E HISTORIAL ==========
+# Registran la tabla FTS, la de historial y sus eventos de sincronización
+from . import history, search  # noqa: E402,F401
+
 __all__ = [
     # Base infrastructure
     "Base",
@@ -138,6 +144,8 @@ __all__ = [
     "Address",
     "AddressType",
     "Product",
+    "ProductBOMClosure",
+    "ProductBOMRollup",
     "ProductComponent",
     "ProductType",
     "PriceCalculationMode",
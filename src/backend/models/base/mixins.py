@@ -15,7 +15,7 @@ import pendulum
 from typing import TYPE_CHECKING
 
 from sqlalchemy import DateTime, event
-from sqlalchemy.orm import Mapped, Session, declared_attr, mapped_column
+from sqlalchemy.orm import Mapped, Session, declared_attr, mapped_column, object_session
 
 if TYPE_CHECKING:
     pass
@@ -30,7 +30,7 @@ class TimestampMixin:
         updated_at: Timestamp UTC de última actualización (auto)
 
     El campo updated_at se actualiza automáticamente en cada UPDATE
-    gracias al event listener configurado más abajo.
+    (ORM o masivo) gracias al onupdate de la columna.
 
     Usage:
         class MyModel(Base, TimestampMixin):
@@ -69,7 +69,8 @@ class AuditMixin:
     Para que funcione automáticamente, establece el user_id en session.info:
         session.info["user_id"] = current_user.id
 
-    El event listener (más abajo) se encarga de setear estos campos automáticamente.
+    Los eventos de mapper (más abajo) setean estos campos en cada flush;
+    bulk_insert y update_many del repositorio los completan en SQL masivo.
 
     Usage:
         class MyModel(Base, AuditMixin):
@@ -180,60 +181,49 @@ class ActiveMixin:
 
 
 # ========== EVENT LISTENERS ==========
-# Automatizan el seteo de campos de auditoría
+# Automatizan el seteo de campos de auditoría. Son eventos de mapper sobre
+# AuditMixin (propagate=True): el flush los llama solo para las filas de
+# modelos auditados que escribe, sin recorrer session.new/session.dirty.
+# updated_at lo resuelve el onupdate de la columna.
 
 
-@event.listens_for(Session, "before_flush")
-def receive_before_flush(
-    session: Session, flush_context: object, instances: object
-) -> None:
-    """
-    Event listener que se ejecuta antes de flush.
+def audit_user_id(session: Session | None) -> int | None:
+    """Usuario de auditoría de la sesión (``session.info["user_id"]``)."""
+    return session.info.get("user_id") if session is not None else None
+
 
-    Automáticamente establece:
-    - created_by_id en registros nuevos
-    - updated_by_id en registros modificados
-    - updated_at en registros modificados
+@event.listens_for(AuditMixin, "before_insert", propagate=True)
+def receive_before_insert(mapper: object, connection: object, target: AuditMixin) -> None:
+    """
+    Completa created_by_id y updated_by_id de un registro nuevo.
 
-    Requiere que el user_id esté en session.info:
+    Solo si la sesión tiene user_id y el campo no fue asignado a mano:
         session.info["user_id"] = current_user_id
 
     Args:
-        session: Sesión de SQLAlchemy
-        flush_context: Contexto del flush
-        instances: Instancias afectadas
+        mapper: Mapper de SQLAlchemy
+        connection: Conexión del flush
+        target: Instancia siendo insertada
     """
-    user_id = session.info.get("user_id")
-
+    user_id = audit_user_id(object_session(target))
     if user_id is None:
-        return  # No hay contexto de usuario, skip
-
-    # Registros nuevos (INSERT)
-    for instance in session.new:
-        if hasattr(instance, "created_by_id") and instance.created_by_id is None:
-            instance.created_by_id = user_id
-        if hasattr(instance, "updated_by_id") and instance.updated_by_id is None:
-            instance.updated_by_id = user_id
+        return
+    if target.created_by_id is None:
+        target.created_by_id = user_id
+    if target.updated_by_id is None:
+        target.updated_by_id = user_id
 
-    # Registros modificados (UPDATE)
-    for instance in session.dirty:
-        if hasattr(instance, "updated_by_id"):
-            instance.updated_by_id = user_id
-        # updated_at se maneja con onupdate en la columna
 
-
-@event.listens_for(Session, "before_update", propagate=True)
-def receive_before_update(mapper: object, connection: object, target: object) -> None:
+@event.listens_for(AuditMixin, "before_update", propagate=True)
+def receive_before_update(mapper: object, connection: object, target: AuditMixin) -> None:
     """
-    Event listener alternativo para actualizar updated_at.
-
-    Se ejecuta antes de cada UPDATE para garantizar que updated_at
-    se actualice incluso si onupdate falla.
+    Marca updated_by_id en un registro modificado.
 
     Args:
         mapper: Mapper de SQLAlchemy
-        connection: Conexión a la base de datos
-        target: Instancia del modelo siendo actualizada
+        connection: Conexión del flush
+        target: Instancia siendo actualizada
     """
-    if hasattr(target, "updated_at"):
-        target.updated_at = pendulum.now("UTC")
+    user_id = audit_user_id(object_session(target))
+    if user_id is not None:
+        target.updated_by_id = user_id
@@ -20,6 +20,8 @@ from .notes import Note, NotePriority
 from .products import (
     PriceCalculationMode,
     Product,
+    ProductBOMClosure,
+    ProductBOMRollup,
     ProductComponent,
     ProductType,
 )
@@ -44,6 +46,8 @@ __all__ = [
     "AddressType",
     # Products
     "Product",
+    "ProductBOMClosure",
+    "ProductBOMRollup",
     "ProductComponent",
     "ProductType",
     "PriceCalculationMode",
@@ -11,6 +11,8 @@ Características:
 - BOM jerárquico ilimitado (solo para NOMENCLATURE)
 - Prevención de ciclos en BOM
 - Cálculo automático de precios desde componentes
+- Acumulados de BOM materializados (ProductBOMRollup)
+- Cierre transitivo del BOM (ProductBOMClosure) mantenido por eventos
 - Gestión de stock (solo ARTICLE)
 - Dimensiones y pesos
 - Múltiples precios (cost, purchase, sale)
@@ -20,8 +22,10 @@ import enum
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
+import pendulum
 from sqlalchemy import (
     CheckConstraint,
+    DateTime,
     Enum as SQLEnum,
     ForeignKey,
     Index,
@@ -29,6 +33,13 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    bindparam,
+    delete,
+    event,
+    insert,
+    inspect,
+    select,
+    update,
 )
 from sqlalchemy.orm import Mapped, Session, mapped_column, relationship, validates
 
@@ -226,13 +237,13 @@ class Product(Base, TimestampMixin, AuditMixin, ActiveMixin):
 
     # ========== RELATIONSHIPS ==========
     family_type: Mapped["FamilyType | None"] = relationship(
-        "FamilyType", back_populates="products", lazy="joined"
+        "FamilyType", back_populates="products", lazy="select"
     )
     matter: Mapped["Matter | None"] = relationship(
-        "Matter", back_populates="products", lazy="joined"
+        "Matter", back_populates="products", lazy="select"
     )
     sales_type: Mapped["SalesType | None"] = relationship(
-        "SalesType", back_populates="products", lazy="joined"
+        "SalesType", back_populates="products", lazy="select"
     )
     company: Mapped["Company | None"] = relationship(
         "Company", back_populates="products", lazy="select"
@@ -499,33 +510,37 @@ class Product(Base, TimestampMixin, AuditMixin, ActiveMixin):
         """
         Valida que agregar un componente no cree ciclos en el BOM.
 
+        Usa el cierre transitivo (ProductBOMClosure): hay ciclo si este
+        producto ya es descendiente del componente, un lookup por PK.
+
         Args:
             component_id: ID del componente a agregar
-            visited: Set de IDs visitados
+            visited: Sin uso, se conserva por compatibilidad
 
         Raises:
             ValueError: Si se detecta un ciclo
         """
-        if visited is None:
-            visited = set()
-
         if component_id == self.id:
             raise ValueError(
                 f"Cannot add product {self.reference} as component of itself"
             )
 
-        visited.add(self.id)
-
         session = Session.object_session(self)
-        if session:
+        if session is None:
+            return
+
+        in_bom = session.execute(
+            select(ProductBOMClosure.path_count).where(
+                ProductBOMClosure.ancestor_id == component_id,
+                ProductBOMClosure.descendant_id == self.id,
+            )
+        ).first()
+        if in_bom:
             component = session.get(Product, component_id)
-            if component:
-                try:
-                    component.get_bom_tree(visited=visited)
-                except ValueError as e:
-                    raise ValueError(
-                        f"Adding component {component.reference} would create a cycle: {str(e)}"
-                    ) from e
+            raise ValueError(
+                f"Adding component {component.reference} would create a cycle: "
+                f"product {self.reference} (id={self.id}) is already part of its BOM"
+            )
 
     def __repr__(self) -> str:
         return (
@@ -624,3 +639,195 @@ class ProductComponent(Base, TimestampMixin, AuditMixin):
             f"<ProductComponent(id={self.id}, parent_id={self.parent_id}, "
             f"component_id={self.component_id}, quantity={self.quantity})>"
         )
+
+
+class ProductBOMRollup(Base):
+    """
+    Acumulados materializados del BOM de un producto.
+
+    Guarda costo, precio y peso acumulados desde todos los niveles del BOM
+    para que leerlos sea un lookup por PK. Una fila existe solo mientras es
+    válida: cualquier cambio en el BOM o en los precios/peso de un
+    componente elimina la fila del producto afectado y de todos sus
+    ancestros (ver ProductBOMRollupRepository.invalidate), y se recalcula
+    en la siguiente lectura.
+
+    Costo, precio y peso se guardan con 10 decimales (bom_engine.ROLLUP_QUANTUM):
+    un sub-ensamble materializado se usa como hoja al recalcular sus padres,
+    y redondearlo a centavos cambiaría el resultado según el estado de la
+    caché. Se redondean solo al responder.
+
+    Attributes:
+        product_id: FK al producto (PK)
+        cost: Costo unitario acumulado
+        price: Precio de venta unitario acumulado
+        weight: Peso unitario acumulado
+        levels: Niveles de profundidad del BOM
+        computed_at: Timestamp UTC del cálculo
+    """
+
+    __tablename__ = "product_bom_rollups"
+
+    product_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Product whose BOM is rolled up",
+    )
+    cost: Mapped[Decimal] = mapped_column(
+        Numeric(30, 10), comment="Rolled-up unit cost"
+    )
+    price: Mapped[Decimal] = mapped_column(
+        Numeric(30, 10), comment="Rolled-up unit sale price"
+    )
+    weight: Mapped[Decimal | None] = mapped_column(
+        Numeric(25, 10), comment="Rolled-up unit weight in kg"
+    )
+    levels: Mapped[int] = mapped_column(default=0, comment="BOM depth")
+    computed_at: Mapped[pendulum.DateTime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: pendulum.now("UTC"),
+        comment="UTC timestamp of the computation",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ProductBOMRollup(product_id={self.product_id}, cost={self.cost}, "
+            f"price={self.price})>"
+        )
+
+
+class ProductBOMClosure(Base):
+    """
+    Cierre transitivo del BOM (tabla ancestro/descendiente).
+
+    Una fila (ancestor_id, descendant_id) existe si descendant_id aparece en
+    algún nivel del BOM de ancestor_id; path_count es el número de caminos
+    distintos entre ambos, lo que permite quitar una arista sin recalcular
+    el grafo (el par desaparece cuando su contador llega a cero).
+
+    Se mantiene automáticamente con los eventos after_insert/after_update/
+    after_delete de ProductComponent, por lo que:
+    - detectar un ciclo al agregar P -> C es buscar la fila (C, P) por PK
+    - "where-used" transitivo es un lookup por el índice de descendant_id
+
+    Attributes:
+        ancestor_id: Producto que contiene (directa o indirectamente)
+        descendant_id: Producto contenido
+        path_count: Número de caminos ancestor -> descendant
+    """
+
+    __tablename__ = "product_bom_closure"
+
+    ancestor_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Product whose BOM contains the descendant",
+    )
+    descendant_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+        comment="Product contained at any BOM level",
+    )
+    path_count: Mapped[int] = mapped_column(
+        default=1, comment="Number of distinct BOM paths ancestor -> descendant"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ProductBOMClosure(ancestor_id={self.ancestor_id}, "
+            f"descendant_id={self.descendant_id}, path_count={self.path_count})>"
+        )
+
+
+# ========== EVENT LISTENERS ==========
+# Mantienen ProductBOMClosure sincronizado con product_components
+
+
+def apply_bom_edge(connection: Any, parent_id: int, component_id: int, sign: int) -> None:
+    """
+    Suma (sign=1) o resta (sign=-1) los caminos que aporta la arista
+    parent -> component al cierre transitivo.
+
+    Cada ancestro A de parent (incluido parent) gana paths(A, parent) *
+    paths(component, D) caminos hacia cada descendiente D de component
+    (incluido component).
+
+    Args:
+        connection: Conexión en la transacción actual
+        parent_id: Producto padre de la arista
+        component_id: Producto componente de la arista
+        sign: 1 al agregar la arista, -1 al quitarla
+    """
+    closure = ProductBOMClosure.__table__
+    c = closure.c
+
+    ancestors = {parent_id: 1}
+    ancestors.update(
+        connection.execute(
+            select(c.ancestor_id, c.path_count).where(c.descendant_id == parent_id)
+        ).all()
+    )
+    descendants = {component_id: 1}
+    descendants.update(
+        connection.execute(
+            select(c.descendant_id, c.path_count).where(c.ancestor_id == component_id)
+        ).all()
+    )
+    existing = {
+        (row.ancestor_id, row.descendant_id): row.path_count
+        for row in connection.execute(
+            select(c.ancestor_id, c.descendant_id, c.path_count).where(
+                c.ancestor_id.in_(ancestors), c.descendant_id.in_(descendants)
+            )
+        )
+    }
+
+    inserts, updates, deletes = [], [], []
+    for ancestor_id, ancestor_paths in ancestors.items():
+        for descendant_id, descendant_paths in descendants.items():
+            key = (ancestor_id, descendant_id)
+            count = existing.get(key, 0) + sign * ancestor_paths * descendant_paths
+            params = {"a": ancestor_id, "d": descendant_id, "n": count}
+            if key not in existing:
+                if count > 0:
+                    inserts.append({"ancestor_id": ancestor_id, "descendant_id": descendant_id, "path_count": count})
+            elif count > 0:
+                updates.append(params)
+            else:
+                deletes.append(params)
+
+    match = (c.ancestor_id == bindparam("a")) & (c.descendant_id == bindparam("d"))
+    if inserts:
+        connection.execute(insert(closure), inserts)
+    if updates:
+        connection.execute(update(closure).where(match).values(path_count=bindparam("n")), updates)
+    if deletes:
+        connection.execute(delete(closure).where(match), deletes)
+
+
+@event.listens_for(ProductComponent, "after_insert")
+def receive_component_insert(mapper: object, connection: Any, target: ProductComponent) -> None:
+    """Agrega al cierre los caminos de la nueva arista."""
+    apply_bom_edge(connection, target.parent_id, target.component_id, 1)
+
+
+@event.listens_for(ProductComponent, "after_delete")
+def receive_component_delete(mapper: object, connection: Any, target: ProductComponent) -> None:
+    """Quita del cierre los caminos de la arista eliminada."""
+    apply_bom_edge(connection, target.parent_id, target.component_id, -1)
+
+
+@event.listens_for(ProductComponent, "after_update")
+def receive_component_update(mapper: object, connection: Any, target: ProductComponent) -> None:
+    """Si la arista cambió de extremos, mueve sus caminos (cambios de cantidad no afectan)."""
+    state = inspect(target)
+    parent = state.attrs.parent_id.history
+    component = state.attrs.component_id.history
+    if not parent.deleted and not component.deleted:
+        return
+
+    old_parent = parent.deleted[0] if parent.deleted else target.parent_id
+    old_component = component.deleted[0] if component.deleted else target.component_id
+    apply_bom_edge(connection, old_parent, old_component, -1)
+    apply_bom_edge(connection, target.parent_id, target.component_id, 1)
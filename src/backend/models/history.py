@@ -0,0 +1,348 @@
+"""
+Historial de cambios (append-only) de cotizaciones, órdenes y facturas.
+
+Cada flush que crea, modifica o elimina una entidad registrada en
+``HISTORY_ENTITIES`` deja una fila en ``change_history`` con el diff campo
+a campo tomado del historial de atributos del ORM::
+
+    {"status_id": [1, 2], "total": ["100.00", "119.00"]}
+
+Las filas se arman en un listener ``after_flush`` de Session y quedan
+pendientes en ``session.info`` hasta el commit; un rollback (incluido el de
+un savepoint) o un close sin commit descarta las de la transacción
+revertida. Al hacer commit se entregan a ``history_writer``:
+
+- con el worker en marcha (la app lo inicia en el lifespan), se encolan y
+  un hilo en segundo plano las inserta por lotes: la request no paga los
+  INSERT extra;
+- sin worker (scripts, tests) se insertan en el acto, en una transacción
+  propia sobre el engine de la sesión.
+
+Con un engine de StaticPool (SQLite de desarrollo) todo el proceso comparte
+una sola conexión DBAPI: un commit desde otra transacción confirmaría o
+revertiría a medias las de las requests en curso. Ahí no hay worker ni
+pendientes: las filas se insertan en el mismo flush, dentro de la
+transacción de la sesión, y se confirman o revierten con ella.
+
+Solo se registran los cambios que pasan por el flush: los UPDATE masivos
+(``update_many``, recálculo de totales en SQL) no dejan historial.
+"""
+
+import enum
+import queue
+import threading
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Index, String, event, insert, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Mapped, Session, SessionTransaction, mapped_column
+from sqlalchemy.pool import StaticPool
+
+from src.backend.utils.logger import logger
+
+from .base import Base
+from .business.invoices import InvoiceExport, InvoiceSII
+from .business.orders import Order
+from .business.quotes import Quote
+
+HISTORY_ENTITIES: dict[str, type] = {
+    "quote": Quote,
+    "order": Order,
+    "invoice_sii": InvoiceSII,
+    "invoice_export": InvoiceExport,
+}
+
+_ENTITY_BY_MODEL = {model: entity_type for entity_type, model in HISTORY_ENTITIES.items()}
+
+# Columnas que cambian en cada escritura y no aportan al historial
+_IGNORED_FIELDS = frozenset({"created_at", "updated_at", "created_by_id", "updated_by_id"})
+
+_PENDING_KEY = "change_history"
+
+
+class ChangeHistory(Base):
+    """
+    Registro de un cambio sobre una entidad.
+
+    Attributes:
+        id: Primary key
+        entity_type: Tipo de entidad (quote, order, invoice_sii, invoice_export)
+        entity_id: ID de la entidad
+        action: create, update o delete
+        changes: Campo -> [valor anterior, valor nuevo]
+        user_id: Usuario de la sesión (session.info["user_id"])
+        ts: Momento del flush (UTC)
+    """
+
+    __tablename__ = "change_history"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    entity_type: Mapped[str] = mapped_column(String(20), comment="Entity type")
+    entity_id: Mapped[int] = mapped_column(comment="Entity ID")
+    action: Mapped[str] = mapped_column(String(10), comment="create, update or delete")
+    changes: Mapped[dict[str, Any]] = mapped_column(JSON, comment="Field -> [old, new]")
+    user_id: Mapped[int | None] = mapped_column(comment="User ID who made the change")
+    ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), comment="UTC timestamp of the change")
+
+    __table_args__ = (
+        Index("ix_change_history_entity", "entity_type", "entity_id", "ts"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ChangeHistory({self.entity_type}#{self.entity_id} {self.action} at {self.ts})>"
+
+
+def _jsonable(value: Any) -> Any:
+    """Valor apto para la columna JSON (Decimal y fechas como texto, enums por valor)."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def shares_connection(bind: Engine) -> bool:
+    """Si todo el proceso usa una sola conexión del engine (StaticPool)."""
+    return isinstance(bind.pool, StaticPool)
+
+
+def entity_changes(entity: Any, action: str) -> dict[str, list[Any]]:
+    """
+    Diff campo a campo de una entidad en el flush en curso.
+
+    Args:
+        entity: Instancia de un modelo de HISTORY_ENTITIES
+        action: create, update o delete
+
+    Returns:
+        Campo -> [anterior, nuevo]. En create el anterior es None (solo
+        campos con valor); en delete el diff va vacío.
+    """
+    if action == "delete":
+        return {}
+
+    state = inspect(entity)
+    changes: dict[str, list[Any]] = {}
+    for attr in state.mapper.column_attrs:
+        key = attr.key
+        if key in _IGNORED_FIELDS:
+            continue
+        if action == "create":
+            value = state.dict.get(key)
+            if value is not None:
+                changes[key] = [None, _jsonable(value)]
+            continue
+
+        history = state.attrs[key].history
+        if not history.added and not history.deleted:
+            continue
+        old = history.deleted[0] if history.deleted else None
+        new = history.added[0] if history.added else None
+        if old != new:
+            changes[key] = [_jsonable(old), _jsonable(new)]
+    return changes
+
+
+class HistoryWriter:
+    """
+    Escritura diferida del historial con un hilo en segundo plano.
+
+    Attributes:
+        batch_size: Máximo de filas por INSERT
+        interval: Segundos que el worker espera filas nuevas antes de volver
+            a revisar si debe detenerse
+
+    Example:
+        history_writer.start(engine)  # lifespan de la app
+        ...
+        history_writer.stop()  # escribe lo pendiente antes de salir
+    """
+
+    def __init__(self, batch_size: int = 500, interval: float = 1.0):
+        self.batch_size = batch_size
+        self.interval = interval
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue()
+        self._bind: Engine | None = None
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """Si el worker está en marcha."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, bind: Engine) -> None:
+        """
+        Inicia el worker.
+
+        Con StaticPool no se inicia: el hilo compartiría la conexión de las
+        requests (ver shares_connection).
+
+        Args:
+            bind: Engine síncrono donde se insertan los lotes
+        """
+        if self.running:
+            return
+        if shares_connection(bind):
+            logger.info("Historial de cambios sin worker: el engine comparte una sola conexión")
+            return
+        self._bind = bind
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Detiene el worker después de escribir las filas encoladas."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def write(self, bind: Engine, rows: list[dict[str, Any]]) -> None:
+        """
+        Entrega filas ya confirmadas: las encola o, sin worker, las inserta.
+
+        Args:
+            bind: Engine de la sesión (solo se usa sin worker)
+            rows: Filas de ChangeHistory
+        """
+        if not self.running:
+            self._insert(bind, rows)
+            return
+        for row in rows:
+            self._queue.put(row)
+
+    def _insert(self, bind: Engine, rows: list[dict[str, Any]]) -> None:
+        with bind.begin() as connection:
+            connection.execute(insert(ChangeHistory), rows)
+
+    def _next_batch(self) -> list[dict[str, Any]]:
+        """Espera hasta ``interval`` la primera fila y junta las disponibles."""
+        try:
+            batch = [self._queue.get(timeout=self.interval)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch:
+                try:
+                    self._insert(self._bind, batch)
+                except Exception:
+                    logger.exception(f"No se pudieron escribir {len(batch)} fila(s) de historial")
+            elif self._stopping.is_set():
+                return
+
+
+history_writer = HistoryWriter()
+
+
+# ========== EVENT LISTENERS ==========
+
+
+def _keep_previous_value(target: Any, value: Any, oldvalue: Any, initiator: Any) -> None:
+    """Listener vacío: solo activa active_history en el atributo."""
+
+
+# Con active_history, asignar un atributo expirado (p. ej. tras un commit)
+# carga antes el valor anterior, y el diff no pierde el "antes".
+for _model in HISTORY_ENTITIES.values():
+    for _attr in inspect(_model).column_attrs:
+        if _attr.key not in _IGNORED_FIELDS:
+            event.listen(_attr.class_attribute, "set", _keep_previous_value, active_history=True)
+
+
+def _transaction(session: Session) -> SessionTransaction | None:
+    """Transacción más interna de la sesión (savepoint o raíz)."""
+    return session.get_nested_transaction() or session.get_transaction()
+
+
+@event.listens_for(Session, "after_flush")
+def receive_after_flush_history(session: Session, flush_context: object) -> None:
+    """
+    Arma las filas de historial de las entidades del flush.
+
+    En after_flush el historial de atributos aún tiene los valores previos
+    y las PK ya están asignadas. Con StaticPool las filas se insertan en el
+    acto, en la transacción de la sesión (ver shares_connection).
+    """
+    rows: list[dict[str, Any]] = []
+    new = session.new  # Session.new arma un IdentitySet nuevo en cada acceso
+    changed = (
+        (entity, "create" if entity in new else "update") for entity in (*new, *session.dirty)
+    )
+    deleted = ((entity, "delete") for entity in session.deleted)
+    ts = None
+
+    for entity, action in (*changed, *deleted):
+        entity_type = _ENTITY_BY_MODEL.get(type(entity))
+        if entity_type is None:
+            continue
+        changes = entity_changes(entity, action)
+        if action == "update" and not changes:
+            continue
+        ts = ts or datetime.now(timezone.utc)
+        rows.append({
+            "entity_type": entity_type,
+            "entity_id": entity.id,
+            "action": action,
+            "changes": changes,
+            "user_id": session.info.get("user_id"),
+            "ts": ts,
+        })
+
+    if not rows:
+        return
+    if shares_connection(session.get_bind()):
+        session.connection().execute(insert(ChangeHistory), rows)
+    else:
+        session.info.setdefault(_PENDING_KEY, []).append((_transaction(session), rows))
+
+
+@event.listens_for(Session, "after_commit")
+def receive_after_commit_history(session: Session) -> None:
+    """Entrega el historial pendiente al confirmar la transacción raíz."""
+    if session.in_nested_transaction() or _PENDING_KEY not in session.info:
+        return
+    rows = [row for _, batch in session.info.pop(_PENDING_KEY) for row in batch]
+    history_writer.write(session.get_bind(), rows)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def receive_after_rollback_history(session: Session, previous_transaction: SessionTransaction) -> None:
+    """Descarta el historial de la transacción revertida y sus savepoints."""
+    pending = session.info.get(_PENDING_KEY)
+    if not pending:
+        return
+
+    def reverted(transaction: SessionTransaction | None) -> bool:
+        while transaction is not None:
+            if transaction is previous_transaction:
+                return True
+            transaction = transaction.parent
+        return False
+
+    kept = [(transaction, rows) for transaction, rows in pending if not reverted(transaction)]
+    if kept:
+        session.info[_PENDING_KEY] = kept
+    else:
+        session.info.pop(_PENDING_KEY)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def receive_after_transaction_end_history(session: Session, transaction: SessionTransaction) -> None:
+    """Al cerrar la transacción raíz sin commit (close, error) no queda nada pendiente."""
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
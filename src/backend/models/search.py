@@ -0,0 +1,242 @@
+"""
+Índice de búsqueda full-text.
+
+Una única tabla ``search_index`` con un documento (título + cuerpo) por cada
+empresa, producto, contacto, usuario, nota y cotización:
+
+- SQLite: tabla virtual FTS5 (tokenizer unicode61 sin acentos, índices de
+  prefijo de 2 y 3 caracteres). La clave del documento es el ``rowid``.
+- MySQL: tabla InnoDB con índice FULLTEXT sobre (title, body). La clave
+  del documento es la columna ``doc_id``.
+
+La clave es ``entity_id * 8 + código de tipo``, por lo que actualizar o
+borrar un documento es un acceso por PK en ambos motores.
+
+El índice se mantiene sincronizado con un listener ``after_flush`` de
+Session: toda entidad indexada que se crea, modifica o elimina a través del
+ORM actualiza su documento en la misma transacción. La tabla se crea junto
+con ``Base.metadata.create_all`` (y por migración en producción).
+"""
+
+from collections.abc import Callable
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import bindparam, column, event, table, text
+from sqlalchemy.orm import Session
+
+from .base import Base
+from .business.quotes import Quote
+from .core.companies import Company
+from .core.contacts import Contact
+from .core.notes import Note
+from .core.products import Product
+from .core.staff import Staff
+
+SEARCH_INDEX_TABLE = "search_index"
+
+_SQLITE_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_INDEX_TABLE} USING fts5("
+    "entity_type UNINDEXED, entity_id UNINDEXED, title, body, "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+)
+_MYSQL_DDL = (
+    f"CREATE TABLE IF NOT EXISTS {SEARCH_INDEX_TABLE} ("
+    "doc_id BIGINT NOT NULL PRIMARY KEY, "
+    "entity_type VARCHAR(20) NOT NULL, "
+    "entity_id INT NOT NULL, "
+    "title VARCHAR(255), "
+    "body TEXT, "
+    "FULLTEXT KEY ft_search_index (title, body)"
+    ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+)
+
+
+def _join(*values: Any) -> str:
+    """Concatena los valores no vacíos separados por espacio."""
+    return " ".join(str(v) for v in values if v)
+
+
+# entity_type -> (código para la clave, modelo, extractor (title, body))
+# El extractor retorna None si la entidad no debe aparecer en búsquedas.
+SEARCH_ENTITIES: dict[str, tuple[int, type, Callable[[Any], tuple[str, str] | None]]] = {
+    "company": (
+        1,
+        Company,
+        lambda c: None if c.is_deleted else (
+            c.name,
+            _join(c.trigram, c.phone, c.website, c.intracommunity_number, c.main_address),
+        ),
+    ),
+    "product": (
+        2,
+        Product,
+        lambda p: (
+            p.reference,
+            _join(
+                p.designation_es, p.designation_en, p.designation_fr,
+                p.short_designation, p.supplier_reference,
+            ),
+        ),
+    ),
+    "contact": (
+        3,
+        Contact,
+        lambda c: (
+            _join(c.first_name, c.last_name),
+            _join(c.email, c.phone, c.mobile, c.position),
+        ),
+    ),
+    "staff": (
+        4,
+        Staff,
+        lambda s: (
+            _join(s.first_name, s.last_name),
+            _join(s.trigram, s.username, s.email, s.position),
+        ),
+    ),
+    "note": (5, Note, lambda n: (n.title or "", n.content or "")),
+    "quote": (6, Quote, lambda q: (q.quote_number, q.subject or "")),
+}
+
+_ENTITY_BY_MODEL = {model: (entity_type, code, extract) for entity_type, (code, model, extract) in SEARCH_ENTITIES.items()}
+
+
+def search_doc_id(code: int, entity_id: int) -> int:
+    """Clave del documento en el índice para una entidad."""
+    return entity_id * 8 + code
+
+
+def search_key_column(dialect_name: str) -> str:
+    """Nombre de la columna clave del documento (rowid en FTS5, doc_id en MySQL)."""
+    return "rowid" if dialect_name == "sqlite" else "doc_id"
+
+
+def search_index_table(dialect_name: str):
+    """
+    Construct ligero de la tabla del índice para el dialecto dado.
+
+    Args:
+        dialect_name: ``sqlite`` o ``mysql``
+
+    Returns:
+        TableClause con columnas doc_id (rowid en SQLite), entity_type,
+        entity_id, title y body
+    """
+    return table(
+        SEARCH_INDEX_TABLE,
+        column(search_key_column(dialect_name)),
+        column("entity_type"),
+        column("entity_id"),
+        column("title"),
+        column("body"),
+    )
+
+
+def build_search_document(entity: Any) -> dict[str, Any] | None:
+    """
+    Construye la fila del índice para una entidad.
+
+    Args:
+        entity: Instancia de un modelo indexado
+
+    Returns:
+        Dict con doc_id, entity_type, entity_id, title y body; None si el
+        modelo no se indexa o la entidad no debe aparecer en búsquedas
+    """
+    spec = _ENTITY_BY_MODEL.get(type(entity))
+    if spec is None:
+        return None
+
+    entity_type, code, extract = spec
+    document = extract(entity)
+    if document is None:
+        return None
+
+    title, body = document
+    return {
+        "doc_id": search_doc_id(code, entity.id),
+        "entity_type": entity_type,
+        "entity_id": entity.id,
+        "title": (title or "")[:255],
+        "body": body,
+    }
+
+
+def write_search_documents(
+    connection: Any, removed: set[int], documents: list[dict[str, Any]]
+) -> None:
+    """
+    Reemplaza documentos del índice: borra las claves dadas e inserta los nuevos.
+
+    Args:
+        connection: Conexión en la transacción actual
+        removed: Claves (doc_id) a borrar (incluye las que se re-insertan)
+        documents: Filas a insertar (ver build_search_document)
+    """
+    dialect_name = connection.dialect.name
+    index = search_index_table(dialect_name)
+    key = index.c[search_key_column(dialect_name)]
+
+    if removed:
+        connection.execute(
+            index.delete().where(key == bindparam("k")),
+            [{"k": doc_id} for doc_id in removed],
+        )
+    if documents:
+        connection.execute(
+            index.insert(),
+            [{key.name: d["doc_id"], **{k: v for k, v in d.items() if k != "doc_id"}} for d in documents],
+        )
+
+
+# ========== EVENT LISTENERS ==========
+
+
+@event.listens_for(Base.metadata, "after_create")
+def create_search_index(target: Any, connection: Any, **kw: Any) -> None:
+    """Crea la tabla del índice junto con el resto del esquema."""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        connection.execute(text(_SQLITE_DDL))
+    elif dialect == "mysql":
+        connection.execute(text(_MYSQL_DDL))
+
+
+@event.listens_for(Base.metadata, "after_drop")
+def drop_search_index(target: Any, connection: Any, **kw: Any) -> None:
+    """Elimina la tabla del índice junto con el resto del esquema."""
+    connection.execute(text(f"DROP TABLE IF EXISTS {SEARCH_INDEX_TABLE}"))
+
+
+@event.listens_for(Session, "after_flush")
+def receive_after_flush_search(session: Session, flush_context: object) -> None:
+    """
+    Sincroniza el índice con las entidades indexadas del flush.
+
+    En after_flush las colecciones new/dirty/deleted aún reflejan el estado
+    previo al flush y las PK ya están asignadas.
+    """
+    removed: set[int] = set()
+    documents: list[dict[str, Any]] = []
+    new = session.new  # Session.new arma un IdentitySet nuevo en cada acceso
+
+    for entity in chain(new, session.dirty):
+        spec = _ENTITY_BY_MODEL.get(type(entity))
+        if spec is None:
+            continue
+        if entity not in new and not session.is_modified(entity, include_collections=False):
+            continue
+
+        removed.add(search_doc_id(spec[1], entity.id))
+        document = build_search_document(entity)
+        if document:
+            documents.append(document)
+
+    for entity in session.deleted:
+        spec = _ENTITY_BY_MODEL.get(type(entity))
+        if spec is not None:
+            removed.add(search_doc_id(spec[1], entity.id))
+
+    if removed:
+        write_search_documents(session.connection(), removed, documents)
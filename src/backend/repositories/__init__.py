@@ -15,6 +15,7 @@ Uso recomendado:
 """
 
 from src.backend.repositories.base import IRepository, BaseRepository, GenericLookupRepository
+from src.backend.repositories.async_base import AsyncBaseRepository
 from src.backend.repositories.factory import RepositoryFactory, Repos
 
 __all__ = [
@@ -22,6 +23,7 @@ __all__ = [
     "IRepository",
     "BaseRepository",
     "GenericLookupRepository",
+    "AsyncBaseRepository",
     # Factory
     "RepositoryFactory",
     "Repos",  # Alias
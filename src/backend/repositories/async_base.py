@@ -0,0 +1,471 @@
+"""
+Repositorio base asíncrono.
+
+Variante de BaseRepository que trabaja sobre AsyncSession. Expone las mismas
+operaciones CRUD como corutinas para que los endpoints ``async def`` puedan
+acceder a la base de datos sin bloquear el event loop.
+"""
+
+from collections.abc import Sequence
+from typing import Generic, TypeVar
+
+from sqlalchemy import delete, func, literal, select, update
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase
+
+from src.backend.exceptions.repository import NotFoundException
+from src.backend.repositories.base import BaseRepository
+from src.backend.repositories.loading import LoadProfile
+from src.backend.repositories.pagination import keyset_select, split_page
+from src.backend.utils.logger import logger
+
+T = TypeVar("T", bound=DeclarativeBase)
+
+
+class AsyncBaseRepository(Generic[T]):
+    """
+    Implementación base asíncrona del patrón Repository.
+
+    Mantiene la misma API que BaseRepository (mismos nombres, argumentos y
+    semántica de flush sin commit), pero cada método es una corutina.
+
+    Attributes:
+        session: Sesión asíncrona de SQLAlchemy
+        model: Clase del modelo SQLAlchemy
+
+    Example:
+        class AsyncCompanyRepository(AsyncBaseRepository[Company]):
+            async def get_by_trigram(self, trigram: str) -> Company | None:
+                stmt = select(Company).filter(Company.trigram == trigram)
+                return (await self.session.execute(stmt)).scalar_one_or_none()
+    """
+
+    __slots__ = ("session", "model")
+
+    # La construcción de queries no toca la sesión, se comparte con la
+    # versión síncrona para que ambos caminos filtren y ordenen igual.
+    _build_query = BaseRepository._build_query
+    _apply_filters = BaseRepository._apply_filters
+    _list_select = BaseRepository._list_select
+    _load_options = BaseRepository._load_options
+    _row_select = BaseRepository._row_select
+
+    # Relaciones que carga cada perfil de respuesta (ver loading.py)
+    load_profiles: dict[LoadProfile, tuple] = {}
+    list_schema: type | None = None
+    list_columns: dict[str, object] = {}
+    list_joins: tuple = ()
+
+    # Contrato de listados (ver listing.py): columnas expuestas a ?sort= y ?q=
+    sortable_columns: tuple[str, ...] = ("id",)
+    searchable_columns: tuple[str, ...] = ()
+    default_sort: str = "id"
+    default_descending: bool = False
+
+    def __init__(self, session: AsyncSession, model: type[T]):
+        """
+        Inicializa el repositorio.
+
+        Args:
+            session: Sesión asíncrona de SQLAlchemy
+            model: Clase del modelo SQLAlchemy
+        """
+        self.session = session
+        self.model = model
+
+    async def get_by_id(self, id: int, profile: LoadProfile | None = None) -> T | None:
+        """
+        Obtiene una entidad por su ID.
+
+        Args:
+            id: ID de la entidad
+            profile: Perfil de carga (ver BaseRepository.get_by_id)
+
+        Returns:
+            Entidad si existe, None en caso contrario
+
+        Example:
+            company = await repository.get_by_id(123)
+        """
+        logger.debug(f"Buscando {self.model.__name__} con id={id}")
+        entity = await self.session.get(self.model, id, options=self._load_options(profile))
+
+        if entity:
+            logger.debug(f"{self.model.__name__} encontrado: id={id}")
+        else:
+            logger.debug(f"{self.model.__name__} no encontrado: id={id}")
+
+        return entity
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: str | None = None,
+        descending: bool = False,
+    ) -> Sequence[T]:
+        """
+        Obtiene todas las entidades con paginación y ordenamiento.
+
+        Args:
+            skip: Número de registros a saltar (offset)
+            limit: Número máximo de registros a retornar
+            order_by: Nombre de columna para ordenar (default: id)
+            descending: Si True, orden descendente
+
+        Returns:
+            Lista de entidades
+
+        Example:
+            companies = await repository.get_all(skip=0, limit=100)
+        """
+        logger.debug(f"Obteniendo {self.model.__name__} - skip={skip}, limit={limit}")
+        stmt = self._build_query(order_by=order_by, descending=descending, skip=skip, limit=limit)
+        result = await self.session.execute(stmt)
+        entities = result.scalars().all()
+        logger.debug(f"Encontrados {len(entities)} {self.model.__name__}(s)")
+        return entities
+
+    async def find_by(
+        self,
+        filters: dict | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: str | None = None,
+        descending: bool = False,
+    ) -> Sequence[T]:
+        """
+        Búsqueda genérica con filtros dinámicos.
+
+        Args:
+            filters: Diccionario de filtros {columna: valor}
+            skip: Número de registros a saltar
+            limit: Número máximo de registros
+            order_by: Columna para ordenar
+            descending: Orden descendente
+
+        Returns:
+            Lista de entidades que coinciden
+
+        Example:
+            active = await repository.find_by(filters={"is_active": True})
+        """
+        logger.debug(f"Buscando {self.model.__name__} con filtros={filters}")
+        stmt = self._build_query(
+            filters=filters,
+            order_by=order_by,
+            descending=descending,
+            skip=skip,
+            limit=limit,
+        )
+        result = await self.session.execute(stmt)
+        entities = result.scalars().all()
+        logger.debug(f"Encontrados {len(entities)} {self.model.__name__}(s) con filtros")
+        return entities
+
+    async def get_page(
+        self,
+        filters: dict | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> tuple[list[T], str | None]:
+        """
+        Obtiene una página usando paginación por cursor (keyset).
+
+        Args:
+            filters: Diccionario de filtros {columna: valor}
+            order_by: Columna para ordenar (default: id)
+            descending: Orden descendente
+            limit: Tamaño de página
+            after: Cursor retornado por la página anterior (None = primera)
+
+        Returns:
+            Tupla (entidades, next_cursor). next_cursor es None en la última página.
+        """
+        stmt = self._apply_filters(select(self.model).options(*self._load_options(LoadProfile.LIST)), filters)
+        return await self._paginate(stmt, order_by, descending, limit, after)
+
+    async def get_list(
+        self,
+        filters: dict | None = None,
+        sort: str | None = None,
+        descending: bool | None = None,
+        search: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[T], int]:
+        """
+        Obtiene una página ordenada y filtrada junto con el total de filas.
+
+        Ver BaseRepository.get_list.
+
+        Returns:
+            Tupla (entidades de la página, total que cumple el filtro)
+
+        Raises:
+            ValidationException: Si ``sort`` no está permitido
+        """
+        page_stmt, count_stmt = self._list_select(filters, sort, descending, search, skip, limit)
+        total = (await self.session.execute(count_stmt)).scalar_one()
+        entities = list((await self.session.execute(page_stmt)).scalars().all())
+        return entities, total
+
+    async def get_rows(
+        self,
+        filters: dict | None = None,
+        sort: str | None = None,
+        descending: bool | None = None,
+        search: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[RowMapping]:
+        """
+        Página del listado como filas con los campos de ``list_schema``.
+
+        Ver BaseRepository.get_rows.
+        """
+        page_stmt, _ = self._list_select(filters, sort, descending, search, skip, limit, rows=True)
+        return list((await self.session.execute(page_stmt)).mappings().all())
+
+    async def get_list_rows(
+        self,
+        filters: dict | None = None,
+        sort: str | None = None,
+        descending: bool | None = None,
+        search: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[RowMapping], int]:
+        """
+        get_rows junto con el total de filas (ver BaseRepository.get_list_rows).
+
+        Returns:
+            Tupla (filas de la página, total que cumple el filtro)
+        """
+        page_stmt, count_stmt = self._list_select(filters, sort, descending, search, skip, limit, rows=True)
+        total = (await self.session.execute(count_stmt)).scalar_one()
+        return list((await self.session.execute(page_stmt)).mappings().all()), total
+
+    async def _paginate(
+        self,
+        stmt,
+        order_by: str | None,
+        descending: bool,
+        limit: int,
+        after: str | None,
+    ) -> tuple[list[T], str | None]:
+        """Ejecuta un select con paginación keyset (ver BaseRepository._paginate)."""
+        stmt, columns = keyset_select(stmt, self.model, order_by, descending, limit, after)
+        rows = (await self.session.execute(stmt)).scalars().all()
+        return split_page(rows, limit, columns)
+
+    async def exists(self, id: int) -> bool:
+        """
+        Verifica si existe una entidad por su ID.
+
+        Args:
+            id: ID de la entidad
+
+        Returns:
+            True si existe, False en caso contrario
+        """
+        stmt = select(literal(1)).select_from(self.model).filter(self.model.id == id)
+        result = (await self.session.execute(stmt)).scalar()
+        return result is not None
+
+    async def create(self, entity: T) -> T:
+        """
+        Crea una nueva entidad.
+
+        Args:
+            entity: Entidad a crear
+
+        Returns:
+            Entidad creada con ID asignado
+
+        Note:
+            Esta operación hace flush() pero NO commit().
+        """
+        logger.debug(f"Creando {self.model.__name__}")
+        self.session.add(entity)
+        await self.session.flush()
+        logger.info(f"{self.model.__name__} creado con id={entity.id}")
+        return entity
+
+    async def update(self, entity: T) -> T:
+        """
+        Actualiza una entidad existente.
+
+        Args:
+            entity: Entidad a actualizar (debe tener ID)
+
+        Returns:
+            Entidad actualizada (merged)
+
+        Raises:
+            NotFoundException: Si la entidad no existe
+
+        Note:
+            Esta operación hace flush() pero NO commit().
+        """
+        logger.debug(f"Actualizando {self.model.__name__} con id={entity.id}")
+
+        if not await self.exists(entity.id):
+            raise NotFoundException(
+                f"{self.model.__name__} no encontrado",
+                details={"id": entity.id}
+            )
+
+        merged = await self.session.merge(entity)
+        await self.session.flush()
+        logger.info(f"{self.model.__name__} actualizado: id={entity.id}")
+        return merged
+
+    async def delete(self, id: int) -> None:
+        """
+        Elimina una entidad permanentemente (hard delete).
+
+        Args:
+            id: ID de la entidad a eliminar
+
+        Raises:
+            NotFoundException: Si la entidad no existe
+
+        Note:
+            Esta operación hace flush() pero NO commit().
+        """
+        logger.debug(f"Eliminando {self.model.__name__} con id={id}")
+
+        entity = await self.get_by_id(id)
+        if not entity:
+            raise NotFoundException(
+                f"{self.model.__name__} no encontrado",
+                details={"id": id}
+            )
+
+        await self.session.delete(entity)
+        await self.session.flush()
+        logger.warning(f"{self.model.__name__} eliminado permanentemente: id={id}")
+
+    async def soft_delete(self, id: int, user_id: int) -> None:
+        """
+        Elimina una entidad de forma lógica (soft delete).
+
+        Args:
+            id: ID de la entidad a eliminar
+            user_id: ID del usuario que realiza la eliminación
+
+        Raises:
+            NotFoundException: Si la entidad no existe
+            NotImplementedError: Si el modelo no soporta soft delete
+        """
+        logger.debug(f"Soft delete {self.model.__name__} con id={id}")
+
+        entity = await self.get_by_id(id)
+        if not entity:
+            raise NotFoundException(
+                f"{self.model.__name__} no encontrado",
+                details={"id": id}
+            )
+
+        if not hasattr(entity, "is_deleted"):
+            raise NotImplementedError(
+                f"{self.model.__name__} no soporta soft delete (falta SoftDeleteMixin)"
+            )
+
+        entity.is_deleted = True
+        entity.deleted_by_id = user_id
+        await self.session.flush()
+        logger.info(f"{self.model.__name__} marcado como eliminado: id={id}")
+
+    async def count(self) -> int:
+        """
+        Cuenta el total de entidades.
+
+        Returns:
+            Número total de entidades
+        """
+        stmt = select(func.count()).select_from(self.model)
+        count = (await self.session.execute(stmt)).scalar() or 0
+        logger.debug(f"Total {self.model.__name__}: {count}")
+        return count
+
+    # =========================================================================
+    # Bulk Operations
+    # =========================================================================
+
+    async def create_many(self, entities: list[T]) -> list[T]:
+        """
+        Crea múltiples entidades en una operación.
+
+        Args:
+            entities: Lista de entidades a crear
+
+        Returns:
+            Lista de entidades creadas con IDs asignados
+        """
+        if not entities:
+            return []
+
+        logger.debug(f"Creando {len(entities)} {self.model.__name__}(s) en bulk")
+        self.session.add_all(entities)
+        await self.session.flush()
+        logger.info(f"{len(entities)} {self.model.__name__}(s) creados en bulk")
+        return entities
+
+    async def update_many(self, ids: list[int], values: dict) -> int:
+        """
+        Actualiza múltiples registros por IDs.
+
+        Args:
+            ids: Lista de IDs a actualizar
+            values: Diccionario con columnas y valores a actualizar
+
+        Returns:
+            Número de filas actualizadas
+
+        Note:
+            Igual que BaseRepository.update_many, completa updated_by_id con
+            el ``user_id`` de la sesión.
+        """
+        if not ids or not values:
+            return 0
+
+        user_id = self.session.info.get("user_id")
+        if user_id is not None and hasattr(self.model, "updated_by_id"):
+            values = {"updated_by_id": user_id, **values}
+
+        logger.debug(f"Actualizando {len(ids)} {self.model.__name__}(s) en bulk")
+        stmt = update(self.model).where(self.model.id.in_(ids)).values(**values)
+        result = await self.session.execute(stmt)
+        await self.session.flush()
+        rowcount = result.rowcount
+        logger.info(f"{rowcount} {self.model.__name__}(s) actualizados en bulk")
+        return rowcount
+
+    async def delete_many(self, ids: list[int]) -> int:
+        """
+        Elimina múltiples registros por IDs.
+
+        Args:
+            ids: Lista de IDs a eliminar
+
+        Returns:
+            Número de filas eliminadas
+
+        Warning:
+            Esta operación es PERMANENTE. Considera usar soft delete.
+        """
+        if not ids:
+            return 0
+
+        logger.debug(f"Eliminando {len(ids)} {self.model.__name__}(s) en bulk")
+        stmt = delete(self.model).where(self.model.id.in_(ids))
+        result = await self.session.execute(stmt)
+        await self.session.flush()
+        rowcount = result.rowcount
+        logger.warning(f"{rowcount} {self.model.__name__}(s) eliminados permanentemente en bulk")
+        return rowcount
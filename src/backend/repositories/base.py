@@ -6,13 +6,22 @@ todos los repositorios específicos de la aplicación.
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from typing import Generic, TypeVar
 
-from sqlalchemy import select, func, exists, literal, update, delete
+from sqlalchemy import select, func, exists, literal, insert, update, delete
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.orm import DeclarativeBase, Session
 
 from src.backend.exceptions.repository import NotFoundException
+from src.backend.repositories.listing import (
+    list_select,
+    order_for_list,
+    resolve_sort,
+    search_condition,
+)
+from src.backend.repositories.loading import LoadProfile, profile_options, projection, row_select
+from src.backend.repositories.pagination import keyset_select, split_page
 from src.backend.utils.logger import logger
 
 # TypeVar genérico con bound a DeclarativeBase para mejor tipado
@@ -28,7 +37,7 @@ class IRepository(ABC, Generic[T]):
     """
 
     @abstractmethod
-    def get_by_id(self, id: int) -> T | None:
+    def get_by_id(self, id: int, profile: LoadProfile | None = None) -> T | None:
         """Obtener entidad por ID."""
         pass
 
@@ -68,6 +77,8 @@ class BaseRepository(IRepository[T], Generic[T]):
     Attributes:
         session: Sesión de SQLAlchemy para operaciones de DB
         model: Clase del modelo SQLAlchemy
+        load_profiles: Options de carga por perfil de respuesta (ver loading.py)
+        list_schema: Schema de los listados; LIST carga solo sus columnas (ver loading.py)
 
     Example:
         class CompanyRepository(BaseRepository[Company]):
@@ -77,6 +88,22 @@ class BaseRepository(IRepository[T], Generic[T]):
 
     __slots__ = ("session", "model")
 
+    # Contrato de listados (ver listing.py): columnas expuestas a ?sort= y ?q=
+    sortable_columns: tuple[str, ...] = ("id",)
+    searchable_columns: tuple[str, ...] = ()
+    default_sort: str = "id"
+    default_descending: bool = False
+
+    # Relaciones que carga cada perfil de respuesta (ver loading.py)
+    load_profiles: dict[LoadProfile, tuple] = {}
+    # Schema de listado: LIST difiere las columnas que no serializa y
+    # get_rows/get_list_rows lo arman desde filas Core, sin entidades
+    list_schema: type | None = None
+    # Campos de list_schema que no son columnas del modelo {campo: columna}
+    # y las relaciones a unir para leerlos
+    list_columns: dict[str, object] = {}
+    list_joins: tuple = ()
+
     def __init__(self, session: Session, model: type[T]):
         """
         Inicializa el repositorio.
@@ -88,12 +115,14 @@ class BaseRepository(IRepository[T], Generic[T]):
         self.session = session
         self.model = model
 
-    def get_by_id(self, id: int) -> T | None:
+    def get_by_id(self, id: int, profile: LoadProfile | None = None) -> T | None:
         """
         Obtiene una entidad por su ID.
 
         Args:
             id: ID de la entidad
+            profile: Perfil de carga (None = solo la entidad, lo que usan
+                las escrituras; DETAIL = lo que lee el schema de detalle)
 
         Returns:
             Entidad si existe, None en caso contrario
@@ -104,7 +133,7 @@ class BaseRepository(IRepository[T], Generic[T]):
                 print(company.name)
         """
         logger.debug(f"Buscando {self.model.__name__} con id={id}")
-        entity = self.session.get(self.model, id)
+        entity = self.session.get(self.model, id, options=self._load_options(profile))
 
         if entity:
             logger.debug(f"{self.model.__name__} encontrado: id={id}")
@@ -191,6 +220,292 @@ class BaseRepository(IRepository[T], Generic[T]):
         logger.debug(f"Encontrados {len(entities)} {self.model.__name__}(s) con filtros")
         return entities
 
+    def get_page(
+        self,
+        filters: dict | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> tuple[list[T], str | None]:
+        """
+        Obtiene una página usando paginación por cursor (keyset).
+
+        A diferencia de get_all/find_by (OFFSET), el costo de cada página no
+        crece con su profundidad. El orden siempre incluye ``id`` como
+        desempate para que el cursor sea estable.
+
+        Args:
+            filters: Diccionario de filtros {columna: valor}
+            order_by: Columna para ordenar (default: id)
+            descending: Orden descendente
+            limit: Tamaño de página
+            after: Cursor retornado por la página anterior (None = primera)
+
+        Returns:
+            Tupla (entidades, next_cursor). next_cursor es None en la última página.
+
+        Raises:
+            ValidationException: Si el cursor es inválido
+
+        Example:
+            page, cursor = repository.get_page(order_by="name", limit=50)
+            while cursor:
+                page, cursor = repository.get_page(order_by="name", limit=50, after=cursor)
+        """
+        stmt = self._apply_filters(select(self.model).options(*self._load_options(LoadProfile.LIST)), filters)
+        return self._paginate(stmt, order_by, descending, limit, after)
+
+    def _paginate(
+        self,
+        stmt,
+        order_by: str | None,
+        descending: bool,
+        limit: int,
+        after: str | None,
+    ) -> tuple[list[T], str | None]:
+        """
+        Ejecuta un select con paginación keyset.
+
+        Permite a los repositorios específicos paginar sus propios selects
+        (con options de eager loading, filtros, etc.) sin ORDER BY/LIMIT.
+
+        Args:
+            stmt: Select base sin ordenamiento ni límite
+            order_by: Columna para ordenar (default: id)
+            descending: Orden descendente
+            limit: Tamaño de página
+            after: Cursor de la página anterior
+
+        Returns:
+            Tupla (entidades, next_cursor)
+        """
+        logger.debug(
+            f"Página keyset de {self.model.__name__} - order_by={order_by}, "
+            f"limit={limit}, after={after}"
+        )
+        stmt, columns = keyset_select(stmt, self.model, order_by, descending, limit, after)
+        rows = self.session.execute(stmt).scalars().all()
+        return split_page(rows, limit, columns)
+
+    def get_list(
+        self,
+        filters: dict | None = None,
+        sort: str | None = None,
+        descending: bool | None = None,
+        search: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[T], int]:
+        """
+        Obtiene una página ordenada y filtrada junto con el total de filas.
+
+        Es el contrato de las tablas con origen de datos remoto: solo se
+        cargan las filas visibles y el total sale de un COUNT sobre el mismo
+        filtro.
+
+        Args:
+            filters: Filtros de igualdad {columna: valor}
+            sort: Columna de orden, debe estar en ``sortable_columns``
+                (None = ``default_sort``)
+            descending: Orden descendente (None = dirección por defecto)
+            search: Texto a buscar en ``searchable_columns``
+            skip: Offset de la página
+            limit: Tamaño de página
+
+        Returns:
+            Tupla (entidades de la página, total que cumple el filtro)
+
+        Raises:
+            ValidationException: Si ``sort`` no está permitido
+
+        Example:
+            items, total = repository.get_list(sort="name", search="ak", skip=50, limit=25)
+        """
+        page_stmt, count_stmt = self._list_select(filters, sort, descending, search, skip, limit)
+        total = self.session.execute(count_stmt).scalar_one()
+        entities = list(self.session.execute(page_stmt).scalars().all())
+        logger.debug(f"Listado de {self.model.__name__}: {len(entities)} de {total}")
+        return entities, total
+
+    def get_rows(
+        self,
+        filters: dict | None = None,
+        sort: str | None = None,
+        descending: bool | None = None,
+        search: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[RowMapping]:
+        """
+        Página del listado como filas con los campos de ``list_schema``.
+
+        Fast path de los listados: ejecuta un select Core de las columnas
+        del schema (ver loading.row_select) y no construye entidades. Mismo
+        filtro, búsqueda y orden que get_list.
+
+        Args:
+            filters: Filtros de igualdad {columna: valor}
+            sort: Columna de orden, debe estar en ``sortable_columns``
+            descending: Orden descendente (None = dirección por defecto)
+            search: Texto a buscar en ``searchable_columns``
+            skip: Offset de la página
+            limit: Tamaño de página
+
+        Returns:
+            Filas (mappings) listas para ``TypeAdapter(list[list_schema])``
+
+        Raises:
+            ValidationException: Si ``sort`` no está permitido
+
+        Example:
+            rows = repository.get_rows(sort="id", limit=1000)
+            items = TypeAdapter(list[QuoteListResponse]).validate_python(rows)
+        """
+        page_stmt, _ = self._list_select(filters, sort, descending, search, skip, limit, rows=True)
+        return list(self.session.execute(page_stmt).mappings().all())
+
+    def get_list_rows(
+        self,
+        filters: dict | None = None,
+        sort: str | None = None,
+        descending: bool | None = None,
+        search: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[RowMapping], int]:
+        """
+        get_rows junto con el total de filas (ver get_list).
+
+        Returns:
+            Tupla (filas de la página, total que cumple el filtro)
+
+        Raises:
+            ValidationException: Si ``sort`` no está permitido
+        """
+        page_stmt, count_stmt = self._list_select(filters, sort, descending, search, skip, limit, rows=True)
+        total = self.session.execute(count_stmt).scalar_one()
+        return list(self.session.execute(page_stmt).mappings().all()), total
+
+    def _list_select(
+        self,
+        filters: dict | None,
+        sort: str | None,
+        descending: bool | None,
+        search: str | None,
+        skip: int,
+        limit: int,
+        rows: bool = False,
+    ):
+        """Construye las queries de página y total de get_list (o get_list_rows con ``rows``)."""
+        sort, descending = resolve_sort(
+            sort, descending, self.sortable_columns, self.default_sort, self.default_descending
+        )
+        logger.debug(
+            f"Listado de {self.model.__name__} - sort={sort}, descending={descending}, "
+            f"search={search}, filters={filters}, skip={skip}, limit={limit}"
+        )
+        stmt = self._apply_filters(select(self.model), filters)
+        condition = search_condition(self.model, search, self.searchable_columns)
+        if condition is not None:
+            stmt = stmt.where(condition)
+
+        page_stmt, count_stmt = list_select(stmt, self.model, sort, descending, skip, limit)
+        if rows:
+            row_stmt = self._row_select()
+            if stmt.whereclause is not None:
+                row_stmt = row_stmt.where(stmt.whereclause)
+            page_stmt = order_for_list(row_stmt, self.model, sort, descending).offset(skip).limit(limit)
+            return page_stmt, count_stmt
+        return page_stmt.options(*self._load_options(LoadProfile.LIST)), count_stmt
+
+    def _row_select(self):
+        """Select Core de los campos de ``list_schema`` (fast path de listados)."""
+        if self.list_schema is None:
+            raise TypeError(f"{type(self).__name__} no declara list_schema")
+        return row_select(self.model, self.list_schema, self.list_columns, self.list_joins)
+
+    def iter_list(
+        self,
+        filters: dict | None = None,
+        sort: str | None = None,
+        descending: bool | None = None,
+        search: str | None = None,
+        batch_size: int = 1000,
+        profile: LoadProfile | None = LoadProfile.LIST,
+        options: Sequence = (),
+    ) -> Iterator[T]:
+        """
+        Recorre el listado completo (mismo filtro y orden que get_list) por lotes.
+
+        Usa ``yield_per``: las filas se leen del cursor de a ``batch_size``
+        y solo ese lote vive en memoria, así una exportación de cientos de
+        miles de filas ocupa lo mismo que una de cien. El orden se valida al
+        llamar (no al iterar) para poder responder 400 antes de empezar a
+        transmitir.
+
+        Args:
+            filters: Filtros de igualdad {columna: valor}
+            sort: Columna de orden, debe estar en ``sortable_columns``
+            descending: Orden descendente (None = dirección por defecto)
+            search: Texto a buscar en ``searchable_columns``
+            batch_size: Filas por lote leído del cursor
+            profile: Perfil de carga (None = solo ``options``)
+            options: Options de carga adicionales a las del perfil
+                (p. ej. las relaciones que se exportan)
+
+        Returns:
+            Iterador de entidades; la sesión debe seguir abierta mientras se recorre
+
+        Raises:
+            ValidationException: Si ``sort`` no está permitido
+
+        Example:
+            for quote in repository.iter_list(filters={"status_id": 2}):
+                writer.writerow(...)
+        """
+        sort, descending = resolve_sort(
+            sort, descending, self.sortable_columns, self.default_sort, self.default_descending
+        )
+        logger.debug(
+            f"Recorrido de {self.model.__name__} - sort={sort}, descending={descending}, "
+            f"search={search}, filters={filters}, batch_size={batch_size}"
+        )
+        stmt = self._apply_filters(select(self.model), filters)
+        condition = search_condition(self.model, search, self.searchable_columns)
+        if condition is not None:
+            stmt = stmt.where(condition)
+        stmt = order_for_list(stmt, self.model, sort, descending).options(
+            *self._load_options(profile), *options
+        )
+        return iter(self.session.scalars(stmt.execution_options(yield_per=batch_size)))
+
+    def _load_options(self, profile: LoadProfile | None) -> tuple:
+        """Options de carga de ``profile`` según ``load_profiles`` y ``list_schema``."""
+        options = profile_options(self.model, self.load_profiles, profile)
+        if profile is LoadProfile.LIST and self.list_schema is not None:
+            # Columnas del modelo que list_columns expone con otro nombre
+            renamed = tuple(
+                column.key for column in self.list_columns.values()
+                if getattr(column, "class_", None) is self.model
+            )
+            options += (projection(self.model, self.list_schema, self.sortable_columns + renamed),)
+        return options
+
+    def _apply_filters(self, stmt, filters: dict | None):
+        """
+        Aplica filtros de igualdad {columna: valor} a un select.
+
+        Los valores None y las columnas inexistentes se ignoran.
+        """
+        if filters:
+            for column_name, value in filters.items():
+                if value is not None:
+                    column = getattr(self.model, column_name, None)
+                    if column is not None:
+                        stmt = stmt.filter(column == value)
+        return stmt
+
     def _build_query(
         self,
         filters: dict | None = None,
@@ -198,6 +513,7 @@ class BaseRepository(IRepository[T], Generic[T]):
         descending: bool = False,
         skip: int = 0,
         limit: int = 100,
+        profile: LoadProfile | None = LoadProfile.LIST,
     ):
         """
         Construye query dinámicamente con filtros, ordenamiento y paginación.
@@ -210,6 +526,7 @@ class BaseRepository(IRepository[T], Generic[T]):
             descending: Si True, orden descendente
             skip: Offset para paginación
             limit: Límite de resultados
+            profile: Perfil de carga de las filas (default: LIST)
 
         Returns:
             Select statement configurado
@@ -218,15 +535,7 @@ class BaseRepository(IRepository[T], Generic[T]):
             Los filtros None son ignorados automáticamente.
             Las columnas inexistentes en filters son ignoradas silenciosamente.
         """
-        stmt = select(self.model)
-
-        # Aplicar filtros
-        if filters:
-            for column_name, value in filters.items():
-                if value is not None:
-                    column = getattr(self.model, column_name, None)
-                    if column is not None:
-                        stmt = stmt.filter(column == value)
+        stmt = self._apply_filters(select(self.model).options(*self._load_options(profile)), filters)
 
         # Aplicar ordenamiento
         if order_by:
@@ -449,6 +758,47 @@ class BaseRepository(IRepository[T], Generic[T]):
         logger.info(f"{len(entities)} {self.model.__name__}(s) creados en bulk")
         return entities
 
+    def bulk_insert(self, rows: list[dict]) -> int:
+        """
+        Inserta múltiples registros con un INSERT masivo (executemany).
+
+        A diferencia de create_many() no crea instancias ORM ni recupera los
+        IDs, así que no se ejecutan los @validates del modelo ni los eventos
+        de flush (índice de búsqueda). Los defaults de columna sí se aplican
+        y, si la sesión tiene ``user_id``, se completan created_by_id y
+        updated_by_id como en los eventos de auditoría del flush.
+
+        Args:
+            rows: Diccionarios columna -> valor (idealmente con las mismas claves)
+
+        Returns:
+            Número de filas insertadas
+
+        Note:
+            Esta operación NO hace commit. En SQLite el ORM no puede agrupar
+            INSERT ... RETURNING, así que create_many() emite un INSERT por
+            fila; para cargas de miles de filas este método es varias veces
+            más rápido.
+
+        Example:
+            count = repository.bulk_insert([
+                {"name": "Empresa 1", "trigram": "EM1", "company_type_id": 1},
+                {"name": "Empresa 2", "trigram": "EM2", "company_type_id": 1},
+            ])
+            session.commit()
+        """
+        if not rows:
+            return 0
+
+        user_id = self.session.info.get("user_id")
+        if user_id is not None and hasattr(self.model, "created_by_id"):
+            rows = [{"created_by_id": user_id, "updated_by_id": user_id, **row} for row in rows]
+
+        logger.debug(f"Insertando {len(rows)} {self.model.__name__}(s) en bulk")
+        self.session.execute(insert(self.model), rows)
+        logger.info(f"{len(rows)} {self.model.__name__}(s) insertados en bulk")
+        return len(rows)
+
     def update_many(self, ids: list[int], values: dict) -> int:
         """
         Actualiza múltiples registros por IDs.
@@ -463,6 +813,9 @@ class BaseRepository(IRepository[T], Generic[T]):
         Note:
             Esta operación hace flush() pero NO commit().
             Usa UPDATE masivo, muy eficiente para actualizaciones simples.
+            Como no pasa por el flush, los eventos de auditoría no se
+            disparan: updated_at lo pone el onupdate de la columna y, si la
+            sesión tiene ``user_id``, updated_by_id se agrega a ``values``.
 
         Example:
             # Desactivar múltiples empresas
@@ -476,6 +829,10 @@ class BaseRepository(IRepository[T], Generic[T]):
         if not ids or not values:
             return 0
 
+        user_id = self.session.info.get("user_id")
+        if user_id is not None and hasattr(self.model, "updated_by_id"):
+            values = {"updated_by_id": user_id, **values}
+
         logger.debug(f"Actualizando {len(ids)} {self.model.__name__}(s) en bulk")
         stmt = update(self.model).where(self.model.id.in_(ids)).values(**values)
         result = self.session.execute(stmt)
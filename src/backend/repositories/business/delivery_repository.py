@@ -11,7 +11,9 @@ from sqlalchemy.orm import Session
 
 from src.backend.models.business.delivery import DeliveryOrder, DeliveryDate, Transport, PaymentCondition
 from src.backend.repositories.base import BaseRepository
+from src.backend.repositories.loading import LoadProfile
 from src.backend.utils.logger import logger
+from src.shared.schemas.business.delivery import DeliveryOrderListResponse
 
 
 class DeliveryOrderRepository(BaseRepository[DeliveryOrder]):
@@ -26,6 +28,9 @@ class DeliveryOrderRepository(BaseRepository[DeliveryOrder]):
         deliveries = repository.get_by_company(company_id=5)
     """
 
+    # Lists leave delivery_instructions, signatures and notes deferred
+    list_schema = DeliveryOrderListResponse
+
     def __init__(self, session: Session):
         """
         Initialize DeliveryOrderRepository.
@@ -76,6 +81,7 @@ class DeliveryOrderRepository(BaseRepository[DeliveryOrder]):
         logger.debug(f"Getting delivery orders for company_id={company_id}")
         stmt = (
             select(DeliveryOrder)
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(DeliveryOrder.company_id == company_id)
             .order_by(DeliveryOrder.delivery_date.desc())
             .offset(skip)
@@ -95,6 +101,7 @@ class DeliveryOrderRepository(BaseRepository[DeliveryOrder]):
         logger.debug(f"Getting delivery orders with status={status}")
         stmt = (
             select(DeliveryOrder)
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(DeliveryOrder.status == status)
             .order_by(DeliveryOrder.delivery_date.desc())
             .offset(skip)
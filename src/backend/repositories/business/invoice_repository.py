@@ -10,12 +10,22 @@ from sqlalchemy.orm import Session
 
 from src.backend.models.business.invoices import InvoiceSII, InvoiceExport
 from src.backend.repositories.base import BaseRepository
+from src.backend.repositories.loading import LoadProfile
 from src.backend.utils.logger import logger
+from src.shared.schemas.business.invoice import InvoiceExportListResponse, InvoiceSIIListResponse
 
 
 class InvoiceSIIRepository(BaseRepository[InvoiceSII]):
     """Repository for Chilean SII domestic invoices."""
 
+    sortable_columns = ("id", "invoice_number", "invoice_date", "due_date", "company_id", "payment_status_id", "total")
+    searchable_columns = ("invoice_number",)
+    default_sort = "invoice_date"
+    default_descending = True
+
+    # InvoiceSIIListResponse reads no relations; lists leave sii_xml and notes deferred
+    list_schema = InvoiceSIIListResponse
+
     def __init__(self, session: Session):
         super().__init__(session, InvoiceSII)
 
@@ -30,6 +40,7 @@ class InvoiceSIIRepository(BaseRepository[InvoiceSII]):
         """Get invoices by order ID."""
         stmt = (
             select(InvoiceSII)
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(InvoiceSII.order_id == order_id)
             .order_by(InvoiceSII.invoice_date.desc())
             .offset(skip)
@@ -41,6 +52,7 @@ class InvoiceSIIRepository(BaseRepository[InvoiceSII]):
         """Get invoices by company."""
         stmt = (
             select(InvoiceSII)
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(InvoiceSII.company_id == company_id)
             .order_by(InvoiceSII.invoice_date.desc())
             .offset(skip)
@@ -52,6 +64,7 @@ class InvoiceSIIRepository(BaseRepository[InvoiceSII]):
         """Get invoices by payment status."""
         stmt = (
             select(InvoiceSII)
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(InvoiceSII.payment_status_id == payment_status_id)
             .order_by(InvoiceSII.invoice_date.desc())
             .offset(skip)
@@ -63,6 +76,14 @@ class InvoiceSIIRepository(BaseRepository[InvoiceSII]):
 class InvoiceExportRepository(BaseRepository[InvoiceExport]):
     """Repository for export invoices."""
 
+    sortable_columns = ("id", "invoice_number", "invoice_date", "due_date", "company_id", "payment_status_id", "total")
+    searchable_columns = ("invoice_number",)
+    default_sort = "invoice_date"
+    default_descending = True
+
+    # InvoiceExportListResponse reads no relations; lists leave notes deferred
+    list_schema = InvoiceExportListResponse
+
     def __init__(self, session: Session):
         super().__init__(session, InvoiceExport)
 
@@ -77,6 +98,7 @@ class InvoiceExportRepository(BaseRepository[InvoiceExport]):
         """Get invoices by order ID."""
         stmt = (
             select(InvoiceExport)
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(InvoiceExport.order_id == order_id)
             .order_by(InvoiceExport.invoice_date.desc())
             .offset(skip)
@@ -88,6 +110,7 @@ class InvoiceExportRepository(BaseRepository[InvoiceExport]):
         """Get invoices by company."""
         stmt = (
             select(InvoiceExport)
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(InvoiceExport.company_id == company_id)
             .order_by(InvoiceExport.invoice_date.desc())
             .offset(skip)
@@ -99,6 +122,7 @@ class InvoiceExportRepository(BaseRepository[InvoiceExport]):
         """Get export invoices by destination country."""
         stmt = (
             select(InvoiceExport)
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(InvoiceExport.country_id == country_id)
             .order_by(InvoiceExport.invoice_date.desc())
             .offset(skip)
@@ -16,8 +16,12 @@ from sqlalchemy import select, and_, delete
 from sqlalchemy.orm import Session, selectinload
 
 from src.backend.models.business.orders import Order, OrderProduct
+from src.backend.models.core.companies import Company
 from src.backend.repositories.base import BaseRepository
+from src.backend.repositories.business.totals import ORDER_TOTALS, recompute_totals
+from src.backend.repositories.loading import LoadProfile
 from src.backend.utils.logger import logger
+from src.shared.schemas.business.order import OrderListResponse
 
 
 class OrderRepository(BaseRepository[Order]):
@@ -33,6 +37,29 @@ class OrderRepository(BaseRepository[Order]):
         orders = repository.get_by_company(company_id=5)
     """
 
+    sortable_columns = ("id", "order_number", "order_date", "required_date", "company_id", "status_id", "total")
+    searchable_columns = ("order_number", "customer_po_number", "project_number")
+    default_sort = "order_date"
+    default_descending = True
+
+    # OrderListResponse reads company.name; OrderResponse reads the lines and header relations
+    load_profiles = {
+        LoadProfile.LIST: (selectinload(Order.company),),
+        LoadProfile.DETAIL: (
+            selectinload(Order.products).selectinload(OrderProduct.product),
+            selectinload(Order.contact),
+            selectinload(Order.company_rut),
+            selectinload(Order.plant),
+            selectinload(Order.staff),
+            selectinload(Order.incoterm),
+            selectinload(Order.quote),  # Cargar cotización origen
+        ),
+    }
+    # Lists leave notes and internal_notes deferred; list rows join the company name
+    list_schema = OrderListResponse
+    list_columns = {"company_name": Company.name}
+    list_joins = (Order.company,)
+
     def __init__(self, session: Session):
         """
         Initialize OrderRepository.
@@ -56,7 +83,7 @@ class OrderRepository(BaseRepository[Order]):
         logger.debug(f"Getting all orders with pagination: skip={skip}, limit={limit}")
         stmt = (
             select(Order)
-            .options(selectinload(Order.company))  # Eager load company for name access
+            .options(*self._load_options(LoadProfile.LIST))
             .order_by(Order.order_date.desc())
             .offset(skip)
             .limit(limit)
@@ -65,6 +92,36 @@ class OrderRepository(BaseRepository[Order]):
         logger.debug(f"Found {len(orders)} order(s)")
         return orders
 
+    def get_page(
+        self,
+        filters: dict | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> tuple[list[Order], str | None]:
+        """
+        Get a keyset page of orders with company eagerly loaded.
+
+        Defaults to the same order as get_all (order_date, newest first).
+
+        Args:
+            filters: Equality filters {column: value}
+            order_by: Column to order by (default: order_date desc)
+            descending: Descending order
+            limit: Page size
+            after: Cursor returned by the previous page
+
+        Returns:
+            Tuple (orders, next_cursor)
+        """
+        if not order_by:
+            order_by = "order_date"
+            descending = True
+
+        stmt = self._apply_filters(select(Order).options(*self._load_options(LoadProfile.LIST)), filters)
+        return self._paginate(stmt, order_by, descending, limit, after)
+
     def get_by_order_number(self, order_number: str) -> Order | None:
         """
         Get order by unique order number.
@@ -100,15 +157,7 @@ class OrderRepository(BaseRepository[Order]):
         logger.debug(f"Getting order id={order_id} with products (eager loading)")
         stmt = (
             select(Order)
-            .options(
-                selectinload(Order.products).selectinload(OrderProduct.product),
-                selectinload(Order.contact),
-                selectinload(Order.company_rut),
-                selectinload(Order.plant),
-                selectinload(Order.staff),
-                selectinload(Order.incoterm),
-                selectinload(Order.quote)  # Cargar cotización origen
-            )
+            .options(*self._load_options(LoadProfile.DETAIL))
             .filter(Order.id == order_id)
         )
         order = self.session.execute(stmt).scalar_one_or_none()
@@ -118,6 +167,41 @@ class OrderRepository(BaseRepository[Order]):
             logger.debug(f"Order not found: id={order_id}")
         return order
 
+    def recompute_totals(
+        self,
+        order_ids: list[int] | None = None,
+        company_id: int | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> int:
+        """
+        Recompute line subtotals and order totals in the database.
+
+        Runs one UPDATE for the lines and one for the orders whatever the
+        number of orders matched; no line is loaded. See
+        ``repositories.business.totals``.
+
+        Args:
+            order_ids: Only these orders
+            company_id: Only orders of this company
+            date_from: Only orders with order_date on or after this day
+            date_to: Only orders with order_date on or before this day
+
+        Returns:
+            Number of orders updated
+
+        Example:
+            repo.recompute_totals(order_ids=[123])
+            repo.recompute_totals(company_id=5, date_from=date(2025, 1, 1))
+        """
+        logger.debug(
+            f"Recomputing order totals: ids={order_ids}, company_id={company_id}, "
+            f"date_from={date_from}, date_to={date_to}"
+        )
+        return recompute_totals(
+            self.session, ORDER_TOTALS, order_ids, company_id, date_from, date_to
+        )
+
     def get_by_company(
         self,
         company_id: int,
@@ -138,7 +222,7 @@ class OrderRepository(BaseRepository[Order]):
         logger.debug(f"Getting orders for company_id={company_id}")
         stmt = (
             select(Order)
-            .options(selectinload(Order.company))
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(Order.company_id == company_id)
             .order_by(Order.order_date.desc())
             .offset(skip)
@@ -158,7 +242,7 @@ class OrderRepository(BaseRepository[Order]):
         logger.debug(f"Getting orders with status_id={status_id}")
         stmt = (
             select(Order)
-            .options(selectinload(Order.company))
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(Order.status_id == status_id)
             .order_by(Order.order_date.desc())
             .offset(skip)
@@ -197,7 +281,7 @@ class OrderRepository(BaseRepository[Order]):
         logger.debug(f"Getting orders for staff_id={staff_id}")
         stmt = (
             select(Order)
-            .options(selectinload(Order.company))
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(Order.staff_id == staff_id)
             .order_by(Order.order_date.desc())
             .offset(skip)
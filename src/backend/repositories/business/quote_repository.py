@@ -13,11 +13,17 @@ from datetime import date
 _time_provider = TimeProvider()
 
 from sqlalchemy import select, and_, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload
 
 from src.backend.models.business.quotes import Quote, QuoteProduct
+from src.backend.models.core.companies import Company
+from src.backend.repositories.async_base import AsyncBaseRepository
 from src.backend.repositories.base import BaseRepository
+from src.backend.repositories.business.totals import QUOTE_TOTALS, recompute_totals
+from src.backend.repositories.loading import LoadProfile
 from src.backend.utils.logger import logger
+from src.shared.schemas.business.quote import QuoteListResponse
 
 
 class QuoteRepository(BaseRepository[Quote]):
@@ -33,6 +39,28 @@ class QuoteRepository(BaseRepository[Quote]):
         quotes = repository.get_by_company(company_id=5, skip=0, limit=10)
     """
 
+    sortable_columns = ("id", "quote_number", "quote_date", "valid_until", "company_id", "status_id", "total")
+    searchable_columns = ("quote_number", "subject")
+    default_sort = "quote_date"
+    default_descending = True
+
+    # QuoteListResponse reads company.name; QuoteResponse reads the lines and header relations
+    load_profiles = {
+        LoadProfile.LIST: (selectinload(Quote.company),),
+        LoadProfile.DETAIL: (
+            selectinload(Quote.products).selectinload(QuoteProduct.product),
+            selectinload(Quote.contact),
+            selectinload(Quote.company_rut),
+            selectinload(Quote.plant),
+            selectinload(Quote.staff),
+            selectinload(Quote.incoterm),
+        ),
+    }
+    # Lists leave notes and internal_notes deferred; list rows join the company name
+    list_schema = QuoteListResponse
+    list_columns = {"company_name": Company.name}
+    list_joins = (Quote.company,)
+
     def __init__(self, session: Session):
         """
         Initialize QuoteRepository.
@@ -59,7 +87,7 @@ class QuoteRepository(BaseRepository[Quote]):
             order_by = "quote_date"
             descending = True
             
-        stmt = select(Quote).options(selectinload(Quote.company))
+        stmt = select(Quote).options(*self._load_options(LoadProfile.LIST))
         
         # Apply ordering
         if order_by:
@@ -74,6 +102,36 @@ class QuoteRepository(BaseRepository[Quote]):
         logger.debug(f"Found {len(quotes)} quote(s)")
         return quotes
 
+    def get_page(
+        self,
+        filters: dict | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> tuple[list[Quote], str | None]:
+        """
+        Get a keyset page of quotes with company eagerly loaded.
+
+        Defaults to the same order as get_all (quote_date, newest first).
+
+        Args:
+            filters: Equality filters {column: value}
+            order_by: Column to order by (default: quote_date desc)
+            descending: Descending order
+            limit: Page size
+            after: Cursor returned by the previous page
+
+        Returns:
+            Tuple (quotes, next_cursor)
+        """
+        if not order_by:
+            order_by = "quote_date"
+            descending = True
+
+        stmt = self._apply_filters(select(Quote).options(*self._load_options(LoadProfile.LIST)), filters)
+        return self._paginate(stmt, order_by, descending, limit, after)
+
     def get_by_quote_number(self, quote_number: str) -> Quote | None:
         """
         Get quote by unique quote number.
@@ -119,14 +177,7 @@ class QuoteRepository(BaseRepository[Quote]):
         logger.debug(f"Getting quote id={quote_id} with products (eager loading)")
         stmt = (
             select(Quote)
-            .options(
-                selectinload(Quote.products).selectinload(QuoteProduct.product),
-                selectinload(Quote.contact),
-                selectinload(Quote.company_rut),
-                selectinload(Quote.plant),
-                selectinload(Quote.staff),
-                selectinload(Quote.incoterm)
-            )
+            .options(*self._load_options(LoadProfile.DETAIL))
             .filter(Quote.id == quote_id)
         )
         quote = self.session.execute(stmt).scalar_one_or_none()
@@ -136,6 +187,41 @@ class QuoteRepository(BaseRepository[Quote]):
             logger.debug(f"Quote not found: id={quote_id}")
         return quote
 
+    def recompute_totals(
+        self,
+        quote_ids: list[int] | None = None,
+        company_id: int | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> int:
+        """
+        Recompute line subtotals and quote totals in the database.
+
+        Runs one UPDATE for the lines and one for the quotes whatever the
+        number of quotes matched; no line is loaded. See
+        ``repositories.business.totals``.
+
+        Args:
+            quote_ids: Only these quotes
+            company_id: Only quotes of this company
+            date_from: Only quotes with quote_date on or after this day
+            date_to: Only quotes with quote_date on or before this day
+
+        Returns:
+            Number of quotes updated
+
+        Example:
+            repo.recompute_totals(quote_ids=[123])
+            repo.recompute_totals(company_id=5, date_from=date(2025, 1, 1))
+        """
+        logger.debug(
+            f"Recomputing quote totals: ids={quote_ids}, company_id={company_id}, "
+            f"date_from={date_from}, date_to={date_to}"
+        )
+        return recompute_totals(
+            self.session, QUOTE_TOTALS, quote_ids, company_id, date_from, date_to
+        )
+
     def get_by_company(
         self,
         company_id: int,
@@ -162,7 +248,7 @@ class QuoteRepository(BaseRepository[Quote]):
         logger.debug(f"Getting quotes for company_id={company_id} (skip={skip}, limit={limit})")
         stmt = (
             select(Quote)
-            .options(selectinload(Quote.company))
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(Quote.company_id == company_id)
             .order_by(Quote.quote_date.desc())
             .offset(skip)
@@ -195,7 +281,7 @@ class QuoteRepository(BaseRepository[Quote]):
         logger.debug(f"Getting quotes with status_id={status_id}")
         stmt = (
             select(Quote)
-            .options(selectinload(Quote.company))
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(Quote.status_id == status_id)
             .order_by(Quote.quote_date.desc())
             .offset(skip)
@@ -225,7 +311,7 @@ class QuoteRepository(BaseRepository[Quote]):
         logger.debug(f"Getting quotes for staff_id={staff_id}")
         stmt = (
             select(Quote)
-            .options(selectinload(Quote.company))
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(Quote.staff_id == staff_id)
             .order_by(Quote.quote_date.desc())
             .offset(skip)
@@ -249,7 +335,7 @@ class QuoteRepository(BaseRepository[Quote]):
         logger.debug("Getting expired quotes")
         stmt = (
             select(Quote)
-            .options(selectinload(Quote.company))
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(
                 and_(
                     Quote.valid_until.isnot(None),
@@ -285,7 +371,7 @@ class QuoteRepository(BaseRepository[Quote]):
         search_pattern = f"%{subject}%"
         stmt = (
             select(Quote)
-            .options(selectinload(Quote.company))
+            .options(*self._load_options(LoadProfile.LIST))
             .filter(Quote.subject.ilike(search_pattern))
             .order_by(Quote.quote_date.desc())
             .offset(skip)
@@ -393,3 +479,218 @@ class QuoteProductRepository(BaseRepository[QuoteProduct]):
         self.session.flush()
         logger.warning(f"Deleted {count} product(s) for quote_id={quote_id}")
         return count
+
+
+class AsyncQuoteRepository(AsyncBaseRepository[Quote]):
+    """
+    Async repository for Quote read queries.
+
+    Mirrors the read methods of QuoteRepository on an AsyncSession so the
+    GET /quotes endpoints can run on the event loop.
+
+    Example:
+        repository = AsyncQuoteRepository(session)
+        quote = await repository.get_with_products(123)
+    """
+
+    sortable_columns = QuoteRepository.sortable_columns
+    searchable_columns = QuoteRepository.searchable_columns
+    default_sort = QuoteRepository.default_sort
+    default_descending = QuoteRepository.default_descending
+    load_profiles = QuoteRepository.load_profiles
+    list_schema = QuoteRepository.list_schema
+    list_columns = QuoteRepository.list_columns
+    list_joins = QuoteRepository.list_joins
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize AsyncQuoteRepository.
+
+        Args:
+            session: SQLAlchemy async session for database operations
+        """
+        super().__init__(session, Quote)
+
+    async def _list(self, stmt, skip: int, limit: int) -> Sequence[Quote]:
+        """Run a list query with company eagerly loaded and pagination applied."""
+        stmt = stmt.options(*self._load_options(LoadProfile.LIST)).offset(skip).limit(limit)
+        quotes = (await self.session.execute(stmt)).scalars().all()
+        logger.debug(f"Found {len(quotes)} quote(s)")
+        return quotes
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: str | None = None,
+        descending: bool = False,
+    ) -> Sequence[Quote]:
+        """
+        Get all quotes with company eagerly loaded.
+        """
+        logger.debug(f"Getting all quotes (skip={skip}, limit={limit})")
+
+        # Default order by date if not specified
+        if not order_by:
+            order_by = "quote_date"
+            descending = True
+
+        stmt = select(Quote)
+        column = getattr(Quote, order_by, None)
+        if column is not None:
+            stmt = stmt.order_by(column.desc() if descending else column.asc())
+
+        return await self._list(stmt, skip, limit)
+
+    async def get_page(
+        self,
+        filters: dict | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> tuple[list[Quote], str | None]:
+        """
+        Get a keyset page of quotes with company eagerly loaded.
+
+        Defaults to the same order as get_all (quote_date, newest first).
+        """
+        if not order_by:
+            order_by = "quote_date"
+            descending = True
+
+        stmt = self._apply_filters(select(Quote).options(*self._load_options(LoadProfile.LIST)), filters)
+        return await self._paginate(stmt, order_by, descending, limit, after)
+
+    async def get_by_quote_number(self, quote_number: str) -> Quote | None:
+        """
+        Get quote by unique quote number.
+
+        Args:
+            quote_number: Quote number (e.g., "Q-2025-001")
+
+        Returns:
+            Quote if found, None otherwise
+        """
+        logger.debug(f"Searching quote by number: {quote_number}")
+        stmt = select(Quote).filter(Quote.quote_number == quote_number.upper())
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def get_with_products(self, quote_id: int) -> Quote | None:
+        """
+        Get quote with products and header relations eagerly loaded.
+
+        Args:
+            quote_id: Quote ID
+
+        Returns:
+            Quote with products loaded, None if not found
+        """
+        logger.debug(f"Getting quote id={quote_id} with products (eager loading)")
+        stmt = (
+            select(Quote)
+            .options(*self._load_options(LoadProfile.DETAIL))
+            .filter(Quote.id == quote_id)
+        )
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def get_by_company(
+        self,
+        company_id: int,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Sequence[Quote]:
+        """
+        Get all quotes for a specific company, most recent first.
+
+        Args:
+            company_id: Company ID
+            skip: Number of records to skip (pagination)
+            limit: Maximum number of records to return
+
+        Returns:
+            List of quotes for the company
+        """
+        logger.debug(f"Getting quotes for company_id={company_id} (skip={skip}, limit={limit})")
+        stmt = (
+            select(Quote)
+            .filter(Quote.company_id == company_id)
+            .order_by(Quote.quote_date.desc())
+        )
+        return await self._list(stmt, skip, limit)
+
+    async def get_by_status(
+        self,
+        status_id: int,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Sequence[Quote]:
+        """
+        Get quotes by status.
+
+        Args:
+            status_id: Quote status ID
+            skip: Number of records to skip
+            limit: Maximum number of records
+
+        Returns:
+            List of quotes with the specified status
+        """
+        logger.debug(f"Getting quotes with status_id={status_id}")
+        stmt = (
+            select(Quote)
+            .filter(Quote.status_id == status_id)
+            .order_by(Quote.quote_date.desc())
+        )
+        return await self._list(stmt, skip, limit)
+
+    async def get_by_staff(
+        self,
+        staff_id: int,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Sequence[Quote]:
+        """
+        Get quotes assigned to a specific staff member.
+
+        Args:
+            staff_id: Staff ID
+            skip: Number of records to skip
+            limit: Maximum number of records
+
+        Returns:
+            List of quotes assigned to the staff member
+        """
+        logger.debug(f"Getting quotes for staff_id={staff_id}")
+        stmt = (
+            select(Quote)
+            .filter(Quote.staff_id == staff_id)
+            .order_by(Quote.quote_date.desc())
+        )
+        return await self._list(stmt, skip, limit)
+
+    async def search_by_subject(
+        self,
+        subject: str,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Sequence[Quote]:
+        """
+        Search quotes by subject (partial match, case-insensitive).
+
+        Args:
+            subject: Text to search in subject field
+            skip: Number of records to skip
+            limit: Maximum number of records
+
+        Returns:
+            List of matching quotes
+        """
+        logger.debug(f"Searching quotes by subject: '{subject}'")
+        stmt = (
+            select(Quote)
+            .filter(Quote.subject.ilike(f"%{subject}%"))
+            .order_by(Quote.quote_date.desc())
+        )
+        return await self._list(stmt, skip, limit)
+
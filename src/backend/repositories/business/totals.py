@@ -0,0 +1,146 @@
+"""
+Set-based totals recomputation for quotes and orders.
+
+Line subtotals and document totals are computed by the database: one UPDATE
+for the lines and one UPDATE ... (SELECT SUM(...)) for the documents,
+whether the target is a single quote or every order of a company. No line
+is loaded into Python.
+
+The arithmetic mirrors ``calculate_subtotal`` / ``calculate_totals`` on the
+models. Rounding is done with SQL ROUND (half away from zero on MySQL),
+so an amount ending exactly in half a cent can differ by 0.01 from the
+in-memory methods, which use Decimal's default half-even rounding.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import Session
+
+from src.backend.models.business.orders import Order, OrderProduct
+from src.backend.models.business.quotes import Quote, QuoteProduct
+from src.backend.utils.logger import logger
+
+
+@dataclass(frozen=True)
+class DocumentTotals:
+    """
+    How the totals of one document type are computed.
+
+    Attributes:
+        document: Header model (Quote, Order)
+        line: Line item model (QuoteProduct, OrderProduct)
+        parent_key: Foreign key from line to header ("quote_id", "order_id")
+        date_column: Header date used by date range filters
+        extra_costs: Header columns added to the total after tax
+        keep_subtotal_without_lines: Keep the stored subtotal of documents
+            without lines instead of resetting it to zero
+    """
+
+    document: type
+    line: type
+    parent_key: str
+    date_column: str
+    extra_costs: tuple[str, ...] = ()
+    keep_subtotal_without_lines: bool = False
+
+
+QUOTE_TOTALS = DocumentTotals(
+    document=Quote,
+    line=QuoteProduct,
+    parent_key="quote_id",
+    date_column="quote_date",
+)
+
+ORDER_TOTALS = DocumentTotals(
+    document=Order,
+    line=OrderProduct,
+    parent_key="order_id",
+    date_column="order_date",
+    extra_costs=("shipping_cost", "other_costs"),
+    keep_subtotal_without_lines=True,
+)
+
+
+def recompute_totals(
+    session: Session,
+    spec: DocumentTotals,
+    document_ids: list[int] | None = None,
+    company_id: int | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> int:
+    """
+    Recompute line subtotals and document totals with two UPDATE statements.
+
+    Filters are combined with AND; with no filters every document is
+    recomputed. Pending ORM changes are flushed first, and loaded
+    documents and lines are expired so they read the new values.
+
+    Args:
+        session: SQLAlchemy session
+        spec: Document type (QUOTE_TOTALS, ORDER_TOTALS)
+        document_ids: Only these documents
+        company_id: Only documents of this company
+        date_from: Only documents dated on or after this day
+        date_to: Only documents dated on or before this day
+
+    Returns:
+        Number of documents updated
+
+    Example:
+        recompute_totals(session, QUOTE_TOTALS, document_ids=[123])
+        recompute_totals(session, ORDER_TOTALS, company_id=5, date_from=date(2025, 1, 1))
+    """
+    document, line = spec.document, spec.line
+    conditions = []
+    if document_ids is not None:
+        conditions.append(document.id.in_(document_ids))
+    if company_id is not None:
+        conditions.append(document.company_id == company_id)
+    if date_from is not None:
+        conditions.append(getattr(document, spec.date_column) >= date_from)
+    if date_to is not None:
+        conditions.append(getattr(document, spec.date_column) <= date_to)
+
+    parent = getattr(line, spec.parent_key)
+    if document_ids is not None and len(conditions) == 1:
+        line_filter = parent.in_(document_ids)
+    else:
+        line_filter = parent.in_(select(document.id).where(*conditions))
+
+    session.flush()
+
+    line_total = line.quantity * line.unit_price
+    discount = case(
+        (line.discount_percentage > 0, func.round(line_total * line.discount_percentage / 100, 2)),
+        else_=0,
+    )
+    session.execute(
+        update(line)
+        .where(line_filter)
+        .values(discount_amount=discount, subtotal=func.round(line_total - discount, 2)),
+        execution_options={"synchronize_session": "fetch"},
+    )
+
+    line_sum = select(func.sum(line.subtotal)).where(parent == document.id).scalar_subquery()
+    subtotal = func.round(
+        func.coalesce(line_sum, document.subtotal if spec.keep_subtotal_without_lines else 0), 2
+    )
+    tax = func.round(subtotal * document.tax_percentage / 100, 2)
+    total = subtotal + tax
+    for column in spec.extra_costs:
+        total = total + getattr(document, column)
+
+    values = {"subtotal": subtotal, "tax_amount": tax, "total": func.round(total, 2)}
+    user_id = session.info.get("user_id")
+    if user_id is not None:
+        values["updated_by_id"] = user_id
+
+    result = session.execute(
+        update(document).where(*conditions).values(**values),
+        execution_options={"synchronize_session": "fetch"},
+    )
+    logger.info(f"Totals recomputed for {result.rowcount} {document.__name__}(s)")
+    return result.rowcount
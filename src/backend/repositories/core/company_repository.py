@@ -4,14 +4,20 @@ Repositorio para Company, CompanyRut y Plant.
 Maneja el acceso a datos para empresas, sus RUTs y plantas.
 """
 
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, lazyload, selectinload
 
 from src.backend.models.core.companies import Company, CompanyRut, Plant
+from src.backend.models.core.notes import Note
+from src.backend.models.lookups import City, CompanyType, Country
+from src.backend.repositories.async_base import AsyncBaseRepository
 from src.backend.repositories.base import BaseRepository
+from src.backend.repositories.loading import LoadProfile
 from src.backend.utils.logger import logger
+from src.shared.schemas.core.company import CompanyResponse
 
 
 class CompanyRepository(BaseRepository[Company]):
@@ -27,6 +33,28 @@ class CompanyRepository(BaseRepository[Company]):
         companies = repo.search_by_name("test")
     """
 
+    sortable_columns = ("id", "name", "trigram", "company_type_id", "is_active", "created_at")
+    searchable_columns = ("name", "trigram")
+    # Ya son joined en el modelo; se nombran para que la carga estricta las mantenga
+    load_profiles = {
+        LoadProfile.LIST: (
+            joinedload(Company.company_type),
+            joinedload(Company.country),
+            joinedload(Company.city),
+        ),
+    }
+    # Filas de listado: los nombres de las relaciones salen de los joins y
+    # los campos de auditoría de columnas con otro nombre
+    list_schema = CompanyResponse
+    list_columns = {
+        "company_type": CompanyType.name,
+        "country_name": Country.name,
+        "city_name": City.name,
+        "created_by": Company.created_by_id,
+        "updated_by": Company.updated_by_id,
+    }
+    list_joins = (Company.company_type, Company.country, Company.city)
+
     def __init__(self, session: Session):
         """
         Inicializa el repositorio de Company.
@@ -62,6 +90,40 @@ class CompanyRepository(BaseRepository[Company]):
 
         return company
 
+    def get_by_trigrams(self, trigrams: list[str]) -> Sequence[Company]:
+        """
+        Obtiene empresas por sus trigrams en una sola query.
+
+        Pensado para operaciones masivas: no carga las relaciones (company_type,
+        country y city son joined por defecto); se cargan al accederlas.
+
+        Args:
+            trigrams: Trigrams (ya normalizados en mayúsculas)
+
+        Returns:
+            Empresas encontradas (sin orden garantizado)
+        """
+        if not trigrams:
+            return []
+        stmt = (
+            select(Company)
+            .filter(Company.trigram.in_(trigrams))
+            .options(lazyload("*"))
+        )
+        return self.session.execute(stmt).scalars().all()
+
+    def get_all_trigrams(self) -> set[str]:
+        """
+        Obtiene todos los trigrams existentes (incluye inactivas).
+
+        Útil para detectar duplicados en importaciones masivas sin una
+        query por fila.
+
+        Returns:
+            Conjunto de trigrams
+        """
+        return set(self.session.execute(select(Company.trigram)).scalars())
+
     def search_by_name(self, name: str) -> Sequence[Company]:
         """
         Busca empresas por nombre (búsqueda parcial).
@@ -379,3 +441,166 @@ class PlantRepository(BaseRepository[Plant]):
 
         logger.debug(f"Encontradas {len(plants)} planta(s)")
         return plants
+
+
+class AsyncCompanyRepository(AsyncBaseRepository[Company]):
+    """
+    Repositorio asíncrono para Company.
+
+    Versión AsyncSession de las consultas de lectura de CompanyRepository,
+    usada por los endpoints GET async de /companies.
+
+    Example:
+        repo = AsyncCompanyRepository(session)
+        company = await repo.get_by_trigram("AKG")
+    """
+
+    sortable_columns = CompanyRepository.sortable_columns
+    searchable_columns = CompanyRepository.searchable_columns
+    load_profiles = CompanyRepository.load_profiles
+    list_schema = CompanyRepository.list_schema
+    list_columns = CompanyRepository.list_columns
+    list_joins = CompanyRepository.list_joins
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el repositorio asíncrono de Company.
+
+        Args:
+            session: Sesión asíncrona de SQLAlchemy
+        """
+        super().__init__(session, Company)
+
+    async def get_by_trigram(self, trigram: str) -> Company | None:
+        """
+        Busca una empresa por su trigram.
+
+        Args:
+            trigram: Trigram de 3 letras (ej: "AKG")
+
+        Returns:
+            Company si existe, None en caso contrario
+        """
+        logger.debug(f"Buscando empresa por trigram: {trigram}")
+        stmt = select(Company).filter(Company.trigram == trigram.upper())
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def search_by_name(self, name: str) -> Sequence[Company]:
+        """
+        Busca empresas por nombre (búsqueda parcial).
+
+        Args:
+            name: Texto a buscar en el nombre
+
+        Returns:
+            Lista de empresas que coinciden
+        """
+        logger.debug(f"Buscando empresas por nombre: {name}")
+        stmt = (
+            select(Company)
+            .filter(Company.name.ilike(f"%{name}%"))
+            .order_by(Company.name)
+        )
+        companies = (await self.session.execute(stmt)).scalars().all()
+
+        logger.debug(f"Encontradas {len(companies)} empresa(s) con nombre '{name}'")
+        return companies
+
+    async def get_by_type(
+        self,
+        company_type_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: bool | None = None
+    ) -> Sequence[Company]:
+        """
+        Obtiene empresas filtradas por tipo y opcionalmente por estado.
+
+        Args:
+            company_type_id: ID del tipo de empresa (1=CLIENT, 2=SUPPLIER)
+            skip: Registros a saltar
+            limit: Máximo de registros
+            is_active: Filtrar por estado activo/inactivo (None = todos)
+
+        Returns:
+            Lista de empresas del tipo especificado
+        """
+        logger.debug(f"Obteniendo empresas por tipo: {company_type_id}, is_active={is_active}")
+
+        stmt = select(Company).filter(Company.company_type_id == company_type_id)
+        if is_active is not None:
+            stmt = stmt.filter(Company.is_active.is_(is_active))
+
+        result = await self.session.execute(stmt.offset(skip).limit(limit))
+        return result.scalars().all()
+
+    async def get_by_status(
+        self,
+        is_active: bool,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Sequence[Company]:
+        """
+        Obtiene empresas activas o inactivas.
+
+        Args:
+            is_active: True para activas, False para inactivas
+            skip: Registros a saltar
+            limit: Número máximo de registros
+
+        Returns:
+            Lista de empresas con el estado indicado
+        """
+        logger.debug(f"Obteniendo empresas is_active={is_active} - skip={skip}, limit={limit}")
+        stmt = (
+            select(Company)
+            .filter(Company.is_active.is_(is_active))
+            .offset(skip)
+            .limit(limit)
+        )
+        return (await self.session.execute(stmt)).scalars().all()
+
+    async def get_with_sections(self, company_id: int, sections: Collection[str]) -> Company | None:
+        """
+        Obtiene una empresa con las colecciones pedidas ya cargadas.
+
+        Cada colección se carga con ``selectinload`` (una query por
+        colección, todas en la misma sesión), así que leerlas después no
+        dispara lazy loads.
+
+        Args:
+            company_id: ID de la empresa
+            sections: Colecciones a cargar ("addresses", "contacts", "ruts", "plants")
+
+        Returns:
+            Company con las colecciones cargadas, None si no existe
+        """
+        logger.debug(f"Obteniendo empresa id={company_id} con secciones {sorted(sections)}")
+        stmt = (
+            select(Company)
+            .options(*(selectinload(getattr(Company, name)) for name in sections))
+            .filter(Company.id == company_id)
+        )
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def get_notes(self, company_id: int, limit: int = 100) -> Sequence[Note]:
+        """
+        Obtiene las notas de una empresa.
+
+        Mismo orden que NoteRepository.get_by_entity("company", ...):
+        prioridad descendente y más recientes primero.
+
+        Args:
+            company_id: ID de la empresa
+            limit: Número máximo de notas
+
+        Returns:
+            Lista de notas de la empresa
+        """
+        stmt = (
+            select(Note)
+            .filter(Note.entity_type == "company", Note.entity_id == company_id)
+            .order_by(Note.priority.desc(), Note.created_at.desc())
+            .limit(limit)
+        )
+        return (await self.session.execute(stmt)).scalars().all()
@@ -6,11 +6,20 @@ Maneja el acceso a datos para productos y sus componentes (BOM).
 
 from collections.abc import Sequence
 
-from sqlalchemy import or_, select
-from sqlalchemy.orm import Session, selectinload
-
-from src.backend.models.core.products import Product, ProductComponent
+from sqlalchemy import delete, exists, func, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from src.backend.models.core.products import (
+    Product,
+    ProductBOMClosure,
+    ProductBOMRollup,
+    ProductComponent,
+    apply_bom_edge,
+)
 from src.backend.repositories.base import BaseRepository
+from src.backend.repositories.loading import LoadProfile, profile_options
 from src.backend.utils.logger import logger
 
 
@@ -26,6 +35,26 @@ class ProductRepository(BaseRepository[Product]):
         products = repo.search("tornillo")
     """
 
+    sortable_columns = (
+        "id", "reference", "product_type", "family_type_id", "sale_price", "cost_price",
+        "is_active", "created_at",
+    )
+    searchable_columns = ("reference", "designation_es", "designation_en", "designation_fr")
+
+    # ProductResponse serializa los lookups, la empresa y el BOM en ambas formas
+    _RESPONSE_LOADS = (
+        joinedload(Product.family_type),
+        joinedload(Product.matter),
+        joinedload(Product.sales_type),
+        selectinload(Product.company),
+        selectinload(Product.components),
+        selectinload(Product.parent_components),
+    )
+    load_profiles = {
+        LoadProfile.LIST: _RESPONSE_LOADS,
+        LoadProfile.DETAIL: _RESPONSE_LOADS,
+    }
+
     def __init__(self, session: Session):
         """
         Inicializa el repositorio de Product.
@@ -49,7 +78,11 @@ class ProductRepository(BaseRepository[Product]):
             product = repo.get_by_reference("PROD-001")
         """
         logger.debug(f"Buscando producto por referencia: {reference}")
-        stmt = select(Product).filter(Product.reference == reference.upper())
+        stmt = (
+            select(Product)
+            .filter(Product.reference == reference.upper())
+            .options(*self._load_options(LoadProfile.DETAIL))
+        )
         product = self.session.execute(stmt).scalar_one_or_none()
 
         if product:
@@ -59,6 +92,55 @@ class ProductRepository(BaseRepository[Product]):
 
         return product
 
+    def get_by_references(self, references: list[str]) -> Sequence[Product]:
+        """
+        Obtiene productos por sus referencias en una sola query.
+
+        Pensado para operaciones masivas: no carga las relaciones; se cargan
+        al accederlas.
+
+        Args:
+            references: Referencias (ya normalizadas en mayúsculas)
+
+        Returns:
+            Productos encontrados (sin orden garantizado)
+        """
+        if not references:
+            return []
+        stmt = select(Product).filter(Product.reference.in_(references))
+        return self.session.execute(stmt).scalars().all()
+
+    def get_all_references(self) -> set[str]:
+        """
+        Obtiene todas las referencias existentes (incluye inactivos).
+
+        Útil para detectar duplicados en importaciones masivas sin una
+        query por fila.
+
+        Returns:
+            Conjunto de referencias
+        """
+        return set(self.session.execute(select(Product.reference)).scalars())
+
+    def get_by_ids(self, ids: list[int]) -> Sequence[Product]:
+        """
+        Obtiene varios productos por ID en una sola query.
+
+        Args:
+            ids: IDs de los productos
+
+        Returns:
+            Productos encontrados (los IDs inexistentes se omiten)
+
+        Example:
+            products = repo.get_by_ids([1, 2, 3])
+        """
+        if not ids:
+            return []
+
+        stmt = select(Product).filter(Product.id.in_(ids))
+        return self.session.execute(stmt).scalars().all()
+
     def search(self, query: str) -> Sequence[Product]:
         """
         Busca productos por referencia o designación en cualquier idioma (búsqueda parcial).
@@ -87,6 +169,7 @@ class ProductRepository(BaseRepository[Product]):
                 )
             )
             .order_by(Product.reference)
+            .options(*self._load_options(LoadProfile.LIST))
         )
         products = self.session.execute(stmt).scalars().all()
 
@@ -112,9 +195,7 @@ class ProductRepository(BaseRepository[Product]):
         logger.debug(f"Obteniendo producto id={product_id} con componentes")
         stmt = (
             select(Product)
-            .options(
-                selectinload(Product.components).selectinload(ProductComponent.component)
-            )
+            .options(*self._load_options(LoadProfile.DETAIL))
             .filter(Product.id == product_id)
         )
         product = self.session.execute(stmt).scalar_one_or_none()
@@ -145,6 +226,7 @@ class ProductRepository(BaseRepository[Product]):
             .order_by(Product.reference)
             .offset(skip)
             .limit(limit)
+            .options(*self._load_options(LoadProfile.LIST))
         )
         products = self.session.execute(stmt).scalars().all()
 
@@ -174,6 +256,7 @@ class ProductRepository(BaseRepository[Product]):
             .order_by(Product.reference)
             .offset(skip)
             .limit(limit)
+            .options(*self._load_options(LoadProfile.LIST))
         )
         products = self.session.execute(stmt).scalars().all()
 
@@ -207,6 +290,7 @@ class ProductRepository(BaseRepository[Product]):
             .order_by(Product.reference)
             .offset(skip)
             .limit(limit)
+            .options(*self._load_options(LoadProfile.LIST))
         )
         products = self.session.execute(stmt).scalars().all()
 
@@ -235,6 +319,7 @@ class ProductRepository(BaseRepository[Product]):
             .order_by(Product.reference)
             .offset(skip)
             .limit(limit)
+            .options(*self._load_options(LoadProfile.LIST))
         )
         products = self.session.execute(stmt).scalars().all()
 
@@ -361,3 +446,238 @@ class ProductComponentRepository(BaseRepository[ProductComponent]):
         self.session.delete(component)
         self.session.flush()
         logger.info(f"Componente eliminado: parent_id={parent_id}, component_id={component_id}")
+
+    def is_in_bom(self, ancestor_id: int, descendant_id: int) -> bool:
+        """
+        Indica si un producto aparece en algún nivel del BOM de otro.
+
+        Lookup por PK en el cierre transitivo (ProductBOMClosure).
+
+        Args:
+            ancestor_id: Producto cuyo BOM se consulta
+            descendant_id: Producto buscado
+
+        Returns:
+            True si descendant_id está en el BOM de ancestor_id
+
+        Example:
+            # Agregar A como componente de B crea un ciclo si B ya está en el BOM de A
+            if repo.is_in_bom(ancestor_id=a_id, descendant_id=b_id):
+                ...
+        """
+        stmt = select(ProductBOMClosure.path_count).filter(
+            ProductBOMClosure.ancestor_id == ancestor_id,
+            ProductBOMClosure.descendant_id == descendant_id,
+        )
+        return self.session.execute(stmt).first() is not None
+
+    def get_where_used(self, component_id: int) -> Sequence[Product]:
+        """
+        Obtiene todos los productos que usan un componente en cualquier nivel.
+
+        Versión transitiva de get_by_component: un lookup por el índice de
+        descendant_id en el cierre transitivo.
+
+        Args:
+            component_id: ID del componente
+
+        Returns:
+            Productos que contienen el componente (directa o indirectamente),
+            ordenados por referencia
+
+        Example:
+            # ¿En qué ensambles termina el tornillo M6?
+            assemblies = repo.get_where_used(component_id=5)
+        """
+        logger.debug(f"Obteniendo where-used transitivo de component_id={component_id}")
+        stmt = (
+            select(Product)
+            .join(ProductBOMClosure, ProductBOMClosure.ancestor_id == Product.id)
+            .filter(ProductBOMClosure.descendant_id == component_id)
+            .order_by(Product.reference)
+            .options(*profile_options(Product, ProductRepository.load_profiles, LoadProfile.LIST))
+        )
+        products = self.session.execute(stmt).scalars().all()
+
+        logger.debug(f"Componente usado en {len(products)} producto(s) (todos los niveles)")
+        return products
+
+    def rebuild_closure(self) -> int:
+        """
+        Reconstruye el cierre transitivo completo desde product_components.
+
+        El cierre se mantiene solo con los eventos de ProductComponent; este
+        método sirve para repararlo tras cargas que no pasan por el ORM
+        (SQL directo, borrados en cascada de la base).
+
+        Returns:
+            Número de filas del cierre
+
+        Note:
+            Esta operación hace flush() pero NO commit().
+        """
+        logger.info("Reconstruyendo cierre transitivo del BOM")
+        self.session.flush()
+        self.session.execute(delete(ProductBOMClosure))
+
+        connection = self.session.connection()
+        edges = self.session.execute(
+            select(ProductComponent.parent_id, ProductComponent.component_id)
+        ).all()
+        for parent_id, component_id in edges:
+            apply_bom_edge(connection, parent_id, component_id, 1)
+
+        total = self.session.execute(select(func.count()).select_from(ProductBOMClosure)).scalar()
+        logger.info(f"Cierre transitivo reconstruido: {total} fila(s) desde {len(edges)} arista(s)")
+        return total
+
+    def get_bom_graph(self, root_id: int, use_rollups: bool = False) -> Sequence[Row]:
+        """
+        Carga el sub-grafo completo del BOM de un producto en una sola query.
+
+        Un CTE recursivo (``WITH RECURSIVE``, soportado por SQLite y MySQL 8)
+        recorre product_components desde el producto raíz; cada producto
+        alcanzable se une a sus aristas salientes. UNION (no UNION ALL)
+        descarta productos ya visitados, por lo que la recursión termina
+        incluso si hubiera un ciclo en los datos.
+
+        Con ``use_rollups`` el recorrido no baja por los productos que ya
+        tienen acumulados materializados (ProductBOMRollup): esos nodos se
+        retornan sin componentes y con las columnas rollup_* cargadas, de
+        modo que solo se recorre la parte invalidada del BOM.
+
+        Args:
+            root_id: ID del producto raíz
+            use_rollups: Cortar el recorrido en productos con acumulados vigentes
+
+        Returns:
+            Filas (id, product_type, reference, designation_es, designation_en,
+            designation_fr, cost_price, sale_price, net_weight, component_id,
+            quantity[, rollup_cost, rollup_price, rollup_weight, rollup_levels]).
+            Un producto aparece una vez por componente directo, o una vez con
+            component_id None si no tiene componentes (o no se expande).
+            Lista vacía si el producto no existe.
+
+        Example:
+            rows = repo.get_bom_graph(root_id=1)
+            engine = BOMEngine(rows, root_id=1)
+        """
+        logger.debug(f"Cargando grafo BOM de product_id={root_id} (use_rollups={use_rollups})")
+        bom = (
+            select(Product.id.label("product_id"))
+            .filter(Product.id == root_id)
+            .cte("bom", recursive=True)
+        )
+        expand = select(ProductComponent.component_id).join(
+            bom, ProductComponent.parent_id == bom.c.product_id
+        )
+        edges_on = ProductComponent.parent_id == Product.id
+        columns = [
+            Product.id,
+            Product.product_type,
+            Product.reference,
+            Product.designation_es,
+            Product.designation_en,
+            Product.designation_fr,
+            Product.cost_price,
+            Product.sale_price,
+            Product.net_weight,
+            ProductComponent.component_id,
+            ProductComponent.quantity,
+        ]
+
+        if use_rollups:
+            # No bajar por padres cuyo acumulado sigue vigente
+            cached = exists().where(ProductBOMRollup.product_id == ProductComponent.parent_id)
+            expand = expand.filter(~cached)
+            edges_on = edges_on & (ProductBOMRollup.product_id.is_(None))
+            columns += [
+                ProductBOMRollup.cost.label("rollup_cost"),
+                ProductBOMRollup.price.label("rollup_price"),
+                ProductBOMRollup.weight.label("rollup_weight"),
+                ProductBOMRollup.levels.label("rollup_levels"),
+            ]
+
+        bom = bom.union(expand)
+        stmt = select(*columns).join(bom, bom.c.product_id == Product.id)
+        if use_rollups:
+            stmt = stmt.outerjoin(ProductBOMRollup, ProductBOMRollup.product_id == Product.id)
+        stmt = stmt.outerjoin(ProductComponent, edges_on).order_by(Product.id, ProductComponent.id)
+        rows = self.session.execute(stmt).all()
+
+        logger.debug(f"Grafo BOM cargado: {len(rows)} fila(s)")
+        return rows
+
+
+class ProductBOMRollupRepository(BaseRepository[ProductBOMRollup]):
+    """
+    Repositorio para los acumulados materializados del BOM.
+
+    La PK es product_id, por lo que get_by_id(product_id) es el lookup O(1)
+    de costo/precio/peso de un producto.
+
+    Example:
+        repo = ProductBOMRollupRepository(session)
+        rollup = repo.get_by_id(product_id)
+        repo.invalidate([article_id])  # cambio de precio de un artículo
+    """
+
+    def __init__(self, session: Session):
+        super().__init__(session, ProductBOMRollup)
+
+    def save_many(self, rollups: list[ProductBOMRollup]) -> None:
+        """
+        Persiste acumulados recién calculados.
+
+        Si otra transacción guardó los mismos productos en paralelo, el
+        conflicto de PK se ignora: ambos cálculos parten de los mismos datos.
+
+        Args:
+            rollups: Acumulados a guardar
+        """
+        if not rollups:
+            return
+
+        logger.debug(f"Guardando {len(rollups)} acumulado(s) de BOM")
+        try:
+            with self.session.begin_nested():
+                self.session.add_all(rollups)
+        except IntegrityError:
+            logger.debug("Acumulados de BOM ya guardados por otra transacción")
+
+    def invalidate(self, product_ids: list[int]) -> int:
+        """
+        Elimina los acumulados de los productos dados y de todos sus ancestros.
+
+        Los ancestros salen del cierre transitivo (ProductBOMClosure) y se
+        borran en un solo statement; los acumulados de ramas no afectadas se
+        conservan.
+
+        Args:
+            product_ids: Productos modificados (artículos o nomenclaturas)
+
+        Returns:
+            Número de acumulados eliminados
+
+        Example:
+            # Cambio de costo de un tornillo: invalida todos los ensambles que lo usan
+            repo.invalidate([screw.id])
+        """
+        if not product_ids:
+            return 0
+
+        ancestors = select(ProductBOMClosure.ancestor_id).filter(
+            ProductBOMClosure.descendant_id.in_(product_ids)
+        )
+        stmt = (
+            delete(ProductBOMRollup)
+            .where(
+                ProductBOMRollup.product_id.in_(product_ids)
+                | ProductBOMRollup.product_id.in_(ancestors)
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        deleted = self.session.execute(stmt).rowcount
+
+        logger.debug(f"Acumulados de BOM invalidados: {deleted} (origen={product_ids})")
+        return deleted
@@ -0,0 +1,59 @@
+"""
+Repositorio para el historial de cambios.
+
+Lee la tabla append-only ``change_history`` que mantienen los eventos de
+src.backend.models.history.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.backend.models.history import ChangeHistory
+
+
+class HistoryRepository:
+    """
+    Repositorio del historial de cambios.
+
+    No hereda de BaseRepository: el historial solo se lee (las filas las
+    escribe history_writer), sin update ni delete.
+
+    Example:
+        repo = HistoryRepository(session)
+        changes = repo.get_for_entity("quote", 42, limit=20)
+    """
+
+    def __init__(self, session: Session):
+        """
+        Inicializa el repositorio.
+
+        Args:
+            session: Sesión de SQLAlchemy
+        """
+        self.session = session
+
+    def get_for_entity(
+        self, entity_type: str, entity_id: int, skip: int = 0, limit: int = 100
+    ) -> list[ChangeHistory]:
+        """
+        Cambios de una entidad, del más reciente al más antiguo.
+
+        Recorre el índice (entity_type, entity_id, ts) hacia atrás.
+
+        Args:
+            entity_type: Tipo de entidad
+            entity_id: ID de la entidad
+            skip: Número de registros a saltar
+            limit: Número máximo de registros
+
+        Returns:
+            Lista de cambios
+        """
+        stmt = (
+            select(ChangeHistory)
+            .filter(ChangeHistory.entity_type == entity_type, ChangeHistory.entity_id == entity_id)
+            .order_by(ChangeHistory.ts.desc(), ChangeHistory.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(self.session.scalars(stmt))
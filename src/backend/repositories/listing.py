@@ -0,0 +1,125 @@
+"""
+Contrato genérico de listados: orden, búsqueda de texto y total.
+
+Las tablas del frontend piden solo la página visible (``sort``, ``order``,
+``q``, ``skip``, ``limit``) y necesitan el total de filas que cumplen el
+filtro para dibujar la paginación. Cada repositorio declara en qué columnas
+se puede ordenar (``sortable_columns``) y en cuáles se busca texto
+(``searchable_columns``); cualquier otra columna se rechaza para no exponer
+por la API ordenamientos sin índice ni columnas internas.
+
+El orden siempre termina en ``id`` para que las páginas sean estables
+aunque la columna de orden tenga valores repetidos.
+
+Como pagination.py, estas funciones solo construyen statements, por lo que
+las comparten BaseRepository y AsyncBaseRepository.
+"""
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.sql import Select
+
+from src.backend.exceptions.service import ValidationException
+
+
+def resolve_sort(
+    sort: str | None,
+    descending: bool | None,
+    sortable_columns: tuple[str, ...],
+    default_sort: str,
+    default_descending: bool,
+) -> tuple[str, bool]:
+    """
+    Valida la columna de orden contra la lista permitida.
+
+    Args:
+        sort: Columna pedida (None = orden por defecto del repositorio)
+        descending: Dirección pedida (None = la del orden por defecto si no
+            se pidió columna, ascendente si se pidió)
+        sortable_columns: Columnas permitidas
+        default_sort: Columna por defecto
+        default_descending: Dirección por defecto
+
+    Returns:
+        Tupla (columna, descendente)
+
+    Raises:
+        ValidationException: Si la columna no está permitida
+    """
+    if sort is None:
+        return default_sort, default_descending if descending is None else descending
+
+    if sort not in sortable_columns:
+        raise ValidationException(
+            f"No se puede ordenar por '{sort}'",
+            details={"sort": sort, "allowed": list(sortable_columns)}
+        )
+    return sort, bool(descending)
+
+
+def search_condition(model, search: str | None, searchable_columns: tuple[str, ...]):
+    """
+    Condición de búsqueda de texto (contiene, sin distinguir mayúsculas).
+
+    Los comodines ``%`` y ``_`` del texto se escapan: se buscan literales.
+
+    Args:
+        model: Modelo listado
+        search: Texto a buscar (None o vacío = sin condición)
+        searchable_columns: Columnas donde buscar
+
+    Returns:
+        Expresión OR sobre las columnas, o None
+    """
+    if not search or not search.strip() or not searchable_columns:
+        return None
+    term = search.strip()
+    return or_(*(getattr(model, name).icontains(term, autoescape=True) for name in searchable_columns))
+
+
+def list_select(
+    stmt: Select,
+    model,
+    sort: str,
+    descending: bool,
+    skip: int,
+    limit: int,
+) -> tuple[Select, Select]:
+    """
+    Construye la query de la página y la de conteo a partir de un select filtrado.
+
+    Args:
+        stmt: Select con filtros y búsqueda aplicados, sin options ni orden
+        model: Modelo listado (debe tener columna ``id``)
+        sort: Columna de orden ya validada con resolve_sort
+        descending: Orden descendente
+        skip: Offset de la página
+        limit: Tamaño de página
+
+    Returns:
+        Tupla (select de la página, select del total)
+    """
+    count_stmt = select(func.count()).select_from(stmt.subquery())
+    page_stmt = order_for_list(stmt, model, sort, descending).offset(skip).limit(limit)
+    return page_stmt, count_stmt
+
+
+def order_for_list(stmt: Select, model, sort: str, descending: bool) -> Select:
+    """
+    Ordena un select por la columna pedida y desempata por ``id``.
+
+    Lo usan las páginas de list_select y las exportaciones, que recorren el
+    mismo listado completo sin paginar.
+
+    Args:
+        stmt: Select con filtros y búsqueda aplicados
+        model: Modelo listado (debe tener columna ``id``)
+        sort: Columna de orden ya validada con resolve_sort
+        descending: Orden descendente
+
+    Returns:
+        Select ordenado
+    """
+    columns = [getattr(model, sort)]
+    if sort != "id":
+        columns.append(model.id)
+    return stmt.order_by(*(c.desc() if descending else c.asc() for c in columns))
@@ -0,0 +1,181 @@
+"""
+Perfiles de carga (eager loading) por tipo de respuesta.
+
+Cada repositorio declara en ``load_profiles`` qué relaciones necesita cada
+forma de respuesta, en lugar de repetir ``selectinload(...)`` en cada query:
+
+    load_profiles = {
+        LoadProfile.LIST: (selectinload(Quote.company),),
+        LoadProfile.DETAIL: (selectinload(Quote.products), selectinload(Quote.staff)),
+    }
+
+- ``LIST``: lo que leen los schemas de listado al serializar cada fila.
+  Lo aplican get_all, find_by, get_page, get_list e iter_list.
+- ``DETAIL``: lo que lee el schema de detalle de una entidad. Lo aplican
+  get_by_id (solo si se pide) y los métodos de detalle del repositorio.
+
+Las relaciones que un perfil no nombra quedan con su estrategia del modelo
+(normalmente ``lazy="select"``): si la serialización las lee, se carga una
+query por fila. Con la carga estricta activada (``strict_eager_loading`` en
+settings, activada en los tests) las queries de LIST agregan
+``raiseload("*", sql_only=True)`` y esa carga oculta lanza un error en vez
+de ejecutar SQL. El comodín también anula los ``lazy="joined"`` del modelo,
+así que el perfil LIST nombra todas las relaciones que lee el listado.
+
+Los repositorios con columnas de texto pesadas (XML, notas) declaran además
+``list_schema``: las queries de LIST cargan solo las columnas de ese schema
+(más PK, FKs y columnas de orden) con ``load_only`` y el resto queda
+diferido. Leer una columna diferida ejecuta un SELECT por fila, o lanza un
+error con la carga estricta.
+
+Con ``list_schema`` los listados tienen además un fast path sin ORM
+(``row_select``): un select Core de las columnas del schema, cuyas filas se
+validan directamente como schema sin construir entidades. Los campos que no
+son columnas del modelo (nombres de relaciones, columnas con otro nombre)
+se declaran en ``list_columns`` con sus joins en ``list_joins``.
+"""
+
+from collections.abc import Iterable, Mapping
+from enum import Enum
+from functools import cache
+
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import Load, load_only
+from sqlalchemy.sql import Select
+
+from src.backend.config.settings import get_settings
+
+
+class LoadProfile(str, Enum):
+    """Formas de respuesta con su propio conjunto de relaciones cargadas."""
+
+    LIST = "list"
+    DETAIL = "detail"
+
+
+_strict_loading = get_settings().strict_eager_loading
+
+
+def set_strict_loading(enabled: bool) -> None:
+    """
+    Activa o desactiva la carga estricta de los listados.
+
+    Args:
+        enabled: Si True, las queries de LIST prohíben las cargas lazy que
+            no están en el perfil
+    """
+    global _strict_loading
+    _strict_loading = enabled
+
+
+def strict_loading_enabled() -> bool:
+    """Si los listados prohíben las cargas lazy fuera de su perfil."""
+    return _strict_loading
+
+
+def profile_options(
+    model: type,
+    profiles: Mapping[LoadProfile, tuple],
+    profile: LoadProfile | None,
+) -> tuple:
+    """
+    Options de carga de un perfil.
+
+    La prohibición de la carga estricta se ata a ``model``: las entidades
+    que el perfil carga (p. ej. la empresa de cada fila) conservan sus
+    relaciones joined del modelo.
+
+    Args:
+        model: Modelo raíz de la query
+        profiles: ``load_profiles`` del repositorio
+        profile: Perfil pedido (None = ninguna option)
+
+    Returns:
+        Options para ``select(...).options(*options)``
+    """
+    if profile is None:
+        return ()
+    options = tuple(profiles.get(profile, ()))
+    if profile is LoadProfile.LIST and _strict_loading:
+        options += (Load(model).raiseload("*", sql_only=True),)
+    return options
+
+
+@cache
+def schema_columns(model: type, schema: type, extra: tuple[str, ...] = ()) -> tuple[str, ...]:
+    """
+    Columnas de ``model`` que necesita serializar ``schema``.
+
+    Incluye siempre la clave primaria y las claves foráneas, que usan los
+    loaders de las relaciones del perfil.
+
+    Args:
+        model: Modelo SQLAlchemy
+        schema: Schema Pydantic de la respuesta
+        extra: Columnas adicionales (p. ej. las de orden)
+
+    Returns:
+        Nombres de los atributos columna a cargar
+    """
+    wanted = set(schema.model_fields) | set(extra)
+    return tuple(
+        attr.key
+        for attr in inspect(model).column_attrs
+        if attr.key in wanted or any(c.primary_key or c.foreign_keys for c in attr.columns)
+    )
+
+
+def projection(model: type, schema: type, extra: Iterable[str] = ()):
+    """
+    Option ``load_only`` con las columnas de ``schema``; el resto queda diferido.
+
+    Args:
+        model: Modelo raíz de la query
+        schema: Schema Pydantic de la respuesta
+        extra: Columnas adicionales a cargar
+
+    Returns:
+        Option para ``select(...).options(...)``
+
+    Example:
+        select(InvoiceSII).options(projection(InvoiceSII, InvoiceSIIListResponse))
+    """
+    columns = schema_columns(model, schema, tuple(extra))
+    return load_only(*(getattr(model, key) for key in columns), raiseload=_strict_loading)
+
+
+def row_select(
+    model: type,
+    schema: type,
+    columns: Mapping[str, object] | None = None,
+    joins: Iterable = (),
+) -> Select:
+    """
+    Select Core con una columna por campo de ``schema``, etiquetada con su nombre.
+
+    Las filas (``.mappings()``) se validan como ``schema`` sin pasar por el
+    ORM: sin identity map, sin eventos de carga y sin loaders de relaciones.
+
+    Args:
+        model: Modelo raíz (FROM)
+        schema: Schema Pydantic de la respuesta
+        columns: Campos que no son columnas de ``model`` {campo: columna}
+        joins: Relaciones de ``model`` a unir (OUTER JOIN) para ``columns``
+
+    Returns:
+        Select sin filtros, orden ni límite
+
+    Example:
+        row_select(Quote, QuoteListResponse, {"company_name": Company.name}, (Quote.company,))
+    """
+    columns = columns or {}
+    selected = [
+        getattr(model, attr.key).label(attr.key)
+        for attr in inspect(model).column_attrs
+        if attr.key in schema.model_fields and attr.key not in columns
+    ]
+    selected += [column.label(field) for field, column in columns.items()]
+    stmt = select(*selected).select_from(model)
+    for relationship in joins:
+        stmt = stmt.outerjoin(relationship)
+    return stmt
@@ -0,0 +1,193 @@
+"""
+Paginación por cursor (keyset) para repositorios.
+
+En lugar de ``OFFSET n`` (que obliga a la base a recorrer y descartar n
+filas), la página siguiente se pide con un cursor opaco que codifica el
+valor de ordenamiento y el id de la última fila recibida:
+
+    WHERE (order_col, id) > (:ultimo_valor, :ultimo_id)
+    ORDER BY order_col, id
+    LIMIT :limit + 1
+
+Con un índice sobre la columna de orden (en SQLite y en InnoDB el índice
+secundario ya incluye la PK) cada página cuesta lo mismo sin importar su
+profundidad.
+
+Estas funciones solo construyen statements y procesan filas, por lo que
+las comparten BaseRepository y AsyncBaseRepository.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import undefer
+from sqlalchemy.sql import Select
+
+from src.backend.exceptions.service import ValidationException
+
+
+def encode_cursor(*values) -> str:
+    """
+    Codifica los valores de la última fila en un cursor opaco.
+
+    Args:
+        *values: Valores (columna de orden, id)
+
+    Returns:
+        Cursor base64 url-safe sin padding
+
+    Example:
+        cursor = encode_cursor(quote.quote_date, quote.id)
+    """
+    raw = json.dumps(list(values), default=str).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, columns: tuple) -> list:
+    """
+    Decodifica un cursor y convierte sus valores al tipo de cada columna.
+
+    Args:
+        cursor: Cursor generado por encode_cursor
+        columns: Columnas en el mismo orden en que se codificaron
+
+    Returns:
+        Lista de valores tipados
+
+    Raises:
+        ValidationException: Si el cursor no es válido
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor length mismatch")
+        return [_coerce(value, column) for value, column in zip(values, columns)]
+    except (ValueError, TypeError, InvalidOperation, binascii.Error) as e:
+        raise ValidationException(
+            "Cursor de paginación inválido",
+            details={"after": cursor, "error": str(e)}
+        )
+
+
+def _coerce(value, column):
+    """Convierte un valor JSON al tipo Python de la columna."""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    if isinstance(value, python_type):
+        return value
+    if python_type in (date, datetime):
+        return python_type.fromisoformat(value)
+    if python_type is Decimal:
+        return Decimal(str(value))
+    return python_type(value)
+
+
+def _after_condition(order_column, id_column, descending: bool, last_value, last_id):
+    """
+    Condición "fila posterior a (last_value, last_id)" en el orden dado.
+
+    Los NULL se ordenan como el menor valor (comportamiento de SQLite y
+    MySQL): primero en ASC, últimos en DESC.
+    """
+    # Se escribe como "col <= v AND (col < v OR id < last_id)" en lugar de
+    # "col < v OR (col = v AND id < last_id)": el término de rango sobre la
+    # columna de orden es el que permite al planner usar el índice.
+    if descending:
+        if last_value is None:
+            return and_(order_column.is_(None), id_column < last_id)
+        condition = and_(
+            order_column <= last_value,
+            or_(order_column < last_value, id_column < last_id),
+        )
+        if order_column.expression.nullable:
+            condition = or_(condition, order_column.is_(None))
+        return condition
+
+    if last_value is None:
+        return or_(
+            and_(order_column.is_(None), id_column > last_id),
+            order_column.isnot(None),
+        )
+    return and_(
+        order_column >= last_value,
+        or_(order_column > last_value, id_column > last_id),
+    )
+
+
+def keyset_select(
+    stmt: Select,
+    model,
+    order_by: str | None = None,
+    descending: bool = False,
+    limit: int = 100,
+    after: str | None = None,
+) -> tuple[Select, tuple]:
+    """
+    Aplica orden, cursor y límite a un select.
+
+    El select recibido no debe tener ORDER BY/LIMIT propios: el orden se
+    fuerza a ``(order_by, id)`` para que el cursor sea estable aunque haya
+    valores repetidos en la columna de orden.
+
+    Args:
+        stmt: Select base (con filtros y options ya aplicados)
+        model: Modelo paginado (debe tener columna ``id``)
+        order_by: Columna de orden (default: id)
+        descending: Orden descendente
+        limit: Tamaño de página
+        after: Cursor de la página anterior (None = primera página)
+
+    Returns:
+        Tupla (select listo para ejecutar, columnas del cursor)
+    """
+    id_column = model.id
+    order_column = getattr(model, order_by, None) if order_by else None
+    if order_column is None or order_column is id_column:
+        columns = (id_column,)
+    else:
+        columns = (order_column, id_column)
+
+    if after:
+        values = decode_cursor(after, columns)
+        if len(columns) == 1:
+            last_id = values[0]
+            stmt = stmt.where(id_column < last_id if descending else id_column > last_id)
+        else:
+            stmt = stmt.where(_after_condition(order_column, id_column, descending, *values))
+
+    # split_page lee las columnas del cursor aunque la query las difiera
+    stmt = stmt.options(*(undefer(c) for c in columns))
+    stmt = stmt.order_by(*(c.desc() if descending else c.asc() for c in columns))
+    # Una fila extra indica si existe página siguiente sin hacer COUNT
+    return stmt.limit(limit + 1), columns
+
+
+def split_page(rows, limit: int, columns: tuple) -> tuple[list, str | None]:
+    """
+    Recorta la fila extra y genera el cursor de la página siguiente.
+
+    Args:
+        rows: Filas obtenidas con keyset_select (hasta limit + 1)
+        limit: Tamaño de página
+        columns: Columnas del cursor retornadas por keyset_select
+
+    Returns:
+        Tupla (items de la página, next_cursor o None si es la última)
+    """
+    items = list(rows)
+    if len(items) <= limit:
+        return items, None
+
+    items = items[:limit]
+    last = items[-1]
+    return items, encode_cursor(*(getattr(last, c.key) for c in columns))
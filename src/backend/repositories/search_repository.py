@@ -0,0 +1,199 @@
+"""
+Repositorio para el índice de búsqueda full-text.
+
+Consulta la tabla ``search_index`` (FTS5 en SQLite, FULLTEXT en MySQL)
+con ranking y coincidencia por prefijo, y permite reconstruir el índice
+completo desde las tablas de origen.
+"""
+
+import re
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from src.backend.models.search import (
+    SEARCH_ENTITIES,
+    SEARCH_INDEX_TABLE,
+    build_search_document,
+    search_index_table,
+    write_search_documents,
+)
+from src.backend.utils.logger import logger
+
+# Palabras de la consulta: letras/dígitos Unicode (descarta operadores y comillas)
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchRepository:
+    """
+    Repositorio del índice de búsqueda.
+
+    A diferencia de los repositorios de entidades no hereda de
+    BaseRepository: el índice no es un modelo ORM sino una tabla
+    mantenida por los eventos de src.backend.models.search.
+
+    Example:
+        repo = SearchRepository(session)
+        hits = repo.search("torn m6", entity_types=["product"], limit=10)
+    """
+
+    def __init__(self, session: Session):
+        """
+        Inicializa el repositorio.
+
+        Args:
+            session: Sesión de SQLAlchemy
+        """
+        self.session = session
+
+    @property
+    def dialect_name(self) -> str:
+        """Dialecto de la base de datos de la sesión."""
+        return self.session.get_bind().dialect.name
+
+    @staticmethod
+    def tokenize(query: str) -> list[str]:
+        """
+        Separa una consulta en palabras aptas para el índice.
+
+        Args:
+            query: Texto ingresado por el usuario
+
+        Returns:
+            Palabras en minúsculas (vacío si no hay nada que buscar)
+        """
+        return [token.lower() for token in _TOKEN_PATTERN.findall(query)]
+
+    def _match_expression(self, tokens: list[str]) -> str:
+        """Expresión de búsqueda: todas las palabras, cada una como prefijo."""
+        if self.dialect_name == "mysql":
+            return " ".join(f"+{token}*" for token in tokens)
+        return " ".join(f'"{token}"*' for token in tokens)
+
+    def search(
+        self,
+        query: str,
+        entity_types: list[str] | None = None,
+        limit: int = 20,
+    ) -> Sequence[Row]:
+        """
+        Busca en el índice con ranking por relevancia.
+
+        Cada palabra de la consulta se busca como prefijo ("torn" encuentra
+        "Tornillo") y todas deben aparecer. Las coincidencias en el título
+        pesan más que en el cuerpo.
+
+        Args:
+            query: Texto a buscar
+            entity_types: Limitar a estos tipos (ver SEARCH_ENTITIES)
+            limit: Máximo de resultados
+
+        Returns:
+            Filas (entity_type, entity_id, title, snippet, score) ordenadas
+            por relevancia descendente
+
+        Example:
+            hits = repo.search("acme")
+            for hit in hits:
+                print(hit.entity_type, hit.entity_id, hit.title)
+        """
+        tokens = self.tokenize(query)
+        if not tokens:
+            return []
+
+        logger.debug(f"Buscando en índice: tokens={tokens}, tipos={entity_types}")
+        params = {"match": self._match_expression(tokens), "limit": limit}
+
+        if self.dialect_name == "mysql":
+            sql = (
+                "SELECT entity_type, entity_id, title, LEFT(body, 160) AS snippet, "
+                "MATCH(title, body) AGAINST(:match IN BOOLEAN MODE) AS score "
+                f"FROM {SEARCH_INDEX_TABLE} "
+                "WHERE MATCH(title, body) AGAINST(:match IN BOOLEAN MODE)"
+            )
+            order = " ORDER BY score DESC"
+        else:
+            # bm25 es menor cuanto más relevante; pesos por columna
+            # (entity_type, entity_id, title, body)
+            sql = (
+                "SELECT entity_type, entity_id, title, "
+                "snippet(" + SEARCH_INDEX_TABLE + ", 3, '', '', '…', 12) AS snippet, "
+                "-bm25(" + SEARCH_INDEX_TABLE + ", 0.0, 0.0, 10.0, 1.0) AS score "
+                f"FROM {SEARCH_INDEX_TABLE} "
+                f"WHERE {SEARCH_INDEX_TABLE} MATCH :match"
+            )
+            order = " ORDER BY score DESC"
+
+        stmt = text(sql + (" AND entity_type IN :types" if entity_types else "") + order + " LIMIT :limit")
+        if entity_types:
+            stmt = stmt.bindparams(bindparam("types", expanding=True))
+            params["types"] = list(entity_types)
+
+        hits = self.session.execute(stmt, params).all()
+
+        logger.debug(f"Encontrados {len(hits)} resultado(s) para '{query}'")
+        return hits
+
+    def index_entities(self, entities: Sequence[Any]) -> int:
+        """
+        Indexa (o reindexa) entidades escritas sin pasar por el flush del ORM.
+
+        El after_flush mantiene el índice en las escrituras normales; las
+        cargas con INSERT masivo deben indexar lo insertado con este método.
+
+        Args:
+            entities: Instancias de modelos indexados (los demás se ignoran)
+
+        Returns:
+            Número de documentos escritos
+        """
+        documents = [d for d in map(build_search_document, entities) if d]
+        if documents:
+            removed = {d["doc_id"] for d in documents}
+            write_search_documents(self.session.connection(), removed, documents)
+        return len(documents)
+
+    def rebuild(self, batch_size: int = 500) -> int:
+        """
+        Reconstruye el índice completo desde las tablas de origen.
+
+        Necesario tras crear el índice sobre una base con datos o después
+        de cargas que no pasan por el ORM.
+
+        Args:
+            batch_size: Entidades cargadas por query
+
+        Returns:
+            Número de documentos indexados
+
+        Note:
+            Esta operación hace flush() pero NO commit().
+        """
+        logger.info("Reconstruyendo índice de búsqueda")
+        self.session.flush()
+
+        connection = self.session.connection()
+        connection.execute(search_index_table(self.dialect_name).delete())
+
+        total = 0
+        for entity_type, (_code, model, _extract) in SEARCH_ENTITIES.items():
+            last_id = 0
+            while True:
+                entities = self.session.execute(
+                    select(model).filter(model.id > last_id).order_by(model.id).limit(batch_size)
+                ).unique().scalars().all()
+                if not entities:
+                    break
+
+                documents = [d for d in map(build_search_document, entities) if d]
+                write_search_documents(connection, set(), documents)
+                total += len(documents)
+                last_id = entities[-1].id
+
+            logger.debug(f"Índice de búsqueda: {entity_type} indexado")
+
+        logger.info(f"Índice de búsqueda reconstruido: {total} documento(s)")
+        return total
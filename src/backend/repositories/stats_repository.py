@@ -0,0 +1,189 @@
+"""
+Repositorio de estadísticas agregadas.
+
+Calcula los KPIs del dashboard con consultas agrupadas (COUNT/SUM ...
+GROUP BY) en lugar de cargar listas de entidades para contarlas en Python.
+Cada método ejecuta una sola query.
+"""
+
+from collections.abc import Sequence
+from datetime import date
+
+from sqlalchemy import case, extract, func, literal, select, union_all
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from src.backend.config.constants import PAYMENT_STATUS_PAID
+from src.backend.models.business.invoices import InvoiceExport, InvoiceSII
+from src.backend.models.business.orders import Order
+from src.backend.models.business.quotes import Quote
+from src.backend.models.core.companies import Company
+from src.backend.models.core.products import Product
+from src.backend.models.lookups import CompanyType, OrderStatus, PaymentStatus, QuoteStatus
+from src.backend.utils.logger import logger
+
+
+class StatsRepository:
+    """
+    Repositorio de estadísticas del dashboard.
+
+    No hereda de BaseRepository: no trabaja sobre un modelo sino sobre
+    agregados de varias tablas.
+
+    Example:
+        repo = StatsRepository(session)
+        by_type = repo.count_companies_by_type()
+    """
+
+    def __init__(self, session: Session):
+        """
+        Inicializa el repositorio.
+
+        Args:
+            session: Sesión de SQLAlchemy
+        """
+        self.session = session
+
+    def count_companies_by_type(self) -> Sequence[Row]:
+        """
+        Cuenta empresas (no eliminadas) por tipo.
+
+        Returns:
+            Filas (company_type_id, name, count)
+        """
+        logger.debug("Estadísticas: contando empresas por tipo")
+        stmt = (
+            select(Company.company_type_id, CompanyType.name, func.count(Company.id).label("count"))
+            .join(CompanyType, CompanyType.id == Company.company_type_id)
+            .where(Company.is_deleted.is_(False))
+            .group_by(Company.company_type_id, CompanyType.name)
+            .order_by(Company.company_type_id)
+        )
+        return self.session.execute(stmt).all()
+
+    def count_products(self) -> Row:
+        """
+        Cuenta productos totales y activos.
+
+        Returns:
+            Fila (total, active)
+        """
+        logger.debug("Estadísticas: contando productos")
+        stmt = select(
+            func.count(Product.id).label("total"),
+            func.coalesce(func.sum(case((Product.is_active.is_(True), 1), else_=0)), 0).label("active"),
+        )
+        return self.session.execute(stmt).one()
+
+    def count_quotes_by_status(self) -> Sequence[Row]:
+        """
+        Cuenta cotizaciones por código de estado.
+
+        Returns:
+            Filas (code, count)
+        """
+        logger.debug("Estadísticas: contando cotizaciones por estado")
+        stmt = (
+            select(QuoteStatus.code, func.count(Quote.id).label("count"))
+            .join(Quote, Quote.status_id == QuoteStatus.id)
+            .group_by(QuoteStatus.code)
+            .order_by(QuoteStatus.code)
+        )
+        return self.session.execute(stmt).all()
+
+    def count_orders_by_status(self) -> Sequence[Row]:
+        """
+        Cuenta órdenes por código de estado.
+
+        Returns:
+            Filas (code, count)
+        """
+        logger.debug("Estadísticas: contando órdenes por estado")
+        stmt = (
+            select(OrderStatus.code, func.count(Order.id).label("count"))
+            .join(Order, Order.status_id == OrderStatus.id)
+            .group_by(OrderStatus.code)
+            .order_by(OrderStatus.code)
+        )
+        return self.session.execute(stmt).all()
+
+    @staticmethod
+    def _invoices_clp():
+        """
+        Facturas nacionales y de exportación con su monto en CLP.
+
+        Returns:
+            Subquery (invoice_date, due_date, paid_date, payment_code, amount)
+        """
+        sii = (
+            select(
+                InvoiceSII.invoice_date.label("invoice_date"),
+                InvoiceSII.due_date.label("due_date"),
+                InvoiceSII.paid_date.label("paid_date"),
+                PaymentStatus.code.label("payment_code"),
+                (InvoiceSII.total * func.coalesce(InvoiceSII.exchange_rate, literal(1))).label("amount"),
+            )
+            .join(PaymentStatus, PaymentStatus.id == InvoiceSII.payment_status_id)
+            .where(InvoiceSII.is_active.is_(True))
+        )
+        export = (
+            select(
+                InvoiceExport.invoice_date,
+                InvoiceExport.due_date,
+                InvoiceExport.paid_date,
+                PaymentStatus.code,
+                InvoiceExport.total_clp,
+            )
+            .join(PaymentStatus, PaymentStatus.id == InvoiceExport.payment_status_id)
+            .where(InvoiceExport.is_active.is_(True))
+        )
+        return union_all(sii, export).subquery("invoices")
+
+    def overdue_invoices(self, today: date) -> Row:
+        """
+        Facturas vencidas: fecha de pago pasada y no pagadas.
+
+        Args:
+            today: Fecha de referencia
+
+        Returns:
+            Fila (count, amount) con el monto en CLP
+        """
+        logger.debug(f"Estadísticas: facturas vencidas al {today}")
+        invoices = self._invoices_clp()
+        stmt = select(
+            func.count().label("count"),
+            func.coalesce(func.sum(invoices.c.amount), 0).label("amount"),
+        ).where(
+            invoices.c.due_date < today,
+            invoices.c.paid_date.is_(None),
+            invoices.c.payment_code != PAYMENT_STATUS_PAID,
+        )
+        return self.session.execute(stmt).one()
+
+    def revenue_by_month(self, since: date) -> Sequence[Row]:
+        """
+        Facturación mensual (CLP) desde una fecha.
+
+        Args:
+            since: Primer día del período
+
+        Returns:
+            Filas (year, month, revenue, invoices) ordenadas por mes
+        """
+        logger.debug(f"Estadísticas: facturación mensual desde {since}")
+        invoices = self._invoices_clp()
+        year = extract("year", invoices.c.invoice_date).label("year")
+        month = extract("month", invoices.c.invoice_date).label("month")
+        stmt = (
+            select(
+                year,
+                month,
+                func.coalesce(func.sum(invoices.c.amount), 0).label("revenue"),
+                func.count().label("invoices"),
+            )
+            .where(invoices.c.invoice_date >= since)
+            .group_by(year, month)
+            .order_by(year, month)
+        )
+        return self.session.execute(stmt).all()
@@ -7,7 +7,9 @@ reglas de validación.
 """
 
 from src.backend.services.base import BaseService
+from src.backend.services.async_base import AsyncBaseService
 
 __all__ = [
     "BaseService",
+    "AsyncBaseService",
 ]
@@ -0,0 +1,359 @@
+"""
+Servicio base asíncrono.
+
+Variante de BaseService para endpoints ``async def``: orquesta un
+AsyncBaseRepository sobre AsyncSession y expone las operaciones de negocio
+comunes como corutinas.
+"""
+
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.backend.exceptions.repository import NotFoundException
+from src.backend.exceptions.service import ValidationException
+from src.backend.repositories.async_base import AsyncBaseRepository
+from src.backend.repositories.loading import LoadProfile
+from src.backend.services.base import list_adapter
+from src.backend.utils.logger import logger
+from src.shared.schemas.base import BaseSchema
+
+# TypeVars para tipos genéricos
+T = TypeVar("T")  # Modelo SQLAlchemy
+CreateSchema = TypeVar("CreateSchema", bound=BaseSchema)
+UpdateSchema = TypeVar("UpdateSchema", bound=BaseSchema)
+ResponseSchema = TypeVar("ResponseSchema", bound=BaseSchema)
+
+
+class AsyncBaseService(Generic[T, CreateSchema, UpdateSchema, ResponseSchema]):
+    """
+    Servicio base asíncrono implementando lógica de negocio común.
+
+    Misma API que BaseService, pero cada operación es una corutina.
+
+    Attributes:
+        repository: Repositorio asíncrono para acceso a datos
+        session: Sesión asíncrona de SQLAlchemy
+        model: Clase del modelo SQLAlchemy
+        response_schema: Clase del schema de respuesta Pydantic
+        list_schema: Schema de los listados (get_all, get_page, get_list)
+        list_rows: Si get_all/get_list usan el fast path de filas del repositorio
+
+    Example:
+        class AsyncCompanyService(AsyncBaseService[Company, CompanyCreate, CompanyUpdate, CompanyResponse]):
+            async def validate_create(self, entity: Company):
+                if await self.repository.get_by_trigram(entity.trigram):
+                    raise ValidationException("Trigram ya existe")
+    """
+
+    def __init__(
+        self,
+        repository: AsyncBaseRepository[T],
+        session: AsyncSession,
+        model: type[T],
+        response_schema: type[ResponseSchema],
+        list_schema: type | None = None,
+    ):
+        """
+        Inicializa el servicio.
+
+        Args:
+            repository: Repositorio asíncrono
+            session: Sesión asíncrona de SQLAlchemy
+            model: Clase del modelo SQLAlchemy
+            response_schema: Clase del schema de respuesta
+            list_schema: Schema de los listados (ver BaseService)
+        """
+        self.repository = repository
+        self.session = session
+        self.model = model
+        self.response_schema = response_schema
+        self.list_schema = list_schema or response_schema
+        self.list_rows = getattr(repository, "list_schema", None) is self.list_schema
+
+    async def to_response(
+        self,
+        data: Any,
+        converter: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """
+        Convierte una entidad (o lista de entidades) a schema de respuesta.
+
+        La conversión se ejecuta dentro de ``run_sync`` para que cualquier
+        relación lazy que el schema lea se cargue en el contexto greenlet de
+        la sesión en lugar de fallar con MissingGreenlet.
+
+        Args:
+            data: Entidad ORM, dict, o lista de ellos
+            converter: Función entidad -> schema
+                (default: response_schema.model_validate)
+
+        Returns:
+            Schema validado, o lista de schemas si data es una lista
+        """
+        convert = converter or self.response_schema.model_validate
+
+        def _convert(_sync_session):
+            if isinstance(data, (list, tuple)):
+                return [convert(item) for item in data]
+            return convert(data)
+
+        return await self.session.run_sync(_convert)
+
+    async def get_by_id(self, id: int) -> ResponseSchema:
+        """
+        Obtiene una entidad por ID.
+
+        Args:
+            id: ID de la entidad
+
+        Returns:
+            Entidad como schema de respuesta
+
+        Raises:
+            NotFoundException: Si la entidad no existe
+        """
+        logger.debug(f"Servicio async: obteniendo {self.model.__name__} id={id}")
+
+        entity = await self.repository.get_by_id(id, profile=LoadProfile.DETAIL)
+        if not entity:
+            raise NotFoundException(
+                f"{self.model.__name__} no encontrado",
+                details={"id": id}
+            )
+
+        return await self.to_response(entity)
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[ResponseSchema]:
+        """
+        Obtiene todas las entidades con paginación.
+
+        Args:
+            skip: Número de registros a saltar
+            limit: Número máximo de registros
+
+        Returns:
+            Lista de entidades como schemas de respuesta
+        """
+        logger.debug(f"Servicio async: obteniendo {self.model.__name__}(s) - skip={skip}, limit={limit}")
+
+        if self.list_rows:
+            rows = await self.repository.get_rows(skip=skip, limit=limit)
+            return list_adapter(self.list_schema).validate_python(rows)
+
+        entities = await self.repository.get_all(skip=skip, limit=limit)
+        return await self.to_response(list(entities), self.list_schema.model_validate)
+
+    async def get_page(
+        self,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> tuple[list[ResponseSchema], str | None]:
+        """
+        Obtiene una página con paginación por cursor (keyset).
+
+        Args:
+            limit: Tamaño de página
+            after: Cursor retornado por la página anterior (None = primera)
+
+        Returns:
+            Tupla (entidades como schemas de respuesta, next_cursor)
+        """
+        entities, next_cursor = await self.repository.get_page(limit=limit, after=after)
+        return await self.to_response(entities, self.list_schema.model_validate), next_cursor
+
+    async def get_list(
+        self,
+        filters: dict | None = None,
+        sort: str | None = None,
+        descending: bool | None = None,
+        search: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[ResponseSchema], int]:
+        """
+        Obtiene una página ordenada y filtrada con el total de filas.
+
+        Ver BaseService.get_list.
+
+        Returns:
+            Tupla (entidades como schemas de respuesta, total)
+        """
+        if self.list_rows:
+            rows, total = await self.repository.get_list_rows(
+                filters=filters, sort=sort, descending=descending, search=search, skip=skip, limit=limit
+            )
+            return list_adapter(self.list_schema).validate_python(rows), total
+
+        entities, total = await self.repository.get_list(
+            filters=filters, sort=sort, descending=descending, search=search, skip=skip, limit=limit
+        )
+        return await self.to_response(entities, self.list_schema.model_validate), total
+
+    async def create(self, schema: CreateSchema, user_id: int) -> ResponseSchema:
+        """
+        Crea una nueva entidad con validación.
+
+        Args:
+            schema: Schema de creación con datos validados
+            user_id: ID del usuario que crea la entidad
+
+        Returns:
+            Entidad creada como schema de respuesta
+
+        Raises:
+            ValidationException: Si la validación falla
+
+        Note:
+            Esta operación NO hace commit.
+        """
+        logger.info(f"Servicio async: creando {self.model.__name__}")
+
+        try:
+            # Establecer contexto de usuario para auditoría
+            self.session.info["user_id"] = user_id
+
+            if hasattr(schema, 'model_dump'):
+                entity_data = schema.model_dump()
+            else:
+                entity_data = schema
+            entity = self.model(**entity_data)
+
+            await self.validate_create(entity)
+
+            created = await self.repository.create(entity)
+
+            logger.success(f"{self.model.__name__} creado exitosamente: id={created.id}")
+            return await self.to_response(created)
+
+        except ValidationException:
+            raise
+        except Exception as e:
+            logger.error(f"Error al crear {self.model.__name__}: {str(e)}")
+            raise
+
+    async def update(self, id: int, schema: UpdateSchema, user_id: int) -> ResponseSchema:
+        """
+        Actualiza una entidad existente.
+
+        Args:
+            id: ID de la entidad a actualizar
+            schema: Schema de actualización con datos validados
+            user_id: ID del usuario que actualiza
+
+        Returns:
+            Entidad actualizada como schema de respuesta
+
+        Raises:
+            NotFoundException: Si la entidad no existe
+            ValidationException: Si la validación falla
+        """
+        logger.info(f"Servicio async: actualizando {self.model.__name__} id={id}")
+
+        try:
+            self.session.info["user_id"] = user_id
+
+            entity = await self.repository.get_by_id(id)
+            if not entity:
+                raise NotFoundException(
+                    f"{self.model.__name__} no encontrado",
+                    details={"id": id}
+                )
+
+            update_data = schema.model_dump(exclude_unset=True)
+            for field, value in update_data.items():
+                setattr(entity, field, value)
+
+            await self.validate_update(entity)
+
+            updated = await self.repository.update(entity)
+
+            logger.success(f"{self.model.__name__} actualizado exitosamente: id={updated.id}")
+            return await self.to_response(updated)
+
+        except (NotFoundException, ValidationException):
+            raise
+        except Exception as e:
+            logger.error(f"Error al actualizar {self.model.__name__} id={id}: {str(e)}")
+            raise
+
+    async def delete(self, id: int, user_id: int, soft: bool = True) -> None:
+        """
+        Elimina una entidad.
+
+        Args:
+            id: ID de la entidad a eliminar
+            user_id: ID del usuario que elimina
+            soft: Si True, hace soft delete; si False, hard delete
+
+        Raises:
+            NotFoundException: Si la entidad no existe
+        """
+        logger.info(f"Servicio async: eliminando {self.model.__name__} id={id} (soft={soft})")
+
+        try:
+            self.session.info["user_id"] = user_id
+
+            if soft and hasattr(self.model, "is_deleted"):
+                await self.repository.soft_delete(id, user_id)
+                logger.success(f"{self.model.__name__} marcado como eliminado: id={id}")
+            else:
+                await self.repository.delete(id)
+                logger.warning(f"{self.model.__name__} eliminado permanentemente: id={id}")
+
+        except NotFoundException:
+            raise
+        except Exception as e:
+            logger.error(f"Error al eliminar {self.model.__name__} id={id}: {str(e)}")
+            raise
+
+    async def count(self) -> int:
+        """
+        Cuenta el total de entidades.
+
+        Returns:
+            Número total de entidades
+        """
+        return await self.repository.count()
+
+    async def exists(self, id: int) -> bool:
+        """
+        Verifica si existe una entidad.
+
+        Args:
+            id: ID a verificar
+
+        Returns:
+            True si existe, False en caso contrario
+        """
+        return await self.repository.exists(id)
+
+    # Métodos para sobrescribir en subclases
+    async def validate_create(self, entity: T) -> None:
+        """
+        Valida reglas de negocio antes de crear.
+
+        Sobrescribir en subclases para agregar validaciones específicas.
+
+        Args:
+            entity: Entidad a validar
+
+        Raises:
+            ValidationException: Si la validación falla
+        """
+        pass
+
+    async def validate_update(self, entity: T) -> None:
+        """
+        Valida reglas de negocio antes de actualizar.
+
+        Sobrescribir en subclases para agregar validaciones específicas.
+
+        Args:
+            entity: Entidad a validar
+
+        Raises:
+            ValidationException: Si la validación falla
+        """
+        pass
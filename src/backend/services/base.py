@@ -5,11 +5,14 @@ Proporciona operaciones de negocio genéricas que son heredadas por
 todos los servicios específicos de la aplicación.
 """
 
+from functools import cache
 from typing import Generic, TypeVar
 
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from src.backend.repositories.base import IRepository
+from src.backend.repositories.loading import LoadProfile
 from src.shared.schemas.base import BaseSchema
 from src.backend.exceptions.repository import NotFoundException
 from src.backend.exceptions.service import ValidationException
@@ -22,6 +25,22 @@ UpdateSchema = TypeVar("UpdateSchema", bound=BaseSchema)
 ResponseSchema = TypeVar("ResponseSchema", bound=BaseSchema)
 
 
+@cache
+def list_adapter(schema: type) -> TypeAdapter:
+    """
+    TypeAdapter de ``list[schema]``, construido una vez por schema.
+
+    Valida una página completa de filas (get_rows) en una sola llamada.
+
+    Args:
+        schema: Schema Pydantic de cada fila
+
+    Returns:
+        TypeAdapter reutilizable
+    """
+    return TypeAdapter(list[schema])
+
+
 class BaseService(Generic[T, CreateSchema, UpdateSchema, ResponseSchema]):
     """
     Servicio base implementando lógica de negocio común.
@@ -34,6 +53,8 @@ class BaseService(Generic[T, CreateSchema, UpdateSchema, ResponseSchema]):
         session: Sesión de SQLAlchemy para transacciones
         model: Clase del modelo SQLAlchemy
         response_schema: Clase del schema de respuesta Pydantic
+        list_schema: Schema de los listados (get_all, get_page, get_list)
+        list_rows: Si get_all/get_list usan el fast path de filas del repositorio
 
     Example:
         class CompanyService(BaseService[Company, CompanyCreate, CompanyUpdate, CompanyResponse]):
@@ -48,6 +69,7 @@ class BaseService(Generic[T, CreateSchema, UpdateSchema, ResponseSchema]):
         session: Session,
         model: type[T],
         response_schema: type[ResponseSchema],
+        list_schema: type | None = None,
     ):
         """
         Inicializa el servicio.
@@ -57,11 +79,18 @@ class BaseService(Generic[T, CreateSchema, UpdateSchema, ResponseSchema]):
             session: Sesión de SQLAlchemy
             model: Clase del modelo SQLAlchemy
             response_schema: Clase del schema de respuesta
+            list_schema: Schema de los listados (default: response_schema).
+                Debe coincidir con ``repository.list_schema``, que difiere
+                las columnas que este schema no lee
         """
         self.repository = repository
         self.session = session
         self.model = model
         self.response_schema = response_schema
+        self.list_schema = list_schema or response_schema
+        # Si el repositorio arma filas de este mismo schema, get_all y
+        # get_list lo validan desde filas Core sin materializar entidades
+        self.list_rows = getattr(repository, "list_schema", None) is self.list_schema
 
     def get_by_id(self, id: int) -> ResponseSchema:
         """
@@ -82,7 +111,7 @@ class BaseService(Generic[T, CreateSchema, UpdateSchema, ResponseSchema]):
         """
         logger.debug(f"Servicio: obteniendo {self.model.__name__} id={id}")
 
-        entity = self.repository.get_by_id(id)
+        entity = self.repository.get_by_id(id, profile=LoadProfile.DETAIL)
         if not entity:
             raise NotFoundException(
                 f"{self.model.__name__} no encontrado",
@@ -109,8 +138,76 @@ class BaseService(Generic[T, CreateSchema, UpdateSchema, ResponseSchema]):
         """
         logger.debug(f"Servicio: obteniendo {self.model.__name__}(s) - skip={skip}, limit={limit}")
 
+        if self.list_rows:
+            rows = self.repository.get_rows(skip=skip, limit=limit)
+            return list_adapter(self.list_schema).validate_python(rows)
+
         entities = self.repository.get_all(skip=skip, limit=limit)
-        return [self.response_schema.model_validate(e) for e in entities]
+        return [self.list_schema.model_validate(e) for e in entities]
+
+    def get_page(
+        self,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> tuple[list[ResponseSchema], str | None]:
+        """
+        Obtiene una página con paginación por cursor (keyset).
+
+        Args:
+            limit: Tamaño de página
+            after: Cursor retornado por la página anterior (None = primera)
+
+        Returns:
+            Tupla (entidades como schemas de respuesta, next_cursor)
+
+        Example:
+            items, cursor = service.get_page(limit=50)
+            more, cursor = service.get_page(limit=50, after=cursor)
+        """
+        logger.debug(f"Servicio: página de {self.model.__name__}(s) - limit={limit}, after={after}")
+
+        entities, next_cursor = self.repository.get_page(limit=limit, after=after)
+        return [self.list_schema.model_validate(e) for e in entities], next_cursor
+
+    def get_list(
+        self,
+        filters: dict | None = None,
+        sort: str | None = None,
+        descending: bool | None = None,
+        search: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[ResponseSchema], int]:
+        """
+        Obtiene una página ordenada y filtrada con el total de filas.
+
+        Args:
+            filters: Filtros de igualdad {columna: valor}
+            sort: Columna de orden (ver repository.sortable_columns)
+            descending: Orden descendente (None = por defecto)
+            search: Texto a buscar (ver repository.searchable_columns)
+            skip: Offset de la página
+            limit: Tamaño de página
+
+        Returns:
+            Tupla (entidades como schemas de respuesta, total)
+
+        Raises:
+            ValidationException: Si la columna de orden no está permitida
+
+        Example:
+            items, total = service.get_list(sort="name", descending=True, limit=25)
+        """
+        if self.list_rows:
+            rows, total = self.repository.get_list_rows(
+                filters=filters, sort=sort, descending=descending, search=search, skip=skip, limit=limit
+            )
+            return list_adapter(self.list_schema).validate_python(rows), total
+
+        entities, total = self.repository.get_list(
+            filters=filters, sort=sort, descending=descending, search=search, skip=skip, limit=limit
+        )
+        return [self.list_schema.model_validate(e) for e in entities], total
 
     def create(self, schema: CreateSchema, user_id: int) -> ResponseSchema:
         """
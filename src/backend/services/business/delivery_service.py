@@ -54,6 +54,7 @@ class DeliveryOrderService(BaseService[DeliveryOrder, DeliveryOrderCreate, Deliv
             session=session,
             model=DeliveryOrder,
             response_schema=DeliveryOrderResponse,
+            list_schema=DeliveryOrderListResponse,
         )
         self.delivery_repo: DeliveryOrderRepository = repository
         self.sequence_service = SequenceService(session)
@@ -23,7 +23,10 @@ class InvoiceSIIService(BaseService[InvoiceSII, InvoiceSIICreate, InvoiceSIIUpda
     """Service for Chilean SII domestic invoices."""
 
     def __init__(self, repository: InvoiceSIIRepository, session: Session):
-        super().__init__(repository=repository, session=session, model=InvoiceSII, response_schema=InvoiceSIIResponse)
+        super().__init__(
+            repository=repository, session=session, model=InvoiceSII,
+            response_schema=InvoiceSIIResponse, list_schema=InvoiceSIIListResponse,
+        )
         self.invoice_repo: InvoiceSIIRepository = repository
 
     def validate_create(self, entity: InvoiceSII) -> None:
@@ -67,7 +70,10 @@ class InvoiceExportService(BaseService[InvoiceExport, InvoiceExportCreate, Invoi
     """Service for export invoices."""
 
     def __init__(self, repository: InvoiceExportRepository, session: Session):
-        super().__init__(repository=repository, session=session, model=InvoiceExport, response_schema=InvoiceExportResponse)
+        super().__init__(
+            repository=repository, session=session, model=InvoiceExport,
+            response_schema=InvoiceExportResponse, list_schema=InvoiceExportListResponse,
+        )
         self.invoice_repo: InvoiceExportRepository = repository
 
     def validate_create(self, entity: InvoiceExport) -> None:
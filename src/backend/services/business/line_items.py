@@ -0,0 +1,110 @@
+"""
+Batch changes to document line items (QuoteProduct / OrderProduct).
+
+Shared by QuoteService and OrderService so that saving many lines is one
+request, one bulk INSERT and one totals recalculation instead of one
+round trip and one recalculation per line.
+"""
+
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+from src.backend.exceptions.repository import NotFoundException
+from src.backend.exceptions.service import ValidationException
+from src.backend.repositories.base import BaseRepository
+
+
+@dataclass(frozen=True)
+class LineItemBatchResult:
+    """
+    Row counts of an applied batch.
+
+    Attributes:
+        created: Lines inserted
+        updated: Lines updated
+        deleted: Lines deleted
+    """
+
+    created: int
+    updated: int
+    deleted: int
+
+
+def apply_line_item_batch(
+    repository: BaseRepository,
+    parent_field: str,
+    parent_id: int,
+    lines: Sequence,
+    create: Sequence[BaseModel],
+    update: Sequence[BaseModel],
+    delete: Sequence[int],
+) -> LineItemBatchResult:
+    """
+    Delete, update and insert line items of one document.
+
+    Deletes run first as a single DELETE, updates are applied to the
+    already-loaded lines, and new lines are inserted with one bulk INSERT.
+    New lines that do not set ``sequence`` are numbered after the highest
+    remaining sequence, in request order. Totals are NOT recalculated here:
+    the caller does it once afterwards.
+
+    Args:
+        repository: Line item repository (QuoteProductRepository, ...)
+        parent_field: Foreign key to the document ("quote_id", "order_id")
+        parent_id: Document ID
+        lines: Current lines of the document
+        create: New lines (XProductCreate schemas)
+        update: Changes with ``id`` (XProductBatchUpdate schemas)
+        delete: IDs of lines to delete
+
+    Returns:
+        LineItemBatchResult with row counts
+
+    Raises:
+        NotFoundException: If an updated/deleted ID is not a line of the document
+        ValidationException: If a line is both updated and deleted, or listed twice
+    """
+    by_id = {line.id: line for line in lines}
+    delete_ids = set(delete)
+    counts = Counter([change.id for change in update] + list(delete))
+
+    repeated = sorted(i for i, n in counts.items() if n > 1)
+    if repeated:
+        raise ValidationException(
+            "A line item can only appear once per batch",
+            details={"ids": repeated}
+        )
+
+    missing = sorted(i for i in counts if i not in by_id)
+    if missing:
+        raise NotFoundException(
+            f"Line items not found in {parent_field}={parent_id}",
+            details={parent_field: parent_id, "ids": missing}
+        )
+
+    deleted = repository.delete_many(sorted(delete_ids))
+
+    for change in update:
+        line = by_id[change.id]
+        for field, value in change.model_dump(exclude_unset=True, exclude={"id"}).items():
+            setattr(line, field, value)
+        line.calculate_subtotal()
+
+    remaining = [line for line_id, line in by_id.items() if line_id not in delete_ids]
+    next_sequence = max((line.sequence for line in remaining), default=0) + 1
+
+    new_lines = []
+    for data in create:
+        values = data.model_dump()
+        if "sequence" not in data.model_fields_set:
+            values["sequence"] = next_sequence
+        next_sequence = max(next_sequence, values["sequence"] + 1)
+        line = repository.model(**{parent_field: parent_id}, **values)
+        line.calculate_subtotal()
+        new_lines.append(line)
+    repository.create_many(new_lines)
+
+    return LineItemBatchResult(created=len(new_lines), updated=len(update), deleted=deleted)
@@ -26,8 +26,10 @@ from src.shared.schemas.business.order import (
     OrderProductCreate,
     OrderProductUpdate,
     OrderProductResponse,
+    OrderProductBatch,
 )
 from src.backend.services.base import BaseService
+from src.backend.services.business.line_items import apply_line_item_batch
 from src.backend.exceptions.service import ValidationException
 from src.backend.exceptions.repository import NotFoundException
 from src.backend.utils.logger import logger
@@ -68,6 +70,7 @@ class OrderService(BaseService[Order, OrderCreate, OrderUpdate, OrderResponse]):
             session=session,
             model=Order,
             response_schema=OrderResponse,
+            list_schema=OrderListResponse,
         )
         self.order_repo: OrderRepository = repository
         self.quote_repo = QuoteRepository(session)
@@ -230,24 +233,24 @@ class OrderService(BaseService[Order, OrderCreate, OrderUpdate, OrderResponse]):
             )
         return self.response_schema.model_validate(order)
 
-    def get_all(
+    def get_page(
         self,
-        skip: int = 0,
-        limit: int = 100
-    ) -> list[OrderListResponse]:
+        limit: int = 100,
+        after: str | None = None,
+    ) -> tuple[list[OrderListResponse], str | None]:
         """
-        Get all orders with company names.
+        Get a keyset page of orders with company names.
 
         Args:
-            skip: Pagination offset
-            limit: Maximum records
+            limit: Page size
+            after: Cursor returned by the previous page
 
         Returns:
-            List of orders with company names
+            Tuple (orders, next_cursor)
         """
-        logger.info(f"Getting all orders: skip={skip}, limit={limit}")
-        orders = self.order_repo.get_all(skip, limit)
-        return [self._convert_to_list_response(o) for o in orders]
+        logger.info(f"Getting orders page: limit={limit}, after={after}")
+        orders, next_cursor = self.order_repo.get_page(limit=limit, after=after)
+        return [self._convert_to_list_response(o) for o in orders], next_cursor
 
     def get_by_company(
         self,
@@ -319,8 +322,9 @@ class OrderService(BaseService[Order, OrderCreate, OrderUpdate, OrderResponse]):
         """
         Recalculate order totals from products.
 
-        Calculates:
-        - Subtotal (sum of all line items)
+        Calculates, in the database (see OrderRepository.recompute_totals):
+        - Line subtotals (quantity * unit_price - discount)
+        - Subtotal (sum of all line items; kept as is if there are none)
         - Tax amount (subtotal * tax_percentage)
         - Total (subtotal + tax + shipping + other costs)
 
@@ -338,22 +342,56 @@ class OrderService(BaseService[Order, OrderCreate, OrderUpdate, OrderResponse]):
 
         self.session.info["user_id"] = user_id
 
-        order = self.order_repo.get_with_products(order_id)
-        if not order:
+        if not self.order_repo.recompute_totals(order_ids=[order_id]):
             raise NotFoundException(
                 f"Order not found: id={order_id}",
                 details={"id": order_id}
             )
 
-        # Calculate totals (using existing model method)
-        order.calculate_totals()
-
-        # Save
-        self.order_repo.update(order)
+        order = self.order_repo.get_with_products(order_id)
 
         logger.success(f"Totals calculated for order_id={order_id}: total={order.total}")
         return self.response_schema.model_validate(order)
 
+    def recalculate_all_totals(
+        self,
+        user_id: int,
+        company_id: int | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> int:
+        """
+        Recalculate totals of every order matching the filters.
+
+        Maintenance operation (e.g. after a tax or pricing fix): runs as two
+        UPDATE statements regardless of how many orders and lines match.
+
+        Args:
+            user_id: User performing the recalculation
+            company_id: Only orders of this company
+            date_from: Only orders dated on or after this day
+            date_to: Only orders dated on or before this day
+
+        Returns:
+            Number of orders recalculated
+
+        Example:
+            count = service.recalculate_all_totals(user_id=1, date_from=date(2025, 1, 1))
+        """
+        logger.info(
+            f"Recalculating order totals: company_id={company_id}, "
+            f"date_from={date_from}, date_to={date_to}"
+        )
+
+        self.session.info["user_id"] = user_id
+
+        count = self.order_repo.recompute_totals(
+            company_id=company_id, date_from=date_from, date_to=date_to
+        )
+
+        logger.success(f"Totals recalculated for {count} order(s)")
+        return count
+
     def add_product(
         self,
         order_id: int,
@@ -398,7 +436,7 @@ class OrderService(BaseService[Order, OrderCreate, OrderUpdate, OrderResponse]):
         created = self.order_product_repo.create(order_product)
 
         # Recalculate order totals
-        self.calculate_totals(order_id, user_id)
+        self.order_repo.recompute_totals(order_ids=[order_id])
 
         logger.success(f"Product added to order_id={order_id}: product_id={created.product_id}")
         return OrderProductResponse.model_validate(created)
@@ -446,7 +484,7 @@ class OrderService(BaseService[Order, OrderCreate, OrderUpdate, OrderResponse]):
         updated = self.order_product_repo.update(order_product)
 
         # Recalculate order totals
-        self.calculate_totals(order_id, user_id)
+        self.order_repo.recompute_totals(order_ids=[order_id])
 
         logger.success(f"Product updated in order_id={order_id}: product_id={product_id}")
         return OrderProductResponse.model_validate(updated)
@@ -481,10 +519,65 @@ class OrderService(BaseService[Order, OrderCreate, OrderUpdate, OrderResponse]):
         self.order_product_repo.delete(product_id)
 
         # Recalculate order totals
-        self.calculate_totals(order_id, user_id)
+        self.order_repo.recompute_totals(order_ids=[order_id])
 
         logger.success(f"Product removed from order_id={order_id}: product_id={product_id}")
 
+    def apply_products_batch(
+        self,
+        order_id: int,
+        batch: OrderProductBatch,
+        user_id: int
+    ) -> OrderResponse:
+        """
+        Create, update and delete many order products at once.
+
+        Lines are written with one DELETE and one bulk INSERT, and order
+        totals are recalculated once at the end instead of once per line.
+
+        Args:
+            order_id: Order ID
+            batch: Lines to create, update and delete
+            user_id: User changing the lines
+
+        Returns:
+            Order with its products and recalculated totals
+
+        Raises:
+            NotFoundException: If the order or a listed line is not found
+            ValidationException: If a line is listed more than once
+        """
+        logger.info(
+            f"Applying product batch to order_id={order_id}: "
+            f"create={len(batch.create)}, update={len(batch.update)}, delete={len(batch.delete)}"
+        )
+
+        self.session.info["user_id"] = user_id
+
+        if not self.order_repo.exists(order_id):
+            raise NotFoundException(
+                f"Order not found: id={order_id}",
+                details={"id": order_id}
+            )
+
+        result = apply_line_item_batch(
+            self.order_product_repo,
+            parent_field="order_id",
+            parent_id=order_id,
+            lines=self.order_product_repo.get_by_order(order_id),
+            create=batch.create,
+            update=batch.update,
+            delete=batch.delete,
+        )
+
+        order = self.calculate_totals(order_id, user_id)
+
+        logger.success(
+            f"Product batch applied to order_id={order_id}: created={result.created}, "
+            f"updated={result.updated}, deleted={result.deleted}"
+        )
+        return order
+
     def create(self, schema: OrderCreate, user_id: int) -> OrderResponse:
         """
         Create a new order.
@@ -6,11 +6,17 @@ and complex business rules.
 """
 
 
+from datetime import date
 from decimal import Decimal
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.backend.models.business.quotes import Quote, QuoteProduct
-from src.backend.repositories.business.quote_repository import QuoteRepository, QuoteProductRepository
+from src.backend.repositories.business.quote_repository import (
+    AsyncQuoteRepository,
+    QuoteRepository,
+    QuoteProductRepository,
+)
 from src.shared.schemas.business.quote import (
     QuoteCreate,
     QuoteUpdate,
@@ -19,8 +25,11 @@ from src.shared.schemas.business.quote import (
     QuoteProductCreate,
     QuoteProductUpdate,
     QuoteProductResponse,
+    QuoteProductBatch,
 )
+from src.backend.services.async_base import AsyncBaseService
 from src.backend.services.base import BaseService
+from src.backend.services.business.line_items import apply_line_item_batch
 from src.backend.exceptions.service import ValidationException
 from src.backend.exceptions.repository import NotFoundException
 from src.backend.utils.logger import logger
@@ -59,12 +68,14 @@ class QuoteService(BaseService[Quote, QuoteCreate, QuoteUpdate, QuoteResponse]):
             session=session,
             model=Quote,
             response_schema=QuoteResponse,
+            list_schema=QuoteListResponse,
         )
         self.quote_repo: QuoteRepository = repository
         self.product_repo = QuoteProductRepository(session)
         self.sequence_service = SequenceService(session)
 
-    def _convert_to_list_response(self, quote: Quote) -> QuoteListResponse:
+    @staticmethod
+    def _convert_to_list_response(quote: Quote) -> QuoteListResponse:
         """
         Convert Quote entity to QuoteListResponse including company name.
 
@@ -248,24 +259,24 @@ class QuoteService(BaseService[Quote, QuoteCreate, QuoteUpdate, QuoteResponse]):
             )
         return self.response_schema.model_validate(quote)
 
-    def get_all(
+    def get_page(
         self,
-        skip: int = 0,
-        limit: int = 100
-    ) -> list[QuoteListResponse]:
+        limit: int = 100,
+        after: str | None = None,
+    ) -> tuple[list[QuoteListResponse], str | None]:
         """
-        Get all quotes with company names.
+        Get a keyset page of quotes with company names.
 
         Args:
-            skip: Pagination offset
-            limit: Maximum records
+            limit: Page size
+            after: Cursor returned by the previous page
 
         Returns:
-            List of quotes with company names
+            Tuple (quotes, next_cursor)
         """
-        logger.info(f"Getting all quotes: skip={skip}, limit={limit}")
-        quotes = self.quote_repo.get_all(skip, limit)
-        return [self._convert_to_list_response(q) for q in quotes]
+        logger.info(f"Getting quotes page: limit={limit}, after={after}")
+        quotes, next_cursor = self.quote_repo.get_page(limit=limit, after=after)
+        return [self._convert_to_list_response(q) for q in quotes], next_cursor
 
     def get_by_company(
         self,
@@ -358,7 +369,8 @@ class QuoteService(BaseService[Quote, QuoteCreate, QuoteUpdate, QuoteResponse]):
         """
         Recalculate quote totals from line items.
 
-        Calculates:
+        Calculates, in the database (see QuoteRepository.recompute_totals):
+        - Line subtotals (quantity * unit_price - discount)
         - Subtotal (sum of all line items)
         - Tax amount (subtotal * tax_percentage)
         - Total (subtotal + tax)
@@ -380,26 +392,56 @@ class QuoteService(BaseService[Quote, QuoteCreate, QuoteUpdate, QuoteResponse]):
 
         self.session.info["user_id"] = user_id
 
-        quote = self.quote_repo.get_with_products(quote_id)
-        if not quote:
+        if not self.quote_repo.recompute_totals(quote_ids=[quote_id]):
             raise NotFoundException(
                 f"Quote not found: id={quote_id}",
                 details={"id": quote_id}
             )
 
-        # Calculate line item subtotals first
-        for product in quote.products:
-            product.calculate_subtotal()
-
-        # Calculate quote totals
-        quote.calculate_totals()
-
-        # Save
-        self.quote_repo.update(quote)
+        quote = self.quote_repo.get_with_products(quote_id)
 
         logger.success(f"Totals calculated for quote_id={quote_id}: total={quote.total}")
         return self.response_schema.model_validate(quote)
 
+    def recalculate_all_totals(
+        self,
+        user_id: int,
+        company_id: int | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> int:
+        """
+        Recalculate totals of every quote matching the filters.
+
+        Maintenance operation (e.g. after a tax or pricing fix): runs as two
+        UPDATE statements regardless of how many quotes and lines match.
+
+        Args:
+            user_id: User performing the recalculation
+            company_id: Only quotes of this company
+            date_from: Only quotes dated on or after this day
+            date_to: Only quotes dated on or before this day
+
+        Returns:
+            Number of quotes recalculated
+
+        Example:
+            count = service.recalculate_all_totals(user_id=1, company_id=5)
+        """
+        logger.info(
+            f"Recalculating quote totals: company_id={company_id}, "
+            f"date_from={date_from}, date_to={date_to}"
+        )
+
+        self.session.info["user_id"] = user_id
+
+        count = self.quote_repo.recompute_totals(
+            company_id=company_id, date_from=date_from, date_to=date_to
+        )
+
+        logger.success(f"Totals recalculated for {count} quote(s)")
+        return count
+
     def add_product(
         self,
         quote_id: int,
@@ -435,8 +477,7 @@ class QuoteService(BaseService[Quote, QuoteCreate, QuoteUpdate, QuoteResponse]):
         self.session.info["user_id"] = user_id
 
         # Verify quote exists
-        quote = self.quote_repo.get_by_id(quote_id)
-        if not quote:
+        if not self.quote_repo.exists(quote_id):
             raise NotFoundException(
                 f"Quote not found: id={quote_id}",
                 details={"id": quote_id}
@@ -453,8 +494,7 @@ class QuoteService(BaseService[Quote, QuoteCreate, QuoteUpdate, QuoteResponse]):
         created = self.product_repo.create(product)
 
         # Recalculate quote totals
-        quote.calculate_totals()
-        self.quote_repo.update(quote)
+        self.quote_repo.recompute_totals(quote_ids=[quote_id])
 
         logger.success(f"Product added to quote_id={quote_id}: product_id={created.id}")
         return QuoteProductResponse.model_validate(created)
@@ -505,10 +545,7 @@ class QuoteService(BaseService[Quote, QuoteCreate, QuoteUpdate, QuoteResponse]):
         updated = self.product_repo.update(product)
 
         # Recalculate quote totals
-        quote = self.quote_repo.get_by_id(product.quote_id)
-        if quote:
-            quote.calculate_totals()
-            self.quote_repo.update(quote)
+        self.quote_repo.recompute_totals(quote_ids=[product.quote_id])
 
         logger.success(f"Quote product updated: id={product_id}")
         return QuoteProductResponse.model_validate(updated)
@@ -544,9 +581,251 @@ class QuoteService(BaseService[Quote, QuoteCreate, QuoteUpdate, QuoteResponse]):
         self.product_repo.delete(product_id)
 
         # Recalculate quote totals
-        quote = self.quote_repo.get_by_id(quote_id)
-        if quote:
-            quote.calculate_totals()
-            self.quote_repo.update(quote)
+        self.quote_repo.recompute_totals(quote_ids=[quote_id])
 
         logger.success(f"Quote product removed: id={product_id}")
+
+    def apply_products_batch(
+        self,
+        quote_id: int,
+        batch: QuoteProductBatch,
+        user_id: int
+    ) -> QuoteResponse:
+        """
+        Create, update and delete many quote products at once.
+
+        Lines are written with one DELETE and one bulk INSERT, and quote
+        totals are recalculated once at the end instead of once per line.
+
+        Args:
+            quote_id: Quote ID
+            batch: Lines to create, update and delete
+            user_id: User changing the lines
+
+        Returns:
+            Quote with its products and recalculated totals
+
+        Raises:
+            NotFoundException: If the quote or a listed line is not found
+            ValidationException: If a line is listed more than once
+
+        Example:
+            batch = QuoteProductBatch(create=[QuoteProductCreate(product_id=10, quantity=1, unit_price=100)])
+            quote = service.apply_products_batch(quote_id=123, batch=batch, user_id=1)
+        """
+        logger.info(
+            f"Applying product batch to quote_id={quote_id}: "
+            f"create={len(batch.create)}, update={len(batch.update)}, delete={len(batch.delete)}"
+        )
+
+        self.session.info["user_id"] = user_id
+
+        if not self.quote_repo.exists(quote_id):
+            raise NotFoundException(
+                f"Quote not found: id={quote_id}",
+                details={"id": quote_id}
+            )
+
+        result = apply_line_item_batch(
+            self.product_repo,
+            parent_field="quote_id",
+            parent_id=quote_id,
+            lines=self.product_repo.get_by_quote(quote_id),
+            create=batch.create,
+            update=batch.update,
+            delete=batch.delete,
+        )
+
+        quote = self.calculate_totals(quote_id, user_id)
+
+        logger.success(
+            f"Product batch applied to quote_id={quote_id}: created={result.created}, "
+            f"updated={result.updated}, deleted={result.deleted}"
+        )
+        return quote
+
+
+class AsyncQuoteService(AsyncBaseService[Quote, QuoteCreate, QuoteUpdate, QuoteResponse]):
+    """
+    Async read service for Quote.
+
+    Exposes the QuoteService read operations as coroutines for the async
+    GET /quotes endpoints. Writes stay on QuoteService.
+
+    Example:
+        service = AsyncQuoteService(AsyncQuoteRepository(session), session)
+        quote = await service.get_with_products(123)
+    """
+
+    def __init__(
+        self,
+        repository: AsyncQuoteRepository,
+        session: AsyncSession,
+    ):
+        """
+        Initialize AsyncQuoteService.
+
+        Args:
+            repository: AsyncQuoteRepository instance
+            session: SQLAlchemy async session
+        """
+        super().__init__(
+            repository=repository,
+            session=session,
+            model=Quote,
+            response_schema=QuoteResponse,
+            list_schema=QuoteListResponse,
+        )
+        self.quote_repo: AsyncQuoteRepository = repository
+
+    async def _to_list_response(self, quotes) -> list[QuoteListResponse]:
+        """Convert quotes to QuoteListResponse including company name."""
+        return await self.to_response(list(quotes), QuoteService._convert_to_list_response)
+
+    async def get_by_quote_number(self, quote_number: str) -> QuoteResponse:
+        """
+        Get quote by unique quote number.
+
+        Args:
+            quote_number: Quote number (e.g., "Q-2025-001")
+
+        Returns:
+            Quote data
+
+        Raises:
+            NotFoundException: If quote not found
+        """
+        logger.info(f"Getting quote by number: {quote_number}")
+        quote = await self.quote_repo.get_by_quote_number(quote_number)
+        if not quote:
+            raise NotFoundException(
+                f"Quote not found: {quote_number}",
+                details={"quote_number": quote_number}
+            )
+        return await self.to_response(quote)
+
+    async def get_with_products(self, quote_id: int) -> QuoteResponse:
+        """
+        Get quote with all products loaded.
+
+        Args:
+            quote_id: Quote ID
+
+        Returns:
+            Quote with products
+
+        Raises:
+            NotFoundException: If quote not found
+        """
+        logger.info(f"Getting quote id={quote_id} with products")
+        quote = await self.quote_repo.get_with_products(quote_id)
+        if not quote:
+            raise NotFoundException(
+                f"Quote not found: id={quote_id}",
+                details={"id": quote_id}
+            )
+        return await self.to_response(quote)
+
+    async def get_page(
+        self,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> tuple[list[QuoteListResponse], str | None]:
+        """
+        Get a keyset page of quotes with company names.
+
+        Args:
+            limit: Page size
+            after: Cursor returned by the previous page
+
+        Returns:
+            Tuple (quotes, next_cursor)
+        """
+        logger.info(f"Getting quotes page: limit={limit}, after={after}")
+        quotes, next_cursor = await self.quote_repo.get_page(limit=limit, after=after)
+        return await self._to_list_response(quotes), next_cursor
+
+    async def get_by_company(
+        self,
+        company_id: int,
+        skip: int = 0,
+        limit: int = 100
+    ) -> list[QuoteListResponse]:
+        """
+        Get all quotes for a company.
+
+        Args:
+            company_id: Company ID
+            skip: Pagination offset
+            limit: Maximum records
+
+        Returns:
+            List of quotes
+        """
+        logger.info(f"Getting quotes for company_id={company_id}")
+        quotes = await self.quote_repo.get_by_company(company_id, skip, limit)
+        return await self._to_list_response(quotes)
+
+    async def get_by_status(
+        self,
+        status_id: int,
+        skip: int = 0,
+        limit: int = 100
+    ) -> list[QuoteListResponse]:
+        """
+        Get quotes by status.
+
+        Args:
+            status_id: Quote status ID
+            skip: Pagination offset
+            limit: Maximum records
+
+        Returns:
+            List of quotes
+        """
+        logger.info(f"Getting quotes with status_id={status_id}")
+        quotes = await self.quote_repo.get_by_status(status_id, skip, limit)
+        return await self._to_list_response(quotes)
+
+    async def get_by_staff(
+        self,
+        staff_id: int,
+        skip: int = 0,
+        limit: int = 100
+    ) -> list[QuoteListResponse]:
+        """
+        Get quotes assigned to staff member.
+
+        Args:
+            staff_id: Staff ID
+            skip: Pagination offset
+            limit: Maximum records
+
+        Returns:
+            List of quotes
+        """
+        logger.info(f"Getting quotes for staff_id={staff_id}")
+        quotes = await self.quote_repo.get_by_staff(staff_id, skip, limit)
+        return await self._to_list_response(quotes)
+
+    async def search_by_subject(
+        self,
+        subject: str,
+        skip: int = 0,
+        limit: int = 100
+    ) -> list[QuoteListResponse]:
+        """
+        Search quotes by subject.
+
+        Args:
+            subject: Text to search
+            skip: Pagination offset
+            limit: Maximum records
+
+        Returns:
+            List of matching quotes
+        """
+        logger.info(f"Searching quotes by subject: '{subject}'")
+        quotes = await self.quote_repo.search_by_subject(subject, skip, limit)
+        return await self._to_list_response(quotes)
+
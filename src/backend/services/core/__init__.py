@@ -7,6 +7,8 @@ las entidades principales del sistema.
 
 from src.backend.services.core.company_service import CompanyService
 from src.backend.services.core.product_service import ProductService
+from src.backend.services.core.product_import_service import ProductImportService
+from src.backend.services.core.company_import_service import CompanyImportService
 from src.backend.services.core.address_service import AddressService
 from src.backend.services.core.contact_service import ContactService
 from src.backend.services.core.service_service import ServiceService
@@ -16,6 +18,8 @@ from src.backend.services.core.note_service import NoteService
 __all__ = [
     "CompanyService",
     "ProductService",
+    "ProductImportService",
+    "CompanyImportService",
     "AddressService",
     "ContactService",
     "ServiceService",
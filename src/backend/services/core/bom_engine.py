@@ -0,0 +1,284 @@
+"""
+Motor de explosión de BOM (Bill of Materials).
+
+Trabaja sobre el sub-grafo que ProductComponentRepository.get_bom_graph
+carga en una sola query: en lugar de pedir a la base los componentes de
+cada nodo (N+1 queries por nivel), todos los cálculos se hacen en memoria.
+
+- Costo, precio, peso y niveles se acumulan recorriendo los nodos en
+  post-orden, de modo que cada sub-ensamble compartido se calcula una sola
+  vez (memoización) sin importar cuántos padres lo usen.
+- Las cantidades aplanadas se propagan en orden topológico desde la raíz
+  (O(aristas)), sin copiar sets de visitados en cada nivel.
+- El recorrido es iterativo: la profundidad del BOM no está limitada por
+  el límite de recursión de Python.
+- Los sub-ensambles con acumulados materializados (ProductBOMRollup) se
+  usan como hojas: solo se recalcula la parte invalidada del BOM.
+- Los acumulados intermedios se llevan a ``ROLLUP_QUANTUM`` (la escala de
+  ProductBOMRollup), no a centavos: un sub-ensamble vale lo mismo leído
+  como hoja materializada que recalculado. Solo los valores que salen del
+  motor (cost, price, weight, flat_bom) se redondean a centavos/gramos.
+"""
+
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import Any
+
+from src.backend.config.constants import PRODUCT_TYPE_ARTICLE, PRODUCT_TYPE_SERVICE
+from src.backend.exceptions.service import BusinessRuleException
+from src.backend.models.core.products import ProductBOMRollup
+
+_VISITING = 1
+_DONE = 2
+
+# Escala de los acumulados intermedios y materializados
+ROLLUP_QUANTUM = Decimal("1E-10")
+# Escala de los valores retornados (la de cost_price/sale_price y net_weight)
+_CENT = Decimal("0.01")
+_GRAM = Decimal("0.001")
+
+
+class BOMEngine:
+    """
+    Explosión de BOM en memoria para un producto raíz.
+
+    Attributes:
+        root_id: ID del producto raíz
+        products: Datos de cada producto del sub-grafo por ID
+        children: Componentes directos por ID de padre [(component_id, quantity)]
+        cached: IDs cuyos acumulados vienen materializados (no se recalculan)
+
+    Example:
+        engine = BOMEngine(component_repo.get_bom_graph(product_id), product_id)
+        cost = engine.cost()
+        flat = engine.flat_bom()
+    """
+
+    def __init__(self, rows: Iterable[Any], root_id: int):
+        """
+        Construye el grafo y calcula los acumulados.
+
+        Args:
+            rows: Filas retornadas por ProductComponentRepository.get_bom_graph
+                (con o sin use_rollups)
+            root_id: ID del producto raíz
+
+        Raises:
+            BusinessRuleException: Si el BOM contiene un ciclo
+        """
+        self.root_id = root_id
+        self.products: dict[int, Any] = {}
+        self.children: dict[int, list[tuple[int, Decimal]]] = {}
+        self.cached: set[int] = set()
+
+        for row in rows:
+            if row.id not in self.products:
+                self.products[row.id] = row
+                self.children[row.id] = []
+                if getattr(row, "rollup_cost", None) is not None:
+                    self.cached.add(row.id)
+            if row.component_id is not None:
+                self.children[row.id].append((row.component_id, row.quantity))
+
+        self._order = self._post_order() if self.exists else []
+        self._cost: dict[int, Decimal] = {}
+        self._price: dict[int, Decimal] = {}
+        self._weight: dict[int, Decimal | None] = {}
+        self._levels: dict[int, int] = {}
+        self._rollup()
+
+    @property
+    def exists(self) -> bool:
+        """True si el producto raíz existe."""
+        return self.root_id in self.products
+
+    def _post_order(self) -> list[int]:
+        """
+        Ordena los nodos alcanzables de forma que cada componente aparezca
+        antes que todos sus padres (DFS iterativo).
+
+        Raises:
+            BusinessRuleException: Si se encuentra un ciclo
+        """
+        order: list[int] = []
+        state = {self.root_id: _VISITING}
+        stack = [(self.root_id, iter(self.children[self.root_id]))]
+
+        while stack:
+            node_id, pending = stack[-1]
+            for child_id, _quantity in pending:
+                child_state = state.get(child_id)
+                if child_state is None:
+                    state[child_id] = _VISITING
+                    stack.append((child_id, iter(self.children[child_id])))
+                    break
+                if child_state == _VISITING:
+                    raise BusinessRuleException(
+                        "Se detectó un ciclo en el BOM",
+                        details={"product_id": self.root_id, "parent_id": node_id, "component_id": child_id}
+                    )
+            else:
+                state[node_id] = _DONE
+                order.append(node_id)
+                stack.pop()
+
+        return order
+
+    def _rollup(self) -> None:
+        """Calcula costo, precio, peso y niveles de cada nodo (memoizado)."""
+        for node_id in self._order:
+            product = self.products[node_id]
+            children = self.children[node_id]
+
+            if node_id in self.cached:
+                self._cost[node_id] = product.rollup_cost
+                self._price[node_id] = product.rollup_price
+                self._weight[node_id] = product.rollup_weight
+                self._levels[node_id] = product.rollup_levels
+                continue
+
+            if product.product_type == PRODUCT_TYPE_ARTICLE:
+                self._cost[node_id] = product.cost_price or Decimal("0.00")
+                self._price[node_id] = product.sale_price or Decimal("0.00")
+            else:
+                self._cost[node_id] = sum(
+                    (self._cost[child_id] * quantity for child_id, quantity in children),
+                    Decimal("0.00"),
+                ).quantize(ROLLUP_QUANTUM)
+                self._price[node_id] = sum(
+                    (self._price[child_id] * quantity for child_id, quantity in children),
+                    Decimal("0.00"),
+                ).quantize(ROLLUP_QUANTUM)
+
+            self._weight[node_id] = self._node_weight(product, children)
+            self._levels[node_id] = 1 + max(
+                (self._levels[child_id] for child_id, _quantity in children), default=-1
+            )
+
+    def _node_weight(self, product: Any, children: list[tuple[int, Decimal]]) -> Decimal | None:
+        """Peso de un nodo con la misma semántica que Product.get_total_weight."""
+        if product.product_type == PRODUCT_TYPE_SERVICE:
+            return None
+        if product.product_type == PRODUCT_TYPE_ARTICLE or not children:
+            return product.net_weight
+
+        total = Decimal("0.000")
+        for child_id, quantity in children:
+            child_weight = self._weight[child_id]
+            if child_weight:
+                total += child_weight * quantity
+        return total.quantize(ROLLUP_QUANTUM) if total > 0 else product.net_weight
+
+    def cost(self, product_id: int | None = None) -> Decimal:
+        """
+        Costo unitario acumulado (ARTICLE: cost_price, resto: suma de componentes).
+
+        Args:
+            product_id: Producto del sub-grafo (default: raíz)
+
+        Returns:
+            Costo redondeado a centavos
+        """
+        return self._cost.get(self.root_id if product_id is None else product_id, Decimal("0")).quantize(_CENT)
+
+    def price(self, product_id: int | None = None) -> Decimal:
+        """
+        Precio de venta unitario acumulado (ARTICLE: sale_price, resto: suma de componentes).
+
+        Args:
+            product_id: Producto del sub-grafo (default: raíz)
+
+        Returns:
+            Precio redondeado a centavos
+        """
+        return self._price.get(self.root_id if product_id is None else product_id, Decimal("0")).quantize(_CENT)
+
+    def weight(self, product_id: int | None = None) -> Decimal | None:
+        """
+        Peso unitario acumulado.
+
+        Args:
+            product_id: Producto del sub-grafo (default: raíz)
+
+        Returns:
+            Peso redondeado a gramos, None si no aplica
+        """
+        weight = self._weight.get(self.root_id if product_id is None else product_id)
+        return None if weight is None else weight.quantize(_GRAM)
+
+    def levels(self) -> int:
+        """Niveles de profundidad del BOM de la raíz (0 si no tiene componentes)."""
+        return self._levels.get(self.root_id, 0)
+
+    def rollups(self) -> list[ProductBOMRollup]:
+        """
+        Acumulados calculados en esta explosión, listos para materializar.
+
+        Incluye la raíz y cada sub-ensamble recalculado (los ARTICLE no se
+        materializan: su costo es su propio cost_price). Los valores van a
+        escala ROLLUP_QUANTUM, sin redondear a centavos.
+
+        Returns:
+            Lista de ProductBOMRollup nuevos (sin persistir)
+        """
+        return [
+            ProductBOMRollup(
+                product_id=node_id,
+                cost=self._cost[node_id],
+                price=self._price[node_id],
+                weight=self._weight[node_id],
+                levels=self._levels[node_id],
+            )
+            for node_id in self._order
+            if node_id not in self.cached
+            and self.products[node_id].product_type != PRODUCT_TYPE_ARTICLE
+        ]
+
+    def flat_quantities(self) -> dict[int, Decimal]:
+        """
+        Cantidad total de cada componente (todos los niveles) por unidad de la raíz.
+
+        Returns:
+            Dict {component_id: cantidad}, incluye sub-ensambles intermedios
+
+        Note:
+            Requiere el grafo completo (get_bom_graph sin use_rollups).
+        """
+        multiplier: dict[int, Decimal] = {self.root_id: Decimal("1")} if self.exists else {}
+        # El post-orden invertido es un orden topológico: cada nodo se
+        # procesa después de todos sus padres, con su multiplicador completo.
+        for node_id in reversed(self._order):
+            factor = multiplier.get(node_id)
+            for child_id, quantity in self.children[node_id]:
+                multiplier[child_id] = multiplier.get(child_id, Decimal("0")) + factor * quantity
+
+        multiplier.pop(self.root_id, None)
+        return multiplier
+
+    def flat_bom(self) -> list[dict[str, Any]]:
+        """
+        Lista plana de todos los componentes del BOM.
+
+        Mismo formato que Product.get_flat_bom, con unit_cost/unit_price
+        acumulados desde los componentes.
+
+        Returns:
+            Lista de dicts (product_id, reference, designation, quantity,
+            unit_cost, unit_price)
+        """
+        flat = []
+        for product_id, quantity in self.flat_quantities().items():
+            product = self.products[product_id]
+            flat.append({
+                "product_id": product_id,
+                "reference": product.reference,
+                "designation": (
+                    product.designation_es
+                    or product.designation_en
+                    or product.designation_fr
+                ),
+                "quantity": quantity,
+                "unit_cost": self.cost(product_id),
+                "unit_price": self.price(product_id),
+            })
+        return flat
@@ -0,0 +1,397 @@
+"""
+Proceso común de las importaciones masivas desde Excel (.xlsx) o CSV.
+
+El archivo se lee en streaming (openpyxl en modo read-only / csv.reader),
+se valida por fila con el schema de creación de la entidad y se inserta por
+bloques con ``bulk_insert`` (INSERT masivo). Las filas con error se informan
+sin abortar la importación.
+
+Cada entidad importable define una subclase de BulkImportService con su
+schema, su columna clave (única, para detectar duplicados) y sus lookups por
+nombre: ver ProductImportService y CompanyImportService.
+"""
+
+import csv
+import io
+import zipfile
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, ClassVar
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.backend.exceptions.service import ValidationException
+from src.backend.repositories.base import BaseRepository
+from src.backend.repositories.search_repository import SearchRepository
+from src.backend.utils.logger import logger
+from src.shared.schemas.core.product_import import ImportResult, ImportRowError
+
+IMPORT_FORMATS = ("csv", "xlsx")
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+
+
+# ============================================================================
+# LECTURA DE ARCHIVOS
+# ============================================================================
+
+def _clean(value: Any) -> Any:
+    """Normaliza una celda: strings sin espacios, vacío -> None, números -> str."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        # Los schemas validan strings numéricos para Decimal/int, y las
+        # referencias numéricas de Excel deben seguir siendo texto.
+        return str(value)
+    return value
+
+
+def _rows_from_values(values: Iterator[tuple]) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Convierte filas de valores (la primera es la cabecera) en dicts."""
+    header = next(values, None)
+    if header is None:
+        return
+    columns = [str(name).strip().lower() if name is not None else "" for name in header]
+
+    for row_number, row in enumerate(values, start=2):
+        cleaned = {column: _clean(value) for column, value in zip(columns, row) if column}
+        if any(value is not None for value in cleaned.values()):
+            yield row_number, cleaned
+
+
+def read_csv_rows(stream: BinaryIO) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Lee un CSV (UTF-8, separador ``,`` ``;`` o tabulador) fila por fila.
+
+    Args:
+        stream: Archivo binario
+
+    Yields:
+        (número de fila, dict columna -> valor)
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    sample = text.read(8192)
+    text.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    try:
+        yield from _rows_from_values(iter(csv.reader(text, dialect)))
+    finally:
+        text.detach()
+
+
+def read_xlsx_rows(stream: BinaryIO) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Lee la primera hoja de un .xlsx en modo read-only (sin cargar el libro en memoria).
+
+    Args:
+        stream: Archivo binario
+
+    Yields:
+        (número de fila, dict columna -> valor)
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        yield from _rows_from_values(workbook.active.iter_rows(values_only=True))
+    finally:
+        workbook.close()
+
+
+def read_rows(stream: BinaryIO, file_format: str) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Lee filas de un archivo CSV o xlsx.
+
+    Raises:
+        ValidationException: Si el formato no está soportado
+    """
+    if file_format == "csv":
+        return read_csv_rows(stream)
+    if file_format == "xlsx":
+        return read_xlsx_rows(stream)
+    raise ValidationException(
+        f"Formato de importación no soportado: '{file_format}'",
+        details={"format": file_format, "allowed": list(IMPORT_FORMATS)},
+    )
+
+
+# ============================================================================
+# SERVICIO
+# ============================================================================
+
+@dataclass
+class _ImportTally:
+    """Contadores de una importación (los schemas validan en cada asignación)."""
+
+    total_rows: int = 0
+    created: int = 0
+    failed: int = 0
+    errors: list[ImportRowError] = field(default_factory=list)
+
+    def add_error(self, row_number: int, reference: Any, errors: list[str]) -> None:
+        """Registra una fila rechazada (detalla solo las primeras MAX_REPORTED_ERRORS)."""
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(
+                ImportRowError(
+                    row=row_number,
+                    reference=str(reference) if reference is not None else None,
+                    errors=errors,
+                )
+            )
+
+
+class BulkImportService:
+    """
+    Base de los servicios de importación masiva.
+
+    Valida cada fila con ``create_schema``, resuelve lookups con mapas en
+    memoria (cargados una vez) y detecta claves duplicadas (en la base o
+    repetidas en el archivo) sin consultar por fila. Cada bloque se inserta
+    con ``bulk_insert`` en un savepoint y se indexa para búsqueda; si la base
+    rechaza el bloque, se reintenta fila por fila para aislar las filas con
+    error.
+
+    Las subclases definen:
+        entity_name: Nombre de la entidad para los logs
+        create_schema: Schema de creación que valida cada fila
+        key_column: Columna única que identifica la fila en los errores
+        lookups: Columna por nombre -> (modelo lookup, campo FK)
+        result_class: Schema del resumen
+        _existing_keys() / _get_by_keys(): claves existentes y filas insertadas
+    """
+
+    entity_name: ClassVar[str]
+    create_schema: ClassVar[type[BaseModel]]
+    key_column: ClassVar[str]
+    lookups: ClassVar[dict[str, tuple[Any, str]]] = {}
+    result_class: ClassVar[type[ImportResult]]
+
+    def __init__(
+        self,
+        repository: BaseRepository,
+        session: Session,
+        search_repository: SearchRepository | None = None,
+    ):
+        """
+        Inicializa el servicio.
+
+        Args:
+            repository: Repositorio de la entidad importada
+            session: Sesión de SQLAlchemy
+            search_repository: Repositorio del índice de búsqueda
+                (default: uno nuevo sobre la misma sesión)
+        """
+        self.repository = repository
+        self.session = session
+        self.search_repo = search_repository or SearchRepository(session)
+
+    def import_file(
+        self,
+        stream: BinaryIO,
+        file_format: str,
+        user_id: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ImportResult:
+        """
+        Importa desde un archivo CSV o xlsx.
+
+        Args:
+            stream: Archivo binario
+            file_format: "csv" o "xlsx"
+            user_id: ID del usuario que importa
+            chunk_size: Filas por bloque de inserción
+
+        Returns:
+            Resumen de la importación
+
+        Raises:
+            ValidationException: Si el formato no está soportado o el archivo no se puede leer
+
+        Note:
+            Esta operación NO hace commit.
+        """
+        rows = read_rows(stream, file_format)
+        try:
+            return self.import_rows(rows, user_id, chunk_size=chunk_size)
+        except (csv.Error, UnicodeDecodeError, zipfile.BadZipFile, KeyError) as e:
+            # openpyxl lanza BadZipFile o KeyError (falta una parte del libro) con archivos inválidos
+            raise ValidationException(
+                f"No se pudo leer el archivo {file_format}: {e}",
+                details={"format": file_format},
+            ) from e
+
+    def import_rows(
+        self,
+        rows: Iterable[tuple[int, dict[str, Any]]],
+        user_id: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ImportResult:
+        """
+        Importa desde filas ya leídas.
+
+        Args:
+            rows: Pares (número de fila, dict columna -> valor)
+            user_id: ID del usuario que importa
+            chunk_size: Filas por bloque de inserción
+
+        Returns:
+            Resumen de la importación
+
+        Note:
+            Esta operación NO hace commit.
+        """
+        logger.info(f"Servicio: importando {self.entity_name} (bloques de {chunk_size})")
+        self.session.info["user_id"] = user_id
+
+        tally = _ImportTally()
+        lookups = self._load_lookups()
+        keys = self._existing_keys()
+        known_columns = set(self.create_schema.model_fields) | set(self.lookups)
+        ignored_columns: set[str] = set()
+
+        chunk: list[tuple[int, dict[str, Any]]] = []
+        for row_number, row in rows:
+            tally.total_rows += 1
+            ignored_columns.update(row.keys() - known_columns)
+
+            values, errors = self._validate_row(row, lookups, keys)
+            if errors:
+                tally.add_error(row_number, row.get(self.key_column), errors)
+                continue
+
+            keys.add(values[self.key_column])
+            chunk.append((row_number, values))
+            if len(chunk) >= chunk_size:
+                self._write_chunk(chunk, tally)
+                chunk = []
+
+        if chunk:
+            self._write_chunk(chunk, tally)
+
+        logger.success(
+            f"Importación terminada: {tally.created} creado(s), {tally.failed} con error "
+            f"de {tally.total_rows} fila(s)"
+        )
+        return self.result_class(
+            total_rows=tally.total_rows,
+            created=tally.created,
+            failed=tally.failed,
+            errors=tally.errors,
+            errors_truncated=tally.failed > len(tally.errors),
+            ignored_columns=sorted(ignored_columns),
+        )
+
+    def _existing_keys(self) -> set[str]:
+        """Claves (``key_column``) ya guardadas en la base."""
+        raise NotImplementedError
+
+    def _get_by_keys(self, keys: list[str]) -> Sequence[Any]:
+        """Entidades recién insertadas, para indexarlas."""
+        raise NotImplementedError
+
+    def _prepare_row(self, data: dict[str, Any]) -> None:
+        """Ajusta la fila antes de validarla con el schema (default: nada)."""
+
+    def _check_values(self, values: dict[str, Any], keys: set[str]) -> list[str]:
+        """
+        Reglas que el schema no cubre (``bulk_insert`` no pasa por los @validates).
+
+        La base verifica que la clave no esté repetida; las subclases agregan
+        las reglas de los @validates de su modelo.
+        """
+        key = values[self.key_column]
+        if key in keys:
+            return [f"{self.key_column}: '{key}' ya existe"]
+        return []
+
+    def _load_lookups(self) -> dict[str, tuple[dict[str, int], set[int]]]:
+        """Carga {columna: ({nombre normalizado: id}, {ids válidos})} para cada lookup."""
+        lookups = {}
+        for column, (model, _) in self.lookups.items():
+            ids_by_name = {
+                name.strip().casefold(): id_
+                for id_, name in self.session.execute(select(model.id, model.name))
+            }
+            lookups[column] = (ids_by_name, set(ids_by_name.values()))
+        return lookups
+
+    def _validate_row(
+        self,
+        row: dict[str, Any],
+        lookups: dict[str, tuple[dict[str, int], set[int]]],
+        keys: set[str],
+    ) -> tuple[dict[str, Any] | None, list[str]]:
+        """
+        Valida una fila y la convierte en valores de columnas del modelo.
+
+        Returns:
+            (valores, []) si la fila es válida; (None, errores) si no
+        """
+        data = dict(row)
+        errors = []
+
+        for column, (_, fk_field) in self.lookups.items():
+            ids_by_name, valid_ids = lookups[column]
+            name = data.pop(column, None)
+            if name is not None:
+                lookup_id = ids_by_name.get(str(name).strip().casefold())
+                if lookup_id is None:
+                    errors.append(f"{column}: '{name}' no existe")
+                else:
+                    data[fk_field] = lookup_id
+            elif data.get(fk_field) is not None and str(data[fk_field]).isdigit():
+                if int(data[fk_field]) not in valid_ids:
+                    errors.append(f"{fk_field}: no existe el ID {data[fk_field]}")
+
+        self._prepare_row(data)
+
+        try:
+            schema = self.create_schema.model_validate(data)
+        except ValidationError as e:
+            errors.extend(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            )
+            return None, errors
+
+        values = schema.model_dump()
+        errors.extend(self._check_values(values, keys))
+        if errors:
+            return None, errors
+
+        return values, []
+
+    def _write_chunk(self, chunk: list[tuple[int, dict[str, Any]]], tally: _ImportTally) -> None:
+        """Inserta e indexa un bloque; si la base lo rechaza, reintenta fila por fila."""
+        try:
+            with self.session.begin_nested():
+                self._insert([values for _, values in chunk])
+            tally.created += len(chunk)
+            return
+        except SQLAlchemyError as e:
+            logger.warning(f"Bloque de {len(chunk)} fila(s) rechazado, reintentando por fila: {e}")
+
+        for row_number, values in chunk:
+            try:
+                with self.session.begin_nested():
+                    self._insert([values])
+                tally.created += 1
+            except SQLAlchemyError as row_error:
+                message = str(getattr(row_error, "orig", row_error))
+                tally.add_error(row_number, values[self.key_column], [message])
+
+    def _insert(self, rows: list[dict[str, Any]]) -> None:
+        """Inserta filas y agrega las entidades al índice de búsqueda."""
+        self.repository.bulk_insert(rows)
+        self.search_repo.index_entities(self._get_by_keys([row[self.key_column] for row in rows]))
@@ -0,0 +1,94 @@
+"""
+Importación masiva de empresas desde Excel (.xlsx) o CSV.
+
+Usa el proceso común de bulk_import: lectura en streaming, validación por
+fila con CompanyCreate e inserción por bloques con ``bulk_insert``. Las
+filas con error se informan sin abortar la importación.
+
+Columnas: las de CompanyCreate (``name``, ``trigram``, ``phone``,
+``website``, ...). El tipo de empresa y el país se pueden dar por nombre
+(``company_type``, ``country``) o por ID (``company_type_id``,
+``country_id``); la ciudad solo por ID (``city_id``), porque hay nombres de
+ciudad repetidos entre países.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from src.backend.models.base import PhoneValidator, UrlValidator
+from src.backend.models.core.companies import Company
+from src.backend.models.lookups import CompanyType, Country
+from src.backend.repositories.core.company_repository import CompanyRepository
+from src.backend.repositories.search_repository import SearchRepository
+from src.backend.services.core.bulk_import import BulkImportService
+from src.shared.schemas.core.company import CompanyCreate
+from src.shared.schemas.core.product_import import CompanyImportResult
+
+# Columna por nombre -> (modelo lookup, campo FK en Company)
+COMPANY_IMPORT_LOOKUPS = {
+    "company_type": (CompanyType, "company_type_id"),
+    "country": (Country, "country_id"),
+}
+
+
+class CompanyImportService(BulkImportService):
+    """
+    Servicio de importación masiva de empresas.
+
+    Los trigrams duplicados (en la base o repetidos en el archivo) se
+    rechazan por fila; ver BulkImportService para el resto del proceso.
+
+    Example:
+        service = CompanyImportService(CompanyRepository(session), session)
+        with open("clientes.xlsx", "rb") as f:
+            result = service.import_file(f, "xlsx", user_id=1)
+        session.commit()
+    """
+
+    entity_name = "empresas"
+    create_schema = CompanyCreate
+    key_column = "trigram"
+    lookups = COMPANY_IMPORT_LOOKUPS
+    result_class = CompanyImportResult
+
+    def __init__(
+        self,
+        company_repository: CompanyRepository,
+        session: Session,
+        search_repository: SearchRepository | None = None,
+    ):
+        """
+        Inicializa el servicio.
+
+        Args:
+            company_repository: Repositorio de Company
+            session: Sesión de SQLAlchemy
+            search_repository: Repositorio del índice de búsqueda
+                (default: uno nuevo sobre la misma sesión)
+        """
+        super().__init__(company_repository, session, search_repository)
+        self.company_repo = company_repository
+
+    def _existing_keys(self) -> set[str]:
+        """Trigrams ya guardados (incluye inactivas)."""
+        return self.company_repo.get_all_trigrams()
+
+    def _get_by_keys(self, keys: list[str]) -> Sequence[Company]:
+        """Empresas recién insertadas."""
+        return self.company_repo.get_by_trigrams(keys)
+
+    def _check_values(self, values: dict[str, Any], keys: set[str]) -> list[str]:
+        """Mismas reglas que los @validates de Company, más el trigram único."""
+        errors = []
+        if not values["trigram"].isalpha():
+            errors.append("trigram: debe contener solo letras")
+        for column, validator in (("phone", PhoneValidator), ("website", UrlValidator)):
+            try:
+                validator.validate(values[column])
+            except ValueError as e:
+                errors.append(f"{column}: {e}")
+        if values["trigram"] in keys:
+            errors.append(f"trigram: ya existe una empresa con el trigram '{values['trigram']}'")
+        return errors
@@ -4,12 +4,26 @@ Servicio de lógica de negocio para Company.
 Implementa validaciones y reglas de negocio para empresas.
 """
 
+from collections.abc import Collection
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.backend.models.core.companies import Company
-from src.backend.repositories.core.company_repository import CompanyRepository
+from src.backend.repositories.core.company_repository import (
+    AsyncCompanyRepository,
+    CompanyRepository,
+)
 from src.shared.schemas.core.company import CompanyCreate, CompanyUpdate, CompanyResponse
-from src.backend.services.base import BaseService
+from src.shared.schemas.core.company_bundle import COMPANY_BUNDLE_SECTIONS, CompanyBundleResponse
+from src.shared.schemas.core.address import AddressResponse
+from src.shared.schemas.core.company_rut import CompanyRutResponse
+from src.shared.schemas.core.contact import ContactResponse
+from src.shared.schemas.core.note import NoteResponse
+from src.shared.schemas.core.plant import PlantResponse
+from src.backend.services.async_base import AsyncBaseService
+from src.backend.services.base import BaseService, list_adapter
+from src.backend.exceptions.repository import NotFoundException
 from src.backend.exceptions.service import ValidationException
 from src.backend.utils.logger import logger
 
@@ -49,7 +63,8 @@ class CompanyService(BaseService[Company, CompanyCreate, CompanyUpdate, CompanyR
         # Cast para tener acceso a métodos específicos de CompanyRepository
         self.company_repo: CompanyRepository = repository
 
-    def _enrich_company_response(self, company: Company) -> dict:
+    @staticmethod
+    def _enrich_company_response(company: Company) -> dict:
         """
         Enriquece los datos de la empresa con nombres de relaciones.
 
@@ -118,25 +133,6 @@ class CompanyService(BaseService[Company, CompanyCreate, CompanyUpdate, CompanyR
         enriched_data = self._enrich_company_response(company)
         return self.response_schema.model_validate(enriched_data)
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> list[CompanyResponse]:
-        """
-        Obtiene todas las empresas con datos enriquecidos.
-
-        Args:
-            skip: Número de registros a saltar
-            limit: Número máximo de registros
-
-        Returns:
-            Lista de empresas con nombres de relaciones
-        """
-        logger.debug(f"Servicio: obteniendo Company(s) - skip={skip}, limit={limit}")
-
-        companies = self.repository.get_all(skip=skip, limit=limit)
-        return [
-            self.response_schema.model_validate(self._enrich_company_response(c))
-            for c in companies
-        ]
-
     def validate_create(self, entity: Company) -> None:
         """
         Valida reglas de negocio antes de crear una empresa.
@@ -331,3 +327,213 @@ class CompanyService(BaseService[Company, CompanyCreate, CompanyUpdate, CompanyR
 
         enriched_data = self._enrich_company_response(company)
         return self.response_schema.model_validate(enriched_data)
+
+
+class AsyncCompanyService(AsyncBaseService[Company, CompanyCreate, CompanyUpdate, CompanyResponse]):
+    """
+    Servicio asíncrono de lectura para Company.
+
+    Expone las mismas consultas que CompanyService para los endpoints GET
+    async, reutilizando el mismo enriquecimiento de respuesta.
+
+    Example:
+        service = AsyncCompanyService(AsyncCompanyRepository(session), session)
+        companies = await service.get_all(skip=0, limit=50)
+    """
+
+    def __init__(
+        self,
+        repository: AsyncCompanyRepository,
+        session: AsyncSession,
+    ):
+        """
+        Inicializa el servicio asíncrono de Company.
+
+        Args:
+            repository: Repositorio asíncrono de Company
+            session: Sesión asíncrona de SQLAlchemy
+        """
+        super().__init__(
+            repository=repository,
+            session=session,
+            model=Company,
+            response_schema=CompanyResponse,
+        )
+        self.company_repo: AsyncCompanyRepository = repository
+
+    def _to_company_response(self, company: Company) -> CompanyResponse:
+        """Convierte una Company a CompanyResponse con nombres de relaciones."""
+        return self.response_schema.model_validate(
+            CompanyService._enrich_company_response(company)
+        )
+
+    async def get_by_id(self, id: int) -> CompanyResponse:
+        """
+        Obtiene una empresa por ID con datos enriquecidos.
+
+        Args:
+            id: ID de la empresa
+
+        Returns:
+            Empresa como schema de respuesta con nombres de relaciones
+
+        Raises:
+            NotFoundException: Si la empresa no existe
+        """
+        logger.debug(f"Servicio async: obteniendo Company id={id}")
+
+        company = await self.repository.get_by_id(id)
+        if not company:
+            raise NotFoundException(
+                "Company no encontrado",
+                details={"id": id}
+            )
+
+        return await self.to_response(company, self._to_company_response)
+
+    async def get_by_trigram(self, trigram: str) -> CompanyResponse:
+        """
+        Obtiene una empresa por su trigram.
+
+        Args:
+            trigram: Trigram de la empresa
+
+        Returns:
+            Empresa encontrada
+
+        Raises:
+            NotFoundException: Si no se encuentra la empresa
+        """
+        logger.info(f"Servicio async: buscando empresa por trigram={trigram}")
+
+        company = await self.company_repo.get_by_trigram(trigram)
+        if not company:
+            raise NotFoundException(
+                f"No se encontró empresa con trigram '{trigram}'",
+                details={"trigram": trigram}
+            )
+
+        return await self.to_response(company, self._to_company_response)
+
+    async def search_by_name(self, name: str) -> list[CompanyResponse]:
+        """
+        Busca empresas por nombre.
+
+        Args:
+            name: Texto a buscar en el nombre
+
+        Returns:
+            Lista de empresas encontradas
+        """
+        companies = await self.company_repo.search_by_name(name)
+        return await self.to_response(list(companies), self._to_company_response)
+
+    async def get_by_status(
+        self,
+        is_active: bool,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[CompanyResponse]:
+        """
+        Obtiene empresas activas o inactivas.
+
+        Args:
+            is_active: True para activas, False para inactivas
+            skip: Registros a saltar
+            limit: Número máximo de registros
+
+        Returns:
+            Lista de empresas con el estado indicado
+        """
+        rows = await self.company_repo.get_rows(filters={"is_active": is_active}, sort="id", skip=skip, limit=limit)
+        return list_adapter(CompanyResponse).validate_python(rows)
+
+    async def get_by_type(
+        self,
+        company_type_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: bool | None = None
+    ) -> list[CompanyResponse]:
+        """
+        Obtiene empresas filtradas por tipo.
+
+        Args:
+            company_type_id: ID del tipo de empresa (1=CLIENT, 2=SUPPLIER)
+            skip: Registros a saltar
+            limit: Número máximo de registros
+            is_active: Filtrar por estado activo/inactivo (None = todos)
+
+        Returns:
+            Lista de empresas del tipo especificado
+        """
+        rows = await self.company_repo.get_rows(
+            filters={"company_type_id": company_type_id, "is_active": is_active},
+            sort="id",
+            skip=skip,
+            limit=limit,
+        )
+        return list_adapter(CompanyResponse).validate_python(rows)
+
+    async def get_bundle(
+        self,
+        company_id: int,
+        include: Collection[str] | None = None,
+    ) -> CompanyBundleResponse:
+        """
+        Obtiene una empresa con las secciones de su pantalla de detalle.
+
+        Reemplaza las cinco peticiones de la vista de detalle (empresa,
+        direcciones, contactos, RUTs, plantas) por una: las colecciones se
+        cargan con selectinload en la misma sesión y cada sección se ordena
+        igual que su endpoint individual.
+
+        Args:
+            company_id: ID de la empresa
+            include: Secciones a incluir (None = todas, ver COMPANY_BUNDLE_SECTIONS)
+
+        Returns:
+            CompanyBundleResponse; las secciones no pedidas quedan en None
+
+        Raises:
+            ValidationException: Si se pide una sección desconocida
+            NotFoundException: Si la empresa no existe
+        """
+        sections = set(COMPANY_BUNDLE_SECTIONS if include is None else include)
+        unknown = sorted(sections - set(COMPANY_BUNDLE_SECTIONS))
+        if unknown:
+            raise ValidationException(
+                f"Secciones desconocidas: {', '.join(unknown)}",
+                details={"include": unknown, "allowed": list(COMPANY_BUNDLE_SECTIONS)}
+            )
+
+        logger.info(f"Servicio async: obteniendo bundle de empresa id={company_id} secciones={sorted(sections)}")
+
+        company = await self.company_repo.get_with_sections(company_id, sections - {"notes"})
+        if not company:
+            raise NotFoundException(
+                f"No se encontró empresa con id={company_id}",
+                details={"company_id": company_id}
+            )
+        notes = await self.company_repo.get_notes(company_id) if "notes" in sections else None
+
+        def _build(company: Company) -> CompanyBundleResponse:
+            bundle = CompanyBundleResponse(company=self._to_company_response(company))
+            if "addresses" in sections:
+                # Mismo orden que AddressRepository.get_by_company
+                addresses = sorted(company.addresses, key=lambda a: a.created_at, reverse=True)
+                addresses.sort(key=lambda a: not a.is_default)
+                bundle.addresses = [AddressResponse.model_validate(a) for a in addresses]
+            if "contacts" in sections:
+                contacts = sorted(company.contacts, key=lambda c: (c.last_name, c.first_name))
+                bundle.contacts = [ContactResponse.model_validate(c) for c in contacts]
+            if "ruts" in sections:
+                bundle.ruts = [CompanyRutResponse.model_validate(r) for r in company.ruts]
+            if "plants" in sections:
+                plants = sorted(company.plants, key=lambda p: p.name)
+                bundle.plants = [PlantResponse.model_validate(p) for p in plants]
+            if notes is not None:
+                bundle.notes = [NoteResponse.model_validate(n) for n in notes]
+            return bundle
+
+        return await self.to_response(company, _build)
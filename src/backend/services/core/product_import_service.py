@@ -0,0 +1,97 @@
+"""
+Importación masiva de productos desde Excel (.xlsx) o CSV.
+
+Usa el proceso común de bulk_import: lectura en streaming, validación por
+fila con ProductCreate e inserción por bloques con ``bulk_insert``. Las
+filas con error se informan sin abortar la importación.
+
+Columnas: las de ProductCreate (``reference``, ``designation_es``,
+``product_type``, ``sale_price``, ...). Las lookups se pueden dar por nombre
+(``family_type``, ``matter``, ``sales_type``) o por ID (``family_type_id``, ...).
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from src.backend.models.core.products import Product
+from src.backend.models.lookups import FamilyType, Matter, SalesType
+from src.backend.repositories.core.product_repository import ProductRepository
+from src.backend.repositories.search_repository import SearchRepository
+from src.backend.services.core.bulk_import import (  # noqa: F401 (re-export)
+    DEFAULT_CHUNK_SIZE,
+    IMPORT_FORMATS,
+    BulkImportService,
+    read_rows,
+)
+from src.shared.schemas.core.product import ProductCreate
+from src.shared.schemas.core.product_import import ProductImportResult
+
+# Columna por nombre -> (modelo lookup, campo FK en Product)
+PRODUCT_IMPORT_LOOKUPS = {
+    "family_type": (FamilyType, "family_type_id"),
+    "matter": (Matter, "matter_id"),
+    "sales_type": (SalesType, "sales_type_id"),
+}
+
+
+class ProductImportService(BulkImportService):
+    """
+    Servicio de importación masiva de productos.
+
+    Las referencias duplicadas (en la base o repetidas en el archivo) se
+    rechazan por fila; ver BulkImportService para el resto del proceso.
+
+    Example:
+        service = ProductImportService(ProductRepository(session), session)
+        with open("catalogo.xlsx", "rb") as f:
+            result = service.import_file(f, "xlsx", user_id=1)
+        session.commit()
+    """
+
+    entity_name = "productos"
+    create_schema = ProductCreate
+    key_column = "reference"
+    lookups = PRODUCT_IMPORT_LOOKUPS
+    result_class = ProductImportResult
+
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        session: Session,
+        search_repository: SearchRepository | None = None,
+    ):
+        """
+        Inicializa el servicio.
+
+        Args:
+            product_repository: Repositorio de Product
+            session: Sesión de SQLAlchemy
+            search_repository: Repositorio del índice de búsqueda
+                (default: uno nuevo sobre la misma sesión)
+        """
+        super().__init__(product_repository, session, search_repository)
+        self.product_repo = product_repository
+
+    def _existing_keys(self) -> set[str]:
+        """Referencias ya guardadas (incluye inactivos)."""
+        return self.product_repo.get_all_references()
+
+    def _get_by_keys(self, keys: list[str]) -> Sequence[Product]:
+        """Productos recién insertados."""
+        return self.product_repo.get_by_references(keys)
+
+    def _prepare_row(self, data: dict[str, Any]) -> None:
+        """El tipo de producto se acepta en mayúsculas."""
+        if isinstance(data.get("product_type"), str):
+            data["product_type"] = data["product_type"].lower()
+
+    def _check_values(self, values: dict[str, Any], keys: set[str]) -> list[str]:
+        """Mismas reglas que los @validates de Product, más la referencia única."""
+        reference = values["reference"]
+        if len(reference) < 2:
+            return ["reference: debe tener al menos 2 caracteres"]
+        if reference in keys:
+            return [f"reference: ya existe un producto con la referencia '{reference}'"]
+        return []
@@ -6,14 +6,16 @@ incluyendo gestión de BOM (Bill of Materials) con detección de ciclos.
 """
 
 from decimal import Decimal
-
+from typing import Any
 
 from sqlalchemy.orm import Session
 
-from src.backend.models.core.products import Product, ProductComponent
+from src.backend.database.routing import use_primary
+from src.backend.models.core.products import Product, ProductBOMRollup, ProductComponent
 from src.backend.repositories.core.product_repository import (
     ProductRepository,
-    ProductComponentRepository
+    ProductComponentRepository,
+    ProductBOMRollupRepository,
 )
 from src.shared.schemas.core.product import (
     ProductCreate,
@@ -22,21 +24,27 @@ from src.shared.schemas.core.product import (
     ProductComponentCreate,
     ProductComponentUpdate,
     ProductComponentResponse,
+    ProductWithBOMResponse,
 )
 from src.backend.services.base import BaseService
+from src.backend.services.core.bom_engine import BOMEngine
 from src.backend.exceptions.service import ValidationException, BusinessRuleException
-from src.backend.config.constants import PRODUCT_TYPE_ARTICLE, PRODUCT_TYPE_NOMENCLATURE
+from src.backend.config.constants import PRODUCT_TYPE_NOMENCLATURE
 from src.backend.utils.logger import logger
 
 
+# Campos de Product que entran en los acumulados del BOM
+BOM_ROLLUP_FIELDS = {"product_type", "cost_price", "sale_price", "net_weight"}
+
+
 class ProductService(BaseService[Product, ProductCreate, ProductUpdate, ProductResponse]):
     """
     Servicio para Product con validaciones de negocio.
 
     Maneja la lógica de negocio para productos, incluyendo:
     - Validación de código único
-    - Gestión de BOM con detección de ciclos
-    - Cálculo de costos recursivos
+    - Gestión de BOM con detección de ciclos (cierre transitivo)
+    - Cálculo de costos del BOM con acumulados materializados
     - Validaciones de stock
 
     Example:
@@ -50,6 +58,7 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate, ProductR
         product_repository: ProductRepository,
         component_repository: ProductComponentRepository,
         session: Session,
+        rollup_repository: ProductBOMRollupRepository | None = None,
     ):
         """
         Inicializa el servicio de Product.
@@ -58,6 +67,8 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate, ProductR
             product_repository: Repositorio de Product
             component_repository: Repositorio de ProductComponent
             session: Sesión de SQLAlchemy
+            rollup_repository: Repositorio de acumulados del BOM
+                (default: uno nuevo sobre la misma sesión)
         """
         super().__init__(
             repository=product_repository,
@@ -67,6 +78,9 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate, ProductR
         )
         self.product_repo: ProductRepository = product_repository
         self.component_repo: ProductComponentRepository = component_repository
+        self.rollup_repo: ProductBOMRollupRepository = (
+            rollup_repository or ProductBOMRollupRepository(session)
+        )
 
     def validate_create(self, entity: Product) -> None:
         """
@@ -121,6 +135,76 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate, ProductR
 
         logger.debug("Validación de actualización exitosa")
 
+    def update(self, id: int, schema: ProductUpdate, user_id: int) -> ProductResponse:
+        """
+        Actualiza un producto e invalida los acumulados de BOM afectados.
+
+        Solo si cambian campos que entran en los acumulados (costo, precio,
+        peso o tipo) se invalidan el producto y sus ancestros.
+
+        Args:
+            id: ID del producto
+            schema: Datos a actualizar
+            user_id: ID del usuario
+
+        Returns:
+            Producto actualizado
+        """
+        updated = super().update(id, schema, user_id)
+
+        if BOM_ROLLUP_FIELDS & schema.model_dump(exclude_unset=True).keys():
+            self.rollup_repo.invalidate([id])
+
+        return updated
+
+    def delete(self, id: int, user_id: int, soft: bool = True) -> None:
+        """
+        Elimina un producto invalidando antes los acumulados de sus ancestros.
+
+        Args:
+            id: ID del producto
+            user_id: ID del usuario
+            soft: Si True, hace soft delete; si False, hard delete
+        """
+        # Antes de eliminar: el CASCADE borra las aristas con las que se
+        # encuentran los ensambles que usan este producto.
+        self.rollup_repo.invalidate([id])
+        super().delete(id, user_id, soft=soft)
+
+    def bulk_update_cost_prices(self, cost_prices: dict[int, Decimal], user_id: int) -> int:
+        """
+        Actualiza el costo de varios productos en una operación.
+
+        Los acumulados se invalidan con un solo recorrido hacia arriba desde
+        todos los productos modificados; solo se recalculan (en la siguiente
+        lectura) los ensambles que contienen alguno de ellos.
+
+        Args:
+            cost_prices: Dict {product_id: nuevo cost_price}
+            user_id: ID del usuario
+
+        Returns:
+            Número de productos actualizados
+
+        Example:
+            service.bulk_update_cost_prices({5: Decimal("1.20"), 6: Decimal("0.80")}, user_id=1)
+        """
+        if not cost_prices:
+            return 0
+
+        logger.info(f"Servicio: actualizando costo de {len(cost_prices)} producto(s)")
+
+        self.session.info["user_id"] = user_id
+        products = self.product_repo.get_by_ids(list(cost_prices))
+        for product in products:
+            product.cost_price = cost_prices[product.id]
+        self.session.flush()
+
+        self.rollup_repo.invalidate([product.id for product in products])
+
+        logger.success(f"Costo actualizado en {len(products)} producto(s)")
+        return len(products)
+
     def get_by_reference(self, reference: str) -> ProductResponse:
         """
         Obtiene un producto por su referencia.
@@ -304,6 +388,7 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate, ProductR
         )
 
         created = self.component_repo.create(product_component)
+        self.rollup_repo.invalidate([parent_id])
         logger.success(f"Componente agregado: id={created.id}")
 
         return ProductComponentResponse.model_validate(created)
@@ -352,6 +437,7 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate, ProductR
         component.quantity = quantity
 
         updated = self.component_repo.update(component)
+        self.rollup_repo.invalidate([parent_id])
         logger.success(f"Componente actualizado: parent_id={parent_id}, component_id={component_id}")
 
         return ProductComponentResponse.model_validate(updated)
@@ -377,6 +463,7 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate, ProductR
 
         self.session.info["user_id"] = user_id
         self.component_repo.delete_component(parent_id, component_id)
+        self.rollup_repo.invalidate([parent_id])
         logger.success(f"Componente eliminado")
 
     def _would_create_cycle(self, parent_id: int, component_id: int) -> bool:
@@ -387,6 +474,9 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate, ProductR
         - El componente es el mismo que el padre (A contiene A)
         - El componente ya contiene al padre en su BOM (A contiene B, B contiene A)
 
+        El segundo caso es un lookup en el cierre transitivo del BOM, sin
+        recorrer el árbol del componente.
+
         Args:
             parent_id: ID del producto padre
             component_id: ID del componente a agregar
@@ -404,66 +494,178 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate, ProductR
             logger.warning(f"Ciclo directo detectado: producto se contiene a sí mismo")
             return True
 
-        # Caso 2: Buscar ciclos recursivamente
-        visited: set[int] = set()
+        # Caso 2: El padre ya está en algún nivel del BOM del componente
+        cycle_detected = self.component_repo.is_in_bom(
+            ancestor_id=component_id, descendant_id=parent_id
+        )
+
+        if cycle_detected:
+            logger.warning(f"Ciclo indirecto detectado: parent_id={parent_id}, component_id={component_id}")
 
-        def has_cycle_recursive(current_id: int) -> bool:
-            """Búsqueda recursiva de ciclos."""
-            if current_id == parent_id:
-                return True  # Encontramos el padre = ciclo
+        return cycle_detected
 
-            if current_id in visited:
-                return False  # Ya visitado, no hay ciclo por esta rama
+    def get_where_used(self, product_id: int) -> list[ProductResponse]:
+        """
+        Obtiene los productos que usan un componente en cualquier nivel del BOM.
 
-            visited.add(current_id)
+        Args:
+            product_id: ID del componente
 
-            # Obtener componentes del producto actual
-            components = self.component_repo.get_by_parent(current_id)
+        Returns:
+            Productos que lo contienen directa o indirectamente
 
-            for comp in components:
-                if has_cycle_recursive(comp.component_id):
-                    return True
+        Example:
+            assemblies = service.get_where_used(product_id=5)
+        """
+        logger.info(f"Servicio: obteniendo where-used de product_id={product_id}")
 
-            return False
+        products = self.component_repo.get_where_used(product_id)
+        return [self.response_schema.model_validate(p) for p in products]
 
-        # Buscar ciclos desde el componente
-        cycle_detected = has_cycle_recursive(component_id)
+    def _bom_engine(self, product_id: int) -> BOMEngine:
+        """Carga el sub-grafo del BOM (una query) y construye el motor de cálculo."""
+        return BOMEngine(self.component_repo.get_bom_graph(product_id), product_id)
 
-        if cycle_detected:
-            logger.warning(f"Ciclo indirecto detectado: parent_id={parent_id}, component_id={component_id}")
+    def get_bom_rollup(self, product_id: int) -> ProductBOMRollup | None:
+        """
+        Obtiene costo, precio, peso y niveles acumulados del BOM de un producto.
 
-        return cycle_detected
+        Si el acumulado está materializado es un lookup por PK. Si no, se
+        recorre solo la parte invalidada del BOM (los sub-ensambles con
+        acumulado vigente se usan tal cual) y se materializa el resultado
+        de la raíz y de cada sub-ensamble recalculado.
 
-    def calculate_bom_cost(self, product_id: int) -> Decimal:
+        Args:
+            product_id: ID del producto
+
+        Returns:
+            Acumulado del producto sin redondear (ver ProductBOMRollup),
+            None si el producto no existe
+
+        Raises:
+            BusinessRuleException: Si el BOM contiene un ciclo
+
+        Example:
+            rollup = service.get_bom_rollup(product_id=1)
+            print(rollup.cost, rollup.price, rollup.weight)
+        """
+        rollup = self.rollup_repo.get_by_id(product_id)
+        if rollup:
+            return rollup
+
+        # Lo que se materializa debe calcularse con los datos de la primaria
+        use_primary(self.session)
+        engine = BOMEngine(
+            self.component_repo.get_bom_graph(product_id, use_rollups=True), product_id
+        )
+        if not engine.exists:
+            return None
+
+        computed = engine.rollups()
+        self.rollup_repo.save_many(computed)
+        logger.debug(f"Acumulados de BOM recalculados: {len(computed)} producto(s)")
+
+        return next(
+            (r for r in computed if r.product_id == product_id),
+            ProductBOMRollup(
+                product_id=product_id,
+                cost=engine.cost(),
+                price=engine.price(),
+                weight=engine.weight(),
+                levels=engine.levels(),
+            ),
+        )
+
+    def get_with_bom(self, product_id: int) -> ProductWithBOMResponse:
         """
-        Calcula el costo total de un producto incluyendo su BOM (recursivo).
+        Obtiene un producto con sus componentes directos y el resumen de su BOM.
 
         Args:
             product_id: ID del producto
 
         Returns:
-            Costo total calculado
+            Producto con componentes, niveles, total de componentes y
+            costo/precio/peso acumulados
+
+        Raises:
+            NotFoundException: Si no se encuentra el producto
 
         Example:
-            cost = service.calculate_bom_cost(product_id=1)
-            print(f"Costo total: ${cost}")
+            product = service.get_with_bom(123)
+            print(f"{product.total_components} componentes en {product.bom_levels} niveles")
         """
-        logger.info(f"Servicio: calculando costo BOM para product_id={product_id}")
+        logger.info(f"Servicio: obteniendo producto id={product_id} con resumen de BOM")
 
         product = self.product_repo.get_with_components(product_id)
         if not product:
-            return Decimal("0.00")
+            from src.backend.exceptions.repository import NotFoundException
+            raise NotFoundException(
+                f"No se encontró producto con id={product_id}",
+                details={"product_id": product_id}
+            )
+
+        engine = self._bom_engine(product_id)
+        return ProductWithBOMResponse.model_validate(product).model_copy(update={
+            "total_components": len(engine.flat_quantities()),
+            "bom_levels": engine.levels(),
+            "bom_cost": engine.cost(),
+            "bom_price": engine.price(),
+            "bom_weight": engine.weight(),
+        })
+
+    def calculate_bom_cost(self, product_id: int) -> Decimal:
+        """
+        Calcula el costo total de un producto incluyendo su BOM (todos los niveles).
+
+        Args:
+            product_id: ID del producto
 
-        # Si es ARTICLE, retornar su costo directo
-        if product.product_type == PRODUCT_TYPE_ARTICLE:
-            return product.cost_price or Decimal("0.00")
+        Returns:
+            Costo total calculado (0.00 si el producto no existe)
+
+        Raises:
+            BusinessRuleException: Si el BOM contiene un ciclo
 
-        # Si es NOMENCLATURE, calcular recursivamente
-        total_cost = Decimal("0.00")
+        Example:
+            cost = service.calculate_bom_cost(product_id=1)
+            print(f"Costo total: ${cost}")
+        """
+        logger.info(f"Servicio: calculando costo BOM para product_id={product_id}")
 
-        for comp in product.components:
-            component_cost = self.calculate_bom_cost(comp.component_id)
-            total_cost += component_cost * comp.quantity
+        rollup = self.get_bom_rollup(product_id)
+        # El acumulado materializado no está redondeado (ver ProductBOMRollup)
+        total_cost = rollup.cost.quantize(Decimal("0.01")) if rollup else Decimal("0.00")
 
         logger.debug(f"Costo BOM calculado para product_id={product_id}: {total_cost}")
         return total_cost
+
+    def get_flat_bom(self, product_id: int) -> list[dict[str, Any]]:
+        """
+        Obtiene la lista plana de componentes (todos los niveles) con cantidades acumuladas.
+
+        Args:
+            product_id: ID del producto
+
+        Returns:
+            Lista de dicts (product_id, reference, designation, quantity,
+            unit_cost, unit_price) por unidad del producto
+
+        Raises:
+            NotFoundException: Si no se encuentra el producto
+            BusinessRuleException: Si el BOM contiene un ciclo
+
+        Example:
+            for item in service.get_flat_bom(product_id=1):
+                print(f"{item['reference']}: {item['quantity']}")
+        """
+        logger.info(f"Servicio: obteniendo BOM plano para product_id={product_id}")
+
+        engine = self._bom_engine(product_id)
+        if not engine.exists:
+            from src.backend.exceptions.repository import NotFoundException
+            raise NotFoundException(
+                f"No se encontró producto con id={product_id}",
+                details={"product_id": product_id}
+            )
+
+        return engine.flat_bom()
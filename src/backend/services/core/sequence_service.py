@@ -1,10 +1,32 @@
 """
 Sequence service for generating standardized document numbers.
+
+Numbers are allocated with one of three gap policies
+(``settings.sequence_gap_policy``):
+
+- ``gapless``: atomic ``UPDATE ... RETURNING`` in the caller's transaction.
+  A number is only consumed if the caller commits, but the sequence row
+  stays locked until then, so concurrent creations for the same
+  prefix/trigram/year serialize.
+- ``atomic``: the same single-statement increment in its own short
+  transaction. The row lock lasts one statement; numbers taken by a
+  request that later rolls back are lost.
+- ``block``: each process reserves ``settings.sequence_block_size``
+  numbers at a time in its own short transaction and hands them out from
+  memory. Cheapest under load, but numbers are not chronological across
+  processes and unused numbers are lost on restart.
+
+SQLite allows a single writer and the application shares one connection
+(StaticPool), so an independent transaction is neither possible nor useful
+there: every policy falls back to ``gapless``.
 """
 
-from datetime import date, datetime
+import threading
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_
 
 from src.shared.providers import TimeProvider
 from src.backend.models.core.sequences import Sequence
@@ -14,6 +36,151 @@ from src.backend.utils.logger import logger
 # Time provider para acceso centralizado al tiempo
 _time_provider = TimeProvider()
 
+GAP_POLICY_GAPLESS = "gapless"
+GAP_POLICY_ATOMIC = "atomic"
+GAP_POLICY_BLOCK = "block"
+
+# (name, year, prefix, trigram)
+SequenceKey = tuple[str, int | None, str | None, str | None]
+
+
+def increment_sequence(connection: Connection, key: SequenceKey, count: int = 1) -> int:
+    """
+    Atomically add ``count`` to a sequence and return its new last value.
+
+    A single UPDATE takes the row lock and increments in place (no
+    SELECT ... FOR UPDATE round trip). The value is read back with
+    RETURNING where the dialect supports it, ``LAST_INSERT_ID(expr)`` on
+    MySQL, or a follow-up SELECT under the lock otherwise. A missing
+    sequence row is created; a concurrent insert of the same row is
+    retried as an update.
+
+    Args:
+        connection: Connection whose transaction the increment joins
+        key: (name, year, prefix, trigram)
+        count: Numbers to reserve
+
+    Returns:
+        Last value reserved (the range is ``last - count + 1 .. last``)
+    """
+    name, year, prefix, trigram = key
+    where = (
+        Sequence.name == name,
+        Sequence.year == year,
+        Sequence.prefix == prefix,
+        Sequence.trigram == trigram,
+    )
+    dialect = connection.dialect
+
+    for _attempt in range(2):
+        if dialect.name == "mysql":
+            stmt = update(Sequence).where(*where).values(
+                last_value=func.last_insert_id(Sequence.last_value + count)
+            )
+            if connection.execute(stmt).rowcount:
+                return connection.execute(select(func.last_insert_id())).scalar_one()
+        elif dialect.update_returning:
+            stmt = update(Sequence).where(*where).values(
+                last_value=Sequence.last_value + count
+            ).returning(Sequence.last_value)
+            value = connection.execute(stmt).scalar()
+            if value is not None:
+                return value
+        else:
+            stmt = update(Sequence).where(*where).values(last_value=Sequence.last_value + count)
+            if connection.execute(stmt).rowcount:
+                return connection.execute(select(Sequence.last_value).where(*where)).scalar_one()
+
+        logger.info(f"Creating new sequence: {name} for year {year} (prefix={prefix}, trigram={trigram})")
+        try:
+            with connection.begin_nested():
+                connection.execute(
+                    insert(Sequence).values(
+                        name=name, year=year, prefix=prefix, trigram=trigram, last_value=count
+                    )
+                )
+            return count
+        except IntegrityError:
+            # Otro proceso creó la secuencia entre el UPDATE y el INSERT
+            continue
+
+    raise RuntimeError(f"Could not allocate sequence {key}")
+
+
+class SequenceAllocator:
+    """
+    Per-process allocator that hands out numbers from reserved blocks.
+
+    Each block is reserved with increment_sequence in its own short
+    transaction; after that, numbers come from memory under a thread lock,
+    without touching the database.
+
+    Attributes:
+        engine: Engine used for the reservation transactions
+        block_size: Numbers reserved per round trip
+
+    Example:
+        allocator = get_sequence_allocator(engine, block_size=20)
+        number = allocator.allocate(("document_sequence", 2025, "C", "MDO"))
+    """
+
+    def __init__(self, engine: Engine, block_size: int):
+        if block_size < 1:
+            raise ValueError("block_size must be >= 1")
+        self.engine = engine
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        # key -> (next value to hand out, last value of the reserved block)
+        self._blocks: dict[SequenceKey, tuple[int, int]] = {}
+
+    def allocate(self, key: SequenceKey) -> int:
+        """
+        Return the next number for a sequence, reserving a new block if needed.
+
+        Args:
+            key: (name, year, prefix, trigram)
+
+        Returns:
+            Allocated number
+        """
+        with self._lock:
+            next_value, last_value = self._blocks.get(key, (1, 0))
+            if next_value > last_value:
+                with self.engine.begin() as connection:
+                    last_value = increment_sequence(connection, key, self.block_size)
+                next_value = last_value - self.block_size + 1
+                logger.debug(f"Reserved sequence block {key}: {next_value}..{last_value}")
+
+            self._blocks[key] = (next_value + 1, last_value)
+            return next_value
+
+    def reset(self) -> None:
+        """Discard the blocks held in memory (their unused numbers are lost)."""
+        with self._lock:
+            self._blocks.clear()
+
+
+_allocators: dict[tuple[int, int], SequenceAllocator] = {}
+_allocators_lock = threading.Lock()
+
+
+def get_sequence_allocator(engine: Engine, block_size: int) -> SequenceAllocator:
+    """
+    Return the process-wide allocator for an engine and block size.
+
+    Args:
+        engine: Engine used for the reservation transactions
+        block_size: Numbers reserved per round trip
+
+    Returns:
+        Shared SequenceAllocator
+    """
+    with _allocators_lock:
+        allocator = _allocators.get((id(engine), block_size))
+        if allocator is None:
+            allocator = SequenceAllocator(engine, block_size)
+            _allocators[(id(engine), block_size)] = allocator
+        return allocator
 
 
 class SequenceService:
@@ -21,71 +188,74 @@ class SequenceService:
     Service for managing document sequences and numbering.
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, gap_policy: str | None = None, block_size: int | None = None):
+        """
+        Args:
+            session: SQLAlchemy session of the calling service
+            gap_policy: gapless, atomic or block (default: settings.sequence_gap_policy)
+            block_size: Numbers per block for the block policy
+                (default: settings.sequence_block_size)
+        """
         self.session = session
+        self.gap_policy = gap_policy or settings.sequence_gap_policy
+        self.block_size = block_size or settings.sequence_block_size
+
+        if self.gap_policy not in (GAP_POLICY_GAPLESS, GAP_POLICY_ATOMIC, GAP_POLICY_BLOCK):
+            raise ValueError(f"Unknown sequence gap policy: {self.gap_policy}")
+
+    def _effective_policy(self) -> str:
+        """Gap policy actually applied for the session's database."""
+        if self.gap_policy != GAP_POLICY_GAPLESS and self.session.get_bind().dialect.name == "sqlite":
+            return GAP_POLICY_GAPLESS
+        return self.gap_policy
 
     def get_next_number(self, name: str, prefix: str = None, year: int = None, trigram: str = None) -> int:
         """
         Get the next sequential number and increment the counter.
-        
+
         Args:
             name: Sequence name
             prefix: Optional prefix filter
             year: Year for the sequence (defaults to current year)
-            
-        Returns:
-            Next integer in the sequence
             trigram: Optional trigram filter
-            
+
         Returns:
             The next integer value in the sequence
         """
-        sequence = self.session.query(Sequence).filter(
-            Sequence.name == name,
-            Sequence.year == year,
-            Sequence.prefix == prefix,
-            Sequence.trigram == trigram
-        ).with_for_update().first()
-
-        if not sequence:
-            logger.info(f"Creating new sequence: {name} for year {year} (prefix={prefix}, trigram={trigram})")
-            sequence = Sequence(
-                name=name,
-                year=year,
-                prefix=prefix,
-                trigram=trigram,
-                last_value=0
-            )
-            self.session.add(sequence)
-            self.session.flush()
+        key = (name, year, prefix, trigram)
+        policy = self._effective_policy()
+
+        if policy == GAP_POLICY_BLOCK:
+            return get_sequence_allocator(self.session.get_bind(), self.block_size).allocate(key)
+
+        if policy == GAP_POLICY_ATOMIC:
+            with self.session.get_bind().begin() as connection:
+                return increment_sequence(connection, key)
 
-        sequence.last_value += 1
-        sequence.updated_at = _time_provider.now()
         # We don't commit here, we let the calling service handle the transaction
-        
-        return sequence.last_value
+        return increment_sequence(self.session.connection(), key)
 
     def generate_document_number(self, prefix: str, company_trigram: str = None, padding: int = 3) -> str:
         """
         Generate a formatted document number (e.g., C-2025-MDO-001 or OC-2025-MDO-01).
-        
+
         Args:
             prefix: Document type prefix (C, OC, DOC)
-            company_trigram: Optional 3-letter company code. 
+            company_trigram: Optional 3-letter company code.
                              If not provided, uses the internal company trigram from settings.
             padding: Number of digits for the sequential part (default: 3)
-        
+
         Returns:
             Formatted document number string
         """
         year = _time_provider.today().year
         trigram = (company_trigram or settings.internal_company_trigram).upper()
-        
+
         # Separate sequence per prefix (C, OC, DOC, etc.) per trigram+year
         # This ensures quotes, orders, and other documents have independent numbering
         next_val = self.get_next_number(
-            name="document_sequence", 
-            year=year, 
+            name="document_sequence",
+            year=year,
             prefix=prefix,  # Separate sequence per document type
             trigram=trigram
         )
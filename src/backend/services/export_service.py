@@ -0,0 +1,357 @@
+"""
+Servicio de exportación de listados a CSV y Excel (xlsx).
+
+Exporta el listado completo de una entidad con los mismos filtros, búsqueda
+y orden que su endpoint de listado, sin paginar. Las filas se leen del
+cursor por lotes (``BaseRepository.iter_list`` con ``yield_per``) y se
+escriben a medida que llegan, por lo que la memoria usada no depende de la
+cantidad de filas:
+
+- CSV: se generan bloques de bytes que se envían directamente al cliente.
+- xlsx: un xlsx es un zip que solo se puede cerrar al final, así que el
+  workbook en modo ``write_only`` (que vuelca cada fila a disco) se guarda
+  en un archivo temporal y luego se transmite en trozos.
+
+Las columnas de productos usan los mismos nombres que acepta la importación
+(family_type, matter y sales_type por nombre), de modo que un catálogo
+exportado se puede volver a importar.
+"""
+
+import csv
+import enum
+import io
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from tempfile import TemporaryFile
+from typing import Any
+
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from sqlalchemy.orm import Session, selectinload
+
+from src.backend.exceptions.service import ValidationException
+from src.backend.repositories.base import BaseRepository
+from src.backend.repositories.business.invoice_repository import (
+    InvoiceExportRepository,
+    InvoiceSIIRepository,
+)
+from src.backend.repositories.business.order_repository import OrderRepository
+from src.backend.repositories.business.quote_repository import QuoteRepository
+from src.backend.repositories.core.product_repository import ProductRepository
+from src.backend.utils.logger import logger
+
+EXPORT_FORMATS = ("csv", "xlsx")
+
+# Filas leídas del cursor por lote
+DEFAULT_BATCH_SIZE = 1000
+
+# Filas CSV acumuladas antes de entregar un bloque de bytes
+CSV_ROWS_PER_CHUNK = 500
+
+# Tamaño de los trozos en que se transmite el xlsx terminado
+XLSX_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    """Columna exportada: cabecera y ruta de atributos (``company.name``)."""
+
+    header: str
+    path: str
+
+    def value(self, entity: Any) -> Any:
+        """Sigue la ruta de atributos; None si algún paso es None."""
+        value = entity
+        for name in self.path.split("."):
+            value = getattr(value, name)
+            if value is None:
+                return None
+        return value
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """
+    Definición de la exportación de una entidad.
+
+    Attributes:
+        repository: Repositorio del listado (orden y búsqueda permitidos)
+        columns: Columnas del archivo, en orden
+        filters: Filtros de igualdad aceptados (los mismos del listado)
+        load: Relaciones a cargar por lote (las que usan las columnas; el
+            perfil LIST del repositorio no se aplica)
+    """
+
+    repository: type[BaseRepository]
+    columns: tuple[ExportColumn, ...]
+    filters: tuple[str, ...]
+    load: tuple[str, ...] = ()
+
+
+def _columns(*names: str | tuple[str, str]) -> tuple[ExportColumn, ...]:
+    """Columnas a partir de nombres (cabecera = ruta) o pares (cabecera, ruta)."""
+    return tuple(
+        ExportColumn(name, name) if isinstance(name, str) else ExportColumn(*name)
+        for name in names
+    )
+
+
+EXPORT_SPECS: dict[str, ExportSpec] = {
+    "products": ExportSpec(
+        repository=ProductRepository,
+        columns=_columns(
+            "id", "reference", "product_type", "designation_es", "designation_en",
+            "designation_fr", "short_designation", "revision",
+            ("family_type", "family_type.name"), ("matter", "matter.name"),
+            ("sales_type", "sales_type.name"),
+            "purchase_price", "cost_price", "sale_price", "sale_price_eur",
+            "stock_quantity", "minimum_stock", "stock_location",
+            "net_weight", "gross_weight", "hs_code", "country_of_origin",
+            "supplier_reference", "is_active",
+        ),
+        filters=("is_active", "product_type"),
+        load=("family_type", "matter", "sales_type"),
+    ),
+    "quotes": ExportSpec(
+        repository=QuoteRepository,
+        columns=_columns(
+            "id", "quote_number", "revision", "subject",
+            ("company", "company.name"), ("status", "status.name"),
+            "quote_date", "valid_until", "shipping_date",
+            ("currency", "currency.code"), "exchange_rate",
+            "subtotal", "tax_percentage", "tax_amount", "total",
+        ),
+        filters=("company_id", "status_id"),
+        load=("company", "status", "currency"),
+    ),
+    "orders": ExportSpec(
+        repository=OrderRepository,
+        columns=_columns(
+            "id", "order_number", "revision", "order_type",
+            "customer_po_number", "project_number",
+            ("company", "company.name"), ("status", "status.name"),
+            ("payment_status", "payment_status.name"),
+            "order_date", "required_date", "promised_date", "shipped_date",
+            ("currency", "currency.code"), "exchange_rate",
+            "subtotal", "tax_amount", "shipping_cost", "other_costs", "total",
+        ),
+        filters=("company_id", "status_id"),
+        load=("company", "status", "payment_status", "currency"),
+    ),
+    "invoices-sii": ExportSpec(
+        repository=InvoiceSIIRepository,
+        columns=_columns(
+            "id", "invoice_number", "revision", "invoice_type", "order_id",
+            ("company", "company.name"), ("payment_status", "payment_status.name"),
+            "invoice_date", "due_date", "paid_date",
+            ("currency", "currency.code"), "exchange_rate",
+            "net_amount", "exempt_amount", "subtotal", "tax_amount", "total",
+            "sii_status",
+        ),
+        filters=("company_id", "order_id", "payment_status_id"),
+        load=("company", "payment_status", "currency"),
+    ),
+    "invoices-export": ExportSpec(
+        repository=InvoiceExportRepository,
+        columns=_columns(
+            "id", "invoice_number", "revision", "invoice_type", "order_id",
+            ("company", "company.name"), ("country", "country.name"),
+            ("incoterm", "incoterm.code"), ("payment_status", "payment_status.name"),
+            "invoice_date", "due_date", "paid_date", "shipping_date",
+            ("currency", "currency.code"), "exchange_rate",
+            "subtotal", "freight_cost", "insurance_cost", "total", "total_clp",
+        ),
+        filters=("company_id", "order_id", "payment_status_id"),
+        load=("company", "country", "incoterm", "payment_status", "currency"),
+    ),
+}
+
+
+def _plain(value: Any) -> Any:
+    """Valores de enums como su valor (``article``, no ``ProductType.ARTICLE``)."""
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def _csv_value(value: Any) -> Any:
+    """Celda CSV: None vacío, booleanos en minúscula, resto con str()."""
+    value = _plain(value)
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+def _xlsx_value(value: Any) -> Any:
+    """
+    Celda xlsx: Excel no admite zonas horarias ni caracteres de control.
+
+    Los Decimal se mantienen (openpyxl los guarda como número).
+    """
+    value = _plain(value)
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.replace(tzinfo=None)
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub("", value)
+    return value
+
+
+def write_csv(header: list[str], rows: Iterable[tuple]) -> Iterator[bytes]:
+    """
+    Escribe las filas como CSV UTF-8 y entrega bloques de bytes.
+
+    El primer bloque lleva BOM para que Excel reconozca los acentos.
+
+    Args:
+        header: Cabecera
+        rows: Filas (se consumen a medida que se escriben)
+
+    Yields:
+        Bloques de bytes del archivo
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(header)
+
+    pending = 0
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+        pending += 1
+        if pending >= CSV_ROWS_PER_CHUNK:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    yield buffer.getvalue().encode("utf-8")
+
+
+def write_xlsx(header: list[str], rows: Iterable[tuple], title: str) -> Iterator[bytes]:
+    """
+    Escribe las filas en un workbook ``write_only`` y entrega el archivo en trozos.
+
+    openpyxl vuelca cada fila a disco al agregarla, así que las filas no se
+    acumulan en memoria; el archivo terminado se lee de un temporal.
+
+    Args:
+        header: Cabecera
+        rows: Filas (se consumen a medida que se escriben)
+        title: Nombre de la hoja
+
+    Yields:
+        Trozos de bytes del archivo xlsx
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=title[:31])
+    sheet.append(header)
+    for row in rows:
+        sheet.append([_xlsx_value(value) for value in row])
+
+    with TemporaryFile() as output:
+        workbook.save(output)
+        output.seek(0)
+        while chunk := output.read(XLSX_STREAM_CHUNK_SIZE):
+            yield chunk
+
+
+class ExportService:
+    """
+    Exporta listados completos a CSV o xlsx.
+
+    La sesión debe seguir abierta mientras se consume el iterador devuelto
+    por ``export``: las filas se leen del cursor durante la escritura.
+
+    Example:
+        service = ExportService(session)
+        with open("cotizaciones.xlsx", "wb") as output:
+            for chunk in service.export("quotes", "xlsx", filters={"status_id": 2}):
+                output.write(chunk)
+    """
+
+    def __init__(self, session: Session):
+        """
+        Inicializa el servicio.
+
+        Args:
+            session: Sesión de base de datos (de lectura)
+        """
+        self.session = session
+
+    def export(
+        self,
+        entity: str,
+        file_format: str,
+        filters: dict | None = None,
+        sort: str | None = None,
+        descending: bool | None = None,
+        search: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Prepara la exportación de un listado.
+
+        Todo lo validable (entidad, formato, filtros y orden) se valida al
+        llamar, antes de generar el primer byte, para que el endpoint pueda
+        responder 400 en lugar de cortar una descarga a medias.
+
+        Args:
+            entity: Entidad (clave de EXPORT_SPECS)
+            file_format: "csv" o "xlsx"
+            filters: Filtros de igualdad {columna: valor}; los None se ignoran
+            sort: Columna de orden (la misma lista permitida que el listado)
+            descending: Orden descendente (None = dirección por defecto)
+            search: Texto a buscar (mismas columnas que el listado)
+            batch_size: Filas leídas del cursor por lote
+
+        Returns:
+            Iterador de bloques de bytes del archivo
+
+        Raises:
+            ValidationException: Entidad, formato, filtro u orden no válidos
+        """
+        spec = EXPORT_SPECS.get(entity)
+        if spec is None:
+            raise ValidationException(
+                f"No se puede exportar '{entity}'",
+                details={"entity": entity, "allowed": list(EXPORT_SPECS)},
+            )
+        if file_format not in EXPORT_FORMATS:
+            raise ValidationException(
+                f"Formato de exportación no soportado: '{file_format}'",
+                details={"format": file_format, "allowed": list(EXPORT_FORMATS)},
+            )
+
+        active_filters = {name: value for name, value in (filters or {}).items() if value is not None}
+        unsupported = sorted(set(active_filters) - set(spec.filters))
+        if unsupported:
+            raise ValidationException(
+                f"Filtros no soportados para '{entity}': {', '.join(unsupported)}",
+                details={"filters": unsupported, "allowed": list(spec.filters)},
+            )
+
+        repository = spec.repository(self.session)
+        entities = repository.iter_list(
+            filters=active_filters,
+            sort=sort,
+            descending=descending,
+            search=search,
+            batch_size=batch_size,
+            profile=None,
+            options=[selectinload(getattr(repository.model, name)) for name in spec.load],
+        )
+        logger.info(f"Exportando {entity} a {file_format} - filters={active_filters}, search={search}")
+
+        header = [column.header for column in spec.columns]
+        rows = self._rows(spec.columns, entities)
+        if file_format == "csv":
+            return write_csv(header, rows)
+        return write_xlsx(header, rows, title=entity)
+
+    @staticmethod
+    def _rows(columns: tuple[ExportColumn, ...], entities: Iterable[Any]) -> Iterator[tuple]:
+        """Convierte cada entidad en la tupla de valores de sus columnas."""
+        getters: list[Callable[[Any], Any]] = [column.value for column in columns]
+        for entity in entities:
+            yield tuple(getter(entity) for getter in getters)
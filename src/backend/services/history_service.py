@@ -0,0 +1,59 @@
+"""
+Servicio del historial de cambios de cotizaciones, órdenes y facturas.
+"""
+
+from src.backend.exceptions.service import ValidationException
+from src.backend.models.history import HISTORY_ENTITIES
+from src.backend.repositories.history_repository import HistoryRepository
+from src.backend.utils.logger import logger
+from src.shared.schemas.history import ChangeHistoryResponse
+
+
+class HistoryService:
+    """
+    Servicio del historial de cambios.
+
+    Attributes:
+        repository: Repositorio del historial
+
+    Example:
+        service = HistoryService(HistoryRepository(session))
+        changes = service.get_history("order", 7)
+    """
+
+    def __init__(self, repository: HistoryRepository):
+        """
+        Inicializa el servicio.
+
+        Args:
+            repository: Repositorio del historial
+        """
+        self.repository = repository
+
+    def get_history(
+        self, entity_type: str, entity_id: int, skip: int = 0, limit: int = 100
+    ) -> list[ChangeHistoryResponse]:
+        """
+        Cambios de una entidad, del más reciente al más antiguo.
+
+        Args:
+            entity_type: Tipo de entidad (quote, order, invoice_sii, invoice_export)
+            entity_id: ID de la entidad
+            skip: Número de registros a saltar
+            limit: Número máximo de registros
+
+        Returns:
+            Lista de cambios
+
+        Raises:
+            ValidationException: Si el tipo de entidad no tiene historial
+        """
+        if entity_type not in HISTORY_ENTITIES:
+            raise ValidationException(
+                f"Tipo de entidad sin historial: {entity_type}",
+                details={"entity_type": entity_type, "valid_types": list(HISTORY_ENTITIES)}
+            )
+
+        logger.debug(f"Historial de {entity_type} {entity_id}: skip={skip}, limit={limit}")
+        changes = self.repository.get_for_entity(entity_type, entity_id, skip=skip, limit=limit)
+        return [ChangeHistoryResponse.model_validate(change) for change in changes]
@@ -0,0 +1,244 @@
+"""
+In-process cache for lookup/reference data.
+
+Lookup tables almost never change, but every form and dialog fetches them.
+Serialized list responses (and the bulk snapshot) are kept here keyed by
+endpoint and query parameters, together with an ETag computed from the
+body, so clients can revalidate with ``If-None-Match`` and get a 304
+instead of downloading the same lists again.
+
+Any committed flush that inserts, updates or deletes a lookup row clears
+the cache. Each uvicorn worker has its own copy: writes made by another
+process, or bulk UPDATEs that bypass the ORM, are picked up when
+``settings.lookup_cache_ttl`` expires. The ETag is a hash of the content,
+so all workers serving the same data agree on it.
+"""
+
+import hashlib
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any
+
+from pydantic_core import to_json
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.backend.config.settings import settings
+from src.backend.models.lookups import (
+    Country,
+    City,
+    CompanyType,
+    Incoterm,
+    Currency,
+    Unit,
+    FamilyType,
+    Matter,
+    SalesType,
+    QuoteStatus,
+    OrderStatus,
+    PaymentStatus,
+)
+from src.backend.repositories.lookups.lookup_repository import (
+    CountryRepository,
+    CityRepository,
+    CompanyTypeRepository,
+    IncotermRepository,
+    CurrencyRepository,
+    UnitRepository,
+    FamilyTypeRepository,
+    MatterRepository,
+    SalesTypeRepository,
+    QuoteStatusRepository,
+    OrderStatusRepository,
+    PaymentStatusRepository,
+)
+from src.backend.utils.cache import TTLCache
+from src.backend.utils.logger import logger
+from src.shared.schemas.lookups.lookup import (
+    CountryResponse,
+    CityResponse,
+    CompanyTypeResponse,
+    IncotermResponse,
+    CurrencyResponse,
+    UnitResponse,
+    FamilyTypeResponse,
+    MatterResponse,
+    SalesTypeResponse,
+    QuoteStatusResponse,
+    OrderStatusResponse,
+    PaymentStatusResponse,
+    LookupSnapshot,
+)
+
+# Models whose writes invalidate the cache
+LOOKUP_MODELS = (
+    Country,
+    City,
+    CompanyType,
+    Incoterm,
+    Currency,
+    Unit,
+    FamilyType,
+    Matter,
+    SalesType,
+    QuoteStatus,
+    OrderStatus,
+    PaymentStatus,
+)
+
+# Snapshot field -> (repository, response schema)
+SNAPSHOT_TABLES = {
+    "countries": (CountryRepository, CountryResponse),
+    "cities": (CityRepository, CityResponse),
+    "company_types": (CompanyTypeRepository, CompanyTypeResponse),
+    "incoterms": (IncotermRepository, IncotermResponse),
+    "currencies": (CurrencyRepository, CurrencyResponse),
+    "units": (UnitRepository, UnitResponse),
+    "family_types": (FamilyTypeRepository, FamilyTypeResponse),
+    "matters": (MatterRepository, MatterResponse),
+    "sales_types": (SalesTypeRepository, SalesTypeResponse),
+    "quote_statuses": (QuoteStatusRepository, QuoteStatusResponse),
+    "order_statuses": (OrderStatusRepository, OrderStatusResponse),
+    "payment_statuses": (PaymentStatusRepository, PaymentStatusResponse),
+}
+
+_LOOKUPS_CHANGED = "lookups_changed"
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    """
+    Serialized JSON response and its ETag.
+
+    Attributes:
+        body: UTF-8 JSON body
+        etag: Quoted strong ETag (hash of body)
+    """
+
+    body: bytes
+    etag: str
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Build a strong ETag from a response body.
+
+    Args:
+        body: Response body
+
+    Returns:
+        Quoted ETag, e.g. '"3f2a..."'
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def encode_json(data: Any) -> CachedBody:
+    """
+    Serialize schemas/lists/dicts to JSON and compute the ETag.
+
+    Args:
+        data: Pydantic models, or lists/dicts of them
+
+    Returns:
+        CachedBody with body and ETag
+    """
+    body = to_json(data)
+    return CachedBody(body=body, etag=make_etag(body))
+
+
+class LookupCache:
+    """
+    TTL cache of serialized lookup responses.
+
+    Tracks a generation counter so a read that started before an
+    invalidation never stores its (possibly stale) result afterwards.
+
+    Example:
+        cached = lookup_cache.get_or_encode(("countries", 0, 100), lambda: service.get_all())
+        cached.body, cached.etag
+    """
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds each entry lives (0 disables caching)
+            clock: Monotonic clock (injectable in tests)
+        """
+        self._entries = TTLCache(ttl=ttl, clock=clock)
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def get_or_encode(self, key: Hashable, factory: Callable[[], Any]) -> CachedBody:
+        """
+        Get a cached body, or load, serialize and store it.
+
+        Args:
+            key: Cache key (endpoint and query parameters)
+            factory: Returns the data to serialize (schemas or lists of them)
+
+        Returns:
+            CachedBody
+        """
+        cached = self._entries.get(key)
+        if cached is not None:
+            return cached
+
+        generation = self._generation
+        cached = encode_json(factory())
+        with self._lock:
+            if generation == self._generation:
+                self._entries.set(key, cached)
+        return cached
+
+    def invalidate(self) -> None:
+        """Drop every entry and discard results of in-flight loads."""
+        with self._lock:
+            self._generation += 1
+            self._entries.invalidate()
+
+
+lookup_cache = LookupCache(ttl=settings.lookup_cache_ttl)
+
+
+def build_lookup_snapshot(session: Session) -> LookupSnapshot:
+    """
+    Load every lookup table into one versioned payload.
+
+    The version is a hash of the lists, so it only changes when some
+    lookup row changes.
+
+    Args:
+        session: Database session
+
+    Returns:
+        LookupSnapshot with all 12 lookup lists
+    """
+    lists = {
+        name: [schema.model_validate(e) for e in repository(session).get_all(limit=None)]
+        for name, (repository, schema) in SNAPSHOT_TABLES.items()
+    }
+    version = hashlib.blake2b(to_json(lists), digest_size=8).hexdigest()
+    return LookupSnapshot(version=version, **lists)
+
+
+# ========== EVENT LISTENERS ==========
+
+
+@event.listens_for(Session, "after_flush")
+def receive_after_flush_lookups(session: Session, flush_context: object) -> None:
+    """Flag the transaction if the flush wrote any lookup row."""
+    if any(isinstance(e, LOOKUP_MODELS) for e in chain(session.new, session.dirty, session.deleted)):
+        session.info[_LOOKUPS_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def receive_after_commit_lookups(session: Session) -> None:
+    """Invalidate the cache once lookup writes are committed."""
+    if session.info.pop(_LOOKUPS_CHANGED, False):
+        logger.debug("Lookup data changed, clearing lookup cache")
+        lookup_cache.invalidate()
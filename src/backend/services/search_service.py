@@ -0,0 +1,85 @@
+"""
+Servicio de búsqueda full-text unificada.
+
+Busca en empresas, productos, contactos, usuarios, notas y cotizaciones
+a través del índice mantenido por src.backend.models.search.
+"""
+
+from src.backend.exceptions.service import ValidationException
+from src.backend.models.search import SEARCH_ENTITIES
+from src.backend.repositories.search_repository import SearchRepository
+from src.backend.utils.logger import logger
+from src.shared.schemas.search import SearchHit
+
+MAX_SEARCH_LIMIT = 100
+
+
+class SearchService:
+    """
+    Servicio de búsqueda.
+
+    Attributes:
+        repository: Repositorio del índice de búsqueda
+
+    Example:
+        service = SearchService(SearchRepository(session))
+        hits = service.search("acme", entity_types=["company", "contact"])
+    """
+
+    def __init__(self, repository: SearchRepository):
+        """
+        Inicializa el servicio.
+
+        Args:
+            repository: Repositorio del índice de búsqueda
+        """
+        self.repository = repository
+
+    def search(
+        self,
+        query: str,
+        entity_types: list[str] | None = None,
+        limit: int = 20,
+    ) -> list[SearchHit]:
+        """
+        Busca en todas las entidades indexadas.
+
+        Args:
+            query: Texto a buscar (cada palabra se busca como prefijo)
+            entity_types: Limitar a estos tipos (default: todos)
+            limit: Máximo de resultados (1-100)
+
+        Returns:
+            Resultados ordenados por relevancia
+
+        Raises:
+            ValidationException: Si algún tipo no es válido o el límite
+                está fuera de rango
+        """
+        if entity_types:
+            unknown = sorted(set(entity_types) - SEARCH_ENTITIES.keys())
+            if unknown:
+                raise ValidationException(
+                    f"Tipo(s) de entidad no indexados: {', '.join(unknown)}",
+                    details={"types": unknown, "valid_types": list(SEARCH_ENTITIES)}
+                )
+
+        if not 1 <= limit <= MAX_SEARCH_LIMIT:
+            raise ValidationException(
+                f"El límite debe estar entre 1 y {MAX_SEARCH_LIMIT}",
+                details={"limit": limit}
+            )
+
+        logger.info(f"Búsqueda: q='{query}', tipos={entity_types}, limit={limit}")
+        hits = self.repository.search(query, entity_types=entity_types, limit=limit)
+
+        return [SearchHit.model_validate(hit._mapping) for hit in hits]
+
+    def rebuild_index(self) -> int:
+        """
+        Reconstruye el índice completo.
+
+        Returns:
+            Número de documentos indexados
+        """
+        return self.repository.rebuild()
@@ -0,0 +1,147 @@
+"""
+Servicio de estadísticas del dashboard.
+
+Arma los KPIs desde StatsRepository (seis queries agrupadas) y los guarda
+en una caché en memoria con TTL corto: el dashboard se abre a menudo y
+unos segundos de desfase no importan.
+"""
+
+from decimal import Decimal
+
+from src.backend.config.constants import (
+    ORDER_STATUS_CANCELLED,
+    ORDER_STATUS_DELIVERED,
+    QUOTE_STATUS_DRAFT,
+    QUOTE_STATUS_SENT,
+)
+from src.backend.config.settings import settings
+from src.backend.repositories.stats_repository import StatsRepository
+from src.backend.utils.cache import TTLCache
+from src.backend.utils.logger import logger
+from src.shared.providers import ITimeProvider, TimeProvider
+from src.shared.schemas.stats import (
+    CompanyTypeCount,
+    DashboardStats,
+    MonthlyRevenue,
+    StatusCount,
+)
+
+# Convención de la API: 1=CLIENT, 2=SUPPLIER (ver CompanyRepository.get_by_type)
+CLIENT_COMPANY_TYPE_ID = 1
+SUPPLIER_COMPANY_TYPE_ID = 2
+
+OPEN_QUOTE_STATUSES = {QUOTE_STATUS_DRAFT, QUOTE_STATUS_SENT}
+CLOSED_ORDER_STATUSES = {ORDER_STATUS_DELIVERED, ORDER_STATUS_CANCELLED}
+
+REVENUE_MONTHS = 12
+
+_DASHBOARD_KEY = "dashboard"
+_dashboard_cache = TTLCache(ttl=settings.dashboard_cache_ttl)
+
+
+class StatsService:
+    """
+    Servicio de estadísticas agregadas.
+
+    Attributes:
+        repository: Repositorio de estadísticas
+        time_provider: Proveedor de fecha actual (inyectable en tests)
+
+    Example:
+        service = StatsService(StatsRepository(session))
+        stats = service.get_dashboard()
+    """
+
+    def __init__(
+        self,
+        repository: StatsRepository,
+        time_provider: ITimeProvider | None = None,
+        cache: TTLCache | None = None,
+    ):
+        """
+        Inicializa el servicio.
+
+        Args:
+            repository: Repositorio de estadísticas
+            time_provider: Proveedor de tiempo (default: TimeProvider)
+            cache: Caché de resultados (default: caché del proceso)
+        """
+        self.repository = repository
+        self.time_provider = time_provider or TimeProvider()
+        self.cache = cache if cache is not None else _dashboard_cache
+
+    def get_dashboard(self, refresh: bool = False) -> DashboardStats:
+        """
+        Obtiene los KPIs del dashboard.
+
+        Args:
+            refresh: Ignorar la caché y recalcular
+
+        Returns:
+            DashboardStats (de caché si tiene menos de dashboard_cache_ttl segundos)
+        """
+        if refresh:
+            self.cache.invalidate(_DASHBOARD_KEY)
+        return self.cache.get_or_set(_DASHBOARD_KEY, self.compute_dashboard)
+
+    def compute_dashboard(self) -> DashboardStats:
+        """
+        Calcula los KPIs del dashboard sin caché.
+
+        Returns:
+            DashboardStats recién calculado
+        """
+        logger.info("Calculando estadísticas del dashboard")
+        today = self.time_provider.today()
+
+        companies = [
+            CompanyTypeCount(company_type_id=row.company_type_id, name=row.name, count=row.count)
+            for row in self.repository.count_companies_by_type()
+        ]
+        by_type = {c.company_type_id: c.count for c in companies}
+
+        products = self.repository.count_products()
+
+        quotes = [StatusCount(code=row.code, count=row.count) for row in self.repository.count_quotes_by_status()]
+        orders = [StatusCount(code=row.code, count=row.count) for row in self.repository.count_orders_by_status()]
+
+        overdue = self.repository.overdue_invoices(today)
+
+        # Primer día del mes, 11 meses atrás: 12 meses incluyendo el actual
+        first_month = today.start_of("month").subtract(months=REVENUE_MONTHS - 1)
+        revenue = {
+            (int(row.year), int(row.month)): row
+            for row in self.repository.revenue_by_month(first_month)
+        }
+        revenue_by_month = []
+        for offset in range(REVENUE_MONTHS):
+            month = first_month.add(months=offset)
+            row = revenue.get((month.year, month.month))
+            revenue_by_month.append(MonthlyRevenue(
+                year=month.year,
+                month=month.month,
+                revenue=_money(row.revenue if row else 0),
+                invoices=row.invoices if row else 0,
+            ))
+
+        return DashboardStats(
+            clients_count=by_type.get(CLIENT_COMPANY_TYPE_ID, 0),
+            providers_count=by_type.get(SUPPLIER_COMPANY_TYPE_ID, 0),
+            companies_by_type=companies,
+            products_count=products.total,
+            active_products_count=products.active,
+            quotes_count=sum(q.count for q in quotes if q.code in OPEN_QUOTE_STATUSES),
+            quotes_by_status=quotes,
+            orders_count=sum(o.count for o in orders),
+            open_orders_count=sum(o.count for o in orders if o.code not in CLOSED_ORDER_STATUSES),
+            orders_by_status=orders,
+            overdue_invoices_count=overdue.count,
+            overdue_invoices_amount=_money(overdue.amount),
+            revenue_by_month=revenue_by_month,
+            generated_at=self.time_provider.now(),
+        )
+
+
+def _money(value) -> Decimal:
+    """Normaliza un SUM (Decimal, float en SQLite o 0) a Decimal con 2 decimales."""
+    return Decimal(str(value or 0)).quantize(Decimal("0.01"))
@@ -5,8 +5,14 @@ Este paquete contiene utilidades y helpers reutilizables en toda la aplicación.
 """
 
 from src.backend.utils.logger import logger, setup_logger
+from src.backend.utils.cache import TTLCache
+from src.backend.utils.metrics import MetricsRegistry, instrument_engine, metrics_registry
 
 __all__ = [
     "logger",
     "setup_logger",
+    "TTLCache",
+    "MetricsRegistry",
+    "instrument_engine",
+    "metrics_registry",
 ]
@@ -0,0 +1,109 @@
+"""
+Caché en memoria con expiración (TTL).
+
+Caché por proceso para resultados caros de calcular y que toleran unos
+segundos de desfase (estadísticas, tablas de referencia). Cada worker de
+uvicorn tiene su propia copia.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class TTLCache:
+    """
+    Caché clave -> valor donde cada entrada expira ``ttl`` segundos después
+    de guardarse.
+
+    Es segura entre hilos (los endpoints ``def`` corren en el threadpool).
+    Si dos requests piden la misma clave expirada a la vez ambos calculan
+    el valor; el segundo simplemente sobrescribe al primero.
+
+    Attributes:
+        ttl: Segundos de vida de cada entrada
+
+    Example:
+        _cache = TTLCache(ttl=30)
+        stats = _cache.get_or_set("dashboard", lambda: repo.compute())
+        _cache.invalidate("dashboard")
+    """
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Inicializa la caché.
+
+        Args:
+            ttl: Segundos de vida de cada entrada (0 desactiva la caché)
+            clock: Reloj monotónico (inyectable en tests)
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Obtiene un valor vigente.
+
+        Args:
+            key: Clave
+            default: Valor si la clave no existe o expiró
+
+        Returns:
+            Valor guardado o default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Guarda un valor con el TTL de la caché.
+
+        Args:
+            key: Clave
+            value: Valor
+        """
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Obtiene un valor vigente o lo calcula y guarda.
+
+        Args:
+            key: Clave
+            factory: Función sin argumentos que calcula el valor
+
+        Returns:
+            Valor guardado o recién calculado
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """
+        Descarta una entrada, o todas si no se indica clave.
+
+        Args:
+            key: Clave a descartar (None = todas)
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
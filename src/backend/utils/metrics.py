@@ -0,0 +1,324 @@
+"""
+Métricas por request: latencia, queries SQL y detección de N+1.
+
+Cada request HTTP tiene un ``RequestMetrics`` en una ContextVar (lo crea
+InstrumentationMiddleware). Los hooks ``before_cursor_execute`` y
+``after_cursor_execute`` de SQLAlchemy suman ahí las queries y su tiempo,
+incluso desde los endpoints ``def`` (el threadpool copia el contexto) y
+desde el engine asíncrono (los greenlets heredan el contexto).
+
+Una query cuya forma (el SQL con parámetros y listas IN colapsadas) se
+repite más de ``n_plus_one_threshold`` veces en un mismo request se avisa
+como posible N+1: suele ser una relación lazy cargada fila por fila.
+
+Al terminar el request el middleware vuelca los totales en
+``metrics_registry``, que ``/metrics`` expone en formato de texto de
+Prometheus. Es por proceso: cada worker de uvicorn tiene sus contadores.
+"""
+
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.backend.utils.logger import logger
+
+# Límites (segundos) de los buckets del histograma de latencia
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Clave en ``Connection.info`` de la pila de inicios de queries en curso
+_QUERY_START_KEY = "akgroup_query_start"
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST_RE = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s)(?:\s*,\s*(?:\?|%s|%\(\w+\)s))*\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Forma de una sentencia SQL, sin los valores que cambian entre ejecuciones.
+
+    Reemplaza literales por ``?`` y colapsa las listas de parámetros
+    (``IN (?, ?, ?)`` → ``IN (?)``) para que la misma query con distintos
+    ids cuente como una sola forma.
+
+    Args:
+        statement: SQL enviado al cursor
+
+    Returns:
+        SQL normalizado
+
+    Example:
+        >>> statement_shape("SELECT * FROM t WHERE id IN (?, ?)  AND x = 3")
+        'SELECT * FROM t WHERE id IN (?) AND x = ?'
+    """
+    shape = _STRING_LITERAL_RE.sub("?", statement)
+    shape = _NUMBER_LITERAL_RE.sub("?", shape)
+    shape = _PLACEHOLDER_LIST_RE.sub("(?)", shape)
+    return _WHITESPACE_RE.sub(" ", shape).strip()
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Queries SQL de un request en curso.
+
+    Attributes:
+        path: Ruta pedida (para los avisos)
+        n_plus_one_threshold: Repeticiones de una forma a partir de las
+            cuales se avisa (0 = sin detección)
+        query_count: Queries ejecutadas
+        query_time: Segundos pasados en el cursor
+        shapes: Ejecuciones por forma de sentencia
+        repeated: Formas avisadas como N+1
+    """
+
+    path: str = ""
+    n_plus_one_threshold: int = 10
+    query_count: int = 0
+    query_time: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    repeated: list[str] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_query(self, statement: str, duration: float) -> None:
+        """
+        Suma una query; avisa la primera vez que su forma supera el umbral.
+
+        Args:
+            statement: SQL ejecutado
+            duration: Segundos que tardó
+        """
+        shape = statement_shape(statement)
+        with self._lock:
+            self.query_count += 1
+            self.query_time += duration
+            self.shapes[shape] += 1
+            crossed = self.n_plus_one_threshold and self.shapes[shape] == self.n_plus_one_threshold + 1
+            if crossed:
+                self.repeated.append(shape)
+        if crossed:
+            logger.warning(
+                f"Posible N+1 en {self.path}: la misma query se ejecutó más de "
+                f"{self.n_plus_one_threshold} veces - {shape[:300]}"
+            )
+
+
+_current_request: ContextVar[RequestMetrics | None] = ContextVar("akgroup_request_metrics", default=None)
+
+
+def current_request_metrics() -> RequestMetrics | None:
+    """Métricas del request en curso (None fuera de un request)."""
+    return _current_request.get()
+
+
+def start_request(metrics: RequestMetrics):
+    """
+    Hace de ``metrics`` el destino de las queries del contexto actual.
+
+    Returns:
+        Token para ``end_request``
+    """
+    return _current_request.set(metrics)
+
+
+def end_request(token) -> None:
+    """Deja de contar queries en el contexto actual."""
+    _current_request.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current_request.get() is not None:
+        conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    metrics = _current_request.get()
+    starts = conn.info.get(_QUERY_START_KEY)
+    if metrics is None or not starts:
+        return
+    metrics.record_query(statement, time.perf_counter() - starts.pop())
+
+
+def _handle_error(exception_context) -> None:
+    # La query falló: after_cursor_execute no se llama, descartar su inicio
+    connection = exception_context.connection
+    if connection is not None and connection.info.get(_QUERY_START_KEY):
+        connection.info[_QUERY_START_KEY].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Registra los hooks que cuentan queries en ``engine``.
+
+    Para el engine asíncrono se pasa ``async_engine.sync_engine``. Llamarla
+    más de una vez con el mismo engine no duplica los hooks.
+
+    Args:
+        engine: Engine síncrono de SQLAlchemy
+
+    Example:
+        instrument_engine(engine)
+        instrument_engine(async_engine.sync_engine)
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def server_timing(app_duration: float, metrics: RequestMetrics) -> str:
+    """
+    Valor del header ``Server-Timing`` (duraciones en milisegundos).
+
+    Example:
+        >>> server_timing(0.0123, RequestMetrics(query_count=2, query_time=0.004))
+        'app;dur=12.3, db;dur=4.0;desc="2 queries"'
+    """
+    return (
+        f"app;dur={app_duration * 1000:.1f}, "
+        f'db;dur={metrics.query_time * 1000:.1f};desc="{metrics.query_count} queries"'
+    )
+
+
+@dataclass
+class _RouteStats:
+    """Acumulados de una ruta (método + plantilla de path)."""
+
+    bucket_counts: list[int]
+    count: int = 0
+    duration_sum: float = 0.0
+    queries: int = 0
+    query_time: float = 0.0
+    n_plus_one: int = 0
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in labels.items()) + "}"
+
+
+class MetricsRegistry:
+    """
+    Contadores por ruta, expuestos en formato de texto de Prometheus.
+
+    Las rutas se identifican por su plantilla (``/api/v1/products/{product_id}``),
+    no por el path pedido, para que la cantidad de series no crezca con los ids.
+    Es segura entre hilos.
+
+    Example:
+        registry = MetricsRegistry()
+        registry.observe_request("GET", "/api/v1/products/", 200, 0.034, request_metrics)
+        text = registry.render()
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Inicializa el registro.
+
+        Args:
+            buckets: Límites (segundos) del histograma de latencia
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._routes: dict[tuple[str, str], _RouteStats] = {}
+        self._statuses: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def observe_request(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        duration: float,
+        metrics: RequestMetrics | None = None,
+    ) -> None:
+        """
+        Registra un request terminado.
+
+        Args:
+            method: Método HTTP
+            route: Plantilla de la ruta
+            status: Código de respuesta
+            duration: Segundos desde que llegó hasta el último byte
+            metrics: Queries del request
+        """
+        with self._lock:
+            stats = self._routes.get((method, route))
+            if stats is None:
+                stats = self._routes[(method, route)] = _RouteStats(bucket_counts=[0] * len(self.buckets))
+            stats.count += 1
+            stats.duration_sum += duration
+            for index, bound in enumerate(self.buckets):
+                if duration <= bound:
+                    stats.bucket_counts[index] += 1
+            if metrics is not None:
+                stats.queries += metrics.query_count
+                stats.query_time += metrics.query_time
+                stats.n_plus_one += len(metrics.repeated)
+            self._statuses[(method, route, status)] += 1
+
+    def reset(self) -> None:
+        """Borra todos los contadores."""
+        with self._lock:
+            self._routes.clear()
+            self._statuses.clear()
+
+    def render(self) -> str:
+        """
+        Contadores en formato de texto de Prometheus (version 0.0.4).
+
+        Returns:
+            Texto para la respuesta de ``/metrics``
+        """
+        with self._lock:
+            routes = sorted(self._routes.items())
+            statuses = sorted(self._statuses.items())
+
+        lines = [
+            "# HELP akgroup_http_requests_total Requests HTTP atendidos.",
+            "# TYPE akgroup_http_requests_total counter",
+        ]
+        for (method, route, status), count in statuses:
+            lines.append(f"akgroup_http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+
+        lines += [
+            "# HELP akgroup_http_request_duration_seconds Latencia de los requests HTTP.",
+            "# TYPE akgroup_http_request_duration_seconds histogram",
+        ]
+        for (method, route), stats in routes:
+            for bound, count in zip(self.buckets, stats.bucket_counts):
+                lines.append(
+                    "akgroup_http_request_duration_seconds_bucket"
+                    f"{_labels(method=method, route=route, le=f'{bound:g}')} {count}"
+                )
+            lines.append(
+                "akgroup_http_request_duration_seconds_bucket"
+                f"{_labels(method=method, route=route, le='+Inf')} {stats.count}"
+            )
+            lines.append(f"akgroup_http_request_duration_seconds_sum{_labels(method=method, route=route)} {stats.duration_sum:.6f}")
+            lines.append(f"akgroup_http_request_duration_seconds_count{_labels(method=method, route=route)} {stats.count}")
+
+        for name, kind, help_text, attribute, fmt in (
+            ("akgroup_db_queries_total", "counter", "Queries SQL ejecutadas por los requests.", "queries", "{}"),
+            ("akgroup_db_query_duration_seconds_total", "counter", "Segundos en el cursor SQL por los requests.", "query_time", "{:.6f}"),
+            ("akgroup_n_plus_one_total", "counter", "Formas de query repetidas sobre el umbral N+1.", "n_plus_one", "{}"),
+        ):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            for (method, route), stats in routes:
+                lines.append(f"{name}{_labels(method=method, route=route)} {fmt.format(getattr(stats, attribute))}")
+
+        return "\n".join(lines) + "\n"
+
+
+# Registro global del proceso
+metrics_registry = MetricsRegistry()
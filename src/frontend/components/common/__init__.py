@@ -11,6 +11,7 @@ from src.frontend.components.common.base_card import BaseCard
 from src.frontend.components.common.search_bar import SearchBar
 from src.frontend.components.common.data_table import DataTable, ColumnConfig
 from src.frontend.components.common.filter_panel import FilterPanel, FilterConfig
+from src.frontend.components.common.export_button import ExportButton
 
 __all__ = [
     "LoadingSpinner",
@@ -23,4 +24,5 @@ __all__ = [
     "ColumnConfig",
     "FilterPanel",
     "FilterConfig",
+    "ExportButton",
 ]
@@ -2,16 +2,22 @@
 Componente de tabla de datos avanzada.
 
 Proporciona una DataTable con ordenamiento, paginación y acciones.
+
+Con ``data_source`` la tabla trabaja en modo remoto: no recibe todo el
+dataset, sino que pide al backend solo la página visible (ordenada y
+filtrada allí) y pagina con el total que informa el backend.
 """
-from typing import Callable, Any
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from typing import Any
+
 import flet as ft
 from loguru import logger
 
-from src.frontend.layout_constants import LayoutConstants
-from src.frontend.i18n.translation_manager import t
 from src.frontend.app_state import app_state
 from src.frontend.components.common.empty_state import EmptyState
+from src.frontend.i18n.translation_manager import t
+from src.frontend.layout_constants import LayoutConstants
 
 
 @dataclass
@@ -25,12 +31,15 @@ class ColumnConfig:
         sortable: Si la columna es ordenable
         width: Ancho de la columna (None = auto)
         formatter: Función para formatear el valor (opcional)
+        sort_key: Columna del backend por la que ordenar en modo remoto
+            (default: key)
     """
     key: str
     label: str
     sortable: bool = False
     width: int | None = None
     formatter: Callable[[Any], str] | None = None
+    sort_key: str | None = None
 
 
 class DataTable(ft.Container):
@@ -46,6 +55,11 @@ class DataTable(ft.Container):
         on_selection_changed: Callback cuando cambia la selección
         page_size: Tamaño de página para paginación (0 = sin paginación)
         empty_message: Mensaje cuando no hay datos
+        data_source: Corutina para el modo remoto. Se llama como
+            ``data_source(page=, page_size=, sort=, order=, **filtros)``
+            (misma firma que ``XAPIService.get_list``) y retorna
+            ``{"items": [...], "total": n}``. La primera carga la dispara
+            el dueño de la tabla con ``await table.reload()``.
 
     Example:
         >>> columns = [
@@ -59,6 +73,11 @@ class DataTable(ft.Container):
         ...     on_edit=handle_edit,
         ...     on_delete=handle_delete
         ... )
+
+        >>> # Modo remoto: solo se pide la página visible
+        >>> table = DataTable(columns=columns, data_source=company_api.get_list, page_size=25)
+        >>> await table.reload()
+        >>> table.set_filters(q="ak", is_active=True)
     """
 
     def __init__(
@@ -73,6 +92,7 @@ class DataTable(ft.Container):
         on_selection_changed: Callable[[list[dict[str, Any]]], None] | None = None,
         page_size: int = 10,
         empty_message: str | None = None,
+        data_source: Callable[..., Awaitable[dict[str, Any]]] | None = None,
     ):
         """Inicializa la tabla de datos."""
         super().__init__()
@@ -87,6 +107,7 @@ class DataTable(ft.Container):
                     sortable=col.get("sortable", False),
                     width=col.get("width"),
                     formatter=col.get("formatter"),
+                    sort_key=col.get("sort_key"),
                 ))
             else:
                 self.columns.append(col)
@@ -100,12 +121,16 @@ class DataTable(ft.Container):
         self.on_selection_changed = on_selection_changed
         self.page_size = page_size
         self.empty_message = empty_message or t("common.no_data")
+        self.data_source = data_source
 
         self._sort_column: str | None = None
         self._sort_ascending: bool = True
         self._current_page: int = 0
         self._total_items: int = 0
         self._selected_rows: set[int] = set()
+        self._filters: dict[str, Any] = {}
+        # Identifica la última petición remota para descartar respuestas viejas
+        self._request_seq: int = 0
 
         logger.debug(f"DataTable initialized: {len(self.columns)} columns, {len(self.data)} rows")
 
@@ -152,8 +177,8 @@ class DataTable(ft.Container):
 
         # Construir paginación si es necesaria
         pagination = None
-        if self.page_size > 0 and len(self.data) > self.page_size:
-            total_pages = (len(self._get_sorted_data()) + self.page_size - 1) // self.page_size
+        total_pages = self._total_pages()
+        if total_pages > 1:
             pagination = ft.Row(
                 controls=[
                     ft.IconButton(
@@ -404,14 +429,36 @@ class DataTable(ft.Container):
 
         return wrapper
 
+    @property
+    def is_remote(self) -> bool:
+        """True si la tabla pide las páginas al backend (data_source)."""
+        return self.data_source is not None
+
+    def _total_pages(self) -> int:
+        """
+        Calcula el número de páginas.
+
+        En modo remoto se usa el total informado por el backend; en modo
+        local, la cantidad de filas cargadas.
+
+        Returns:
+            Número de páginas (0 si no hay paginación)
+        """
+        if self.page_size <= 0:
+            return 0
+        total = self._total_items if self.is_remote else len(self.data)
+        return (total + self.page_size - 1) // self.page_size
+
     def _get_sorted_data(self) -> list[dict[str, Any]]:
         """
         Obtiene los datos ordenados.
 
+        En modo remoto los datos ya vienen ordenados por el backend.
+
         Returns:
             Lista de datos ordenados
         """
-        if not self._sort_column:
+        if not self._sort_column or self.is_remote:
             return self.data
 
         return sorted(
@@ -430,7 +477,7 @@ class DataTable(ft.Container):
         Returns:
             Datos de la página actual
         """
-        if self.page_size <= 0:
+        if self.page_size <= 0 or self.is_remote:
             return data
 
         start = self._current_page * self.page_size
@@ -451,6 +498,10 @@ class DataTable(ft.Container):
             self._sort_ascending = True
 
         logger.debug(f"Sorting by {column_key}, ascending={self._sort_ascending}")
+        if self.is_remote:
+            self._current_page = 0
+            self._schedule_reload()
+            return
         if self.page:
             # Reconstruir contenido al ordenar
             self.content = self.build()
@@ -514,9 +565,7 @@ class DataTable(ft.Container):
         logger.debug(f"Selected rows: {len(self._selected_rows)}")
 
         if self.on_selection_changed:
-            selected_data = [
-                self.data[i] for i in self._selected_rows if i < len(self.data)
-            ]
+            selected_data = self.get_selected_data()
             try:
                 self.on_selection_changed(selected_data)
             except Exception as ex:
@@ -543,9 +592,7 @@ class DataTable(ft.Container):
 
         # Llamar callback si existe
         if self.on_selection_changed:
-            selected_data = [
-                self.data[idx] for idx in self._selected_rows if idx < len(self.data)
-            ]
+            selected_data = self.get_selected_data()
             try:
                 self.on_selection_changed(selected_data)
             except Exception as ex:
@@ -571,9 +618,7 @@ class DataTable(ft.Container):
 
         # Llamar callback si existe
         if self.on_selection_changed:
-            selected_data = [
-                self.data[idx] for idx in self._selected_rows if idx < len(self.data)
-            ]
+            selected_data = self.get_selected_data()
             try:
                 self.on_selection_changed(selected_data)
             except Exception as ex:
@@ -582,33 +627,136 @@ class DataTable(ft.Container):
     def _previous_page(self, e: ft.ControlEvent) -> None:
         """Navega a la página anterior."""
         if self._current_page > 0:
-            self._current_page -= 1
-            logger.debug(f"Navigate to page {self._current_page}")
-            if self.on_page_change:
-                try:
-                    self.on_page_change(self._current_page + 1)  # 1-indexed for user
-                except Exception as ex:
-                    logger.error(f"Error in page change callback: {ex}")
-            if self.page:
-                # Reconstruir contenido al cambiar de página
-                self.content = self.build()
-                self.update()
+            self._go_to_page(self._current_page - 1)
 
     def _next_page(self, e: ft.ControlEvent) -> None:
         """Navega a la página siguiente."""
-        total_pages = (len(self.data) + self.page_size - 1) // self.page_size
-        if self._current_page < total_pages - 1:
-            self._current_page += 1
-            logger.debug(f"Navigate to page {self._current_page}")
-            if self.on_page_change:
-                try:
-                    self.on_page_change(self._current_page + 1)  # 1-indexed for user
-                except Exception as ex:
-                    logger.error(f"Error in page change callback: {ex}")
+        if self._current_page < self._total_pages() - 1:
+            self._go_to_page(self._current_page + 1)
+
+    def _go_to_page(self, page_index: int) -> None:
+        """
+        Cambia de página y la muestra (o la pide al backend en modo remoto).
+
+        Args:
+            page_index: Página destino (0-indexed)
+        """
+        self._current_page = page_index
+        logger.debug(f"Navigate to page {self._current_page}")
+        if self.on_page_change:
+            try:
+                self.on_page_change(self._current_page + 1)  # 1-indexed for user
+            except Exception as ex:
+                logger.error(f"Error in page change callback: {ex}")
+        if self.is_remote:
+            self._schedule_reload()
+        elif self.page:
+            # Reconstruir contenido al cambiar de página
+            self.content = self.build()
+            self.update()
+
+    def sort_params(self) -> dict[str, Any]:
+        """
+        Orden vigente en el formato de los listados del backend.
+
+        Lo usa reload() y también las exportaciones, que piden el listado
+        completo en el mismo orden que muestra la tabla.
+
+        Returns:
+            Diccionario con 'sort' y 'order' (ambos None sin columna de
+            orden: se usa el orden por defecto del backend)
+        """
+        if not self._sort_column:
+            return {"sort": None, "order": None}
+        column = next((c for c in self.columns if c.key == self._sort_column), None)
+        sort = (column.sort_key or column.key) if column else self._sort_column
+        return {"sort": sort, "order": "asc" if self._sort_ascending else "desc"}
+
+    async def reload(self, reset_page: bool = False) -> None:
+        """
+        Pide al backend la página actual con el orden y filtros vigentes.
+
+        Solo aplica en modo remoto. Si llega la respuesta de una petición
+        anterior a la última (p. ej. clicks rápidos en "siguiente"), se
+        descarta.
+
+        Args:
+            reset_page: Volver a la primera página antes de pedir
+
+        Raises:
+            Las excepciones de data_source (para que el dueño muestre el error)
+
+        Example:
+            >>> await table.reload(reset_page=True)
+        """
+        if not self.data_source:
+            return
+        if reset_page:
+            self._current_page = 0
+
+        params = {
+            "page": self._current_page + 1,
+            "page_size": self.page_size,
+            **self.sort_params(),
+            **self._filters,
+        }
+        self._request_seq += 1
+        request_seq = self._request_seq
+        logger.debug(f"DataTable remote load: {params}")
+
+        result = await self.data_source(**params)
+        if request_seq != self._request_seq:
+            logger.debug("DataTable: respuesta de una petición anterior descartada")
+            return
+
+        self.data = result.get("items", [])
+        self._total_items = result.get("total", len(self.data))
+        self._selected_rows.clear()
+
+        # La página quedó fuera de rango (p. ej. se eliminó la última fila)
+        if not self.data and self._current_page > 0 and self._total_items > 0:
+            self._current_page = self._total_pages() - 1
+            await self.reload()
+            return
+
+        self.content = self.build()
+        try:
             if self.page:
-                # Reconstruir contenido al cambiar de página
-                self.content = self.build()
                 self.update()
+        except RuntimeError:
+            # La tabla se quitó de la página mientras llegaba la respuesta
+            logger.debug("DataTable: respuesta recibida sin tabla en la página")
+
+    def set_filters(self, **filters: Any) -> None:
+        """
+        Reemplaza los filtros del modo remoto y recarga desde la primera página.
+
+        Los filtros se envían tal cual a data_source (p. ej. ``q``,
+        ``is_active``); los valores None se omiten.
+
+        Args:
+            **filters: Filtros para data_source
+
+        Example:
+            >>> table.set_filters(q="bomba", status_id=2)
+        """
+        self._filters = {k: v for k, v in filters.items() if v is not None}
+        self._current_page = 0
+        self._schedule_reload()
+
+    def _schedule_reload(self) -> None:
+        """Programa reload() en el event loop de la página."""
+        if self.page:
+            self.page.run_task(self._reload_safely)
+
+    async def _reload_safely(self) -> None:
+        """reload() disparado por la propia tabla (orden/página): solo registra errores."""
+        from src.frontend.services.api import APIException
+
+        try:
+            await self.reload()
+        except APIException as ex:
+            logger.error(f"Error loading remote page: {ex.message}")
 
     def update_data(self, data: list[dict[str, Any]]) -> None:
         """
@@ -674,7 +822,13 @@ class DataTable(ft.Container):
         Example:
             >>> selected = table.get_selected_data()
         """
-        return [self.data[i] for i in self._selected_rows if i < len(self.data)]
+        # En modo remoto self.data es solo la página actual
+        offset = self._current_page * self.page_size if self.is_remote else 0
+        return [
+            self.data[i - offset]
+            for i in sorted(self._selected_rows)
+            if 0 <= i - offset < len(self.data)
+        ]
 
     def clear_selection(self) -> None:
         """
@@ -687,6 +841,10 @@ class DataTable(ft.Container):
         if self.page:
             self.update()
 
+    def did_mount(self) -> None:
+        """Re-suscribe al tema (la vista dueña puede reinsertar la misma tabla)."""
+        app_state.theme.add_observer(self._on_theme_changed)
+
     def will_unmount(self) -> None:
         """Limpieza cuando el componente se desmonta."""
         app_state.theme.remove_observer(self._on_theme_changed)
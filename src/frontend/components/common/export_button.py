@@ -0,0 +1,132 @@
+"""
+Botón de exportación de listados a CSV o Excel.
+
+Pide al backend el listado completo con el orden, búsqueda y filtros que
+muestra la vista, y lo guarda en disco a medida que llega.
+"""
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable
+
+import flet as ft
+from loguru import logger
+
+from src.frontend.i18n.translation_manager import t
+
+
+class ExportButton(ft.PopupMenuButton):
+    """
+    Menú "Exportar" con las opciones CSV y Excel.
+
+    Args:
+        entity: Listado a exportar (products, quotes, orders, invoices-sii,
+            invoices-export)
+        get_params: Callback que retorna los parámetros vigentes de la
+            vista (sort, order, q y filtros del listado)
+        tooltip: Texto del botón (default: "Exportar")
+        visible: Si el botón se muestra
+
+    Example:
+        >>> export_button = ExportButton(
+        ...     entity="quotes",
+        ...     get_params=lambda: {**table.sort_params(), "q": query, "status_id": 2},
+        ... )
+        >>> header.controls.append(export_button)
+    """
+
+    def __init__(
+        self,
+        entity: str,
+        get_params: Callable[[], dict[str, Any]],
+        tooltip: str | None = None,
+        visible: bool = True,
+    ):
+        """Inicializa el botón de exportación."""
+        super().__init__()
+        self._entity = entity
+        self._get_params = get_params
+
+        self.icon = ft.Icons.DOWNLOAD
+        self.tooltip = tooltip or t("common.export")
+        self.visible = visible
+        self.items = [
+            ft.PopupMenuItem(
+                content=ft.Text(t("common.export_csv")),
+                on_click=lambda e: self._start_export("csv"),
+            ),
+            ft.PopupMenuItem(
+                content=ft.Text(t("common.export_xlsx")),
+                on_click=lambda e: self._start_export("xlsx"),
+            ),
+        ]
+        logger.debug(f"ExportButton initialized for {entity}")
+
+    def _start_export(self, file_format: str) -> None:
+        """Lanza la exportación sin bloquear la interfaz."""
+        if self.page:
+            self.page.run_task(self._export, file_format)
+
+    async def _export(self, file_format: str) -> None:
+        """
+        Pregunta dónde guardar y descarga el archivo.
+
+        Args:
+            file_format: "csv" o "xlsx"
+        """
+        from src.frontend.services.api import APIException, export_api
+
+        file_name = f"{self._entity}-{date.today().isoformat()}.{file_format}"
+        destination = await self._ask_destination(file_name, file_format)
+        if destination is None:
+            return
+
+        params = dict(self._get_params())
+        # Sin columna de orden se usa el orden por defecto del listado
+        if not params.get("sort"):
+            params.pop("sort", None)
+            params.pop("order", None)
+
+        self.disabled = True
+        self.update()
+        try:
+            await export_api.download(self._entity, file_format, destination, **params)
+            self._show_message(t("common.export_done", {"path": str(destination)}))
+        except APIException as e:
+            logger.error(f"Error exporting {self._entity}: {e.message}")
+            self._show_message(t("common.export_error", {"error": e.message}), is_error=True)
+        finally:
+            self.disabled = False
+            self.update()
+
+    async def _ask_destination(self, file_name: str, file_format: str) -> Path | None:
+        """
+        Ruta donde guardar el archivo.
+
+        En escritorio se pregunta con el diálogo del sistema; si el diálogo
+        no está disponible (modo web), se guarda en la carpeta Descargas.
+
+        Returns:
+            Ruta elegida, o None si el usuario canceló
+        """
+        try:
+            path = await ft.FilePicker().save_file(
+                file_name=file_name,
+                allowed_extensions=[file_format],
+            )
+        except Exception as e:
+            logger.warning(f"FilePicker no disponible, se usa Descargas: {e}")
+            downloads = Path.home() / "Downloads"
+            downloads.mkdir(parents=True, exist_ok=True)
+            return downloads / file_name
+        return Path(path) if path else None
+
+    def _show_message(self, message: str, is_error: bool = False) -> None:
+        """Muestra el resultado en un SnackBar."""
+        if not self.page:
+            return
+        self.page.show_dialog(
+            ft.SnackBar(
+                content=ft.Text(message),
+                bgcolor=ft.Colors.ERROR if is_error else None,
+            )
+        )
@@ -146,7 +146,7 @@ class AddressFormDialog:
         self._set_loading(True)
 
         try:
-            import httpx
+            from src.frontend.services.api import http_client_manager
 
             # Preparar datos
             data = {
@@ -159,7 +159,7 @@ class AddressFormDialog:
                 "company_id": self.company_id,
             }
 
-            async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
+            async with http_client_manager.borrow() as client:
                 if self.mode == "create":
                     # POST para crear
                     response = await client.post("/api/v1/addresses", json=data)
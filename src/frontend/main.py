@@ -8,6 +8,7 @@ from loguru import logger
 
 from src.frontend.views import MainView
 from src.frontend.app_state import app_state
+from src.frontend.services.api import http_client_manager
 
 
 async def main(page: ft.Page) -> None:
@@ -48,6 +49,19 @@ async def main(page: ft.Page) -> None:
 
     app_state.theme.add_observer(on_theme_change)
 
+    # Cerrar el cliente HTTP compartido (y su pool de conexiones) al salir
+    async def on_window_event(e: ft.WindowEvent):
+        """Al cerrar la ventana libera el cliente HTTP y luego la cierra."""
+        if e.type == ft.WindowEventType.CLOSE:
+            logger.info("Cerrando aplicación: liberando cliente HTTP")
+            try:
+                await http_client_manager.aclose()
+            finally:
+                await page.window.destroy()
+
+    page.window.prevent_close = True
+    page.window.on_event = on_window_event
+
     # Crear la vista principal
     logger.info("Creando MainView")
     main_view = MainView()
@@ -23,7 +23,12 @@ from .contact_api import ContactAPIService
 from .company_rut_api import CompanyRutAPIService
 from .staff_api import StaffAPIService
 from .invoice_api import InvoiceAPIService
+from .search_api import SearchAPIService
+from .stats_api import StatsAPIService
+from .export_api import ExportAPIService
 from .config import APISettings, api_settings
+from .http_client import HTTPClientManager, http_client_manager
+from .response_cache import ResponseCache, response_cache
 
 
 # Aliases para compatibilidad con los nombres usados en las vistas
@@ -37,6 +42,9 @@ ContactAPI = ContactAPIService
 CompanyRutAPI = CompanyRutAPIService
 StaffAPI = StaffAPIService
 InvoiceAPI = InvoiceAPIService
+SearchAPI = SearchAPIService
+StatsAPI = StatsAPIService
+ExportAPI = ExportAPIService
 
 # Instancias singleton de servicios
 # Estas instancias pueden ser importadas y reutilizadas en toda la aplicación
@@ -50,6 +58,9 @@ contact_api = ContactAPIService()
 company_rut_api = CompanyRutAPIService()
 staff_api = StaffAPIService()
 invoice_api = InvoiceAPIService()
+search_api = SearchAPIService()
+stats_api = StatsAPIService()
+export_api = ExportAPIService()
 
 
 __all__ = [
@@ -72,6 +83,9 @@ __all__ = [
     "CompanyRutAPIService",
     "StaffAPIService",
     "InvoiceAPIService",
+    "SearchAPIService",
+    "StatsAPIService",
+    "ExportAPIService",
     # Aliases
     "CompanyAPI",
     "ProductAPI",
@@ -83,6 +97,9 @@ __all__ = [
     "CompanyRutAPI",
     "StaffAPI",
     "InvoiceAPI",
+    "SearchAPI",
+    "StatsAPI",
+    "ExportAPI",
     # Instancias singleton
     "company_api",
     "product_api",
@@ -94,7 +111,16 @@ __all__ = [
     "company_rut_api",
     "staff_api",
     "invoice_api",
+    "search_api",
+    "stats_api",
+    "export_api",
     # Configuración
     "APISettings",
     "api_settings",
+    # Cliente HTTP compartido
+    "HTTPClientManager",
+    "http_client_manager",
+    # Caché de respuestas GET
+    "ResponseCache",
+    "response_cache",
 ]
@@ -5,11 +5,18 @@ Este módulo proporciona un cliente HTTP asíncrono base con manejo de errores,
 logging, reintentos automáticos y excepciones personalizadas.
 """
 
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, ClassVar, Optional
 import httpx
 from loguru import logger
 import asyncio
 
+from .http_client import HTTPClientManager, http_client_manager
+from .response_cache import ResponseCache, response_cache
+
+# Header con el total de filas de los listados ordenados/filtrados
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
 
 # Excepciones personalizadas
 class APIException(Exception):
@@ -108,13 +115,24 @@ class BaseAPIClient:
 
     Proporciona métodos para realizar peticiones HTTP con manejo de errores,
     logging automático, reintentos y timeout configurable.
+
+    Todas las instancias usan el cliente HTTP compartido de
+    ``http_client_manager``, así que reutilizan las mismas conexiones, y la
+    caché de respuestas ``response_cache``: los GET se sirven desde la
+    caché (revalidando en segundo plano las vencidas) y cualquier otro
+    método la vacía.
     """
 
+    # Revalidaciones en curso por clave, compartidas por todas las instancias
+    _revalidations: ClassVar[dict[str, asyncio.Task]] = {}
+
     def __init__(
         self,
         base_url: str = "http://localhost:8000/api/v1",
         timeout: float = 30.0,
         max_retries: int = 3,
+        client_manager: Optional[HTTPClientManager] = None,
+        cache: Optional[ResponseCache] = None,
     ) -> None:
         """
         Inicializa el cliente API base.
@@ -123,6 +141,8 @@ class BaseAPIClient:
             base_url: URL base del backend
             timeout: Timeout en segundos para las peticiones (default: 30s)
             max_retries: Número máximo de reintentos para errores de red (default: 3)
+            client_manager: Pool HTTP a usar (default: el compartido de la aplicación)
+            cache: Caché de respuestas GET (default: la compartida de la aplicación)
 
         Example:
             >>> client = BaseAPIClient(base_url="http://localhost:8000/api/v1")
@@ -130,7 +150,8 @@ class BaseAPIClient:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client_manager = client_manager or http_client_manager
+        self._cache = cache or response_cache
 
         logger.info(
             "Cliente API inicializado | base_url={} timeout={}s max_retries={}",
@@ -141,32 +162,32 @@ class BaseAPIClient:
 
     async def _get_client(self) -> httpx.AsyncClient:
         """
-        Obtiene o crea el cliente HTTP asíncrono.
+        Obtiene el cliente HTTP compartido.
 
         Returns:
-            Cliente HTTP asíncrono configurado
+            Cliente HTTP asíncrono con pool de conexiones
 
         Example:
             >>> client = await self._get_client()
         """
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=httpx.Timeout(self.timeout),
-                headers={"Content-Type": "application/json"},
-            )
-        return self._client
+        return await self._client_manager.get_client()
+
+    def _url(self, endpoint: str) -> str:
+        """URL absoluta: el cliente compartido lo usan servicios con distinto base_url."""
+        path = endpoint if endpoint.startswith("/") else f"/{endpoint}"
+        return f"{self.base_url}{path}"
 
     async def close(self) -> None:
         """
-        Cierra el cliente HTTP y libera recursos.
+        Libera el cliente.
+
+        El pool es compartido por todos los servicios, así que no se cierra
+        aquí; se cierra una sola vez con ``http_client_manager.aclose()``.
 
         Example:
             >>> await client.close()
         """
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            logger.debug("Cliente HTTP cerrado")
+        logger.debug("Cliente API liberado | base_url={}", self.base_url)
 
     async def _handle_response(self, response: httpx.Response) -> Any:
         """
@@ -176,7 +197,7 @@ class BaseAPIClient:
             response: Respuesta HTTP del servidor
 
         Returns:
-            Datos JSON de la respuesta
+            Datos JSON de la respuesta (None si es 304 Not Modified)
 
         Raises:
             UnauthorizedException: Si el código de estado es 401
@@ -243,6 +264,10 @@ class BaseAPIClient:
                         details=error_details,
                     )
 
+            # 304 Not Modified: sin cuerpo, el cliente reutiliza su copia
+            if response.status_code == 304:
+                return None
+
             # Retornar datos JSON
             return response.json()
 
@@ -259,6 +284,7 @@ class BaseAPIClient:
         self,
         method: str,
         endpoint: str,
+        include_headers: bool = False,
         **kwargs: Any,
     ) -> Any:
         """
@@ -267,10 +293,12 @@ class BaseAPIClient:
         Args:
             method: Método HTTP (GET, POST, PUT, PATCH, DELETE)
             endpoint: Endpoint de la API (sin base_url)
+            include_headers: Retornar también los headers de la respuesta
             **kwargs: Argumentos adicionales para httpx.request
 
         Returns:
-            Datos JSON de la respuesta
+            Datos JSON de la respuesta, o tupla (datos, headers) si
+            include_headers es True
 
         Raises:
             NetworkException: Si se agotan los reintentos
@@ -280,7 +308,8 @@ class BaseAPIClient:
             >>> data = await self._request_with_retry("GET", "/companies")
         """
         client = await self._get_client()
-        url = f"{endpoint}" if endpoint.startswith("/") else f"/{endpoint}"
+        url = self._url(endpoint)
+        kwargs.setdefault("timeout", httpx.Timeout(self.timeout))
 
         last_exception: Optional[Exception] = None
 
@@ -295,7 +324,8 @@ class BaseAPIClient:
                 )
 
                 response = await client.request(method, url, **kwargs)
-                return await self._handle_response(response)
+                data = await self._handle_response(response)
+                return (data, response.headers) if include_headers else data
 
             except (
                 httpx.ConnectError,
@@ -346,10 +376,81 @@ class BaseAPIClient:
             )
         raise APIException("Error desconocido en petición HTTP")
 
+    async def _write(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        """
+        Petición que modifica datos: al terminar (bien o mal) vacía la caché.
+
+        Una escritura puede cambiar cualquier respuesta cacheada; vaciar al
+        final también descarta los GET que estaban en vuelo (ver
+        ResponseCache.generation).
+        """
+        try:
+            return await self._request_with_retry(method, endpoint, **kwargs)
+        finally:
+            self._cache.clear()
+
+    async def _fetch(self, endpoint: str, params: Optional[dict[str, Any]], with_total: bool) -> Any:
+        """GET al backend; con ``with_total`` retorna [datos, total]."""
+        if not with_total:
+            return await self._request_with_retry("GET", endpoint, params=params)
+        data, headers = await self._request_with_retry(
+            "GET", endpoint, include_headers=True, params=params
+        )
+        total = headers.get(TOTAL_COUNT_HEADER)
+        return [data, int(total) if total is not None else None]
+
+    async def _fetch_and_store(
+        self, key: str, endpoint: str, params: Optional[dict[str, Any]], with_total: bool
+    ) -> Any:
+        generation = self._cache.generation
+        data = await self._fetch(endpoint, params, with_total)
+        self._cache.put(key, data, generation=generation)
+        return data
+
+    def _revalidate(
+        self, key: str, endpoint: str, params: Optional[dict[str, Any]], with_total: bool
+    ) -> None:
+        """Renueva en segundo plano una respuesta vencida (una sola vez por clave)."""
+        running = self._revalidations.get(key)
+        if running is not None and not running.done():
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._fetch_and_store(key, endpoint, params, with_total)
+                logger.debug("Respuesta revalidada | endpoint={} params={}", endpoint, params)
+            except APIException as e:
+                logger.warning("No se pudo revalidar | endpoint={} error={}", endpoint, e)
+            finally:
+                self._revalidations.pop(key, None)
+
+        self._revalidations[key] = asyncio.get_running_loop().create_task(refresh())
+
+    async def _cached_get(
+        self, endpoint: str, params: Optional[dict[str, Any]], with_total: bool = False
+    ) -> Any:
+        """
+        GET servido desde la caché de respuestas.
+
+        Fresca: se retorna sin ir al backend. Vencida: se retorna y se
+        revalida en segundo plano. Ausente: se pide y se guarda.
+        """
+        key = self._cache.make_key("GET+total" if with_total else "GET", self._url(endpoint), params)
+        cached = self._cache.get(key)
+        if cached is None:
+            return await self._fetch_and_store(key, endpoint, params, with_total)
+
+        data, fresh = cached
+        logger.debug("Respuesta desde caché | endpoint={} fresca={}", endpoint, fresh)
+        if not fresh:
+            self._revalidate(key, endpoint, params, with_total)
+        return data
+
     async def get(
         self,
         endpoint: str,
         params: Optional[dict[str, Any]] = None,
+        use_cache: bool = True,
     ) -> Any:
         """
         Realiza una petición GET.
@@ -357,6 +458,7 @@ class BaseAPIClient:
         Args:
             endpoint: Endpoint de la API
             params: Parámetros de query string
+            use_cache: Servir desde la caché de respuestas (False = ir siempre al backend)
 
         Returns:
             Datos JSON de la respuesta
@@ -369,8 +471,74 @@ class BaseAPIClient:
             >>> companies = await client.get("/companies", params={"skip": 0, "limit": 10})
         """
         logger.info("GET request | endpoint={} params={}", endpoint, params)
+        if use_cache:
+            return await self._cached_get(endpoint, params)
         return await self._request_with_retry("GET", endpoint, params=params)
 
+    async def get_with_total(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        use_cache: bool = True,
+    ) -> tuple[Any, Optional[int]]:
+        """
+        Realiza una petición GET a un listado y lee el total de filas.
+
+        Los listados con ``sort``/``order``/``q`` informan el total de filas
+        que cumplen el filtro en el header ``X-Total-Count``.
+
+        Args:
+            endpoint: Endpoint de la API
+            params: Parámetros de query string
+            use_cache: Servir desde la caché de respuestas (False = ir siempre al backend)
+
+        Returns:
+            Tupla (datos JSON, total o None si el backend no lo informó)
+
+        Example:
+            >>> items, total = await client.get_with_total(
+            ...     "/companies/", params={"sort": "name", "order": "asc", "skip": 0, "limit": 25}
+            ... )
+        """
+        logger.info("GET request (con total) | endpoint={} params={}", endpoint, params)
+        if use_cache:
+            data, total = await self._cached_get(endpoint, params, with_total=True)
+        else:
+            data, total = await self._fetch(endpoint, params, with_total=True)
+        return data, total
+
+    async def get_if_changed(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        etag: Optional[str] = None,
+    ) -> tuple[Any, Optional[str]]:
+        """
+        Realiza una petición GET condicional (If-None-Match).
+
+        Si el backend responde 304 Not Modified los datos no se vuelven a
+        descargar y se retorna None: el llamador reutiliza su copia.
+
+        Args:
+            endpoint: Endpoint de la API
+            params: Parámetros de query string
+            etag: ETag de la copia que tiene el llamador (None = GET normal)
+
+        Returns:
+            Tupla (datos JSON o None si no cambió, ETag actual o None)
+
+        Example:
+            >>> data, etag = await client.get_if_changed("/lookups/countries/", etag=cached_etag)
+            >>> if data is None:
+            ...     data = cached_data
+        """
+        logger.info("GET request (condicional) | endpoint={} params={}", endpoint, params)
+        headers = {"If-None-Match": etag} if etag else None
+        data, response_headers = await self._request_with_retry(
+            "GET", endpoint, include_headers=True, params=params, headers=headers
+        )
+        return data, response_headers.get("ETag")
+
     async def post(
         self,
         endpoint: str,
@@ -395,7 +563,7 @@ class BaseAPIClient:
             >>> company = await client.post("/companies", json={"name": "AK Group"})
         """
         logger.info("POST request | endpoint={} json={}", endpoint, json)
-        return await self._request_with_retry("POST", endpoint, json=json)
+        return await self._write("POST", endpoint, json=json)
 
     async def put(
         self,
@@ -422,7 +590,7 @@ class BaseAPIClient:
             >>> company = await client.put("/companies/1", json={"name": "Updated Name"})
         """
         logger.info("PUT request | endpoint={} json={}", endpoint, json)
-        return await self._request_with_retry("PUT", endpoint, json=json)
+        return await self._write("PUT", endpoint, json=json)
 
     async def patch(
         self,
@@ -449,7 +617,7 @@ class BaseAPIClient:
             >>> company = await client.patch("/companies/1", json={"is_active": False})
         """
         logger.info("PATCH request | endpoint={} json={}", endpoint, json)
-        return await self._request_with_retry("PATCH", endpoint, json=json)
+        return await self._write("PATCH", endpoint, json=json)
 
     async def delete(
         self,
@@ -475,9 +643,66 @@ class BaseAPIClient:
             >>> success = await client.delete("/companies/1")
         """
         logger.info("DELETE request | endpoint={} params={}", endpoint, params)
-        await self._request_with_retry("DELETE", endpoint, params=params)
+        await self._write("DELETE", endpoint, params=params)
         return True
 
+    async def download(
+        self,
+        endpoint: str,
+        destination: Path,
+        params: Optional[dict[str, Any]] = None,
+    ) -> int:
+        """
+        Descarga un archivo transmitido por el backend directo a disco.
+
+        El cuerpo se escribe a medida que llega, sin cargarlo entero en
+        memoria. Se escribe en un ``.part`` que solo se renombra al destino
+        si la descarga termina bien. No se reintenta: una exportación
+        cortada se vuelve a pedir desde la vista.
+
+        Args:
+            endpoint: Endpoint de la API
+            destination: Ruta del archivo a escribir
+            params: Parámetros de query string
+
+        Returns:
+            Bytes escritos
+
+        Raises:
+            NetworkException: Error de red/conexión
+            APIException: Error de API (el backend respondió con error)
+
+        Example:
+            >>> size = await client.download("/export/quotes.xlsx", Path("cotizaciones.xlsx"))
+        """
+        client = await self._get_client()
+        url = self._url(endpoint)
+        partial = destination.with_name(destination.name + ".part")
+        logger.info("Descarga | endpoint={} params={} destino={}", endpoint, params, destination)
+
+        written = 0
+        try:
+            # Sin timeout de lectura: el backend puede tardar en generar el
+            # primer trozo de una exportación grande
+            async with client.stream(
+                "GET", url, params=params, timeout=httpx.Timeout(self.timeout, read=None)
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    await self._handle_response(response)
+                with partial.open("wb") as output:
+                    async for chunk in response.aiter_bytes():
+                        output.write(chunk)
+                        written += len(chunk)
+            partial.replace(destination)
+        except (httpx.ConnectError, httpx.TimeoutException, httpx.NetworkError) as e:
+            raise NetworkException(f"Error de red durante la descarga: {str(e)}")
+        finally:
+            partial.unlink(missing_ok=True)
+
+        logger.success("Descarga completa | destino={} bytes={}", destination, written)
+        return written
+
     async def __aenter__(self) -> "BaseAPIClient":
         """Context manager entry."""
         await self._get_client()
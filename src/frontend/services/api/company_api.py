@@ -97,6 +97,53 @@ class CompanyAPIService:
             logger.error("Error al obtener empresas | error={}", str(e))
             raise
 
+    async def get_list(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        sort: str | None = None,
+        order: str | None = None,
+        q: str | None = None,
+        **filters: Any,
+    ) -> dict[str, Any]:
+        """
+        Obtiene solo una página de empresas, ordenada y filtrada en el backend.
+
+        Usado por las tablas con origen de datos remoto: el total viene del
+        header X-Total-Count, no del largo de la página.
+
+        Args:
+            page: Número de página (1-indexed)
+            page_size: Tamaño de página
+            sort: Columna de orden (None = orden por defecto del backend)
+            order: "asc" o "desc" (None = dirección por defecto del backend)
+            q: Texto a buscar
+            **filters: Filtros de igualdad (company_type_id, is_active, country_id)
+
+        Returns:
+            Diccionario con 'items' (página de empresas) y 'total' (filas que cumplen el filtro)
+
+        Raises:
+            NetworkException: Error de red/conexión
+            APIException: Error de API (400 si la columna de orden no está permitida)
+
+        Example:
+            >>> result = await service.get_list(page=2, page_size=25, sort="name", order="desc")
+        """
+        params = {"skip": (page - 1) * page_size, "limit": page_size, "with_total": True}
+        if sort:
+            params["sort"] = sort
+        if order:
+            params["order"] = order
+        if q:
+            params["q"] = q
+        params.update({k: v for k, v in filters.items() if v is not None})
+
+        logger.info("Obteniendo página de empresas | params={}", params)
+        items, total = await self._client.get_with_total("/companies/", params=params)
+        items = items if isinstance(items, list) else []
+        return {"items": items, "total": total if total is not None else len(items)}
+
     async def get_by_id(self, company_id: int) -> dict[str, Any]:
         """
         Obtiene una empresa por su ID.
@@ -134,6 +181,38 @@ class CompanyAPIService:
             )
             raise
 
+    async def get_bundle(
+        self,
+        company_id: int,
+        include: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Obtiene una empresa con las secciones de su pantalla de detalle.
+
+        Una sola petición en lugar de una por sección. Las secciones no
+        pedidas vienen en None.
+
+        Args:
+            company_id: ID de la empresa
+            include: Secciones (addresses, contacts, ruts, plants, notes).
+                None = todas
+
+        Returns:
+            Diccionario con ``company`` y una lista por sección
+
+        Raises:
+            NotFoundException: Si la empresa no existe
+            NetworkException: Error de red/conexión
+            APIException: Error de API
+
+        Example:
+            >>> bundle = await service.get_bundle(1, include=["addresses", "plants"])
+            >>> print(bundle["company"]["name"], len(bundle["plants"]))
+        """
+        logger.info("Obteniendo bundle de empresa | company_id={} include={}", company_id, include)
+        params = {"include": ",".join(include)} if include is not None else None
+        return await self._client.get(f"/companies/{company_id}/bundle", params=params)
+
     async def search(
         self,
         query: str,
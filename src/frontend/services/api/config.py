@@ -5,6 +5,8 @@ Este módulo centraliza la configuración de los servicios API
 para facilitar cambios de entorno (desarrollo, producción, etc.).
 """
 
+from pathlib import Path
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,6 +19,16 @@ class APISettings(BaseSettings):
         api_timeout: Timeout en segundos para peticiones HTTP
         api_max_retries: Número máximo de reintentos para errores de red
         api_version: Versión de la API
+        api_max_connections: Conexiones simultáneas máximas del pool HTTP
+        api_max_keepalive_connections: Conexiones ociosas que se mantienen abiertas
+        api_keepalive_expiry: Segundos que una conexión ociosa se mantiene abierta
+        api_http2: Usar HTTP/2 (requiere el paquete ``h2`` y un servidor HTTP/2)
+        api_cache_enabled: Cachear las respuestas GET (ver response_cache)
+        api_cache_ttl: Segundos en que una respuesta se sirve sin revalidar
+        api_cache_max_age: Segundos tras los que una respuesta cacheada se descarta
+        api_cache_max_entries: Respuestas máximas en memoria
+        api_cache_persist: Guardar también la caché en ``api_cache_path``
+        api_cache_path: Archivo SQLite de la caché en el perfil del usuario
     """
 
     model_config = SettingsConfigDict(
@@ -30,6 +42,16 @@ class APISettings(BaseSettings):
     api_timeout: float = 30.0
     api_max_retries: int = 3
     api_version: str = "v1"
+    api_max_connections: int = 20
+    api_max_keepalive_connections: int = 10
+    api_keepalive_expiry: float = 30.0
+    api_http2: bool = False
+    api_cache_enabled: bool = True
+    api_cache_ttl: float = 30.0
+    api_cache_max_age: float = 86400.0
+    api_cache_max_entries: int = 256
+    api_cache_persist: bool = False
+    api_cache_path: str = str(Path.home() / ".akgroup" / "api_cache.sqlite3")
 
     @property
     def full_api_url(self) -> str:
@@ -0,0 +1,66 @@
+"""
+API Service for list exports.
+
+Downloads the CSV/xlsx exports of the list views straight to disk.
+"""
+from pathlib import Path
+from typing import Any
+from loguru import logger
+from src.frontend.services.api.base_api_client import BaseAPIClient
+
+# Exportable lists (same names as the /export/{entity} endpoints)
+EXPORT_ENTITIES = ("products", "quotes", "orders", "invoices-sii", "invoices-export")
+EXPORT_FORMATS = ("csv", "xlsx")
+
+
+class ExportAPIService:
+    """
+    Service for interacting with the Export API.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000/api/v1",
+        timeout: float = 30.0,
+    ):
+        self._client = BaseAPIClient(base_url=base_url, timeout=timeout)
+        logger.debug("ExportAPIService initialized | base_url={}", base_url)
+
+    async def download(
+        self,
+        entity: str,
+        file_format: str,
+        destination: Path,
+        sort: str | None = None,
+        order: str | None = None,
+        q: str | None = None,
+        **filters: Any,
+    ) -> int:
+        """
+        Export a whole list (same sort, search and filters as the table) to a file.
+
+        The file is written as it streams in; it is never held in memory.
+
+        Args:
+            entity: List to export (see EXPORT_ENTITIES)
+            file_format: "csv" or "xlsx"
+            destination: File to write
+            sort: Sort column (None = backend default order)
+            order: "asc" or "desc"
+            q: Text to search
+            **filters: Equality filters of the list (None values are skipped)
+
+        Returns:
+            Bytes written
+        """
+        params: dict[str, Any] = {}
+        if sort:
+            params["sort"] = sort
+        if order:
+            params["order"] = order
+        if q:
+            params["q"] = q
+        params.update({k: v for k, v in filters.items() if v is not None})
+
+        logger.info(f"Exporting {entity} as {file_format} | params={params}")
+        return await self._client.download(f"/export/{entity}.{file_format}", destination, params=params)
@@ -0,0 +1,175 @@
+"""
+Cliente HTTP compartido por todo el frontend.
+
+Crear un ``httpx.AsyncClient`` por petición (o por servicio) obliga a abrir
+una conexión TCP nueva cada vez. Este módulo mantiene un único cliente con
+pool de conexiones keep-alive que usan todos los servicios API y las vistas,
+de modo que las peticiones de una pantalla reutilizan las mismas conexiones.
+
+HTTP/2 es opcional (``API_API_HTTP2=true``): requiere el paquete ``h2``
+(``httpx[http2]``) y un servidor que lo hable; uvicorn solo sirve HTTP/1.1,
+así que solo aplica detrás de un proxy HTTP/2. Si ``h2`` no está instalado
+se usa HTTP/1.1.
+
+Toda respuesta a una petición que no sea GET/HEAD vacía la caché de
+respuestas (``response_cache``), también la de las vistas y formularios que
+escriben con ``borrow()`` sin pasar por los servicios API.
+"""
+
+import asyncio
+import importlib.util
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+from loguru import logger
+
+from .config import APISettings, api_settings
+from .response_cache import ResponseCache, response_cache
+
+# Métodos que no modifican datos: no invalidan la caché de respuestas
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class HTTPClientManager:
+    """
+    Administra el cliente HTTP compartido y su pool de conexiones.
+
+    El cliente se crea al primer uso y se asocia al event loop en que se
+    creó: si el loop cambia (por ejemplo, entre tests), se crea otro.
+
+    Example:
+        >>> client = await http_client_manager.get_client()
+        >>> response = await client.get("/api/v1/companies/")
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 30.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        """
+        Inicializa el administrador (no abre conexiones).
+
+        Args:
+            base_url: URL del backend para rutas relativas (ej: http://localhost:8000)
+            timeout: Timeout por defecto en segundos
+            max_connections: Conexiones simultáneas máximas
+            max_keepalive_connections: Conexiones ociosas que se mantienen abiertas
+            keepalive_expiry: Segundos que una conexión ociosa se mantiene abierta
+            http2: Usar HTTP/2 si el paquete ``h2`` está instalado
+            transport: Transporte alternativo (tests)
+            cache: Caché de respuestas a vaciar tras cada escritura (None = ninguna)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and self._h2_available()
+        self._transport = transport
+        self._cache = cache
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def from_settings(
+        cls, settings: APISettings, cache: ResponseCache | None = None
+    ) -> "HTTPClientManager":
+        """
+        Crea el administrador desde la configuración de la API.
+
+        Args:
+            settings: Configuración de servicios API
+            cache: Caché de respuestas a vaciar tras cada escritura
+
+        Returns:
+            HTTPClientManager configurado
+        """
+        return cls(
+            base_url=settings.backend_base_url,
+            timeout=settings.api_timeout,
+            max_connections=settings.api_max_connections,
+            max_keepalive_connections=settings.api_max_keepalive_connections,
+            keepalive_expiry=settings.api_keepalive_expiry,
+            http2=settings.api_http2,
+            cache=cache,
+        )
+
+    @staticmethod
+    def _h2_available() -> bool:
+        """Indica si el paquete ``h2`` está instalado."""
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 solicitado pero el paquete 'h2' no está instalado, se usa HTTP/1.1")
+            return False
+        return True
+
+    async def get_client(self) -> httpx.AsyncClient:
+        """
+        Obtiene el cliente compartido, creándolo si hace falta.
+
+        Returns:
+            Cliente HTTP asíncrono con pool de conexiones
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            # Las conexiones de otro loop no se pueden reutilizar ni cerrar desde este
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout),
+                limits=self.limits,
+                http2=self.http2,
+                follow_redirects=True,
+                transport=self._transport,
+                event_hooks={"response": [self._invalidate_cache]} if self._cache is not None else None,
+            )
+            self._loop = loop
+            logger.debug(
+                "Cliente HTTP compartido creado | base_url={} http2={} max_connections={}",
+                self.base_url,
+                self.http2,
+                self.limits.max_connections,
+            )
+        return self._client
+
+    async def _invalidate_cache(self, response: httpx.Response) -> None:
+        """Hook de respuesta: una escritura puede cambiar cualquier respuesta cacheada."""
+        if response.request.method not in SAFE_METHODS:
+            self._cache.clear()
+
+    @asynccontextmanager
+    async def borrow(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Presta el cliente compartido dentro de un ``async with``.
+
+        A diferencia de ``async with httpx.AsyncClient()``, al salir del
+        bloque el cliente NO se cierra: sus conexiones vuelven al pool.
+
+        Example:
+            >>> async with http_client_manager.borrow() as client:
+            ...     response = await client.get("/api/v1/plants/company/1")
+        """
+        yield await self.get_client()
+
+    async def aclose(self) -> None:
+        """Cierra el cliente compartido y sus conexiones (al salir de la aplicación)."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.debug("Cliente HTTP compartido cerrado")
+        self._client = None
+        self._loop = None
+
+
+# Instancia global: todos los servicios API y vistas comparten este pool
+http_client_manager = HTTPClientManager.from_settings(api_settings, cache=response_cache)
+
+
+__all__ = ["HTTPClientManager", "http_client_manager"]
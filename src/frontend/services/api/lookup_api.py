@@ -3,13 +3,22 @@ Servicio API para gestión de Lookups (datos de referencia).
 
 Este módulo proporciona métodos para obtener datos de referencia del sistema
 como tipos de empresa, países, unidades de medida, etc.
+
+Las respuestas se guardan en una caché compartida por todas las instancias
+junto con su ETag. Cada lectura revalida con If-None-Match: si el backend
+responde 304 se reutiliza la copia en memoria sin volver a descargarla.
 """
 
+import copy
 from typing import Any
 from loguru import logger
 
 from .base_api_client import BaseAPIClient
 
+# (endpoint, params) -> (ETag, datos). A nivel de módulo porque las vistas
+# crean instancias nuevas de LookupAPIService en cada diálogo.
+_lookup_cache: dict[tuple[str, tuple], tuple[str, Any]] = {}
+
 
 class LookupAPIService:
     """
@@ -37,6 +46,72 @@ class LookupAPIService:
         self._client = BaseAPIClient(base_url=base_url, timeout=timeout)
         logger.debug("LookupAPIService inicializado | base_url={}", base_url)
 
+    async def _get_cached(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """
+        GET con caché revalidada por ETag.
+
+        Args:
+            endpoint: Endpoint del lookup
+            params: Parámetros de query string
+
+        Returns:
+            Datos JSON (copia; la caché no se modifica desde las vistas)
+        """
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        etag, cached = _lookup_cache.get(key, (None, None))
+
+        data, new_etag = await self._client.get_if_changed(endpoint, params=params, etag=etag)
+        if data is None and cached is not None:
+            logger.debug("Lookup sin cambios (304) | endpoint={}", endpoint)
+            data = cached
+        elif new_etag:
+            _lookup_cache[key] = (new_etag, data)
+        return copy.deepcopy(data)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Descarta la caché de lookups (p. ej. tras editar un lookup).
+
+        Example:
+            >>> LookupAPIService.clear_cache()
+        """
+        _lookup_cache.clear()
+
+    async def get_snapshot(self) -> dict[str, Any]:
+        """
+        Obtiene todos los lookups en una sola petición.
+
+        Returns:
+            Diccionario con ``version`` y una lista por lookup: countries,
+            cities, company_types, incoterms, currencies, units,
+            family_types, matters, sales_types, quote_statuses,
+            order_statuses, payment_statuses
+
+        Raises:
+            NetworkException: Error de red/conexión
+            APIException: Error de API
+
+        Example:
+            >>> snapshot = await service.get_snapshot()
+            >>> currencies = snapshot["currencies"]
+        """
+        logger.info("Obteniendo snapshot de lookups")
+
+        try:
+            snapshot = await self._get_cached("/lookups/snapshot")
+
+            logger.success("Snapshot de lookups obtenido | version={}", snapshot["version"])
+            return snapshot
+
+        except Exception as e:
+            logger.error("Error al obtener snapshot de lookups | error={}", str(e))
+            raise
+
     async def get_company_types(self) -> list[dict[str, Any]]:
         """
         Obtiene todos los tipos de empresa disponibles.
@@ -60,7 +135,7 @@ class LookupAPIService:
         logger.info("Obteniendo tipos de empresa")
 
         try:
-            company_types = await self._client.get("/lookups/company-types/")
+            company_types = await self._get_cached("/lookups/company-types/")
 
             logger.success("Tipos de empresa obtenidos | total={}", len(company_types))
             return company_types
@@ -92,7 +167,7 @@ class LookupAPIService:
         logger.info("Obteniendo países")
 
         try:
-            countries = await self._client.get("/lookups/countries/")
+            countries = await self._get_cached("/lookups/countries/")
 
             logger.success("Países obtenidos | total={}", len(countries))
             return countries
@@ -101,9 +176,12 @@ class LookupAPIService:
             logger.error("Error al obtener países | error={}", str(e))
             raise
 
-    async def get_cities(self) -> list[dict[str, Any]]:
+    async def get_cities(self, country_id: int | None = None) -> list[dict[str, Any]]:
         """
-        Obtiene todas las ciudades disponibles.
+        Obtiene las ciudades disponibles.
+
+        Args:
+            country_id: Solo las ciudades de este país (opcional)
 
         Returns:
             Lista de ciudades con estructura:
@@ -123,7 +201,8 @@ class LookupAPIService:
         logger.info("Obteniendo ciudades")
 
         try:
-            cities = await self._client.get("/lookups/cities/")
+            params = {"country_id": country_id} if country_id is not None else None
+            cities = await self._get_cached("/lookups/cities/", params=params)
 
             logger.success("Ciudades obtenidas | total={}", len(cities))
             return cities
@@ -155,7 +234,7 @@ class LookupAPIService:
         logger.info("Obteniendo unidades de medida")
 
         try:
-            units = await self._client.get("/lookups/units/")
+            units = await self._get_cached("/lookups/units/")
 
             logger.success("Unidades obtenidas | total={}", len(units))
             return units
@@ -183,7 +262,7 @@ class LookupAPIService:
         logger.info("Obteniendo tipos de familia")
 
         try:
-            family_types = await self._client.get("/lookups/family-types/")
+            family_types = await self._get_cached("/lookups/family-types/")
 
             logger.success("Tipos de familia obtenidos | total={}", len(family_types))
             return family_types
@@ -211,7 +290,7 @@ class LookupAPIService:
         logger.info("Obteniendo materiales")
 
         try:
-            matters = await self._client.get("/lookups/matters/")
+            matters = await self._get_cached("/lookups/matters/")
 
             logger.success("Materiales obtenidos | total={}", len(matters))
             return matters
@@ -233,7 +312,7 @@ class LookupAPIService:
         """
         logger.info("Obteniendo tipos de venta")
         try:
-            sales_types = await self._client.get("/lookups/sales-types/")
+            sales_types = await self._get_cached("/lookups/sales-types/")
             logger.success("Tipos de venta obtenidos | total={}", len(sales_types))
             return sales_types
         except Exception as e:
@@ -274,7 +353,7 @@ class LookupAPIService:
         """Obtiene estados de cotización."""
         logger.info("Obteniendo estados de cotización")
         try:
-            statuses = await self._client.get("/lookups/quote-statuses/")
+            statuses = await self._get_cached("/lookups/quote-statuses/")
             logger.success("Estados de cotización obtenidos | total={}", len(statuses))
             return statuses
         except Exception as e:
@@ -285,7 +364,7 @@ class LookupAPIService:
         """Obtiene Incoterms."""
         logger.info("Obteniendo Incoterms")
         try:
-            incoterms = await self._client.get("/lookups/incoterms/")
+            incoterms = await self._get_cached("/lookups/incoterms/")
             logger.success("Incoterms obtenidos | total={}", len(incoterms))
             return incoterms
         except Exception as e:
@@ -296,7 +375,7 @@ class LookupAPIService:
         """Obtiene monedas."""
         logger.info("Obteniendo monedas")
         try:
-            currencies = await self._client.get("/lookups/currencies/")
+            currencies = await self._get_cached("/lookups/currencies/")
             logger.success("Monedas obtenidas | total={}", len(currencies))
             return currencies
         except Exception as e:
@@ -25,6 +25,46 @@ class OrderAPIService:
         items = await self._client.get("/orders/", params=params)
         return {"items": items, "total": len(items)} # Total estimation same as quotes
 
+    async def get_list(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        sort: str | None = None,
+        order: str | None = None,
+        q: str | None = None,
+        **filters: Any,
+    ) -> dict[str, Any]:
+        """
+        Get one page of orders, sorted and filtered by the backend.
+
+        Used by remote data-source tables: the total comes from the
+        X-Total-Count header instead of the page length.
+
+        Args:
+            page: Page number (1-based)
+            page_size: Number of items per page
+            sort: Sort column (None = backend default order)
+            order: "asc" or "desc" (None = backend default direction)
+            q: Text to search
+            **filters: Equality filters (company_id, status_id)
+
+        Returns:
+            Dictionary with items (the page) and total (rows matching the filter)
+        """
+        params = {"skip": (page - 1) * page_size, "limit": page_size, "with_total": True}
+        if sort:
+            params["sort"] = sort
+        if order:
+            params["order"] = order
+        if q:
+            params["q"] = q
+        params.update({k: v for k, v in filters.items() if v is not None})
+
+        logger.info(f"Getting orders page | params={params}")
+        items, total = await self._client.get_with_total("/orders/", params=params)
+        items = items if isinstance(items, list) else []
+        return {"items": items, "total": total if total is not None else len(items)}
+
     async def get_by_company(
         self, 
         company_id: int, 
@@ -73,5 +113,19 @@ class OrderAPIService:
             
         return await self._client.post(url)
 
+    async def apply_products_batch(
+        self,
+        order_id: int,
+        user_id: int,
+        create: Optional[List[Dict[str, Any]]] = None,
+        update: Optional[List[Dict[str, Any]]] = None,
+        delete: Optional[List[int]] = None,
+    ) -> Dict[str, Any]:
+        """Create, update and delete order lines in one request."""
+        return await self._client.post(
+            f"/orders/{order_id}/products:batch?user_id={user_id}",
+            json={"create": create or [], "update": update or [], "delete": delete or []},
+        )
+
     async def close(self):
         await self._client.close()
@@ -104,6 +104,53 @@ class ProductAPIService:
             logger.error("Error al obtener productos | error={}", str(e))
             raise
 
+    async def get_list(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        sort: str | None = None,
+        order: str | None = None,
+        q: str | None = None,
+        **filters: Any,
+    ) -> dict[str, Any]:
+        """
+        Obtiene solo una página de productos, ordenada y filtrada en el backend.
+
+        Usado por las tablas con origen de datos remoto: el total viene del
+        header X-Total-Count, no del largo de la página.
+
+        Args:
+            page: Número de página (1-indexed)
+            page_size: Tamaño de página
+            sort: Columna de orden (None = orden por defecto del backend)
+            order: "asc" o "desc" (None = dirección por defecto del backend)
+            q: Texto a buscar
+            **filters: Filtros de igualdad (is_active, product_type)
+
+        Returns:
+            Diccionario con 'items' (página de productos) y 'total' (filas que cumplen el filtro)
+
+        Raises:
+            NetworkException: Error de red/conexión
+            APIException: Error de API (400 si la columna de orden no está permitida)
+
+        Example:
+            >>> result = await service.get_list(page=2, page_size=25, sort="reference", order="desc")
+        """
+        params = {"skip": (page - 1) * page_size, "limit": page_size, "with_total": True}
+        if sort:
+            params["sort"] = sort
+        if order:
+            params["order"] = order
+        if q:
+            params["q"] = q
+        params.update({k: v for k, v in filters.items() if v is not None})
+
+        logger.info("Obteniendo página de productos | params={}", params)
+        items, total = await self._client.get_with_total("/products/", params=params)
+        items = items if isinstance(items, list) else []
+        return {"items": items, "total": total if total is not None else len(items)}
+
     async def get_by_id(self, product_id: int) -> dict[str, Any]:
         """
         Obtiene un producto por su ID.
@@ -1,7 +1,7 @@
 """
 API Service for Quotes.
 """
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from loguru import logger
 from src.frontend.services.api.base_api_client import BaseAPIClient
 
@@ -69,6 +69,46 @@ class QuoteAPIService:
             logger.error(f"Error getting all quotes: {e}")
             return {"items": [], "total": 0}
 
+    async def get_list(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        sort: str | None = None,
+        order: str | None = None,
+        q: str | None = None,
+        **filters: Any,
+    ) -> dict[str, Any]:
+        """
+        Get one page of quotes, sorted and filtered by the backend.
+
+        Used by remote data-source tables: the total comes from the
+        X-Total-Count header instead of the page length.
+
+        Args:
+            page: Page number (1-based)
+            page_size: Number of items per page
+            sort: Sort column (None = backend default order)
+            order: "asc" or "desc" (None = backend default direction)
+            q: Text to search
+            **filters: Equality filters (company_id, status_id)
+
+        Returns:
+            Dictionary with items (the page) and total (rows matching the filter)
+        """
+        params = {"skip": (page - 1) * page_size, "limit": page_size, "with_total": True}
+        if sort:
+            params["sort"] = sort
+        if order:
+            params["order"] = order
+        if q:
+            params["q"] = q
+        params.update({k: v for k, v in filters.items() if v is not None})
+
+        logger.info(f"Getting quotes page | params={params}")
+        items, total = await self._client.get_with_total("/quotes/", params=params)
+        items = items if isinstance(items, list) else []
+        return {"items": items, "total": total if total is not None else len(items)}
+
     async def search(
         self,
         query: str,
@@ -220,5 +260,33 @@ class QuoteAPIService:
         logger.info(f"Removing quote product {product_id}")
         await self._client.delete(f"/quotes/products/{product_id}")
 
+    async def apply_products_batch(
+        self,
+        quote_id: int,
+        create: Optional[List[Dict[str, Any]]] = None,
+        update: Optional[List[Dict[str, Any]]] = None,
+        delete: Optional[List[int]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create, update and delete quote lines in one request.
+
+        The whole batch is applied atomically and totals are recalculated
+        once. Lines created without ``sequence`` are numbered by the server.
+
+        Args:
+            quote_id: ID of the quote
+            create: New lines (product_id, quantity, unit_price, ...)
+            update: Changes to existing lines, each with its ``id``
+            delete: IDs of quote products to remove
+
+        Returns:
+            Updated quote with products and totals
+        """
+        logger.info(f"Applying product batch to quote {quote_id}")
+        return await self._client.post(
+            f"/quotes/{quote_id}/products:batch",
+            json={"create": create or [], "update": update or [], "delete": delete or []},
+        )
+
     async def close(self):
         await self._client.close()
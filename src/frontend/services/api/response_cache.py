@@ -0,0 +1,253 @@
+"""
+Caché de respuestas GET del backend para el cliente de escritorio.
+
+Cada navegación reconstruye la vista y vuelve a pedir sus datos. Esta caché
+guarda las respuestas GET por URL + parámetros para que ir y volver entre
+pantallas (o reabrir el detalle de una empresa o producto) no espere a la
+red:
+
+- fresca (menos de ``ttl`` segundos): se sirve sin tocar el backend;
+- vencida (hasta ``max_age``): se sirve al instante y se revalida en
+  segundo plano (stale-while-revalidate); la siguiente lectura ya ve la
+  respuesta nueva;
+- más vieja, o ausente: se pide al backend y se guarda.
+
+Las entradas viven en un LRU en memoria y, opcionalmente, en un archivo
+SQLite del perfil del usuario, de modo que la primera pantalla tras
+reiniciar la aplicación también se pinta al instante (con revalidación).
+
+Cualquier POST/PUT/PATCH/DELETE del propio cliente (los servicios API o
+``http_client_manager.borrow()`` en vistas y formularios) vacía la caché
+entera: las respuestas de un recurso embeben datos de otros (el nombre de
+la empresa en las cotizaciones, por ejemplo), así que invalidar por
+prefijo dejaría copias desactualizadas.
+"""
+
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .config import APISettings, api_settings
+
+
+@dataclass
+class CacheEntry:
+    """Respuesta guardada: JSON serializado y momento en que se obtuvo."""
+
+    payload: str
+    stored_at: float
+
+    def age(self) -> float:
+        """Segundos desde que se obtuvo la respuesta."""
+        return time.time() - self.stored_at
+
+
+class ResponseCache:
+    """
+    LRU en memoria con respaldo opcional en SQLite.
+
+    Las respuestas se guardan serializadas: cada lectura entrega una copia
+    nueva, así que las vistas pueden modificarla sin afectar la caché.
+
+    Attributes:
+        ttl: Segundos en que una respuesta se sirve sin revalidar
+        max_age: Segundos tras los que una respuesta se descarta
+        max_entries: Entradas máximas en memoria
+        path: Archivo SQLite (None = solo memoria)
+        hits: Lecturas servidas frescas desde la caché
+        stale_hits: Lecturas servidas vencidas (con revalidación)
+        misses: Lecturas que fueron al backend
+        generation: Se incrementa en cada clear(); put() con una generación
+            anterior no guarda (la respuesta se pidió antes de una escritura)
+
+    Example:
+        >>> cache = ResponseCache(ttl=30, path=Path.home() / ".akgroup" / "api_cache.sqlite3")
+        >>> cache.put("GET http://backend/api/v1/companies/1", {"id": 1})
+        >>> cache.get("GET http://backend/api/v1/companies/1")
+        ({'id': 1}, True)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        max_age: float = 86400.0,
+        max_entries: int = 256,
+        path: Path | None = None,
+        enabled: bool = True,
+    ) -> None:
+        """
+        Inicializa la caché (la tabla SQLite se crea al primer uso).
+
+        Args:
+            ttl: Segundos en que una respuesta se sirve sin revalidar
+            max_age: Segundos tras los que una respuesta se descarta
+            max_entries: Entradas máximas en memoria
+            path: Archivo SQLite para persistir entre sesiones (None = solo memoria)
+            enabled: Si es False, get() nunca encuentra nada y put() no guarda
+        """
+        self.ttl = ttl
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.path = path
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self.enabled = enabled
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._memory: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._db_ready = False
+
+    @classmethod
+    def from_settings(cls, settings: APISettings) -> "ResponseCache":
+        """
+        Crea la caché desde la configuración de la API.
+
+        Args:
+            settings: Configuración de servicios API
+
+        Returns:
+            ResponseCache configurada
+        """
+        return cls(
+            ttl=settings.api_cache_ttl,
+            max_age=settings.api_cache_max_age,
+            max_entries=settings.api_cache_max_entries,
+            path=Path(settings.api_cache_path).expanduser() if settings.api_cache_persist else None,
+            enabled=settings.api_cache_enabled,
+        )
+
+    @staticmethod
+    def make_key(method: str, url: str, params: dict[str, Any] | None = None) -> str:
+        """
+        Clave de una petición: método, URL absoluta y parámetros ordenados.
+
+        Los parámetros en None se omiten, igual que al enviarlos con httpx.
+
+        Args:
+            method: Método HTTP (con sufijo si la misma URL se cachea de dos formas)
+            url: URL absoluta
+            params: Parámetros de query string
+        """
+        query = sorted((k, str(v)) for k, v in (params or {}).items() if v is not None)
+        return f"{method} {url}?{json.dumps(query, ensure_ascii=False)}"
+
+    def get(self, key: str) -> tuple[Any, bool] | None:
+        """
+        Busca una respuesta.
+
+        Args:
+            key: Clave (ver make_key)
+
+        Returns:
+            Tupla (datos, fresca) o None si no hay una entrada utilizable
+        """
+        entry = self._lookup(key) if self.enabled else None
+        if entry is None:
+            self.misses += 1
+            return None
+
+        fresh = entry.age() < self.ttl
+        if fresh:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return json.loads(entry.payload), fresh
+
+    def put(self, key: str, data: Any, generation: int | None = None) -> None:
+        """
+        Guarda una respuesta.
+
+        Args:
+            key: Clave (ver make_key)
+            data: Datos JSON de la respuesta
+            generation: Generación leída al hacer la petición (None = guardar siempre)
+        """
+        if not self.enabled or (generation is not None and generation != self.generation):
+            return
+        entry = CacheEntry(json.dumps(data, ensure_ascii=False), time.time())
+        self._remember(key, entry)
+        if self.path is not None:
+            self._execute(
+                "INSERT OR REPLACE INTO responses (key, payload, stored_at) VALUES (?, ?, ?)",
+                (key, entry.payload, entry.stored_at),
+            )
+
+    def clear(self) -> None:
+        """Descarta todas las respuestas (memoria y archivo)."""
+        self.generation += 1
+        self._memory.clear()
+        if self.path is not None and self.path.exists():
+            self._execute("DELETE FROM responses")
+        logger.debug("Caché de respuestas vaciada")
+
+    def stats(self) -> dict[str, int]:
+        """
+        Contadores de uso.
+
+        Returns:
+            Diccionario con hits, stale_hits, misses y entries (en memoria)
+        """
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "entries": len(self._memory),
+        }
+
+    def _lookup(self, key: str) -> CacheEntry | None:
+        """Entrada no expirada de la clave: primero en memoria, luego en disco."""
+        entry = self._memory.get(key)
+        if entry is None and self.path is not None and self.path.exists():
+            row = self._execute("SELECT payload, stored_at FROM responses WHERE key = ?", (key,))
+            if row is not None:
+                entry = CacheEntry(*row)
+                self._remember(key, entry)
+
+        if entry is None:
+            return None
+        if entry.age() >= self.max_age:
+            self._memory.pop(key, None)
+            return None
+        self._memory.move_to_end(key)
+        return entry
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _execute(self, sql: str, params: tuple = ()) -> tuple | None:
+        """Ejecuta una sentencia en el archivo de caché y retorna la primera fila."""
+        db = sqlite3.connect(self.path)
+        try:
+            with db:
+                if not self._db_ready:
+                    self._create_table(db)
+                return db.execute(sql, params).fetchone()
+        finally:
+            db.close()
+
+    def _create_table(self, db: sqlite3.Connection) -> None:
+        """Crea la tabla la primera vez y descarta las respuestas expiradas."""
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, payload TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        db.execute("DELETE FROM responses WHERE stored_at < ?", (time.time() - self.max_age,))
+        self._db_ready = True
+
+
+# Instancia global: la comparten todos los servicios API, como el pool HTTP
+response_cache = ResponseCache.from_settings(api_settings)
+
+
+__all__ = ["CacheEntry", "ResponseCache", "response_cache"]
@@ -0,0 +1,50 @@
+"""
+API Service for full-text search.
+
+Provides the unified search across companies, products, contacts,
+staff, notes and quotes.
+"""
+from typing import Any
+from loguru import logger
+from src.frontend.services.api.base_api_client import BaseAPIClient
+
+
+class SearchAPIService:
+    """
+    Service for interacting with the Search API.
+
+    Results come ranked by relevance; every word of the query is matched
+    as a prefix, so it is suitable for search-as-you-type boxes.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000/api/v1",
+        timeout: float = 30.0,
+    ):
+        self._client = BaseAPIClient(base_url=base_url, timeout=timeout)
+        logger.debug("SearchAPIService initialized | base_url={}", base_url)
+
+    async def search(
+        self,
+        query: str,
+        types: list[str] | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """
+        Search all indexed entities.
+
+        Args:
+            query: Text to search
+            types: Restrict to these entity types
+                (company, product, contact, staff, note, quote)
+            limit: Maximum number of hits
+
+        Returns:
+            List of hits (entity_type, entity_id, title, snippet, score)
+        """
+        logger.info(f"Searching | query={query!r} types={types} limit={limit}")
+        params: dict[str, Any] = {"q": query, "limit": limit}
+        if types:
+            params["types"] = types
+        return await self._client.get("/search/", params=params)
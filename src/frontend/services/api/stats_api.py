@@ -0,0 +1,38 @@
+"""
+API Service for aggregated statistics.
+
+Provides the dashboard KPIs in a single request.
+"""
+from typing import Any
+from loguru import logger
+from src.frontend.services.api.base_api_client import BaseAPIClient
+
+
+class StatsAPIService:
+    """
+    Service for interacting with the Stats API.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000/api/v1",
+        timeout: float = 30.0,
+    ):
+        self._client = BaseAPIClient(base_url=base_url, timeout=timeout)
+        logger.debug("StatsAPIService initialized | base_url={}", base_url)
+
+    async def get_dashboard(self, refresh: bool = False) -> dict[str, Any]:
+        """
+        Get the dashboard KPIs.
+
+        Args:
+            refresh: Bypass the server-side cache
+
+        Returns:
+            Dictionary with counts (clients_count, providers_count,
+            products_count, quotes_count, orders_count, ...), overdue
+            invoices and revenue by month
+        """
+        logger.info(f"Getting dashboard stats | refresh={refresh}")
+        params = {"refresh": "true"} if refresh else None
+        return await self._client.get("/stats/dashboard", params=params)
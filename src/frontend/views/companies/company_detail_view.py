@@ -3,6 +3,7 @@ Vista de detalle de empresa.
 
 Muestra información completa de una empresa con opciones de editar/eliminar.
 """
+import asyncio
 from typing import Callable
 import flet as ft
 from loguru import logger
@@ -958,14 +959,21 @@ class CompanyDetailView(ft.Container):
             self.update()
 
         try:
-            from src.frontend.services.api import CompanyAPI
-            import httpx
-
-            company_api = CompanyAPI()
+            from src.frontend.services.api import company_api
 
-            # Cargar empresa
-            self._company = await company_api.get_by_id(self.company_id)
-            logger.success(f"Company loaded: {self._company.get('name')}")
+            # Empresa y secciones en una sola petición
+            bundle = await company_api.get_bundle(
+                self.company_id, include=["addresses", "contacts", "ruts", "plants"]
+            )
+            self._company = bundle["company"]
+            self._addresses = bundle["addresses"]
+            self._contacts = bundle["contacts"]
+            self._ruts = bundle["ruts"]
+            self._plants = bundle["plants"]
+            logger.success(
+                f"Company loaded: {self._company.get('name')} | addresses={len(self._addresses)} "
+                f"contacts={len(self._contacts)} ruts={len(self._ruts)} plants={len(self._plants)}"
+            )
 
             company_name = (self._company or {}).get("name")
             if company_name:
@@ -979,60 +987,6 @@ class CompanyDetailView(ft.Container):
                         updated_path.append(item)
                 app_state.navigation.set_breadcrumb(updated_path)
 
-            # Cargar direcciones y contactos en paralelo usando httpx directamente
-            async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
-                try:
-                    # Cargar direcciones
-                    addr_response = await client.get(f"/api/v1/addresses/company/{self.company_id}")
-                    if addr_response.status_code == 200:
-                        self._addresses = addr_response.json()
-                        logger.success(f"Loaded {len(self._addresses)} addresses")
-                    else:
-                        logger.warning(f"Error loading addresses: {addr_response.status_code}")
-                        self._addresses = []
-                except Exception as e:
-                    logger.warning(f"Error loading addresses: {e}")
-                    self._addresses = []
-
-                try:
-                    # Cargar contactos
-                    contact_response = await client.get(f"/api/v1/contacts/company/{self.company_id}")
-                    if contact_response.status_code == 200:
-                        self._contacts = contact_response.json()
-                        logger.success(f"Loaded {len(self._contacts)} contacts")
-                    else:
-                        logger.warning(f"Error loading contacts: {contact_response.status_code}")
-                        self._contacts = []
-                except Exception as e:
-                    logger.warning(f"Error loading contacts: {e}")
-                    self._contacts = []
-
-                try:
-                    # Cargar RUTs
-                    rut_response = await client.get(f"/api/v1/company-ruts/company/{self.company_id}")
-                    if rut_response.status_code == 200:
-                        self._ruts = rut_response.json()
-                        logger.success(f"Loaded {len(self._ruts)} RUTs")
-                    else:
-                        logger.warning(f"Error loading RUTs: {rut_response.status_code}")
-                        self._ruts = []
-                except Exception as e:
-                    logger.warning(f"Error loading RUTs: {e}")
-                    self._ruts = []
-
-                try:
-                    # Cargar Plantas
-                    plant_response = await client.get(f"/api/v1/plants/company/{self.company_id}")
-                    if plant_response.status_code == 200:
-                        self._plants = plant_response.json()
-                        logger.success(f"Loaded {len(self._plants)} plants")
-                    else:
-                        logger.warning(f"Error loading plants: {plant_response.status_code}")
-                        self._plants = []
-                except Exception as e:
-                    logger.warning(f"Error loading plants: {e}")
-                    self._plants = []
-
             self._is_loading = False
 
         except Exception as e:
@@ -1125,48 +1079,40 @@ class CompanyDetailView(ft.Container):
         async def load_countries():
             """Carga los países desde la API."""
             try:
-                import httpx
-                async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
-                    response = await client.get("/api/v1/lookups/countries/")
-                    if response.status_code == 200:
-                        countries = response.json()
-                        for country in countries:
-                            countries_data[country["id"]] = country["name"]
-
-                        # Actualizar dropdown de países
-                        country_dropdown.options = [
-                            ft.dropdown.Option(str(cid), cname)
-                            for cid, cname in sorted(countries_data.items(), key=lambda x: x[1])
-                        ]
-                        country_dropdown.disabled = False
-                        country_dropdown.update()
-                        logger.success(f"Loaded {len(countries_data)} countries from API")
-                    else:
-                        logger.error(f"Error loading countries: {response.status_code}")
+                from src.frontend.services.api import lookup_api
+
+                countries = await lookup_api.get_countries()
+                for country in countries:
+                    countries_data[country["id"]] = country["name"]
+
+                # Actualizar dropdown de países
+                country_dropdown.options = [
+                    ft.dropdown.Option(str(cid), cname)
+                    for cid, cname in sorted(countries_data.items(), key=lambda x: x[1])
+                ]
+                country_dropdown.disabled = False
+                country_dropdown.update()
+                logger.success(f"Loaded {len(countries_data)} countries from API")
             except Exception as ex:
                 logger.exception(f"Error loading countries: {ex}")
 
         async def load_cities(country_id: int):
             """Carga las ciudades de un país desde la API."""
             try:
-                import httpx
-                async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
-                    response = await client.get(f"/api/v1/lookups/cities/?country_id={country_id}")
-                    if response.status_code == 200:
-                        cities = response.json()
-                        cities_by_country[country_id] = cities
-
-                        # Actualizar dropdown de ciudades
-                        city_dropdown.options = [
-                            ft.dropdown.Option(city["name"], city["name"])
-                            for city in sorted(cities, key=lambda x: x["name"])
-                        ]
-                        city_dropdown.disabled = False
-                        city_dropdown.value = None
-                        city_dropdown.update()
-                        logger.success(f"Loaded {len(cities)} cities for country {country_id}")
-                    else:
-                        logger.error(f"Error loading cities: {response.status_code}")
+                from src.frontend.services.api import lookup_api
+
+                cities = await lookup_api.get_cities(country_id=country_id)
+                cities_by_country[country_id] = cities
+
+                # Actualizar dropdown de ciudades
+                city_dropdown.options = [
+                    ft.dropdown.Option(city["name"], city["name"])
+                    for city in sorted(cities, key=lambda x: x["name"])
+                ]
+                city_dropdown.disabled = False
+                city_dropdown.value = None
+                city_dropdown.update()
+                logger.success(f"Loaded {len(cities)} cities for country {country_id}")
             except Exception as ex:
                 logger.exception(f"Error loading cities: {ex}")
 
@@ -1216,7 +1162,7 @@ class CompanyDetailView(ft.Container):
                 return
 
             try:
-                import httpx
+                from src.frontend.services.api import http_client_manager
                 # Obtener el nombre del país seleccionado
                 country_id = int(country_dropdown.value)
                 country_name = countries_data.get(country_id, "")
@@ -1231,7 +1177,7 @@ class CompanyDetailView(ft.Container):
                     "company_id": self.company_id,
                 }
 
-                async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+                async with http_client_manager.borrow() as client:
                     response = await client.post("/api/v1/addresses/", json=data)
                     if response.status_code == 201:
                         close_bottom_sheet()
@@ -1357,68 +1303,60 @@ class CompanyDetailView(ft.Container):
         async def load_countries():
             """Carga los países desde la API."""
             try:
-                import httpx
-                async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
-                    response = await client.get("/api/v1/lookups/countries/")
-                    if response.status_code == 200:
-                        countries = response.json()
-                        current_country_id = None
-
-                        for country in countries:
-                            countries_data[country["id"]] = country["name"]
-                            # Encontrar el ID del país actual
-                            if country["name"] == current_country_name:
-                                current_country_id = country["id"]
-
-                        # Actualizar dropdown de países
-                        country_dropdown.options = [
-                            ft.dropdown.Option(str(cid), cname)
-                            for cid, cname in sorted(countries_data.items(), key=lambda x: x[1])
-                        ]
-                        country_dropdown.disabled = False
-
-                        # Establecer el país actual si existe
-                        if current_country_id:
-                            country_dropdown.value = str(current_country_id)
-                            # Cargar ciudades del país actual
-                            await load_cities(current_country_id, set_current=True)
-
-                        country_dropdown.update()
-                        logger.success(f"Loaded {len(countries_data)} countries from API")
-                    else:
-                        logger.error(f"Error loading countries: {response.status_code}")
+                from src.frontend.services.api import lookup_api
+
+                countries = await lookup_api.get_countries()
+                current_country_id = None
+
+                for country in countries:
+                    countries_data[country["id"]] = country["name"]
+                    # Encontrar el ID del país actual
+                    if country["name"] == current_country_name:
+                        current_country_id = country["id"]
+
+                # Actualizar dropdown de países
+                country_dropdown.options = [
+                    ft.dropdown.Option(str(cid), cname)
+                    for cid, cname in sorted(countries_data.items(), key=lambda x: x[1])
+                ]
+                country_dropdown.disabled = False
+
+                # Establecer el país actual si existe
+                if current_country_id:
+                    country_dropdown.value = str(current_country_id)
+                    # Cargar ciudades del país actual
+                    await load_cities(current_country_id, set_current=True)
+
+                country_dropdown.update()
+                logger.success(f"Loaded {len(countries_data)} countries from API")
             except Exception as ex:
                 logger.exception(f"Error loading countries: {ex}")
 
         async def load_cities(country_id: int, set_current: bool = False):
             """Carga las ciudades de un país desde la API."""
             try:
-                import httpx
-                async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
-                    response = await client.get(f"/api/v1/lookups/cities/?country_id={country_id}")
-                    if response.status_code == 200:
-                        cities = response.json()
-                        cities_by_country[country_id] = cities
-
-                        # Actualizar dropdown de ciudades
-                        city_dropdown.options = [
-                            ft.dropdown.Option(city["name"], city["name"])
-                            for city in sorted(cities, key=lambda x: x["name"])
-                        ]
-                        city_dropdown.disabled = False
-
-                        # Si estamos cargando inicialmente, establecer la ciudad actual
-                        if set_current and current_city_name:
-                            city_names = [c["name"] for c in cities]
-                            if current_city_name in city_names:
-                                city_dropdown.value = current_city_name
-                        else:
-                            city_dropdown.value = None
-
-                        city_dropdown.update()
-                        logger.success(f"Loaded {len(cities)} cities for country {country_id}")
-                    else:
-                        logger.error(f"Error loading cities: {response.status_code}")
+                from src.frontend.services.api import lookup_api
+
+                cities = await lookup_api.get_cities(country_id=country_id)
+                cities_by_country[country_id] = cities
+
+                # Actualizar dropdown de ciudades
+                city_dropdown.options = [
+                    ft.dropdown.Option(city["name"], city["name"])
+                    for city in sorted(cities, key=lambda x: x["name"])
+                ]
+                city_dropdown.disabled = False
+
+                # Si estamos cargando inicialmente, establecer la ciudad actual
+                if set_current and current_city_name:
+                    city_names = [c["name"] for c in cities]
+                    if current_city_name in city_names:
+                        city_dropdown.value = current_city_name
+                else:
+                    city_dropdown.value = None
+
+                city_dropdown.update()
+                logger.success(f"Loaded {len(cities)} cities for country {country_id}")
             except Exception as ex:
                 logger.exception(f"Error loading cities: {ex}")
 
@@ -1471,7 +1409,7 @@ class CompanyDetailView(ft.Container):
                 return
 
             try:
-                import httpx
+                from src.frontend.services.api import http_client_manager
                 # Obtener el nombre del país seleccionado
                 country_id = int(country_dropdown.value)
                 country_name = countries_data.get(country_id, "")
@@ -1485,7 +1423,7 @@ class CompanyDetailView(ft.Container):
                     "address_type": type_dropdown.value,
                 }
 
-                async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+                async with http_client_manager.borrow() as client:
                     response = await client.put(
                         f"/api/v1/addresses/{address_id}/", json=data
                     )
@@ -1585,9 +1523,9 @@ class CompanyDetailView(ft.Container):
         logger.info(f"Confirming deletion of address ID={address_id}")
 
         try:
-            import httpx
+            from src.frontend.services.api import http_client_manager
 
-            async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+            async with http_client_manager.borrow() as client:
                 response = await client.delete(f"/api/v1/addresses/{address_id}/")
 
                 if response.status_code == 200:
@@ -1615,9 +1553,9 @@ class CompanyDetailView(ft.Container):
     async def _reload_addresses(self) -> None:
         """Recarga solo las direcciones desde la API."""
         try:
-            import httpx
+            from src.frontend.services.api import http_client_manager
 
-            async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+            async with http_client_manager.borrow() as client:
                 response = await client.get(f"/api/v1/addresses/company/{self.company_id}/")
                 if response.status_code == 200:
                     self._addresses = response.json()
@@ -1668,7 +1606,7 @@ class CompanyDetailView(ft.Container):
                 return
 
             try:
-                import httpx
+                from src.frontend.services.api import http_client_manager
                 data = {
                     "first_name": first_name_field.value,
                     "last_name": last_name_field.value,
@@ -1679,7 +1617,7 @@ class CompanyDetailView(ft.Container):
                     "company_id": self.company_id,
                 }
 
-                async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+                async with http_client_manager.borrow() as client:
                     response = await client.post("/api/v1/contacts", json=data)
                     if response.status_code == 201:
                         close_bottom_sheet()
@@ -1809,7 +1747,7 @@ class CompanyDetailView(ft.Container):
                 return
 
             try:
-                import httpx
+                from src.frontend.services.api import http_client_manager
                 data = {
                     "first_name": first_name_field.value,
                     "last_name": last_name_field.value,
@@ -1819,7 +1757,7 @@ class CompanyDetailView(ft.Container):
                     "position": position_field.value or None,
                 }
 
-                async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+                async with http_client_manager.borrow() as client:
                     response = await client.put(
                         f"/api/v1/contacts/{contact_id}", json=data
                     )
@@ -1925,9 +1863,9 @@ class CompanyDetailView(ft.Container):
         logger.info(f"Confirming deletion of contact ID={contact_id}")
 
         try:
-            import httpx
+            from src.frontend.services.api import http_client_manager
 
-            async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+            async with http_client_manager.borrow() as client:
                 response = await client.delete(f"/api/v1/contacts/{contact_id}")
 
                 if response.status_code == 200:
@@ -1955,9 +1893,9 @@ class CompanyDetailView(ft.Container):
     async def _reload_contacts(self) -> None:
         """Recarga solo los contactos desde la API."""
         try:
-            import httpx
+            from src.frontend.services.api import http_client_manager
 
-            async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+            async with http_client_manager.borrow() as client:
                 response = await client.get(f"/api/v1/contacts/company/{self.company_id}")
                 if response.status_code == 200:
                     self._contacts = response.json()
@@ -2015,46 +1953,38 @@ class CompanyDetailView(ft.Container):
         async def load_countries():
             """Carga los países desde la API."""
             try:
-                import httpx
-                async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
-                    response = await client.get("/api/v1/lookups/countries/")
-                    if response.status_code == 200:
-                        countries = response.json()
-                        for country in countries:
-                            countries_data[country["id"]] = country["name"]
-
-                        # Actualizar dropdown de países
-                        country_dropdown.options = [
-                            ft.dropdown.Option(str(cid), cname)
-                            for cid, cname in sorted(countries_data.items(), key=lambda x: x[1])
-                        ]
-                        country_dropdown.disabled = False
-                        country_dropdown.update()
-                    else:
-                        logger.error(f"Error loading countries: {response.status_code}")
+                from src.frontend.services.api import lookup_api
+
+                countries = await lookup_api.get_countries()
+                for country in countries:
+                    countries_data[country["id"]] = country["name"]
+
+                # Actualizar dropdown de países
+                country_dropdown.options = [
+                    ft.dropdown.Option(str(cid), cname)
+                    for cid, cname in sorted(countries_data.items(), key=lambda x: x[1])
+                ]
+                country_dropdown.disabled = False
+                country_dropdown.update()
             except Exception as ex:
                 logger.exception(f"Error loading countries: {ex}")
 
         async def load_cities(country_id: int):
             """Carga las ciudades de un país desde la API."""
             try:
-                import httpx
-                async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
-                    response = await client.get(f"/api/v1/lookups/cities/?country_id={country_id}")
-                    if response.status_code == 200:
-                        cities = response.json()
-                        cities_by_country[country_id] = cities
-
-                        # Actualizar dropdown de ciudades
-                        city_dropdown.options = [
-                            ft.dropdown.Option(str(city["id"]), city["name"]) # Value es el ID
-                            for city in sorted(cities, key=lambda x: x["name"])
-                        ]
-                        city_dropdown.disabled = False
-                        city_dropdown.value = None
-                        city_dropdown.update()
-                    else:
-                        logger.error(f"Error loading cities: {response.status_code}")
+                from src.frontend.services.api import lookup_api
+
+                cities = await lookup_api.get_cities(country_id=country_id)
+                cities_by_country[country_id] = cities
+
+                # Actualizar dropdown de ciudades
+                city_dropdown.options = [
+                    ft.dropdown.Option(str(city["id"]), city["name"]) # Value es el ID
+                    for city in sorted(cities, key=lambda x: x["name"])
+                ]
+                city_dropdown.disabled = False
+                city_dropdown.value = None
+                city_dropdown.update()
             except Exception as ex:
                 logger.exception(f"Error loading cities: {ex}")
 
@@ -2094,7 +2024,7 @@ class CompanyDetailView(ft.Container):
                 return
 
             try:
-                import httpx
+                from src.frontend.services.api import http_client_manager
                 
                 # Obtener ID de ciudad si se seleccionó
                 city_id = int(city_dropdown.value) if city_dropdown.value else None
@@ -2109,7 +2039,7 @@ class CompanyDetailView(ft.Container):
                     "company_id": self.company_id,
                 }
 
-                async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+                async with http_client_manager.borrow() as client:
                     logger.info("Enviando petición POST /api/v1/plants/")
                     response = await client.post("/api/v1/plants/", json=data)
                     logger.info(f"Respuesta recibida: {response.status_code}")
@@ -2243,59 +2173,56 @@ class CompanyDetailView(ft.Container):
         )
 
         async def load_countries():
-            """Carga los países."""
+            """Carga los países y, en paralelo, las ciudades del país actual."""
             try:
-                import httpx
-                async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
-                    response = await client.get("/api/v1/lookups/countries/")
-                    if response.status_code == 200:
-                        countries = response.json()
-                        for country in countries:
-                            countries_data[country["id"]] = country["name"]
-                        
-                        country_dropdown.options = [
-                            ft.dropdown.Option(str(cid), cname)
-                            for cid, cname in sorted(countries_data.items(), key=lambda x: x[1])
-                        ]
-                        country_dropdown.disabled = False
-                        
-                        # Si tenemos current_country_id, seleccionarlo
-                        if current_country_id:
-                            country_dropdown.value = str(current_country_id)
-                            # Y cargar ciudades
-                            await load_cities(current_country_id, set_current=True)
-                            
-                        country_dropdown.update()
-                    else:
-                        logger.error(f"Error loading countries: {response.status_code}")
+                from src.frontend.services.api import lookup_api
+
+                if current_country_id:
+                    # El país actual ya se conoce: países y ciudades son independientes
+                    countries, _ = await asyncio.gather(
+                        lookup_api.get_countries(),
+                        load_cities(current_country_id, set_current=True),
+                    )
+                else:
+                    countries = await lookup_api.get_countries()
+                for country in countries:
+                    countries_data[country["id"]] = country["name"]
+
+                country_dropdown.options = [
+                    ft.dropdown.Option(str(cid), cname)
+                    for cid, cname in sorted(countries_data.items(), key=lambda x: x[1])
+                ]
+                country_dropdown.disabled = False
+
+                # Si tenemos current_country_id, seleccionarlo
+                if current_country_id:
+                    country_dropdown.value = str(current_country_id)
+
+                country_dropdown.update()
             except Exception as ex:
                 logger.exception(f"Error loading countries: {ex}")
 
         async def load_cities(country_id: int, set_current: bool = False):
             """Carga las ciudades."""
             try:
-                import httpx
-                async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
-                    response = await client.get(f"/api/v1/lookups/cities/?country_id={country_id}")
-                    if response.status_code == 200:
-                        cities = response.json()
-                        cities_by_country[country_id] = cities
-
-                        city_dropdown.options = [
-                            ft.dropdown.Option(str(city["id"]), city["name"])
-                            for city in sorted(cities, key=lambda x: x["name"])
-                        ]
-                        city_dropdown.disabled = False
-                        
-                        if set_current and current_city_id:
-                            # Verificar si la ciudad actual está en la lista
-                            city_ids = [c["id"] for c in cities]
-                            if current_city_id in city_ids:
-                                city_dropdown.value = str(current_city_id)
-                        
-                        city_dropdown.update()
-                    else:
-                        logger.error(f"Error loading cities: {response.status_code}")
+                from src.frontend.services.api import lookup_api
+
+                cities = await lookup_api.get_cities(country_id=country_id)
+                cities_by_country[country_id] = cities
+
+                city_dropdown.options = [
+                    ft.dropdown.Option(str(city["id"]), city["name"])
+                    for city in sorted(cities, key=lambda x: x["name"])
+                ]
+                city_dropdown.disabled = False
+
+                if set_current and current_city_id:
+                    # Verificar si la ciudad actual está en la lista
+                    city_ids = [c["id"] for c in cities]
+                    if current_city_id in city_ids:
+                        city_dropdown.value = str(current_city_id)
+
+                city_dropdown.update()
             except Exception as ex:
                 logger.exception(f"Error loading cities: {ex}")
 
@@ -2325,7 +2252,7 @@ class CompanyDetailView(ft.Container):
                 return
 
             try:
-                import httpx
+                from src.frontend.services.api import http_client_manager
                 city_id = int(city_dropdown.value) if city_dropdown.value else None
 
                 data = {
@@ -2336,7 +2263,7 @@ class CompanyDetailView(ft.Container):
                     "city_id": city_id,
                 }
 
-                async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+                async with http_client_manager.borrow() as client:
                     response = await client.put(f"/api/v1/plants/{plant_id}", json=data)
                     if response.status_code == 200:
                         close_bottom_sheet()
@@ -2419,9 +2346,9 @@ class CompanyDetailView(ft.Container):
         logger.info(f"Confirming deletion of plant ID={plant_id}")
 
         try:
-            import httpx
+            from src.frontend.services.api import http_client_manager
 
-            async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+            async with http_client_manager.borrow() as client:
                 response = await client.delete(f"/api/v1/plants/{plant_id}")
 
                 if response.status_code == 200:
@@ -2449,9 +2376,9 @@ class CompanyDetailView(ft.Container):
     async def _reload_plants(self) -> None:
         """Recarga solo las plantas desde la API."""
         try:
-            import httpx
+            from src.frontend.services.api import http_client_manager
 
-            async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+            async with http_client_manager.borrow() as client:
                 response = await client.get(f"/api/v1/plants/company/{self.company_id}")
                 if response.status_code == 200:
                     self._plants = response.json()
@@ -2558,7 +2485,7 @@ class CompanyDetailView(ft.Container):
                 return
 
             try:
-                import httpx
+                from src.frontend.services.api import http_client_manager
                 # Enviar el RUT formateado
                 formatted_rut = format_rut(rut_field.value)
                 logger.info(f"Sending RUT to API: {formatted_rut}")
@@ -2568,7 +2495,7 @@ class CompanyDetailView(ft.Container):
                     "company_id": self.company_id,
                 }
 
-                async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+                async with http_client_manager.borrow() as client:
                     response = await client.post("/api/v1/company-ruts/", json=data)
                     if response.status_code == 201:
                         close_bottom_sheet()
@@ -2698,7 +2625,7 @@ class CompanyDetailView(ft.Container):
                 return
 
             try:
-                import httpx
+                from src.frontend.services.api import http_client_manager
                 # Enviar el RUT formateado
                 formatted_rut = format_rut(rut_field.value)
                 data = {
@@ -2706,7 +2633,7 @@ class CompanyDetailView(ft.Container):
                     "is_main": is_main_checkbox.value,
                 }
 
-                async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+                async with http_client_manager.borrow() as client:
                     response = await client.put(
                         f"/api/v1/company-ruts/{rut_id}", json=data
                     )
@@ -2806,9 +2733,9 @@ class CompanyDetailView(ft.Container):
         logger.info(f"Confirming deletion of RUT ID={rut_id}")
 
         try:
-            import httpx
+            from src.frontend.services.api import http_client_manager
 
-            async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+            async with http_client_manager.borrow() as client:
                 response = await client.delete(f"/api/v1/company-ruts/{rut_id}")
 
                 if response.status_code == 200:
@@ -2836,9 +2763,9 @@ class CompanyDetailView(ft.Container):
     async def _reload_ruts(self) -> None:
         """Recarga solo los RUTs desde la API."""
         try:
-            import httpx
+            from src.frontend.services.api import http_client_manager
 
-            async with httpx.AsyncClient(base_url="http://localhost:8000", follow_redirects=True) as client:
+            async with http_client_manager.borrow() as client:
                 response = await client.get(f"/api/v1/company-ruts/company/{self.company_id}")
                 if response.status_code == 200:
                     self._ruts = response.json()
@@ -79,9 +79,26 @@ class CompanyListView(ft.Container):
         # Componentes
         self._search_bar: SearchBar | None = None
         self._filter_panel: FilterPanel | None = None
-        self._data_table: DataTable | None = None
         self._confirm_dialog: ConfirmDialog | None = None
 
+        # DataTable remota: se crea una sola vez para conservar orden y página
+        # entre reconstrucciones; pide al backend solo la página visible
+        self._data_table = DataTable(
+            columns=[
+                {"key": "name", "label": "companies.columns.name", "sortable": True},
+                {"key": "trigram", "label": "companies.columns.trigram", "sortable": True},
+                {"key": "phone", "label": "companies.columns.phone", "sortable": False},
+                {"key": "city", "label": "companies.columns.city", "sortable": False},
+                {"key": "status", "label": "companies.columns.status", "sortable": True, "sort_key": "is_active"},
+            ],
+            on_row_click=self._on_row_click,
+            on_edit=self._on_edit_company,
+            on_delete=self._on_delete_company,
+            page_size=self._page_size,
+            on_page_change=self._on_page_change,
+            data_source=self._fetch_companies_page,
+        )
+
         # Configurar propiedades del contenedor
         self.expand = True
         self.padding = 0
@@ -213,31 +230,6 @@ class CompanyListView(ft.Container):
             on_filter_change=self._on_filter_change,
         )
 
-        # DataTable con columnas de empresas
-        self._data_table = DataTable(
-            columns=[
-                {"key": "name", "label": "companies.columns.name", "sortable": True},
-                {"key": "trigram", "label": "companies.columns.trigram", "sortable": True},
-                {"key": "phone", "label": "companies.columns.phone", "sortable": False},
-                {"key": "city", "label": "companies.columns.city", "sortable": True},
-                {"key": "status", "label": "companies.columns.status", "sortable": True},
-            ],
-            on_row_click=self._on_row_click,
-            on_edit=self._on_edit_company,
-            on_delete=self._on_delete_company,
-            page_size=self._page_size,
-            on_page_change=self._on_page_change,
-        )
-
-        # Asignar datos al DataTable si hay empresas cargadas
-        if self._companies:
-            formatted_data = self._format_companies_for_table(self._companies)
-            self._data_table.set_data(
-                formatted_data,
-                total=self._total_companies,
-                current_page=self._current_page,
-            )
-
         # Header con título y botón crear
         header = ft.Row(
             controls=[
@@ -350,11 +342,14 @@ class CompanyListView(ft.Container):
         except Exception as e:
             logger.warning(f"Error loading country options: {e}")
 
-    async def load_companies(self) -> None:
+    async def load_companies(self, reset_page: bool = False) -> None:
         """
         Carga las empresas desde la API.
 
         Aplica los filtros y búsqueda actuales.
+
+        Args:
+            reset_page: Volver a la primera página (búsqueda o filtros nuevos)
         """
         logger.info(
             f"Loading companies: page={self._current_page}, "
@@ -370,30 +365,7 @@ class CompanyListView(ft.Container):
             self.update()
 
         try:
-            from src.frontend.services.api import CompanyAPI
-
-            company_api = CompanyAPI()
-
-            # Preparar parámetros de búsqueda
-            params: dict[str, Any] = {
-                "page": self._current_page,
-                "page_size": self._page_size,
-            }
-
-            # Agregar búsqueda si existe
-            if self._search_query:
-                response = await company_api.search(
-                    query=self._search_query,
-                    **params,
-                )
-            else:
-                # Agregar filtros
-                filters = self._get_active_filters()
-                response = await company_api.get_all(**params, **filters)
-
-            # Actualizar datos
-            self._companies = response.get("items", [])
-            self._total_companies = response.get("total", 0)
+            await self._data_table.reload(reset_page=reset_page)
 
             logger.success(
                 f"Loaded {len(self._companies)} companies "
@@ -412,6 +384,35 @@ class CompanyListView(ft.Container):
         if self.page:
             self.update()
 
+    async def _fetch_companies_page(self, **params: Any) -> dict[str, Any]:
+        """
+        data_source del DataTable: pide solo la página visible.
+
+        La búsqueda y los filtros se resuelven en el backend junto con el
+        orden, así el total corresponde al filtro aplicado.
+
+        Args:
+            **params: page, page_size, sort y order enviados por la tabla
+
+        Returns:
+            Diccionario con 'items' (filas formateadas) y 'total'
+        """
+        from src.frontend.services.api import CompanyAPI
+
+        company_api = CompanyAPI()
+        response = await company_api.get_list(
+            q=self._search_query or None,
+            **params,
+            **self._get_active_filters(),
+        )
+        self._companies = response.get("items", [])
+        self._total_companies = response.get("total", 0)
+        self._current_page = params["page"]
+        return {
+            "items": self._format_companies_for_table(self._companies),
+            "total": self._total_companies,
+        }
+
     def _format_companies_for_table(self, companies: list[dict]) -> list[dict]:
         """
         Formatea los datos de empresas para la tabla.
@@ -453,7 +454,7 @@ class CompanyListView(ft.Container):
             filters["company_type_id"] = type_map.get(self._type_filter)
 
         if self._country_filter != "all":
-            filters["country_code"] = self._country_filter
+            filters["country_id"] = int(self._country_filter)
 
         return filters
 
@@ -468,7 +469,7 @@ class CompanyListView(ft.Container):
         self._search_query = query
         self._current_page = 1  # Resetear a primera página
         if self.page:
-            self.page.run_task(self.load_companies)
+            self.page.run_task(self.load_companies, True)
 
     def _on_clear_search(self) -> None:
         """Callback cuando se limpia la búsqueda."""
@@ -476,7 +477,7 @@ class CompanyListView(ft.Container):
         self._search_query = ""
         self._current_page = 1
         if self.page:
-            self.page.run_task(self.load_companies)
+            self.page.run_task(self.load_companies, True)
 
     def _on_filter_change(self, filters: dict[str, Any]) -> None:
         """
@@ -492,7 +493,7 @@ class CompanyListView(ft.Container):
         self._current_page = 1  # Resetear a primera página
 
         if self.page:
-            self.page.run_task(self.load_companies)
+            self.page.run_task(self.load_companies, True)
 
     def _on_page_change(self, page: int) -> None:
         """
@@ -502,9 +503,8 @@ class CompanyListView(ft.Container):
             page: Número de página
         """
         logger.info(f"Page changed to: {page}")
+        # La tabla remota pide la página al backend
         self._current_page = page
-        if self.page:
-            self.page.run_task(self.load_companies)
 
     def _on_row_click(self, row_data: dict) -> None:
         """
@@ -602,6 +602,7 @@ class CompanyListView(ft.Container):
         """
         logger.debug("CompanyListView state changed, rebuilding content")
         # Reconstruir el contenido con las nuevas traducciones
+        self._data_table.content = self._data_table.build()
         self.content = self.build()
         if self.page:
             self.update()
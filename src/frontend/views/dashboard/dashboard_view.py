@@ -233,9 +233,10 @@ class DashboardView(ft.Container):
 
     async def load_dashboard_data(self) -> None:
         """
-        Carga los datos del dashboard desde las APIs.
+        Carga los datos del dashboard desde la API de estadísticas.
 
-        Obtiene contadores de empresas, productos, cotizaciones y pedidos.
+        Obtiene contadores de empresas, productos, cotizaciones y pedidos
+        en una sola petición (GET /stats/dashboard).
         """
         logger.info("Loading dashboard data")
         self._is_loading = True
@@ -247,60 +248,17 @@ class DashboardView(ft.Container):
             self.update()
 
         try:
-            # Importar APIs
-            from src.frontend.services.api import CompanyAPI, ProductAPI
-
-            # Crear instancias de APIs
-            company_api = CompanyAPI()
-            product_api = ProductAPI()
-
-            # Inicializar contadores
-            clients_count = 0
-            providers_count = 0
-            products_count = 0
-
-            # Cargar datos con manejo de errores
-            try:
-                logger.debug("Fetching clients count (company_type_id=1)")
-                clients_response = await company_api.get_all(skip=0, limit=1000, company_type_id=1)
-                clients_count = clients_response.get("total", 0)
-            except Exception as e:
-                logger.warning(f"Error fetching clients: {e}")
-                clients_count = 0
-
-            try:
-                logger.debug("Fetching providers count (company_type_id=2)")
-                providers_response = await company_api.get_all(skip=0, limit=1000, company_type_id=2)
-                providers_count = providers_response.get("total", 0)
-            except Exception as e:
-                logger.warning(f"Error fetching providers: {e}")
-                providers_count = 0
-
-            try:
-                logger.debug("Fetching products count")
-                products_response = await product_api.get_all(skip=0, limit=1000)
-                products_count = products_response.get("total", 0)
-            except Exception as e:
-                logger.warning(f"Error fetching products: {e}")
-                products_count = 0
-
-            # TODO: Implementar APIs de cotizaciones y pedidos
-            quotes_count = 0
-            orders_count = 0
-
-            # Guardar datos en el estado
-            self._dashboard_data = {
-                "clients_count": clients_count,
-                "providers_count": providers_count,
-                "products_count": products_count,
-                "quotes_count": quotes_count,
-                "orders_count": orders_count,
-            }
+            from src.frontend.services.api import StatsAPI
+
+            # Una sola llamada: el backend agrega todos los KPIs en SQL
+            self._dashboard_data = await StatsAPI().get_dashboard()
 
             logger.success(
-                f"Dashboard data loaded: {clients_count} clients, "
-                f"{providers_count} providers, {products_count} products, "
-                f"{quotes_count} quotes, {orders_count} orders"
+                f"Dashboard data loaded: {self._dashboard_data.get('clients_count', 0)} clients, "
+                f"{self._dashboard_data.get('providers_count', 0)} providers, "
+                f"{self._dashboard_data.get('products_count', 0)} products, "
+                f"{self._dashboard_data.get('quotes_count', 0)} quotes, "
+                f"{self._dashboard_data.get('orders_count', 0)} orders"
             )
 
             self._is_loading = False
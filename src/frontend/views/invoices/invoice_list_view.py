@@ -18,6 +18,7 @@ from src.frontend.components.common import (
     ErrorDisplay,
     EmptyState,
     ConfirmDialog,
+    ExportButton,
 )
 
 
@@ -194,6 +195,19 @@ class InvoiceListView(ft.Container):
                     weight=LayoutConstants.FONT_WEIGHT_BOLD,
                     expand=True,
                 ),
+                # Una exportación por tipo de factura (el backend las lista por separado)
+                ExportButton(
+                    entity="invoices-sii",
+                    get_params=self._get_export_params,
+                    tooltip=f"{t('common.export')} - {t('invoices.type.sii')}",
+                    visible=self._type_filter in ("all", "SII"),
+                ),
+                ExportButton(
+                    entity="invoices-export",
+                    get_params=self._get_export_params,
+                    tooltip=f"{t('common.export')} - {t('invoices.type.export')}",
+                    visible=self._type_filter in ("all", "EXPORT"),
+                ),
                 ft.FloatingActionButton(
                     icon=ft.Icons.ADD,
                     on_click=self._on_create_invoice,
@@ -335,6 +349,10 @@ class InvoiceListView(ft.Container):
             })
         return formatted
 
+    def _get_export_params(self) -> dict[str, Any]:
+        """Facturas de la orden con la búsqueda vigente, para exportar."""
+        return {"order_id": self._order_id, "q": self._search_query or None}
+
     def _on_search(self, query: str) -> None:
         """Callback de búsqueda."""
         self._search_query = query
@@ -18,6 +18,7 @@ from src.frontend.components.common import (
     ErrorDisplay,
     EmptyState,
     ConfirmDialog,
+    ExportButton,
 )
 
 
@@ -68,9 +69,26 @@ class OrderListView(ft.Container):
         # Componentes
         self._search_bar: SearchBar | None = None
         self._filter_panel: FilterPanel | None = None
-        self._data_table: DataTable | None = None
         self._confirm_dialog: ConfirmDialog | None = None
 
+        # DataTable remota: se crea una sola vez para conservar orden y página
+        # entre reconstrucciones; pide al backend solo la página visible
+        self._data_table = DataTable(
+            columns=[
+                {"key": "order_number", "label": "orders.columns.order_number", "sortable": True},
+                {"key": "company_name", "label": "orders.columns.company"},
+                {"key": "order_date", "label": "orders.columns.order_date", "sortable": True},
+                {"key": "total", "label": "orders.columns.total_amount", "sortable": True, "numeric": True},
+                {"key": "status", "label": "orders.columns.status", "sortable": True, "sort_key": "status_id"},
+            ],
+            on_row_click=self._on_row_click,
+            on_edit=self._on_edit_order,
+            on_delete=self._on_delete_order,
+            page_size=self._page_size,
+            on_page_change=self._on_page_change,
+            data_source=self._fetch_orders_page,
+        )
+
         # Configurar propiedades del contenedor
         self.expand = True
         self.padding = 0
@@ -148,30 +166,6 @@ class OrderListView(ft.Container):
             on_filter_change=self._on_filter_change,
         )
 
-        # DataTable con columnas de órdenes
-        self._data_table = DataTable(
-            columns=[
-                {"key": "order_number", "label": "orders.columns.order_number", "sortable": True},
-                {"key": "company_name", "label": "orders.columns.company", "sortable": True},
-                {"key": "order_date", "label": "orders.columns.order_date", "sortable": True},
-                {"key": "total", "label": "orders.columns.total_amount", "sortable": True, "numeric": True},
-                {"key": "status", "label": "orders.columns.status", "sortable": True},
-            ],
-            on_row_click=self._on_row_click,
-            on_edit=self._on_edit_order,
-            on_delete=self._on_delete_order,
-            page_size=self._page_size,
-            on_page_change=self._on_page_change,
-        )
-
-        # Asignar datos al DataTable
-        formatted_data = self._format_orders_for_table(self._orders)
-        self._data_table.set_data(
-            formatted_data,
-            total=self._total_orders,
-            current_page=self._current_page,
-        )
-
         # Header con título y botón crear (opcional desde aquí)
         header = ft.Row(
             controls=[
@@ -181,6 +175,7 @@ class OrderListView(ft.Container):
                     weight=LayoutConstants.FONT_WEIGHT_BOLD,
                     expand=True,
                 ),
+                ExportButton(entity="orders", get_params=self._get_export_params),
                 # Generalmente las órdenes se crean desde una empresa o una cotización,
                 # pero podemos permitirlo si el callback está asignado
                 ft.FloatingActionButton(
@@ -241,8 +236,13 @@ class OrderListView(ft.Container):
         app_state.theme.remove_observer(self._on_state_changed)
         app_state.i18n.remove_observer(self._on_state_changed)
 
-    async def load_orders(self) -> None:
-        """Carga las órdenes desde la API."""
+    async def load_orders(self, reset_page: bool = False) -> None:
+        """
+        Carga las órdenes desde la API.
+
+        Args:
+            reset_page: Volver a la primera página (búsqueda o filtros nuevos)
+        """
         logger.info(f"Loading orders: page={self._current_page}, search='{self._search_query}'")
         self._is_loading = True
         self._error_message = ""
@@ -252,26 +252,10 @@ class OrderListView(ft.Container):
             self.update()
 
         try:
-            from src.frontend.services.api import order_api
-            
-            params = {
-                "page": self._current_page,
-                "page_size": self._page_size,
-            }
-
-            if self._search_query:
-                response = await order_api.search(query=self._search_query, **params)
-            else:
-                filters = {}
-                if self._status_filter != "all":
-                    filters["status_id"] = int(self._status_filter)
-                response = await order_api.get_all(**params, **filters)
-
-            self._orders = response.get("items", [])
-            self._total_orders = response.get("total", 0)
+            await self._data_table.reload(reset_page=reset_page)
             self._is_loading = False
 
-            logger.success(f"Loaded {len(self._orders)} orders")
+            logger.success(f"Loaded {len(self._orders)} of {self._total_orders} orders")
 
         except Exception as e:
             logger.exception(f"Error loading orders: {e}")
@@ -282,6 +266,41 @@ class OrderListView(ft.Container):
         if self.page:
             self.update()
 
+    async def _fetch_orders_page(self, **params: Any) -> dict[str, Any]:
+        """
+        data_source del DataTable: pide solo la página visible.
+
+        Args:
+            **params: page, page_size, sort y order enviados por la tabla
+
+        Returns:
+            Diccionario con 'items' (filas formateadas) y 'total'
+        """
+        from src.frontend.services.api import order_api
+
+        response = await order_api.get_list(
+            q=self._search_query or None, **params, **self._get_active_filters()
+        )
+        self._orders = response.get("items", [])
+        self._total_orders = response.get("total", 0)
+        self._current_page = params["page"]
+        return {"items": self._format_orders_for_table(self._orders), "total": self._total_orders}
+
+    def _get_active_filters(self) -> dict[str, Any]:
+        """Obtiene los filtros activos."""
+        filters: dict[str, Any] = {}
+        if self._status_filter != "all":
+            filters["status_id"] = int(self._status_filter)
+        return filters
+
+    def _get_export_params(self) -> dict[str, Any]:
+        """Orden, búsqueda y filtros vigentes para exportar el listado completo."""
+        return {
+            **self._data_table.sort_params(),
+            "q": self._search_query or None,
+            **self._get_active_filters(),
+        }
+
     def _format_orders_for_table(self, orders: list[dict]) -> list[dict]:
         """Formatea los datos para la tabla."""
         formatted = []
@@ -316,20 +335,18 @@ class OrderListView(ft.Container):
         self._search_query = query
         self._current_page = 1
         if self.page:
-            self.page.run_task(self.load_orders)
+            self.page.run_task(self.load_orders, True)
 
     def _on_filter_change(self, filters: dict[str, Any]) -> None:
         """Callback de cambio de filtros."""
         self._status_filter = filters.get("status", "all")
         self._current_page = 1
         if self.page:
-            self.page.run_task(self.load_orders)
+            self.page.run_task(self.load_orders, True)
 
     def _on_page_change(self, page: int) -> None:
-        """Callback de cambio de página."""
+        """Callback de cambio de página (la tabla pide la página al backend)."""
         self._current_page = page
-        if self.page:
-            self.page.run_task(self.load_orders)
 
     def _on_row_click(self, row_data: dict) -> None:
         """Callback de click en fila."""
@@ -384,6 +401,7 @@ class OrderListView(ft.Container):
 
     def _on_state_changed(self) -> None:
         """Actualiza la interfaz al cambiar tema/idioma."""
+        self._data_table.content = self._data_table.build()
         self.content = self.build()
         if self.page:
             self.update()
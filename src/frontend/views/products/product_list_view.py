@@ -19,6 +19,7 @@ from src.frontend.components.common import (
     ErrorDisplay,
     EmptyState,
     ConfirmDialog,
+    ExportButton,
 )
 
 
@@ -85,7 +86,23 @@ class ProductListView(ft.Container):
         # Componentes
         self._search_bar: SearchBar | None = None
         self._filter_panel: FilterPanel | None = None
-        self._data_table: DataTable | None = None
+        # DataTable remota: se crea una sola vez para conservar orden y página
+        # entre reconstrucciones; pide al backend solo la página visible
+        self._data_table = DataTable(
+            columns=[
+                {"key": "code", "label": "articles.columns.code", "sortable": True, "sort_key": "reference"},
+                {"key": "name", "label": "articles.columns.name", "sortable": False},
+                {"key": "unit", "label": "articles.columns.unit", "sortable": False},
+                {"key": "cost", "label": "articles.columns.cost", "sortable": True, "sort_key": "cost_price"},
+                {"key": "status", "label": "articles.columns.status", "sortable": True, "sort_key": "is_active"},
+            ],
+            on_row_click=self._on_row_click,
+            on_edit=self._on_edit_product,
+            on_delete=self._on_delete_product,
+            page_size=self._page_size,
+            on_page_change=self._on_page_change,
+            data_source=self._fetch_products_page,
+        )
 
         # ID del producto pendiente de eliminar
         self._pending_delete_id: int | None = None
@@ -157,6 +174,7 @@ class ProductListView(ft.Container):
                     weight=LayoutConstants.FONT_WEIGHT_BOLD,
                     expand=True,
                 ),
+                ExportButton(entity="products", get_params=self._get_export_params),
                 ft.FloatingActionButton(
                     icon=ft.Icons.ADD,
                     on_click=self._on_create_product,
@@ -187,30 +205,6 @@ class ProductListView(ft.Container):
             on_filter_change=self._on_filter_change,
         )
 
-        self._data_table = DataTable(
-            columns=[
-                {"key": "code", "label": "articles.columns.code", "sortable": True},
-                {"key": "name", "label": "articles.columns.name", "sortable": True},
-                {"key": "unit", "label": "articles.columns.unit", "sortable": False},
-                {"key": "cost", "label": "articles.columns.cost", "sortable": True},
-                {"key": "status", "label": "articles.columns.status", "sortable": True},
-            ],
-            on_row_click=self._on_row_click,
-            on_edit=self._on_edit_product,
-            on_delete=self._on_delete_product,
-            page_size=self._page_size,
-            on_page_change=self._on_page_change,
-        )
-
-        # Asignar datos al DataTable si hay productos cargados
-        if self._products:
-            formatted_data = self._format_products_for_table(self._products)
-            self._data_table.set_data(
-                formatted_data,
-                total=self._total_products,
-                current_page=self._current_page,
-            )
-
         return ft.Container(
             content=ft.Column(
                 controls=[
@@ -259,8 +253,13 @@ class ProductListView(ft.Container):
         app_state.theme.remove_observer(self._on_state_changed)
         app_state.i18n.remove_observer(self._on_state_changed)
 
-    async def load_products(self) -> None:
-        """Carga los productos desde la API."""
+    async def load_products(self, reset_page: bool = False) -> None:
+        """
+        Carga los productos desde la API.
+
+        Args:
+            reset_page: Volver a la primera página (búsqueda o filtros nuevos)
+        """
         logger.info(f"Loading products: page={self._current_page}")
         self._is_loading = True
         self._error_message = ""
@@ -271,24 +270,9 @@ class ProductListView(ft.Container):
             self.update()
 
         try:
-            from src.frontend.services.api import ProductAPI
-
-            product_api = ProductAPI()
-            params: dict[str, Any] = {
-                "page": self._current_page,
-                "page_size": self._page_size,
-            }
-
-            if self._search_query:
-                response = await product_api.search(query=self._search_query, **params)
-            else:
-                filters = self._get_active_filters()
-                response = await product_api.get_all(**params, **filters)
-
-            self._products = response.get("items", [])
-            self._total_products = response.get("total", 0)
+            await self._data_table.reload(reset_page=reset_page)
 
-            logger.success(f"Loaded {len(self._products)} products")
+            logger.success(f"Loaded {len(self._products)} of {self._total_products} products")
             self._is_loading = False
 
         except Exception as e:
@@ -301,6 +285,32 @@ class ProductListView(ft.Container):
         if self.page:
             self.update()
 
+    async def _fetch_products_page(self, **params: Any) -> dict[str, Any]:
+        """
+        data_source del DataTable: pide solo la página visible.
+
+        Args:
+            **params: page, page_size, sort y order enviados por la tabla
+
+        Returns:
+            Diccionario con 'items' (filas formateadas) y 'total'
+        """
+        from src.frontend.services.api import ProductAPI
+
+        product_api = ProductAPI()
+        response = await product_api.get_list(
+            q=self._search_query or None,
+            **params,
+            **self._get_active_filters(),
+        )
+        self._products = response.get("items", [])
+        self._total_products = response.get("total", 0)
+        self._current_page = params["page"]
+        return {
+            "items": self._format_products_for_table(self._products),
+            "total": self._total_products,
+        }
+
     def _format_products_for_table(self, products: list[dict]) -> list[dict]:
         """Formatea los datos de productos para la tabla."""
         formatted = []
@@ -339,19 +349,27 @@ class ProductListView(ft.Container):
 
         return filters
 
+    def _get_export_params(self) -> dict[str, Any]:
+        """Orden, búsqueda y filtros vigentes para exportar el listado completo."""
+        return {
+            **self._data_table.sort_params(),
+            "q": self._search_query or None,
+            **self._get_active_filters(),
+        }
+
     def _on_search(self, query: str) -> None:
         """Callback cuando se realiza una búsqueda."""
         self._search_query = query
         self._current_page = 1
         if self.page:
-            self.page.run_task(self.load_products)
+            self.page.run_task(self.load_products, True)
 
     def _on_clear_search(self) -> None:
         """Callback cuando se limpia la búsqueda."""
         self._search_query = ""
         self._current_page = 1
         if self.page:
-            self.page.run_task(self.load_products)
+            self.page.run_task(self.load_products, True)
 
     def _on_filter_change(self, filters: dict[str, Any]) -> None:
         """Callback cuando cambian los filtros."""
@@ -359,13 +377,11 @@ class ProductListView(ft.Container):
         self._type_filter = filters.get("type", "all")
         self._current_page = 1
         if self.page:
-            self.page.run_task(self.load_products)
+            self.page.run_task(self.load_products, True)
 
     def _on_page_change(self, page: int) -> None:
-        """Callback cuando cambia la página."""
+        """Callback cuando cambia la página (la tabla pide la página al backend)."""
         self._current_page = page
-        if self.page:
-            self.page.run_task(self.load_products)
 
     def _on_row_click(self, row_data: dict) -> None:
         """Callback cuando se hace click en una fila."""
@@ -18,6 +18,7 @@ from src.frontend.components.common import (
     ErrorDisplay,
     EmptyState,
     ConfirmDialog,
+    ExportButton,
 )
 
 
@@ -69,9 +70,27 @@ class QuoteListView(ft.Container):
         # Componentes
         self._search_bar: SearchBar | None = None
         self._filter_panel: FilterPanel | None = None
-        self._data_table: DataTable | None = None
         self._confirm_dialog: ConfirmDialog | None = None
 
+        # DataTable remota: se crea una sola vez para conservar orden y página
+        # entre reconstrucciones; pide al backend solo la página visible
+        self._data_table = DataTable(
+            columns=[
+                {"key": "quote_number", "label": "quotes.columns.quote_number", "sortable": True},
+                {"key": "subject", "label": "quotes.columns.subject"},
+                {"key": "company_name", "label": "quotes.columns.company"},
+                {"key": "quote_date", "label": "quotes.columns.quote_date", "sortable": True},
+                {"key": "total", "label": "quotes.columns.total_amount", "sortable": True, "numeric": True},
+                {"key": "status", "label": "quotes.columns.status", "sortable": True, "sort_key": "status_id"},
+            ],
+            on_row_click=self._on_row_click,
+            on_edit=self._on_edit_quote,
+            on_delete=self._on_delete_quote,
+            page_size=self._page_size,
+            on_page_change=self._on_page_change,
+            data_source=self._fetch_quotes_page,
+        )
+
         # Configurar propiedades del contenedor
         self.expand = True
         self.padding = 0
@@ -148,31 +167,6 @@ class QuoteListView(ft.Container):
             on_filter_change=self._on_filter_change,
         )
 
-        # DataTable con columnas de cotizaciones
-        self._data_table = DataTable(
-            columns=[
-                {"key": "quote_number", "label": "quotes.columns.quote_number", "sortable": True},
-                {"key": "subject", "label": "quotes.columns.subject", "sortable": True},
-                {"key": "company_name", "label": "quotes.columns.company", "sortable": True},
-                {"key": "quote_date", "label": "quotes.columns.quote_date", "sortable": True},
-                {"key": "total", "label": "quotes.columns.total_amount", "sortable": True, "numeric": True},
-                {"key": "status", "label": "quotes.columns.status", "sortable": True},
-            ],
-            on_row_click=self._on_row_click,
-            on_edit=self._on_edit_quote,
-            on_delete=self._on_delete_quote,
-            page_size=self._page_size,
-            on_page_change=self._on_page_change,
-        )
-
-        # Asignar datos al DataTable
-        formatted_data = self._format_quotes_for_table(self._quotes)
-        self._data_table.set_data(
-            formatted_data,
-            total=self._total_quotes,
-            current_page=self._current_page,
-        )
-
         # Header con título y botón crear (opcional desde aquí)
         header = ft.Row(
             controls=[
@@ -182,6 +176,7 @@ class QuoteListView(ft.Container):
                     weight=LayoutConstants.FONT_WEIGHT_BOLD,
                     expand=True,
                 ),
+                ExportButton(entity="quotes", get_params=self._get_export_params),
                 # Generalmente las cotizaciones se crean desde una empresa, 
                 # pero podemos permitirlo si el callback está asignado
                 ft.FloatingActionButton(
@@ -242,8 +237,13 @@ class QuoteListView(ft.Container):
         app_state.theme.remove_observer(self._on_state_changed)
         app_state.i18n.remove_observer(self._on_state_changed)
 
-    async def load_quotes(self) -> None:
-        """Carga las cotizaciones desde la API."""
+    async def load_quotes(self, reset_page: bool = False) -> None:
+        """
+        Carga las cotizaciones desde la API.
+
+        Args:
+            reset_page: Volver a la primera página (búsqueda o filtros nuevos)
+        """
         logger.info(f"Loading quotes: page={self._current_page}, search='{self._search_query}'")
         self._is_loading = True
         self._error_message = ""
@@ -253,26 +253,10 @@ class QuoteListView(ft.Container):
             self.update()
 
         try:
-            from src.frontend.services.api import quote_api
-            
-            params = {
-                "page": self._current_page,
-                "page_size": self._page_size,
-            }
-
-            if self._search_query:
-                response = await quote_api.search(query=self._search_query, **params)
-            else:
-                filters = {}
-                if self._status_filter != "all":
-                    filters["status_id"] = int(self._status_filter)
-                response = await quote_api.get_all(**params, **filters)
-
-            self._quotes = response.get("items", [])
-            self._total_quotes = response.get("total", 0)
+            await self._data_table.reload(reset_page=reset_page)
             self._is_loading = False
 
-            logger.success(f"Loaded {len(self._quotes)} quotes")
+            logger.success(f"Loaded {len(self._quotes)} of {self._total_quotes} quotes")
 
         except Exception as e:
             logger.exception(f"Error loading quotes: {e}")
@@ -283,6 +267,41 @@ class QuoteListView(ft.Container):
         if self.page:
             self.update()
 
+    async def _fetch_quotes_page(self, **params: Any) -> dict[str, Any]:
+        """
+        data_source del DataTable: pide solo la página visible.
+
+        Args:
+            **params: page, page_size, sort y order enviados por la tabla
+
+        Returns:
+            Diccionario con 'items' (filas formateadas) y 'total'
+        """
+        from src.frontend.services.api import quote_api
+
+        response = await quote_api.get_list(
+            q=self._search_query or None, **params, **self._get_active_filters()
+        )
+        self._quotes = response.get("items", [])
+        self._total_quotes = response.get("total", 0)
+        self._current_page = params["page"]
+        return {"items": self._format_quotes_for_table(self._quotes), "total": self._total_quotes}
+
+    def _get_active_filters(self) -> dict[str, Any]:
+        """Obtiene los filtros activos."""
+        filters: dict[str, Any] = {}
+        if self._status_filter != "all":
+            filters["status_id"] = int(self._status_filter)
+        return filters
+
+    def _get_export_params(self) -> dict[str, Any]:
+        """Orden, búsqueda y filtros vigentes para exportar el listado completo."""
+        return {
+            **self._data_table.sort_params(),
+            "q": self._search_query or None,
+            **self._get_active_filters(),
+        }
+
     def _format_quotes_for_table(self, quotes: list[dict]) -> list[dict]:
         """Formatea los datos para la tabla."""
         formatted = []
@@ -312,20 +331,18 @@ class QuoteListView(ft.Container):
         self._search_query = query
         self._current_page = 1
         if self.page:
-            self.page.run_task(self.load_quotes)
+            self.page.run_task(self.load_quotes, True)
 
     def _on_filter_change(self, filters: dict[str, Any]) -> None:
         """Callback de cambio de filtros."""
         self._status_filter = filters.get("status", "all")
         self._current_page = 1
         if self.page:
-            self.page.run_task(self.load_quotes)
+            self.page.run_task(self.load_quotes, True)
 
     def _on_page_change(self, page: int) -> None:
-        """Callback de cambio de página."""
+        """Callback de cambio de página (la tabla pide la página al backend)."""
         self._current_page = page
-        if self.page:
-            self.page.run_task(self.load_quotes)
 
     def _on_row_click(self, row_data: dict) -> None:
         """Callback de click en fila."""
@@ -380,6 +397,7 @@ class QuoteListView(ft.Container):
 
     def _on_state_changed(self) -> None:
         """Actualiza la interfaz al cambiar tema/idioma."""
+        self._data_table.content = self._data_table.build()
         self.content = self.build()
         if self.page:
             self.update()
@@ -731,40 +731,27 @@ class QuoteProductsView(ft.Column):
         try:
             from src.frontend.services.api import quote_api
 
-            success_count = 0
-            error_count = 0
-
-            for item in self._selected_products:
-                try:
-                    product_data = {
-                        "product_id": item["product_id"],
-                        "quantity": item["quantity"],
-                        "unit_price": item["unit_price"],
-                        "discount_percentage": item["discount_percentage"],
-                        "notes": item["notes"],
-                        "sequence": item["sequence"],
-                    }
-
-                    await quote_api.add_product(self.quote_id, product_data)
-                    success_count += 1
-                    logger.success(f"Product saved: {item['reference']}")
-
-                except Exception as ex:
-                    error_count += 1
-                    logger.error(f"Error saving product {item['reference']}: {ex}")
+            # Un solo lote: se guardan todas las líneas o ninguna
+            lines = [
+                {
+                    "product_id": item["product_id"],
+                    "quantity": item["quantity"],
+                    "unit_price": item["unit_price"],
+                    "discount_percentage": item["discount_percentage"],
+                    "notes": item["notes"],
+                    "sequence": item["sequence"],
+                }
+                for item in self._selected_products
+            ]
+            await quote_api.apply_products_batch(self.quote_id, create=lines)
+            logger.success(f"{len(lines)} products saved to quote {self.quote_id}")
 
             # Mostrar resultado
             if self.page:
-                if error_count == 0:
-                    snackbar = ft.SnackBar(
-                        content=ft.Text(t("quotes.add_products.messages.success_adding", {"count": success_count})),
-                        bgcolor=ft.Colors.GREEN,
-                    )
-                else:
-                    snackbar = ft.SnackBar(
-                        content=ft.Text(t("quotes.add_products.messages.partial_success", {"success": success_count, "error": error_count})),
-                        bgcolor=ft.Colors.ORANGE,
-                    )
+                snackbar = ft.SnackBar(
+                    content=ft.Text(t("quotes.add_products.messages.success_adding", {"count": len(lines)})),
+                    bgcolor=ft.Colors.GREEN,
+                )
                 self.page.overlay.append(snackbar)
                 snackbar.open = True
                 self.page.update()
@@ -12,6 +12,8 @@ from src.shared.schemas.business.quote import (
     QuoteProductCreate,
     QuoteProductUpdate,
     QuoteProductResponse,
+    QuoteProductBatch,
+    QuoteProductBatchUpdate,
 )
 from src.shared.schemas.business.order import (
     OrderCreate,
@@ -51,6 +53,8 @@ __all__ = [
     "QuoteProductCreate",
     "QuoteProductUpdate",
     "QuoteProductResponse",
+    "QuoteProductBatch",
+    "QuoteProductBatchUpdate",
     # Order schemas
     "OrderCreate",
     "OrderUpdate",
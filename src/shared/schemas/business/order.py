@@ -48,6 +48,26 @@ class OrderProductUpdate(BaseModel):
     notes: str | None = Field(None, max_length=1000)
 
 
+class OrderProductBatchUpdate(OrderProductUpdate):
+    """Change to an existing order product inside a batch."""
+
+    id: int = Field(..., gt=0, description="Order product ID")
+
+
+class OrderProductBatch(BaseModel):
+    """
+    Schema for changing many order products in one request.
+
+    Deletes, updates and creates are applied in one transaction and the
+    order totals are recalculated once. New lines that omit ``sequence``
+    are numbered after the last existing line, in list order.
+    """
+
+    create: list[OrderProductCreate] = Field(default_factory=list, description="Lines to add")
+    update: list[OrderProductBatchUpdate] = Field(default_factory=list, description="Lines to change")
+    delete: list[int] = Field(default_factory=list, description="Order product IDs to remove")
+
+
 class ProductSummary(BaseModel):
     """Resumen de producto para incluir en respuestas de order product."""
     
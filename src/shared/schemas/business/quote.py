@@ -138,6 +138,32 @@ class QuoteProductUpdate(BaseModel):
     notes: str | None = Field(None, max_length=1000)
 
 
+class QuoteProductBatchUpdate(QuoteProductUpdate):
+    """Change to an existing quote product inside a batch."""
+
+    id: int = Field(..., gt=0, description="Quote product ID")
+
+
+class QuoteProductBatch(BaseModel):
+    """
+    Schema for changing many quote products in one request.
+
+    Deletes, updates and creates are applied in one transaction and the
+    quote totals are recalculated once. New lines that omit ``sequence``
+    are numbered after the last existing line, in list order.
+
+    Example:
+        data = QuoteProductBatch(
+            create=[QuoteProductCreate(product_id=10, quantity=Decimal("5"), unit_price=Decimal("1500"))],
+            update=[QuoteProductBatchUpdate(id=4, quantity=Decimal("2"))],
+            delete=[7]
+        )
+    """
+
+    create: list[QuoteProductCreate] = Field(default_factory=list, description="Lines to add")
+    update: list[QuoteProductBatchUpdate] = Field(default_factory=list, description="Lines to change")
+    delete: list[int] = Field(default_factory=list, description="Quote product IDs to remove")
+
 
 class ProductSummary(BaseModel):
     """Resumen de producto para incluir en respuestas de quote product."""
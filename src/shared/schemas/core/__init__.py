@@ -48,6 +48,16 @@ from src.shared.schemas.core.note import (
     NoteUpdate,
     NoteResponse,
 )
+from src.shared.schemas.core.company_bundle import (
+    COMPANY_BUNDLE_SECTIONS,
+    CompanyBundleResponse,
+)
+from src.shared.schemas.core.product_import import (
+    CompanyImportResult,
+    ImportResult,
+    ImportRowError,
+    ProductImportResult,
+)
 
 __all__ = [
     # Company
@@ -86,4 +96,12 @@ __all__ = [
     "NoteCreate",
     "NoteUpdate",
     "NoteResponse",
+    # Company bundle
+    "COMPANY_BUNDLE_SECTIONS",
+    "CompanyBundleResponse",
+    # Product and company import
+    "ImportResult",
+    "ImportRowError",
+    "ProductImportResult",
+    "CompanyImportResult",
 ]
@@ -0,0 +1,39 @@
+"""
+Schema de Pydantic para el detalle completo de una empresa.
+
+Agrupa en una sola respuesta la empresa y las secciones que muestra la
+pantalla de detalle (direcciones, contactos, RUTs, plantas y notas).
+"""
+
+from src.shared.schemas.base import BaseSchema
+from src.shared.schemas.core.address import AddressResponse
+from src.shared.schemas.core.company import CompanyResponse
+from src.shared.schemas.core.company_rut import CompanyRutResponse
+from src.shared.schemas.core.contact import ContactResponse
+from src.shared.schemas.core.note import NoteResponse
+from src.shared.schemas.core.plant import PlantResponse
+
+# Secciones que se pueden pedir con ?include=
+COMPANY_BUNDLE_SECTIONS = ("addresses", "contacts", "ruts", "plants", "notes")
+
+
+class CompanyBundleResponse(BaseSchema):
+    """
+    Schema para respuesta de GET /companies/{id}/bundle.
+
+    Cada sección tiene el mismo formato y orden que su endpoint individual
+    (ej: ``addresses`` = GET /addresses/company/{id}). Las secciones que no
+    se pidieron en ``include`` quedan en None, para distinguirlas de una
+    sección vacía.
+
+    Example:
+        bundle = CompanyBundleResponse(company=company, addresses=[...])
+        print(bundle.company.name, len(bundle.addresses))
+    """
+
+    company: CompanyResponse
+    addresses: list[AddressResponse] | None = None
+    contacts: list[ContactResponse] | None = None
+    ruts: list[CompanyRutResponse] | None = None
+    plants: list[PlantResponse] | None = None
+    notes: list[NoteResponse] | None = None
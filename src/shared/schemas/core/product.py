@@ -475,6 +475,11 @@ class ProductWithBOMResponse(ProductResponse):
     total_components: int = 0
     bom_levels: int = 0  # Niveles de profundidad del BOM
 
+    # Acumulados por unidad calculados desde todos los niveles del BOM
+    bom_cost: Decimal | None = None
+    bom_price: Decimal | None = None
+    bom_weight: Decimal | None = None
+
 
 class ProductSearchResponse(BaseSchema):
     """
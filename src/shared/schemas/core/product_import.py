@@ -0,0 +1,52 @@
+"""
+Schemas de Pydantic para la importación masiva de productos y empresas.
+
+Resultado de POST /import/products y /import/companies, y de los scripts
+``scripts.import_products`` y ``scripts.import_companies``.
+"""
+
+from pydantic import Field
+
+from src.shared.schemas.base import BaseSchema
+
+
+class ImportRowError(BaseSchema):
+    """
+    Error de una fila del archivo importado.
+
+    Example:
+        ImportRowError(row=15, reference="PROD-001", errors=["sale_price: debe ser >= 0"])
+    """
+
+    row: int = Field(..., description="Número de fila en el archivo (la cabecera es la fila 1)")
+    reference: str | None = Field(None, description="Clave de la fila (referencia o trigram), si venía")
+    errors: list[str] = Field(default_factory=list, description="Mensajes de error de la fila")
+
+
+class ImportResult(BaseSchema):
+    """
+    Resumen de una importación masiva.
+
+    Las filas con error no detienen la importación: se informan en
+    ``errors`` y el resto se inserta. Para no generar respuestas enormes
+    solo se detallan los primeros errores (``errors_truncated`` indica si
+    hubo más); ``failed`` siempre cuenta todas las filas rechazadas.
+
+    Example:
+        result = ProductImportResult(total_rows=100, created=98, failed=2, errors=[...])
+    """
+
+    total_rows: int = Field(0, description="Filas de datos leídas (sin cabecera ni filas vacías)")
+    created: int = Field(0, description="Registros creados")
+    failed: int = Field(0, description="Filas rechazadas")
+    errors: list[ImportRowError] = Field(default_factory=list, description="Detalle de filas rechazadas")
+    errors_truncated: bool = Field(False, description="True si hubo más errores que los detallados")
+    ignored_columns: list[str] = Field(default_factory=list, description="Columnas del archivo que no se usaron")
+
+
+class ProductImportResult(ImportResult):
+    """Resumen de una importación de productos (POST /import/products)."""
+
+
+class CompanyImportResult(ImportResult):
+    """Resumen de una importación de empresas (POST /import/companies)."""
@@ -0,0 +1,35 @@
+"""
+Schemas de Pydantic para el historial de cambios.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import Field
+
+from src.shared.schemas.base import BaseSchema
+
+
+class ChangeHistoryResponse(BaseSchema):
+    """
+    Cambio registrado sobre una entidad.
+
+    Example:
+        {
+            "id": 12,
+            "entity_type": "quote",
+            "entity_id": 42,
+            "action": "update",
+            "changes": {"status_id": [1, 2], "total": ["100.00", "119.00"]},
+            "user_id": 1,
+            "ts": "2025-06-30T14:05:11.204512+00:00"
+        }
+    """
+
+    id: int
+    entity_type: str = Field(..., description="Tipo de entidad (quote, order, invoice_sii, invoice_export)")
+    entity_id: int = Field(..., description="ID de la entidad")
+    action: str = Field(..., description="create, update o delete")
+    changes: dict[str, list[Any]] = Field(..., description="Campo -> [valor anterior, valor nuevo]")
+    user_id: int | None = Field(None, description="Usuario que hizo el cambio")
+    ts: datetime = Field(..., description="Momento del cambio (UTC)")
@@ -41,6 +41,7 @@ from src.shared.schemas.lookups.lookup import (
     PaymentStatusCreate,
     PaymentStatusUpdate,
     PaymentStatusResponse,
+    LookupSnapshot,
 )
 
 __all__ = [
@@ -92,4 +93,6 @@ __all__ = [
     "PaymentStatusCreate",
     "PaymentStatusUpdate",
     "PaymentStatusResponse",
+    # Snapshot
+    "LookupSnapshot",
 ]
@@ -409,3 +409,27 @@ class PaymentStatusResponse(PaymentStatusBase):
     id: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# ========== SNAPSHOT ==========
+class LookupSnapshot(BaseModel):
+    """
+    All lookup tables in one payload.
+
+    ``version`` is a hash of the content: clients can keep the snapshot and
+    revalidate it with If-None-Match instead of downloading it again.
+    """
+
+    version: str = Field(..., description="Content hash; changes when any lookup row changes")
+    countries: list[CountryResponse]
+    cities: list[CityResponse]
+    company_types: list[CompanyTypeResponse]
+    incoterms: list[IncotermResponse]
+    currencies: list[CurrencyResponse]
+    units: list[UnitResponse]
+    family_types: list[FamilyTypeResponse]
+    matters: list[MatterResponse]
+    sales_types: list[SalesTypeResponse]
+    quote_statuses: list[QuoteStatusResponse]
+    order_statuses: list[OrderStatusResponse]
+    payment_statuses: list[PaymentStatusResponse]
@@ -0,0 +1,28 @@
+"""
+Schemas de Pydantic para la búsqueda full-text unificada.
+"""
+
+from pydantic import Field
+
+from src.shared.schemas.base import BaseSchema
+
+
+class SearchHit(BaseSchema):
+    """
+    Resultado de búsqueda.
+
+    Example:
+        {
+            "entity_type": "product",
+            "entity_id": 42,
+            "title": "TORN-M6-20",
+            "snippet": "Tornillo hexagonal M6 x 20 …",
+            "score": 3.71
+        }
+    """
+
+    entity_type: str = Field(..., description="Tipo de entidad (company, product, contact, staff, note, quote)")
+    entity_id: int = Field(..., description="ID de la entidad")
+    title: str = Field(..., description="Título del documento (nombre, referencia, etc.)")
+    snippet: str | None = Field(None, description="Fragmento del contenido que coincide")
+    score: float = Field(..., description="Relevancia (mayor = más relevante)")
@@ -0,0 +1,74 @@
+"""
+Schemas de Pydantic para estadísticas agregadas (dashboard).
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+from pydantic import Field
+
+from src.shared.schemas.base import BaseSchema
+
+
+class CompanyTypeCount(BaseSchema):
+    """Cantidad de empresas de un tipo."""
+
+    company_type_id: int
+    name: str
+    count: int
+
+
+class StatusCount(BaseSchema):
+    """Cantidad de documentos en un estado."""
+
+    code: str
+    count: int
+
+
+class MonthlyRevenue(BaseSchema):
+    """Facturación de un mes en CLP."""
+
+    year: int
+    month: int
+    revenue: Decimal = Field(..., description="Total facturado en CLP")
+    invoices: int = Field(..., description="Cantidad de facturas")
+
+
+class DashboardStats(BaseSchema):
+    """
+    KPIs del dashboard calculados en una sola llamada.
+
+    Example:
+        {
+            "clients_count": 120,
+            "providers_count": 45,
+            "products_count": 830,
+            "quotes_count": 12,
+            "orders_count": 310,
+            "open_orders_count": 27,
+            "overdue_invoices_count": 3,
+            "overdue_invoices_amount": "1250000.00",
+            ...
+        }
+    """
+
+    clients_count: int = Field(..., description="Empresas cliente")
+    providers_count: int = Field(..., description="Empresas proveedoras")
+    companies_by_type: list[CompanyTypeCount]
+
+    products_count: int = Field(..., description="Productos totales")
+    active_products_count: int = Field(..., description="Productos activos")
+
+    quotes_count: int = Field(..., description="Cotizaciones abiertas (borrador o enviadas)")
+    quotes_by_status: list[StatusCount]
+
+    orders_count: int = Field(..., description="Órdenes totales")
+    open_orders_count: int = Field(..., description="Órdenes no entregadas ni canceladas")
+    orders_by_status: list[StatusCount]
+
+    overdue_invoices_count: int = Field(..., description="Facturas vencidas no pagadas")
+    overdue_invoices_amount: Decimal = Field(..., description="Monto vencido en CLP")
+
+    revenue_by_month: list[MonthlyRevenue] = Field(..., description="Últimos 12 meses, del más antiguo al actual")
+
+    generated_at: datetime = Field(..., description="Momento del cálculo (puede venir de caché)")
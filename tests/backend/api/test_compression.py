@@ -0,0 +1,94 @@
+"""
+Tests para la serialización JSON y la compresión de respuestas.
+
+Usan una app FastAPI mínima, sin base de datos.
+"""
+
+from decimal import Decimal
+
+import httpx
+import pendulum
+import pytest
+from fastapi import FastAPI, Response
+
+from src.backend.api.compression import CompressionMiddleware, accepted_encodings
+from src.backend.api.responses import FastJSONResponse, dumps
+
+ROWS = [{"id": i, "reference": f"PROD-{i:04d}", "price": "10.00"} for i in range(200)]
+
+
+@pytest.fixture
+def client() -> httpx.AsyncClient:
+    """Cliente contra una app con FastJSONResponse y CompressionMiddleware."""
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/big")
+    async def big():
+        return ROWS
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/etag")
+    async def etag():
+        return Response(dumps(ROWS), media_type="application/json", headers={"ETag": '"abc"'})
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestFastJSONResponse:
+    """Tests para la serialización."""
+
+    def test_decimal_and_pendulum(self):
+        """Decimal como string (igual que los schemas) y fechas pendulum en ISO 8601."""
+        body = dumps({"total": Decimal("119.00"), "date": pendulum.datetime(2025, 1, 2, tz="UTC"), 1: "a"})
+
+        assert body == b'{"total":"119.00","date":"2025-01-02T00:00:00+00:00","1":"a"}'
+
+    def test_utf8(self):
+        """Escribe UTF-8 sin escapar, como JSONResponse."""
+        assert FastJSONResponse({"name": "Perú"}).body == '{"name":"Perú"}'.encode()
+
+
+class TestCompressionMiddleware:
+    """Tests para la compresión de respuestas."""
+
+    async def test_gzip_large_response(self, client):
+        """Respuestas sobre el umbral se comprimen con gzip."""
+        async with client:
+            response = await client.get("/big", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.num_bytes_downloaded < len(dumps(ROWS)) / 3
+        assert response.json() == ROWS
+
+    async def test_small_response_not_compressed(self, client):
+        """Respuestas bajo el umbral van sin comprimir."""
+        async with client:
+            response = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+
+    async def test_identity_when_not_accepted(self, client):
+        """Sin gzip aceptado (o con q=0) no se comprime."""
+        async with client:
+            response = await client.get("/big", headers={"Accept-Encoding": "gzip;q=0"})
+
+        assert "content-encoding" not in response.headers
+        assert response.content == dumps(ROWS)
+
+    async def test_compressed_etag_is_weak(self, client):
+        """El ETag de una respuesta comprimida pasa a ser débil."""
+        async with client:
+            response = await client.get("/etag", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["etag"] == 'W/"abc"'
+        assert response.json() == ROWS
+
+    def test_accepted_encodings(self):
+        """Parsea Accept-Encoding descartando q=0."""
+        assert accepted_encodings("gzip, deflate, br") == {"gzip", "deflate", "br"}
+        assert accepted_encodings("br;q=0, gzip;q=0.5") == {"gzip"}
+        assert accepted_encodings("") == set()
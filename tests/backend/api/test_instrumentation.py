@@ -0,0 +1,107 @@
+"""
+Tests para la instrumentación de requests (latencia, queries, N+1, /metrics).
+
+Usan una app FastAPI mínima con un engine SQLite en memoria.
+"""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from src.backend.api.instrumentation import InstrumentationMiddleware
+from src.backend.utils.metrics import MetricsRegistry, instrument_engine, statement_shape
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry(buckets=(0.1, 1.0))
+
+
+@pytest.fixture
+def client(registry) -> httpx.AsyncClient:
+    """Cliente contra una app instrumentada con endpoints sync y async."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    instrument_engine(engine)
+    instrument_engine(engine)  # idempotente
+
+    app = FastAPI()
+    app.add_middleware(InstrumentationMiddleware, registry=registry, n_plus_one_threshold=3)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT :id"), {"id": item_id})
+        return {"id": item_id}
+
+    @app.get("/lazy")
+    async def lazy():
+        with engine.connect() as conn:
+            for i in range(5):
+                conn.execute(text("SELECT :id"), {"id": i})
+        return {}
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestInstrumentationMiddleware:
+    """Tests para el middleware."""
+
+    async def test_server_timing_counts_queries(self, client):
+        """Server-Timing informa las queries de un endpoint def (threadpool)."""
+        async with client:
+            response = await client.get("/items/7")
+
+        timing = response.headers["server-timing"]
+        assert timing.startswith("app;dur=")
+        assert 'desc="2 queries"' in timing
+
+    async def test_registry_uses_route_template(self, client, registry):
+        """Las series se agrupan por plantilla de ruta, no por id."""
+        async with client:
+            await client.get("/items/1")
+            await client.get("/items/2")
+            await client.get("/missing")
+
+        output = registry.render()
+        assert 'akgroup_http_requests_total{method="GET",route="/items/{item_id}",status="200"} 2' in output
+        assert 'akgroup_http_requests_total{method="GET",route="unmatched",status="404"} 1' in output
+        assert 'akgroup_db_queries_total{method="GET",route="/items/{item_id}"} 4' in output
+        assert 'akgroup_http_request_duration_seconds_bucket{method="GET",route="/items/{item_id}",le="+Inf"} 2' in output
+        assert 'akgroup_http_request_duration_seconds_count{method="GET",route="/items/{item_id}"} 2' in output
+
+    async def test_n_plus_one_detected(self, client, registry):
+        """La misma forma de query más de N veces se cuenta como N+1 una vez."""
+        async with client:
+            response = await client.get("/lazy")
+
+        assert 'desc="5 queries"' in response.headers["server-timing"]
+        assert 'akgroup_n_plus_one_total{method="GET",route="/lazy"} 1' in registry.render()
+
+    async def test_no_n_plus_one_below_threshold(self, client, registry):
+        """Queries distintas no se avisan."""
+        async with client:
+            await client.get("/items/1")
+
+        assert 'akgroup_n_plus_one_total{method="GET",route="/items/{item_id}"} 0' in registry.render()
+
+
+class TestStatementShape:
+    """Tests para la normalización de sentencias."""
+
+    def test_collapses_literals_and_in_lists(self):
+        """Literales y listas de parámetros no cambian la forma."""
+        first = statement_shape("SELECT * FROM t WHERE id IN (?, ?, ?) AND name = 'a'")
+        second = statement_shape("SELECT *\n  FROM t WHERE id IN (?) AND name = 'b''c'")
+
+        assert first == second == "SELECT * FROM t WHERE id IN (?) AND name = ?"
+
+    def test_keeps_identifiers(self):
+        """Los números dentro de identificadores (alias) se mantienen."""
+        assert statement_shape("SELECT anon_1.id FROM anon_1 LIMIT 10") == "SELECT anon_1.id FROM anon_1 LIMIT ?"
+
+    def test_pyformat_placeholders(self):
+        """Las listas IN de pymysql (``%(name)s``) también se colapsan."""
+        assert statement_shape("WHERE id IN (%(id_1_1)s, %(id_1_2)s)") == "WHERE id IN (?)"
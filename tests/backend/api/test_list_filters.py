@@ -0,0 +1,198 @@
+"""
+Tests para los filtros de los listados de cotizaciones, órdenes y productos.
+
+Usan los routers reales sobre una base SQLite en archivo (engine síncrono y
+aiosqlite sobre el mismo archivo), sin el backend ejecutándose.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.backend.api.dependencies import (
+    TOTAL_COUNT_HEADER,
+    get_async_database,
+    get_database,
+)
+from src.backend.api.v1 import orders, products, quotes
+from src.backend.models.base import Base
+from src.backend.models.business.orders import Order
+from src.backend.models.business.quotes import Quote
+from src.backend.models.core.companies import Company
+from src.backend.models.core.products import Product
+from src.backend.models.core.staff import Staff
+from src.backend.models.lookups import (
+    City,
+    CompanyType,
+    Country,
+    Currency,
+    OrderStatus,
+    PaymentStatus,
+    QuoteStatus,
+)
+
+
+def _seed(session: Session) -> dict:
+    """Dos empresas con una cotización, una orden y un producto cada una."""
+    company_type = CompanyType(name="CLIENT")
+    country = Country(name="Chile", iso_code_alpha2="CL", iso_code_alpha3="CHL")
+    staff = Staff(username="filters", first_name="Fil", last_name="Ters", email="filters@test.com")
+    currency = Currency(code="CLP", name="Chilean Peso", symbol="$")
+    quote_status = QuoteStatus(code="draft", name="Draft")
+    order_status = OrderStatus(code="confirmed", name="Confirmed")
+    payment_status = PaymentStatus(code="pending", name="Pending")
+    session.add_all([company_type, country, staff, currency, quote_status, order_status, payment_status])
+    session.flush()
+    city = City(name="Santiago", country_id=country.id)
+    session.add(city)
+    session.flush()
+
+    companies = [
+        Company(name=name, trigram=trigram, company_type_id=company_type.id, country_id=country.id, city_id=city.id)
+        for name, trigram in [("Alpha SpA", "ALP"), ("Beta Ltda", "BET")]
+    ]
+    session.add_all(companies)
+    session.flush()
+
+    for i, company in enumerate(companies):
+        session.add_all([
+            Quote(
+                quote_number=f"Q-FIL-{i}",
+                subject=f"Cotización {i}",
+                company_id=company.id,
+                staff_id=staff.id,
+                currency_id=currency.id,
+                status_id=quote_status.id,
+                quote_date=date(2025, 1, 1 + i),
+                subtotal=Decimal("100.00"),
+                total=Decimal("119.00"),
+            ),
+            Order(
+                order_number=f"O-FIL-{i}",
+                order_type="sales",
+                company_id=company.id,
+                staff_id=staff.id,
+                currency_id=currency.id,
+                status_id=order_status.id,
+                payment_status_id=payment_status.id,
+                order_date=date(2025, 1, 1 + i),
+                subtotal=Decimal("100.00"),
+                total=Decimal("119.00"),
+            ),
+            Product(
+                product_type="article" if i == 0 else "service",
+                reference=f"FIL-{i}",
+                designation_es=f"Producto {i}",
+                company_id=company.id,
+                is_active=i == 0,
+            ),
+        ])
+    session.commit()
+    return {"company_id": companies[0].id}
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Archivo SQLite sembrado (ver _seed)."""
+    path = tmp_path / "filters.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.info["user_id"] = 1
+        ids = _seed(session)
+    engine.dispose()
+    return {"path": path, **ids}
+
+
+@pytest.fixture
+async def client(database):
+    """Cliente contra los routers de listados."""
+    engine = create_engine(f"sqlite:///{database['path']}")
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{database['path']}")
+
+    def database_override():
+        with Session(engine) as session:
+            yield session
+
+    async def async_database_override():
+        async with AsyncSession(async_engine) as session:
+            yield session
+
+    app = FastAPI()
+    for module in (quotes, orders, products):
+        app.include_router(module.router, prefix="/api/v1")
+    app.dependency_overrides[get_database] = database_override
+    app.dependency_overrides[get_async_database] = async_database_override
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+        yield http
+
+    await async_engine.dispose()
+    engine.dispose()
+
+
+class TestListFilters:
+    """Los filtros aplican aunque no se envíe sort, order ni q."""
+
+    async def test_quotes_company_filter_without_sort(self, client, database):
+        """GET /quotes?company_id= filtra sin sort ni q."""
+        # Act
+        response = await client.get("/api/v1/quotes/", params={"company_id": database["company_id"]})
+
+        # Assert
+        assert response.status_code == 200
+        assert [q["quote_number"] for q in response.json()] == ["Q-FIL-0"]
+        assert response.headers[TOTAL_COUNT_HEADER] == "1"
+
+    async def test_quotes_filter_with_skip(self, client, database):
+        """El filtro también aplica a las páginas OFFSET (skip > 0)."""
+        # Act
+        response = await client.get("/api/v1/quotes/", params={"company_id": database["company_id"], "skip": 1})
+
+        # Assert
+        assert response.json() == []
+
+    async def test_orders_company_filter_without_sort(self, client, database):
+        """GET /orders?company_id= filtra sin sort ni q."""
+        # Act
+        response = await client.get("/api/v1/orders/", params={"company_id": database["company_id"]})
+
+        # Assert
+        assert response.status_code == 200
+        assert [o["order_number"] for o in response.json()] == ["O-FIL-0"]
+
+    async def test_products_filters_without_sort(self, client):
+        """GET /products?product_type= y ?is_active= filtran sin sort ni q."""
+        # Act
+        by_type = await client.get("/api/v1/products/", params={"product_type": "service"})
+        inactive = await client.get("/api/v1/products/", params={"is_active": False})
+
+        # Assert
+        assert [p["reference"] for p in by_type.json()] == ["FIL-1"]
+        assert [p["reference"] for p in inactive.json()] == ["FIL-1"]
+
+    async def test_no_filter_keeps_keyset_page(self, client):
+        """Sin filtros ni orden se mantiene el listado por cursor (sin total)."""
+        # Act
+        response = await client.get("/api/v1/quotes/")
+
+        # Assert
+        assert len(response.json()) == 2
+        assert TOTAL_COUNT_HEADER not in response.headers
+
+    async def test_with_total_keeps_default_order(self, client):
+        """?with_total pide el total sin cambiar el orden por defecto (más reciente primero)."""
+        # Act
+        response = await client.get("/api/v1/quotes/", params={"with_total": True})
+        ascending = await client.get("/api/v1/quotes/", params={"with_total": True, "order": "asc"})
+
+        # Assert
+        assert [q["quote_number"] for q in response.json()] == ["Q-FIL-1", "Q-FIL-0"]
+        assert response.headers[TOTAL_COUNT_HEADER] == "2"
+        assert [q["quote_number"] for q in ascending.json()] == ["Q-FIL-0", "Q-FIL-1"]
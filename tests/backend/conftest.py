@@ -5,6 +5,7 @@ This module provides common fixtures for database setup, test data factories,
 and other test utilities for SQLAlchemy models testing.
 
 Fixtures:
+    strict_loading: Lazy loads outside a list's load profile raise (autouse)
     engine: SQLAlchemy engine with in-memory SQLite
     session: Database session for each test (auto-rollback)
     sample_country: Sample Country instance
@@ -45,6 +46,7 @@ from src.backend.models.lookups import (
 )
 from src.backend.models.core.companies import Company, CompanyRut, Plant
 from src.backend.models.business.quotes import Quote, QuoteProduct
+from src.backend.repositories.loading import set_strict_loading, strict_loading_enabled
 
 
 # Enable foreign keys in SQLite
@@ -56,6 +58,20 @@ def set_sqlite_pragma(dbapi_conn, connection_record):
     cursor.close()
 
 
+@pytest.fixture(autouse=True)
+def strict_loading() -> Generator[None, None, None]:
+    """
+    Make list queries raise on lazy loads missing from their load profile.
+
+    A list schema that reads a relationship the repository does not load
+    fails the test instead of silently running one query per row.
+    """
+    previous = strict_loading_enabled()
+    set_strict_loading(True)
+    yield
+    set_strict_loading(previous)
+
+
 @pytest.fixture(scope="function")
 def engine() -> Generator[Engine, None, None]:
     """
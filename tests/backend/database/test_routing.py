@@ -0,0 +1,197 @@
+"""
+Tests para el enrutamiento de lecturas a réplicas (RoutingSession).
+
+Usan dos archivos SQLite como primaria y réplica, con el mismo esquema y
+una fila distinta en cada uno: el nombre leído indica qué base respondió.
+"""
+
+from decimal import Decimal
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+import src.backend.database.session as database_session
+from src.backend.api.dependencies import get_database
+from src.backend.api.v1 import products
+from src.backend.database.routing import RoutingSession, mark_read_only, use_primary
+from src.backend.models.base import Base
+from src.backend.models.core.products import Product, ProductBOMRollup, ProductComponent, ProductType
+from src.backend.models.lookups import CompanyType
+
+
+@pytest.fixture
+def database_files(tmp_path):
+    """Primaria y réplica con una fila ``id=1`` distinta en cada una."""
+    paths = {"primary": tmp_path / "primary.db", "replica": tmp_path / "replica.db"}
+    for name, path in paths.items():
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(CompanyType(id=1, name=name.upper()))
+            session.commit()
+        engine.dispose()
+    return paths
+
+
+@pytest.fixture
+def session_factory(database_files):
+    """sessionmaker de RoutingSession sobre los dos archivos."""
+    primary = create_engine(f"sqlite:///{database_files['primary']}")
+    replica = create_engine(f"sqlite:///{database_files['replica']}")
+    yield sessionmaker(class_=RoutingSession, bind=primary, replicas=[replica], expire_on_commit=False)
+    primary.dispose()
+    replica.dispose()
+
+
+def read_name(session: Session) -> str:
+    """Nombre de la fila id=1 según la base que responda."""
+    return session.execute(select(CompanyType.name).filter(CompanyType.id == 1)).scalar_one()
+
+
+class TestRoutingSession:
+    """Tests para RoutingSession."""
+
+    def test_read_only_session_reads_replica(self, session_factory):
+        """Una sesión de solo lectura lee de la réplica."""
+        with session_factory() as session:
+            mark_read_only(session)
+            assert read_name(session) == "REPLICA"
+
+    def test_unmarked_session_reads_primary(self, session_factory):
+        """Sin marcar, todo va a la primaria."""
+        with session_factory() as session:
+            assert read_name(session) == "PRIMARY"
+
+    def test_read_after_write_goes_to_primary(self, session_factory):
+        """Tras la primera escritura la sesión lee lo que escribió."""
+        with session_factory() as session:
+            mark_read_only(session)
+            assert read_name(session) == "REPLICA"
+
+            session.add(CompanyType(name="NEW"))
+            session.flush()
+
+            assert read_name(session) == "PRIMARY"
+            assert session.execute(select(CompanyType).filter_by(name="NEW")).scalar_one()
+            session.commit()
+
+    def test_select_for_update_goes_to_primary(self, session_factory):
+        """Un SELECT ... FOR UPDATE no se envía a la réplica."""
+        with session_factory() as session:
+            mark_read_only(session)
+            stmt = select(CompanyType.name).filter(CompanyType.id == 1).with_for_update()
+            assert session.execute(stmt).scalar_one() == "PRIMARY"
+
+    def test_without_replicas_behaves_like_session(self, database_files):
+        """Sin réplicas configuradas la marca no cambia nada."""
+        engine = create_engine(f"sqlite:///{database_files['primary']}")
+        with sessionmaker(class_=RoutingSession, bind=engine)() as session:
+            mark_read_only(session)
+            assert read_name(session) == "PRIMARY"
+        engine.dispose()
+
+    def test_use_primary_after_read_only(self, session_factory):
+        """use_primary devuelve las lecturas de una sesión marcada a la primaria."""
+        with session_factory() as session:
+            mark_read_only(session)
+            assert read_name(session) == "REPLICA"
+
+            use_primary(session)
+
+            assert read_name(session) == "PRIMARY"
+
+    async def test_async_session_reads_replica(self, database_files):
+        """AsyncSession con RoutingSession usa el engine síncrono de la réplica."""
+        primary = create_async_engine(f"sqlite+aiosqlite:///{database_files['primary']}")
+        replica = create_async_engine(f"sqlite+aiosqlite:///{database_files['replica']}")
+        factory = async_sessionmaker(
+            bind=primary, class_=AsyncSession, sync_session_class=RoutingSession,
+            replicas=[replica.sync_engine],
+        )
+
+        async with factory() as session:
+            mark_read_only(session.sync_session)
+            result = await session.execute(select(CompanyType.name).filter(CompanyType.id == 1))
+            assert result.scalar_one() == "REPLICA"
+
+        await primary.dispose()
+        await replica.dispose()
+
+
+class TestRequestRouting:
+    """Tests para el marcado por método HTTP en get_database."""
+
+    @pytest.fixture
+    def client(self, session_factory, monkeypatch) -> httpx.AsyncClient:
+        monkeypatch.setattr(database_session, "SessionLocal", session_factory)
+        app = FastAPI()
+
+        @app.get("/name")
+        def get_name(db: Session = Depends(get_database)):
+            return {"name": read_name(db)}
+
+        @app.post("/name")
+        def post_name(db: Session = Depends(get_database)):
+            return {"name": read_name(db)}
+
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    async def test_get_reads_replica(self, client):
+        """GET lee de la réplica."""
+        async with client:
+            response = await client.get("/name")
+
+        assert response.json() == {"name": "REPLICA"}
+
+    async def test_post_reads_primary(self, client):
+        """POST lee y escribe en la primaria."""
+        async with client:
+            response = await client.post("/name")
+
+        assert response.json() == {"name": "PRIMARY"}
+
+
+class TestMaterializedReads:
+    """Los datos derivados que guarda un GET se calculan desde la primaria."""
+
+    @pytest.fixture
+    def bom_files(self, database_files):
+        """TOP -> 4 x BOLT en ambas bases; la réplica tiene el costo anterior de BOLT."""
+        for name, cost in (("primary", "2.00"), ("replica", "1.50")):
+            engine = create_engine(f"sqlite:///{database_files[name]}")
+            with Session(engine) as session:
+                session.info["user_id"] = 1
+                top = Product(id=1, product_type=ProductType.NOMENCLATURE, reference="TOP")
+                bolt = Product(id=2, product_type=ProductType.ARTICLE, reference="BOLT", cost_price=Decimal(cost))
+                session.add_all([top, bolt])
+                session.flush()
+                session.add(ProductComponent(parent_id=top.id, component_id=bolt.id, quantity=Decimal("4")))
+                session.commit()
+            engine.dispose()
+        return database_files
+
+    @pytest.fixture
+    def client(self, bom_files, session_factory, monkeypatch) -> httpx.AsyncClient:
+        monkeypatch.setattr(database_session, "SessionLocal", session_factory)
+        app = FastAPI()
+        app.include_router(products.router, prefix="/api/v1")
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    async def test_bom_cost_rollup_uses_primary(self, client, bom_files):
+        """GET /bom-cost con réplica atrasada calcula y guarda el costo de la primaria."""
+        # Act
+        async with client:
+            first = await client.get("/api/v1/products/1/bom-cost")
+            second = await client.get("/api/v1/products/1/bom-cost")
+
+        # Assert
+        assert Decimal(str(first.json()["total_cost"])) == Decimal("8.00")
+        assert Decimal(str(second.json()["total_cost"])) == Decimal("8.00")
+        engine = create_engine(f"sqlite:///{bom_files['primary']}")
+        with Session(engine) as session:
+            assert session.get(ProductBOMRollup, 1).cost == Decimal("8.00")
+        engine.dispose()
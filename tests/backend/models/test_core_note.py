@@ -676,6 +676,38 @@ class TestNoteMixins:
 
         assert note.created_by_id == 1
 
+    def test_audit_mixin_keeps_explicit_created_by(self, session):
+        """Test AuditMixin does not overwrite audit fields set by hand."""
+        note = Note(entity_type="company", entity_id=1, content="Imported", created_by_id=7)
+        session.add(note)
+        session.commit()
+
+        assert note.created_by_id == 7
+        assert note.updated_by_id == 1
+
+    def test_audit_mixin_sets_updated_by_on_update(self, session):
+        """Test AuditMixin sets updated_by_id when a note is modified."""
+        note = Note(entity_type="company", entity_id=1, content="Test note")
+        session.add(note)
+        session.commit()
+
+        session.info["user_id"] = 2
+        note.content = "Edited"
+        session.commit()
+
+        assert note.created_by_id == 1
+        assert note.updated_by_id == 2
+
+    def test_audit_mixin_without_session_user(self, session):
+        """Test AuditMixin leaves audit fields empty without a session user."""
+        session.info.pop("user_id")
+        note = Note(entity_type="company", entity_id=1, content="Test note")
+        session.add(note)
+        session.commit()
+
+        assert note.created_by_id is None
+        assert note.updated_by_id is None
+
 
 class TestNoteRepr:
     """Tests for Note __repr__ method."""
@@ -8,12 +8,15 @@ from datetime import date, timedelta
 from decimal import Decimal
 
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import Session
 
 from src.backend.models.business.invoices import InvoiceSII, InvoiceExport
 from src.backend.models.business.orders import Order
 from src.backend.models.core.staff import Staff
 from src.backend.models.lookups import OrderStatus, PaymentStatus
+from src.backend.repositories.loading import set_strict_loading
+from src.shared.schemas.business.invoice import InvoiceSIIListResponse
 
 
 # ===================== FIXTURES =====================
@@ -283,6 +286,57 @@ class TestInvoiceSIIRepositoryGetByPaymentStatus:
         assert results == []
 
 
+class TestInvoiceSIIRepositoryListProjection:
+    """Tests para la proyección de columnas de los listados."""
+
+    @pytest.fixture
+    def invoice_with_xml(self, sample_invoice_sii, session) -> InvoiceSII:
+        sample_invoice_sii.sii_xml = "<DTE>" + "x" * 1000 + "</DTE>"
+        sample_invoice_sii.notes = "Factura con XML"
+        session.commit()
+        session.refresh(sample_invoice_sii)
+        session.expunge_all()
+        return sample_invoice_sii
+
+    def test_list_defers_heavy_columns(self, invoice_sii_repository, invoice_with_xml):
+        """Test que los listados no cargan sii_xml ni notes."""
+        # Act
+        page, _ = invoice_sii_repository.get_list()
+
+        # Assert
+        assert "sii_xml" not in page[0].__dict__
+        assert "notes" not in page[0].__dict__
+        assert InvoiceSIIListResponse.model_validate(page[0]).invoice_number == "F-2025-001"
+
+    def test_strict_list_raises_on_deferred_column(self, invoice_sii_repository, invoice_with_xml):
+        """Test que leer una columna diferida falla con carga estricta."""
+        # Act
+        invoices = invoice_sii_repository.get_by_company(invoice_with_xml.company_id)
+
+        # Assert
+        with pytest.raises(InvalidRequestError):
+            invoices[0].sii_xml
+
+    def test_deferred_column_loads_when_not_strict(self, invoice_sii_repository, invoice_with_xml):
+        """Test que sin carga estricta la columna diferida se carga al leerla."""
+        # Arrange
+        set_strict_loading(False)
+
+        # Act
+        invoices = invoice_sii_repository.get_all()
+
+        # Assert
+        assert invoices[0].sii_xml.startswith("<DTE>")
+
+    def test_detail_loads_heavy_columns(self, invoice_sii_repository, invoice_with_xml):
+        """Test que la búsqueda por número carga la factura completa."""
+        # Act
+        result = invoice_sii_repository.get_by_invoice_number("F-2025-001")
+
+        # Assert
+        assert result.notes == "Factura con XML"
+
+
 # ===================== INVOICE EXPORT REPOSITORY TESTS =====================
 
 
@@ -224,6 +224,47 @@ class TestOrderRepositoryGetWithProducts:
         assert result is None
 
 
+class TestOrderRepositoryRecomputeTotals:
+    """Tests para recompute_totals()."""
+
+    def test_total_includes_costs(
+        self, order_repository, sample_order, sample_order_product, session
+    ):
+        """Test que el total suma impuesto, flete y otros costos."""
+        # Arrange
+        sample_order_product.quantity = Decimal("4.000")
+        sample_order.shipping_cost = Decimal("50.00")
+        sample_order.other_costs = Decimal("10.00")
+        session.commit()
+
+        # Act
+        count = order_repository.recompute_totals(order_ids=[sample_order.id])
+
+        # Assert - 4 * 100 = 400; 19% = 76; 400 + 76 + 50 + 10
+        assert count == 1
+        assert sample_order_product.subtotal == Decimal("400.00")
+        assert sample_order.subtotal == Decimal("400.00")
+        assert sample_order.tax_amount == Decimal("76.00")
+        assert sample_order.total == Decimal("536.00")
+
+    def test_order_without_lines_keeps_subtotal(self, order_repository, sample_order, session):
+        """Test que una orden sin líneas conserva su subtotal, como Order.calculate_totals."""
+        # Arrange
+        sample_order.shipping_cost = Decimal("50.00")
+        session.commit()
+
+        # Act
+        order_repository.recompute_totals(order_ids=[sample_order.id])
+
+        # Assert
+        assert sample_order.subtotal == Decimal("1000.00")
+        assert sample_order.total == Decimal("1240.00")
+
+    def test_unknown_order_updates_nothing(self, order_repository):
+        """Test que un ID inexistente no actualiza filas."""
+        assert order_repository.recompute_totals(order_ids=[99999]) == 0
+
+
 class TestOrderRepositoryGetByCompany:
     """Tests para get_by_company()."""
 
@@ -13,6 +13,9 @@ from sqlalchemy.orm import Session
 from src.backend.models.business.quotes import Quote, QuoteProduct
 from src.backend.models.core.staff import Staff
 from src.backend.models.lookups import OrderStatus, PaymentStatus
+from src.backend.services.base import list_adapter
+from src.backend.services.business.quote_service import QuoteService
+from src.shared.schemas.business.quote import QuoteListResponse
 
 
 # ===================== FIXTURES =====================
@@ -268,6 +271,70 @@ class TestQuoteRepositoryGetWithProducts:
         assert result is None
 
 
+class TestQuoteRepositoryRecomputeTotals:
+    """Tests para recompute_totals()."""
+
+    def test_recomputes_lines_and_totals(
+        self, quote_repository, sample_quote, sample_product, session
+    ):
+        """Test que recalcula subtotales de línea, impuesto y total en SQL."""
+        # Arrange - subtotales guardados desactualizados
+        session.add_all([
+            QuoteProduct(
+                quote_id=sample_quote.id, product_id=sample_product.id, sequence=1,
+                quantity=Decimal("3.000"), unit_price=Decimal("15.50"),
+                discount_percentage=Decimal("10.00"), subtotal=Decimal("0.00"),
+            ),
+            QuoteProduct(
+                quote_id=sample_quote.id, product_id=sample_product.id, sequence=2,
+                quantity=Decimal("2.000"), unit_price=Decimal("100.00"), subtotal=Decimal("0.00"),
+            ),
+        ])
+        session.commit()
+
+        # Act
+        count = quote_repository.recompute_totals(quote_ids=[sample_quote.id])
+
+        # Assert - 3 * 15.50 = 46.50 - 4.65 de descuento; 19% de 241.85 = 45.95
+        assert count == 1
+        assert [(p.discount_amount, p.subtotal) for p in sample_quote.products] == [
+            (Decimal("4.65"), Decimal("41.85")),
+            (Decimal("0.00"), Decimal("200.00")),
+        ]
+        assert sample_quote.subtotal == Decimal("241.85")
+        assert sample_quote.tax_amount == Decimal("45.95")
+        assert sample_quote.total == Decimal("287.80")
+
+    def test_quote_without_lines_is_zeroed(self, quote_repository, sample_quote):
+        """Test que una cotización sin líneas queda en cero."""
+        # Act
+        quote_repository.recompute_totals(quote_ids=[sample_quote.id])
+
+        # Assert
+        assert sample_quote.subtotal == Decimal("0.00")
+        assert sample_quote.total == Decimal("0.00")
+
+    def test_date_range_filter(
+        self, quote_repository, sample_company, sample_staff, sample_currency,
+        sample_quote_status, session
+    ):
+        """Test que el recálculo masivo solo toca las cotizaciones del rango."""
+        # Arrange - fechas today, today-1, today-2
+        quotes = create_test_quotes(
+            session, quote_repository, sample_company, sample_staff,
+            sample_currency, sample_quote_status, count=3,
+        )
+
+        # Act
+        count = quote_repository.recompute_totals(
+            company_id=sample_company.id, date_from=date.today() - timedelta(days=1)
+        )
+
+        # Assert
+        assert count == 2
+        assert [q.total for q in quotes] == [Decimal("0.00"), Decimal("0.00"), Decimal("3570.00")]
+
+
 class TestQuoteRepositoryGetByCompany:
     """Tests para get_by_company()."""
 
@@ -608,3 +675,109 @@ class TestQuoteProductRepositoryDeleteByQuote:
 
         # Assert
         assert deleted_count == 0
+
+
+class TestQuoteRepositoryGetPage:
+    """Tests para get_page() (paginación keyset)."""
+
+    def test_get_page_newest_first(
+        self,
+        quote_repository,
+        sample_company,
+        sample_staff,
+        sample_currency,
+        sample_quote_status,
+        session,
+    ):
+        """Test que get_page ordena por quote_date desc y pagina con cursor."""
+        # Arrange
+        quotes = create_test_quotes(
+            session,
+            quote_repository,
+            sample_company,
+            sample_staff,
+            sample_currency,
+            sample_quote_status,
+            count=5,
+        )
+
+        # Act
+        page1, cursor = quote_repository.get_page(limit=3)
+        page2, last_cursor = quote_repository.get_page(limit=3, after=cursor)
+
+        # Assert - create_test_quotes crea fechas decrecientes
+        assert [q.id for q in page1 + page2] == [q.id for q in quotes]
+        assert cursor is not None
+        assert last_cursor is None
+        assert page1[0].company.name == sample_company.name
+
+
+class TestQuoteRepositoryListRows:
+    """Tests para get_list_rows() (fast path de listados)."""
+
+    def test_rows_match_orm_list(
+        self,
+        quote_repository,
+        sample_company,
+        sample_staff,
+        sample_currency,
+        sample_quote_status,
+        session,
+    ):
+        """Test que filas y entidades producen el mismo QuoteListResponse."""
+        # Arrange
+        create_test_quotes(
+            session,
+            quote_repository,
+            sample_company,
+            sample_staff,
+            sample_currency,
+            sample_quote_status,
+            count=4,
+        )
+
+        # Act
+        rows, total = quote_repository.get_list_rows(sort="total", descending=True, skip=1, limit=2)
+        quotes, orm_total = quote_repository.get_list(sort="total", descending=True, skip=1, limit=2)
+
+        # Assert
+        assert total == orm_total == 4
+        assert list_adapter(QuoteListResponse).validate_python(rows) == [
+            QuoteService._convert_to_list_response(q) for q in quotes
+        ]
+        assert rows[0]["company_name"] == sample_company.name
+
+    def test_offset_pages_follow_keyset_order(
+        self,
+        quote_repository,
+        sample_company,
+        sample_staff,
+        sample_currency,
+        sample_quote_status,
+        session,
+    ):
+        """Test que get_all (OFFSET) usa el mismo orden por fecha que get_page (keyset)."""
+        # Arrange - la primera cotización creada pasa a ser la más antigua
+        quotes = create_test_quotes(
+            session,
+            quote_repository,
+            sample_company,
+            sample_staff,
+            sample_currency,
+            sample_quote_status,
+            count=3,
+        )
+        quotes[0].quote_date = date.today() - timedelta(days=10)
+        session.commit()
+        service = QuoteService(quote_repository, session)
+
+        # Act
+        keyset, _ = service.get_page(limit=3)
+        first = service.get_all(skip=0, limit=3)
+        offset = service.get_all(skip=1, limit=2)
+
+        # Assert
+        expected = [quotes[1].id, quotes[2].id, quotes[0].id]
+        assert [q.id for q in keyset] == expected
+        assert [q.id for q in first] == expected
+        assert [q.id for q in offset] == expected[1:]
@@ -6,7 +6,11 @@ datos de ejemplo, y utilidades comunes para tests de la capa de acceso a datos.
 """
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.backend.models.base import Base
 
 from src.backend.repositories.base import BaseRepository
 from src.backend.repositories.core.company_repository import (
@@ -415,3 +419,35 @@ def create_test_products(session: Session, product_repository: ProductRepository
         return products
 
     return _create
+
+
+# ===================== ASYNC FIXTURES =====================
+
+
+@pytest.fixture
+async def async_engine():
+    """
+    Engine aiosqlite en memoria para tests de repositorios asíncronos.
+
+    StaticPool mantiene una única conexión para que la base en memoria
+    sobreviva entre las operaciones del test.
+    """
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def async_session(async_engine) -> AsyncSession:
+    """Sesión asíncrona con contexto de usuario para auditoría."""
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        session.info["user_id"] = 1
+        yield session
+
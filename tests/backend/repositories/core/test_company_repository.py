@@ -9,6 +9,9 @@ from sqlalchemy.exc import IntegrityError
 
 from src.backend.models.core.companies import Company, CompanyRut, Plant
 from src.backend.exceptions.repository import NotFoundException
+from src.backend.services.base import list_adapter
+from src.backend.services.core.company_service import CompanyService
+from src.shared.schemas.core.company import CompanyResponse
 
 
 # ===================== COMPANY REPOSITORY TESTS =====================
@@ -343,6 +346,41 @@ class TestCompanyRepositoryGetByType:
         assert len(results_from_created) == 7  # 10 creadas - 3 skip
 
 
+class TestCompanyRepositoryListRows:
+    """Tests para get_rows()/get_list_rows() (fast path de listados)."""
+
+    def test_rows_match_enriched_response(self, company_repository, sample_company, session):
+        """Test que las filas producen la misma respuesta que la entidad enriquecida."""
+        # Arrange
+        session.info["user_id"] = 1
+        sample_company.phone = "+56900000000"
+        session.commit()
+        expected = CompanyResponse.model_validate(CompanyService._enrich_company_response(sample_company))
+
+        # Act
+        rows, total = company_repository.get_list_rows(filters={"company_type_id": sample_company.company_type_id})
+
+        # Assert
+        assert total == 1
+        assert list_adapter(CompanyResponse).validate_python(rows) == [expected]
+        assert rows[0]["country_name"] is not None
+        assert rows[0]["updated_by"] == 1
+
+    def test_rows_without_optional_relations(self, company_repository, create_test_companies):
+        """Test que las relaciones opcionales ausentes quedan en None (OUTER JOIN)."""
+        # Arrange
+        create_test_companies(3)
+
+        # Act
+        rows = company_repository.get_rows(search="Test Company 2")
+
+        # Assert
+        assert len(rows) == 1
+        assert rows[0]["name"] == "Test Company 2"
+        assert rows[0]["city_name"] is None
+        assert rows[0]["company_type"] is not None
+
+
 # ===================== COMPANY RUT REPOSITORY TESTS =====================
 
 
@@ -6,10 +6,17 @@ Valida funcionalidad CRUD base más métodos específicos de Product y BOM.
 
 import pytest
 from decimal import Decimal
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
-from src.backend.models.core.products import Product, ProductComponent, ProductType
+from src.backend.models.core.products import (
+    Product,
+    ProductBOMClosure,
+    ProductComponent,
+    ProductType,
+)
 from src.backend.exceptions.repository import NotFoundException
+from src.backend.repositories.loading import LoadProfile
 
 
 # ===================== PRODUCT REPOSITORY TESTS =====================
@@ -50,6 +57,36 @@ class TestProductRepositoryGetByReference:
         assert result.id == sample_product.id
 
 
+class TestProductRepositoryLoadProfiles:
+    """Tests para los perfiles de carga de Product."""
+
+    def test_list_loads_response_relationships(
+        self, product_repository, sample_product, session
+    ):
+        """Test que el perfil LIST carga todo lo que serializa ProductResponse."""
+        # Arrange
+        session.expunge_all()
+
+        # Act
+        page, _ = product_repository.get_list()
+
+        # Assert
+        loaded = page[0].__dict__
+        for name in ("family_type", "matter", "sales_type", "company", "components", "parent_components"):
+            assert name in loaded
+
+    def test_detail_profile_on_get_by_id(self, product_repository, sample_product, session):
+        """Test que get_by_id con DETAIL carga el BOM."""
+        # Arrange
+        session.expunge_all()
+
+        # Act
+        product = product_repository.get_by_id(sample_product.id, profile=LoadProfile.DETAIL)
+
+        # Assert
+        assert "components" in product.__dict__
+
+
 class TestProductRepositorySearch:
     """Tests para search()."""
 
@@ -722,3 +759,157 @@ class TestProductComponentRepositoryDeleteComponent:
         assert (
             product_component_repository.get_component(parent.id, comp2.id) is not None
         )
+
+
+class TestProductComponentRepositoryGetBomGraph:
+    """Tests para get_bom_graph()."""
+
+    def test_get_bom_graph_loads_all_levels(
+        self,
+        product_repository,
+        product_component_repository,
+        sample_family_type,
+        session,
+    ):
+        """Test que carga todos los niveles del BOM en una sola query."""
+        # Arrange - ROOT -> SUB -> LEAF, ROOT -> LEAF
+        root = Product(
+            product_type=ProductType.NOMENCLATURE,
+            reference="ROOT",
+            family_type_id=sample_family_type.id,
+        )
+        sub = Product(
+            product_type=ProductType.NOMENCLATURE,
+            reference="SUB",
+            family_type_id=sample_family_type.id,
+        )
+        leaf = Product(
+            product_type=ProductType.ARTICLE,
+            reference="LEAF",
+            family_type_id=sample_family_type.id,
+            cost_price=Decimal("2.00"),
+        )
+        other = Product(
+            product_type=ProductType.ARTICLE,
+            reference="OTHER",
+            family_type_id=sample_family_type.id,
+        )
+        for product in (root, sub, leaf, other):
+            product_repository.create(product)
+        for parent, component, quantity in (
+            (root, sub, "2"),
+            (sub, leaf, "3"),
+            (root, leaf, "1"),
+        ):
+            product_component_repository.create(
+                ProductComponent(
+                    parent_id=parent.id,
+                    component_id=component.id,
+                    quantity=Decimal(quantity),
+                )
+            )
+        session.commit()
+
+        # Act
+        rows = product_component_repository.get_bom_graph(root.id)
+
+        # Assert
+        edges = {(r.id, r.component_id) for r in rows}
+        assert edges == {
+            (root.id, sub.id),
+            (root.id, leaf.id),
+            (sub.id, leaf.id),
+            (leaf.id, None),
+        }
+        assert other.id not in {r.id for r in rows}
+
+    def test_get_bom_graph_article_without_components(
+        self, product_component_repository, sample_product
+    ):
+        """Test que un producto sin componentes retorna una sola fila."""
+        rows = product_component_repository.get_bom_graph(sample_product.id)
+
+        assert len(rows) == 1
+        assert rows[0].id == sample_product.id
+        assert rows[0].component_id is None
+
+    def test_get_bom_graph_not_found(self, product_component_repository):
+        """Test que retorna lista vacía si el producto no existe."""
+        assert product_component_repository.get_bom_graph(99999) == []
+
+
+class TestProductComponentRepositoryClosure:
+    """Tests para el cierre transitivo: is_in_bom(), get_where_used(), rebuild_closure()."""
+
+    @pytest.fixture
+    def diamond(self, product_repository, product_component_repository, sample_family_type, session):
+        """TOP -> LEFT -> BASE, TOP -> RIGHT -> BASE, TOP -> BASE."""
+        products = {}
+        for reference in ("TOP", "LEFT", "RIGHT", "BASE"):
+            products[reference] = product_repository.create(
+                Product(
+                    product_type=ProductType.NOMENCLATURE,
+                    reference=reference,
+                    family_type_id=sample_family_type.id,
+                )
+            )
+        for parent, component in (
+            ("TOP", "LEFT"),
+            ("TOP", "RIGHT"),
+            ("TOP", "BASE"),
+            ("LEFT", "BASE"),
+            ("RIGHT", "BASE"),
+        ):
+            product_component_repository.create(
+                ProductComponent(
+                    parent_id=products[parent].id,
+                    component_id=products[component].id,
+                    quantity=Decimal("1"),
+                )
+            )
+        session.commit()
+        return products
+
+    @staticmethod
+    def _closure(session):
+        rows = session.execute(
+            select(
+                ProductBOMClosure.ancestor_id,
+                ProductBOMClosure.descendant_id,
+                ProductBOMClosure.path_count,
+            )
+        ).all()
+        return {(a, d): n for a, d, n in rows}
+
+    def test_closure_counts_paths(self, product_component_repository, diamond, session):
+        """Test que el cierre cuenta todos los caminos entre pares."""
+        closure = self._closure(session)
+
+        assert closure[(diamond["TOP"].id, diamond["BASE"].id)] == 3
+        assert closure[(diamond["LEFT"].id, diamond["BASE"].id)] == 1
+        assert product_component_repository.is_in_bom(diamond["TOP"].id, diamond["BASE"].id)
+        assert not product_component_repository.is_in_bom(diamond["BASE"].id, diamond["TOP"].id)
+
+    def test_delete_component_keeps_other_paths(self, product_component_repository, diamond, session):
+        """Test que quitar una arista conserva los pares con otros caminos."""
+        product_component_repository.delete_component(diamond["LEFT"].id, diamond["BASE"].id)
+
+        closure = self._closure(session)
+        assert closure[(diamond["TOP"].id, diamond["BASE"].id)] == 2
+        assert (diamond["LEFT"].id, diamond["BASE"].id) not in closure
+
+    def test_get_where_used_is_transitive(self, product_component_repository, diamond):
+        """Test que where-used incluye ancestros indirectos."""
+        used_in = product_component_repository.get_where_used(diamond["BASE"].id)
+
+        assert [p.reference for p in used_in] == ["LEFT", "RIGHT", "TOP"]
+        assert product_component_repository.get_where_used(diamond["TOP"].id) == []
+
+    def test_rebuild_closure_matches_maintained(self, product_component_repository, diamond, session):
+        """Test que la reconstrucción produce el mismo cierre que los eventos."""
+        maintained = self._closure(session)
+
+        total = product_component_repository.rebuild_closure()
+
+        assert total == len(maintained)
+        assert self._closure(session) == maintained
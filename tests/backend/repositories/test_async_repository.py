@@ -0,0 +1,329 @@
+"""
+Tests para los repositorios asíncronos (AsyncSession).
+
+Valida que AsyncBaseRepository y los repositorios async de Company y Quote
+devuelven los mismos resultados que sus equivalentes síncronos.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.backend.exceptions.repository import NotFoundException
+from src.backend.exceptions.service import ValidationException
+from src.backend.models.business.quotes import Quote
+from src.backend.models.core.addresses import Address
+from src.backend.models.core.companies import Company, CompanyRut, Plant
+from src.backend.models.core.contacts import Contact
+from src.backend.models.core.notes import Note
+from src.backend.models.core.staff import Staff
+from src.backend.models.lookups import City, CompanyType, Country, Currency, QuoteStatus
+from src.backend.repositories.async_base import AsyncBaseRepository
+from src.backend.repositories.business.quote_repository import AsyncQuoteRepository
+from src.backend.repositories.core.company_repository import AsyncCompanyRepository
+from src.backend.services.business.quote_service import AsyncQuoteService
+from src.backend.services.core.company_service import AsyncCompanyService
+from src.shared.enums import AddressType, NotePriority
+
+# ===================== FIXTURES =====================
+
+
+def _seed(session) -> dict:
+    """Crea lookups, 3 empresas (una inactiva) y 2 cotizaciones."""
+    company_type = CompanyType(name="CLIENT")
+    country = Country(name="Chile", iso_code_alpha2="CL", iso_code_alpha3="CHL")
+    session.add_all([company_type, country])
+    session.flush()
+    city = City(name="Santiago", country_id=country.id)
+    staff = Staff(
+        username="async_staff",
+        first_name="Async",
+        last_name="Staff",
+        email="async@test.com",
+        is_active=True,
+    )
+    currency = Currency(code="CLP", name="Chilean Peso", symbol="$", is_active=True)
+    status = QuoteStatus(code="draft", name="Draft")
+    session.add_all([city, staff, currency, status])
+    session.flush()
+
+    companies = [
+        Company(
+            name=name,
+            trigram=trigram,
+            company_type_id=company_type.id,
+            country_id=country.id,
+            city_id=city.id,
+            is_active=is_active,
+        )
+        for name, trigram, is_active in [
+            ("Alpha SpA", "ALP", True),
+            ("Beta Ltda", "BET", True),
+            ("Gamma SA", "GAM", False),
+        ]
+    ]
+    session.add_all(companies)
+    session.flush()
+
+    quotes = [
+        Quote(
+            quote_number=f"Q-ASYNC-{i:03d}",
+            subject=f"Async Quote {i}",
+            company_id=companies[0].id,
+            staff_id=staff.id,
+            currency_id=currency.id,
+            status_id=status.id,
+            quote_date=date.today() - timedelta(days=i),
+            subtotal=Decimal("100.00"),
+            tax_amount=Decimal("19.00"),
+            total=Decimal("119.00"),
+        )
+        for i in range(2)
+    ]
+    session.add_all(quotes)
+    session.flush()
+
+    return {
+        "company_type_id": company_type.id,
+        "company_ids": [c.id for c in companies],
+        "quote_ids": [q.id for q in quotes],
+    }
+
+
+@pytest.fixture
+async def seeded(async_session: AsyncSession) -> dict:
+    """Datos de prueba creados a través de la sesión asíncrona."""
+    ids = await async_session.run_sync(_seed)
+    await async_session.commit()
+    return ids
+
+
+# ===================== ASYNC BASE REPOSITORY =====================
+
+
+class TestAsyncBaseRepository:
+    """Tests para operaciones CRUD de AsyncBaseRepository."""
+
+    async def test_get_by_id(self, async_session, seeded):
+        repo = AsyncBaseRepository(async_session, Company)
+
+        company = await repo.get_by_id(seeded["company_ids"][0])
+
+        assert company is not None
+        assert company.trigram == "ALP"
+        assert await repo.get_by_id(99999) is None
+
+    async def test_get_all_and_count(self, async_session, seeded):
+        repo = AsyncBaseRepository(async_session, Company)
+
+        companies = await repo.get_all(skip=1, limit=10, order_by="name")
+
+        assert [c.trigram for c in companies] == ["BET", "GAM"]
+        assert await repo.count() == 3
+
+    async def test_find_by(self, async_session, seeded):
+        repo = AsyncBaseRepository(async_session, Company)
+
+        inactive = await repo.find_by(filters={"is_active": False})
+
+        assert [c.trigram for c in inactive] == ["GAM"]
+
+    async def test_exists(self, async_session, seeded):
+        repo = AsyncBaseRepository(async_session, Company)
+
+        assert await repo.exists(seeded["company_ids"][0]) is True
+        assert await repo.exists(99999) is False
+
+    async def test_create_and_delete(self, async_session, seeded):
+        repo = AsyncBaseRepository(async_session, Company)
+        company = Company(
+            name="Delta SpA",
+            trigram="DEL",
+            company_type_id=seeded["company_type_id"],
+        )
+
+        created = await repo.create(company)
+        assert created.id is not None
+        assert created.created_by_id == 1
+
+        await repo.delete(created.id)
+        assert await repo.get_by_id(created.id) is None
+
+    async def test_delete_not_found(self, async_session, seeded):
+        repo = AsyncBaseRepository(async_session, Company)
+
+        with pytest.raises(NotFoundException):
+            await repo.delete(99999)
+
+    async def test_update_many(self, async_session, seeded):
+        repo = AsyncBaseRepository(async_session, Company)
+
+        updated = await repo.update_many(seeded["company_ids"][:2], {"is_active": False})
+
+        assert updated == 2
+        assert len(await repo.find_by(filters={"is_active": False})) == 3
+
+
+# ===================== ASYNC COMPANY / QUOTE =====================
+
+
+class TestAsyncCompanyRepository:
+    """Tests para AsyncCompanyRepository."""
+
+    async def test_get_by_trigram(self, async_session, seeded):
+        repo = AsyncCompanyRepository(async_session)
+
+        company = await repo.get_by_trigram("bet")
+
+        assert company is not None
+        assert company.name == "Beta Ltda"
+
+    async def test_get_by_status(self, async_session, seeded):
+        repo = AsyncCompanyRepository(async_session)
+
+        active = await repo.get_by_status(True)
+        inactive = await repo.get_by_status(False)
+
+        assert {c.trigram for c in active} == {"ALP", "BET"}
+        assert [c.trigram for c in inactive] == ["GAM"]
+
+    async def test_search_by_name(self, async_session, seeded):
+        repo = AsyncCompanyRepository(async_session)
+
+        companies = await repo.search_by_name("ta")
+
+        assert [c.name for c in companies] == ["Beta Ltda"]
+
+
+class TestAsyncServices:
+    """Tests para los servicios de lectura asíncronos."""
+
+    async def test_company_service_enriches_response(self, async_session, seeded):
+        service = AsyncCompanyService(AsyncCompanyRepository(async_session), async_session)
+
+        company = await service.get_by_id(seeded["company_ids"][0])
+
+        assert company.company_type == "CLIENT"
+        assert company.country_name == "Chile"
+        assert company.city_name == "Santiago"
+
+    async def test_company_service_not_found(self, async_session, seeded):
+        service = AsyncCompanyService(AsyncCompanyRepository(async_session), async_session)
+
+        with pytest.raises(NotFoundException):
+            await service.get_by_trigram("ZZZ")
+
+    async def test_quote_service_list_includes_company_name(self, async_session, seeded):
+        service = AsyncQuoteService(AsyncQuoteRepository(async_session), async_session)
+
+        quotes = await service.get_all()
+
+        # Ordenadas por fecha descendente por defecto
+        assert [q.quote_number for q in quotes] == ["Q-ASYNC-000", "Q-ASYNC-001"]
+        assert all(q.company_name == "Alpha SpA" for q in quotes)
+
+    async def test_quote_service_offset_follows_keyset_order(self, async_session, seeded):
+        service = AsyncQuoteService(AsyncQuoteRepository(async_session), async_session)
+        first = await async_session.get(Quote, seeded["quote_ids"][0])
+        first.quote_date = date.today() - timedelta(days=10)
+        await async_session.commit()
+
+        keyset, _ = await service.get_page(limit=2)
+        offset = await service.get_all(skip=1, limit=1)
+
+        # La primera cotización pasó a ser la más antigua: va al final en ambos caminos
+        assert [q.quote_number for q in keyset] == ["Q-ASYNC-001", "Q-ASYNC-000"]
+        assert [q.quote_number for q in await service.get_all()] == ["Q-ASYNC-001", "Q-ASYNC-000"]
+        assert [q.quote_number for q in offset] == ["Q-ASYNC-000"]
+
+    async def test_company_service_get_list(self, async_session, seeded):
+        service = AsyncCompanyService(AsyncCompanyRepository(async_session), async_session)
+
+        companies, total = await service.get_list(
+            filters={"is_active": True}, sort="trigram", descending=True, limit=1
+        )
+
+        assert total == 2
+        assert [c.trigram for c in companies] == ["BET"]
+        assert companies[0].company_type == "CLIENT"
+
+    async def test_quote_service_get_list(self, async_session, seeded):
+        service = AsyncQuoteService(AsyncQuoteRepository(async_session), async_session)
+
+        default, total = await service.get_list()
+        searched, searched_total = await service.get_list(search="quote 1", sort="quote_number")
+
+        # Por defecto más recientes primero, como get_all
+        assert [q.quote_number for q in default] == ["Q-ASYNC-000", "Q-ASYNC-001"]
+        assert total == 2
+        assert [q.quote_number for q in searched] == ["Q-ASYNC-001"]
+        assert searched_total == 1
+        assert searched[0].company_name == "Alpha SpA"
+
+    async def test_quote_service_get_with_products(self, async_session, seeded):
+        service = AsyncQuoteService(AsyncQuoteRepository(async_session), async_session)
+
+        quote = await service.get_with_products(seeded["quote_ids"][0])
+
+        assert quote.quote_number == "Q-ASYNC-000"
+        assert quote.products == []
+
+
+def _seed_sections(session, company_id: int) -> None:
+    """Crea direcciones, contactos, RUT, plantas y notas para una empresa."""
+    session.add_all([
+        Address(address="Calle 1", company_id=company_id, address_type=AddressType.BILLING),
+        Address(address="Calle 2", company_id=company_id, address_type=AddressType.DELIVERY, is_default=True),
+        Contact(first_name="Ana", last_name="Soto", company_id=company_id),
+        Contact(first_name="Luis", last_name="Araya", company_id=company_id),
+        CompanyRut(rut="12345678-5", is_main=True, company_id=company_id),
+        Plant(name="Planta Sur", company_id=company_id),
+        Plant(name="Planta Norte", company_id=company_id),
+        Note(entity_type="company", entity_id=company_id, content="Normal", priority=NotePriority.NORMAL),
+        Note(entity_type="company", entity_id=company_id, content="Urgente", priority=NotePriority.URGENT),
+        Note(entity_type="quote", entity_id=company_id, content="Otra entidad"),
+    ])
+    session.flush()
+
+
+class TestAsyncCompanyBundle:
+    """Tests para AsyncCompanyService.get_bundle."""
+
+    async def test_bundle_contains_all_sections(self, async_session, seeded):
+        company_id = seeded["company_ids"][0]
+        await async_session.run_sync(_seed_sections, company_id)
+        await async_session.commit()
+        service = AsyncCompanyService(AsyncCompanyRepository(async_session), async_session)
+
+        bundle = await service.get_bundle(company_id)
+
+        assert bundle.company.city_name == "Santiago"
+        # Mismo orden que los endpoints individuales
+        assert [a.address for a in bundle.addresses] == ["Calle 2", "Calle 1"]
+        assert [c.last_name for c in bundle.contacts] == ["Araya", "Soto"]
+        assert [r.rut for r in bundle.ruts] == ["12345678-5"]
+        assert [p.name for p in bundle.plants] == ["Planta Norte", "Planta Sur"]
+        assert [n.content for n in bundle.notes] == ["Urgente", "Normal"]
+
+    async def test_bundle_only_requested_sections(self, async_session, seeded):
+        service = AsyncCompanyService(AsyncCompanyRepository(async_session), async_session)
+
+        bundle = await service.get_bundle(seeded["company_ids"][1], ["plants"])
+
+        assert bundle.plants == []
+        assert bundle.addresses is None
+        assert bundle.notes is None
+
+    async def test_bundle_unknown_section(self, async_session, seeded):
+        service = AsyncCompanyService(AsyncCompanyRepository(async_session), async_session)
+
+        with pytest.raises(ValidationException):
+            await service.get_bundle(seeded["company_ids"][0], ["plants", "quotes"])
+
+    async def test_bundle_not_found(self, async_session, seeded):
+        service = AsyncCompanyService(AsyncCompanyRepository(async_session), async_session)
+
+        with pytest.raises(NotFoundException):
+            await service.get_bundle(999999)
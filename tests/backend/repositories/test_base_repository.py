@@ -12,13 +12,16 @@ Test Coverage:
     - Utility methods (count, exists)
     - Transaction behavior (flush without commit)
     - Error handling (NotFoundException)
+    - Load profiles (strict loading)
     - Edge cases
 """
 
 import pytest
-from sqlalchemy.exc import IntegrityError
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
 
 from src.backend.repositories.base import BaseRepository
+from src.backend.repositories.loading import set_strict_loading
 from src.backend.models.core.companies import Company
 from src.backend.exceptions.repository import NotFoundException
 
@@ -654,6 +657,30 @@ class TestBaseRepositoryBulkOperations:
         # Assert - no se guardaron
         assert base_repository.count() == 0
 
+    def test_bulk_insert_sets_defaults_and_audit(
+        self, base_repository, sample_company_type, session
+    ):
+        """Test que bulk_insert aplica defaults de columna y auditoría de la sesión."""
+        # Arrange
+        rows = [
+            {"name": f"Bulk Insert {i}", "trigram": f"BI{chr(65+i)}", "company_type_id": sample_company_type.id}
+            for i in range(3)
+        ]
+
+        # Act
+        count = base_repository.bulk_insert(rows)
+
+        # Assert
+        assert count == 3
+        companies = base_repository.get_all()
+        assert len(companies) == 3
+        assert all(c.created_by_id == session.info["user_id"] for c in companies)
+        assert all(c.created_at is not None and c.is_active for c in companies)
+
+    def test_bulk_insert_with_empty_list_returns_zero(self, base_repository):
+        """Test que bulk_insert con lista vacía no ejecuta nada."""
+        assert base_repository.bulk_insert([]) == 0
+
     def test_update_many_updates_multiple_entities(
         self, base_repository, create_test_companies, session
     ):
@@ -676,6 +703,27 @@ class TestBaseRepositoryBulkOperations:
             company = base_repository.get_by_id(company_id)
             assert company.is_active is True
 
+    def test_update_many_sets_audit_fields(
+        self, base_repository, create_test_companies, session
+    ):
+        """Test que update_many completa updated_by_id y updated_at sin pasar por el flush."""
+        # Arrange
+        companies = create_test_companies(2)
+        ids = [c.id for c in companies]
+        before = {c.id: c.updated_at for c in companies}
+        session.info["user_id"] = 2
+
+        # Act
+        base_repository.update_many(ids, {"is_active": False})
+        session.commit()
+
+        # Assert
+        for company_id in ids:
+            company = base_repository.get_by_id(company_id)
+            assert company.updated_by_id == 2
+            assert company.created_by_id == 1
+            assert company.updated_at > before[company_id]
+
     def test_update_many_with_empty_ids_returns_zero(self, base_repository):
         """Test que update_many con IDs vacíos retorna 0."""
         # Act
@@ -980,3 +1028,320 @@ class TestBaseRepositoryQueryBuilder:
 
         # Assert
         assert len(result) == 5
+
+
+# ============= KEYSET PAGINATION TESTS =============
+
+
+class TestBaseRepositoryKeysetPagination:
+    """Tests para BaseRepository.get_page() (paginación por cursor)."""
+
+    def test_get_page_walks_all_rows_without_overlap(
+        self, base_repository, create_test_companies
+    ):
+        """Test que recorrer las páginas con el cursor retorna cada fila una vez."""
+        # Arrange
+        companies = create_test_companies(7)
+
+        # Act
+        seen = []
+        page, cursor = base_repository.get_page(limit=3)
+        seen.extend(page)
+        while cursor:
+            page, cursor = base_repository.get_page(limit=3, after=cursor)
+            seen.extend(page)
+
+        # Assert
+        assert [c.id for c in seen] == sorted(c.id for c in companies)
+
+    def test_get_page_last_page_has_no_cursor(self, base_repository, create_test_companies):
+        """Test que la última página retorna next_cursor None."""
+        # Arrange
+        create_test_companies(3)
+
+        # Act
+        page, cursor = base_repository.get_page(limit=3)
+
+        # Assert
+        assert len(page) == 3
+        assert cursor is None
+
+    def test_get_page_descending_with_ties(
+        self, base_repository, create_test_companies, session
+    ):
+        """Test que valores repetidos en la columna de orden se desempatan por id."""
+        # Arrange - todas las companies con el mismo valor de orden
+        companies = create_test_companies(5)
+        for company in companies:
+            company.main_address = "Misma dirección"
+        session.commit()
+
+        # Act
+        page1, cursor = base_repository.get_page(
+            order_by="main_address", descending=True, limit=2
+        )
+        page2, cursor = base_repository.get_page(
+            order_by="main_address", descending=True, limit=2, after=cursor
+        )
+        page3, cursor = base_repository.get_page(
+            order_by="main_address", descending=True, limit=2, after=cursor
+        )
+
+        # Assert
+        ids = [c.id for c in page1 + page2 + page3]
+        assert ids == sorted((c.id for c in companies), reverse=True)
+        assert cursor is None
+
+    def test_get_page_nullable_column(self, base_repository, create_test_companies, session):
+        """Test que filas con NULL en la columna de orden no se pierden."""
+        # Arrange
+        companies = create_test_companies(4)
+        companies[0].phone = "+56911111111"
+        companies[2].phone = "+56922222222"
+        session.commit()
+
+        # Act
+        for descending in (False, True):
+            seen = []
+            page, cursor = base_repository.get_page(
+                order_by="phone", descending=descending, limit=1
+            )
+            seen.extend(page)
+            while cursor:
+                page, cursor = base_repository.get_page(
+                    order_by="phone", descending=descending, limit=1, after=cursor
+                )
+                seen.extend(page)
+
+            # Assert
+            assert sorted(c.id for c in seen) == sorted(c.id for c in companies)
+
+    def test_get_page_with_filters(self, base_repository, create_test_companies, session):
+        """Test que get_page aplica filtros."""
+        # Arrange
+        companies = create_test_companies(4)
+        companies[1].is_active = False
+        session.commit()
+
+        # Act
+        page, cursor = base_repository.get_page(filters={"is_active": False})
+
+        # Assert
+        assert [c.id for c in page] == [companies[1].id]
+        assert cursor is None
+
+    def test_get_page_invalid_cursor(self, base_repository):
+        """Test que un cursor inválido lanza ValidationException."""
+        from src.backend.exceptions.service import ValidationException
+
+        with pytest.raises(ValidationException):
+            base_repository.get_page(after="no-es-un-cursor")
+
+
+# ============= LIST CONTRACT TESTS =============
+
+
+class TestBaseRepositoryListContract:
+    """Tests para get_list() (orden whitelisteado, búsqueda y total)."""
+
+    def test_get_list_returns_page_and_total(self, company_repository, create_test_companies):
+        """Test que get_list retorna solo la página pedida y el total filtrado."""
+        # Arrange
+        create_test_companies(5)
+
+        # Act
+        page, total = company_repository.get_list(sort="name", descending=True, skip=1, limit=2)
+
+        # Assert
+        assert total == 5
+        assert [c.name for c in page] == ["Test Company 4", "Test Company 3"]
+
+    def test_get_list_default_order_is_id(self, company_repository, create_test_companies):
+        """Test que sin sort se usa default_sort (id ascendente)."""
+        # Arrange
+        companies = create_test_companies(3)
+
+        # Act
+        page, total = company_repository.get_list()
+
+        # Assert
+        assert [c.id for c in page] == [c.id for c in companies]
+        assert total == 3
+
+    def test_get_list_rejects_column_not_whitelisted(self, company_repository):
+        """Test que ordenar por una columna fuera de sortable_columns falla."""
+        from src.backend.exceptions.service import ValidationException
+
+        with pytest.raises(ValidationException) as exc_info:
+            company_repository.get_list(sort="main_address")
+
+        assert "name" in exc_info.value.details["allowed"]
+
+    def test_get_list_search_and_filters(self, company_repository, create_test_companies, session):
+        """Test que search y filters reducen página y total."""
+        # Arrange
+        companies = create_test_companies(5)
+        companies[0].name = "Bombas 100% Chile"
+        companies[1].name = "Bombas del Sur"
+        companies[1].is_active = False
+        session.commit()
+
+        # Act
+        matching, matching_total = company_repository.get_list(search="bombas")
+        active, active_total = company_repository.get_list(search="bombas", filters={"is_active": True})
+        literal, literal_total = company_repository.get_list(search="100%")
+
+        # Assert
+        assert matching_total == 2
+        assert {c.id for c in matching} == {companies[0].id, companies[1].id}
+        assert active_total == 1 and active[0].id == companies[0].id
+        assert literal_total == 1 and literal[0].id == companies[0].id
+
+    def test_get_list_ties_are_stable(self, company_repository, create_test_companies, session):
+        """Test que valores repetidos en la columna de orden se desempatan por id."""
+        # Arrange
+        companies = create_test_companies(5)
+        for company in companies:
+            company.is_active = True
+        session.commit()
+
+        # Act
+        ids = []
+        for skip in range(0, 5, 2):
+            page, _ = company_repository.get_list(sort="is_active", skip=skip, limit=2)
+            ids.extend(c.id for c in page)
+
+        # Assert
+        assert ids == [c.id for c in companies]
+
+
+# ============= LOAD PROFILE TESTS =============
+
+
+class CompanyNameItem(BaseModel):
+    """Schema de listado mínimo para probar la proyección."""
+
+    id: int
+    name: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectedCompanyRepository(BaseRepository[Company]):
+    """Repositorio con list_schema: los listados cargan solo id, name y FKs."""
+
+    list_schema = CompanyNameItem
+
+    def __init__(self, session):
+        super().__init__(session, Company)
+
+
+class TestBaseRepositoryLoadProfiles:
+    """Tests para los perfiles de carga y la carga estricta."""
+
+    def test_strict_list_raises_on_lazy_load(self, base_repository, create_test_companies, session):
+        """Test que un listado estricto prohíbe las relaciones fuera del perfil."""
+        # Arrange
+        create_test_companies(2)
+        session.expunge_all()
+
+        # Act
+        page, _ = base_repository.get_list()
+
+        # Assert
+        with pytest.raises(InvalidRequestError):
+            page[0].plants
+
+    def test_profile_relationships_are_loaded(self, company_repository, create_test_companies, session):
+        """Test que las relaciones del perfil LIST siguen disponibles en modo estricto."""
+        # Arrange
+        create_test_companies(2)
+        session.expunge_all()
+
+        # Act
+        page, _ = company_repository.get_list()
+
+        # Assert
+        assert all(company.company_type is not None for company in page)
+
+    def test_lazy_load_allowed_when_not_strict(self, base_repository, create_test_companies, session):
+        """Test que sin carga estricta la relación se carga al accederla."""
+        # Arrange
+        create_test_companies(1)
+        session.expunge_all()
+        set_strict_loading(False)
+
+        # Act
+        page, _ = base_repository.get_list()
+
+        # Assert
+        assert page[0].plants == []
+
+    def test_get_by_id_without_profile_is_not_strict(self, base_repository, sample_company, session):
+        """Test que get_by_id sin perfil no prohíbe cargas lazy."""
+        # Arrange
+        session.expunge_all()
+
+        # Act
+        result = base_repository.get_by_id(sample_company.id)
+
+        # Assert
+        assert result.plants == []
+
+    def test_list_schema_defers_other_columns(self, create_test_companies, session):
+        """Test que LIST carga solo las columnas del list_schema, la PK y las FKs."""
+        # Arrange
+        create_test_companies(2)
+        session.expunge_all()
+
+        # Act
+        page, _ = ProjectedCompanyRepository(session).get_list()
+
+        # Assert
+        loaded = page[0].__dict__
+        assert {"id", "name", "company_type_id"} <= loaded.keys()
+        assert "trigram" not in loaded
+        with pytest.raises(InvalidRequestError):
+            page[0].trigram
+
+    def test_keyset_cursor_on_deferred_column(self, create_test_companies, session):
+        """Test que get_page ordena por una columna que el list_schema difiere."""
+        # Arrange
+        create_test_companies(3)
+        session.expunge_all()
+        repository = ProjectedCompanyRepository(session)
+
+        # Act
+        first, cursor = repository.get_page(order_by="trigram", limit=2)
+        second, last_cursor = repository.get_page(order_by="trigram", limit=2, after=cursor)
+
+        # Assert
+        assert [c.name for c in first + second] == ["Test Company 1", "Test Company 2", "Test Company 3"]
+        assert last_cursor is None
+
+
+# ============= LIST ROWS TESTS =============
+
+
+class TestBaseRepositoryListRows:
+    """Tests para get_rows()/get_list_rows()."""
+
+    def test_rows_have_schema_fields(self, create_test_companies, session):
+        """Test que cada fila trae exactamente los campos del list_schema."""
+        # Arrange
+        create_test_companies(3)
+
+        # Act
+        rows, total = ProjectedCompanyRepository(session).get_list_rows(descending=True, limit=2)
+
+        # Assert
+        assert total == 3
+        assert [dict(row) for row in rows] == [
+            {"id": 3, "name": "Test Company 3"},
+            {"id": 2, "name": "Test Company 2"},
+        ]
+
+    def test_rows_require_list_schema(self, base_repository):
+        """Test que sin list_schema no hay fast path."""
+        with pytest.raises(TypeError):
+            base_repository.get_rows()
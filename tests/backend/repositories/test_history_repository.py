@@ -0,0 +1,217 @@
+"""
+Tests para el historial de cambios (HistoryRepository, HistoryService).
+
+Valida que los eventos del ORM registran diffs campo a campo solo al
+confirmar la transacción, que los rollbacks los descartan y que el worker
+en segundo plano escribe por lotes.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.backend.exceptions.service import ValidationException
+from src.backend.models.base import Base
+from src.backend.models.business.quotes import Quote
+from src.backend.models.core.staff import Staff
+from src.backend.models.history import ChangeHistory, HistoryWriter
+from src.backend.repositories.history_repository import HistoryRepository
+from src.backend.services.history_service import HistoryService
+
+
+@pytest.fixture
+def history_repository(session: Session) -> HistoryRepository:
+    """Fixture para HistoryRepository."""
+    return HistoryRepository(session)
+
+
+@pytest.fixture
+def quote(session: Session, sample_company, sample_currency, sample_quote_status) -> Quote:
+    """Cotización confirmada (deja su fila 'create' en el historial)."""
+    staff = Staff(username="history", first_name="Hist", last_name="Ory", email="history@test.com")
+    session.add(staff)
+    session.flush()
+    quote = Quote(
+        quote_number="Q-HIST-001",
+        subject="Historial",
+        company_id=sample_company.id,
+        staff_id=staff.id,
+        currency_id=sample_currency.id,
+        status_id=sample_quote_status.id,
+        quote_date=date(2025, 1, 1),
+        subtotal=Decimal("100.00"),
+        total=Decimal("119.00"),
+    )
+    session.add(quote)
+    session.commit()
+    return quote
+
+
+class TestChangeHistoryCapture:
+    """Tests para el registro de cambios desde los eventos del ORM."""
+
+    def test_create_records_initial_values(self, quote, history_repository):
+        """Test que crear una cotización registra sus valores iniciales."""
+        # Act
+        [change] = history_repository.get_for_entity("quote", quote.id)
+
+        # Assert
+        assert change.action == "create"
+        assert change.user_id == 1
+        assert change.changes["quote_number"] == [None, "Q-HIST-001"]
+        assert change.changes["total"] == [None, "119.00"]
+        assert change.changes["quote_date"] == [None, "2025-01-01"]
+        assert "created_at" not in change.changes
+
+    def test_update_records_field_diff(self, quote, session, history_repository):
+        """Test que modificar registra solo los campos cambiados con su valor anterior."""
+        # Arrange
+        session.info["user_id"] = 2
+
+        # Act
+        quote.subject = "Historial editado"
+        quote.total = Decimal("238.00")
+        session.commit()
+
+        # Assert
+        latest = history_repository.get_for_entity("quote", quote.id)[0]
+        assert latest.action == "update"
+        assert latest.user_id == 2
+        assert latest.changes == {
+            "subject": ["Historial", "Historial editado"],
+            "total": ["119.00", "238.00"],
+        }
+
+    def test_unchanged_value_is_not_recorded(self, quote, session, history_repository):
+        """Test que reasignar el mismo valor no deja una fila de historial."""
+        # Act
+        quote.subject = "Historial"
+        session.commit()
+
+        # Assert
+        assert len(history_repository.get_for_entity("quote", quote.id)) == 1
+
+    def test_delete_is_recorded(self, quote, session, history_repository):
+        """Test que eliminar registra la acción delete."""
+        # Act
+        quote_id = quote.id
+        session.delete(quote)
+        session.commit()
+
+        # Assert
+        latest = history_repository.get_for_entity("quote", quote_id)[0]
+        assert latest.action == "delete"
+        assert latest.changes == {}
+
+    def test_rollback_discards_pending_changes(self, quote, session, history_repository):
+        """Test que un rollback descarta los cambios ya flusheados."""
+        # Act
+        quote.subject = "Descartado"
+        session.flush()
+        session.rollback()
+        session.commit()
+
+        # Assert
+        assert [c.action for c in history_repository.get_for_entity("quote", quote.id)] == ["create"]
+
+    def test_savepoint_rollback_keeps_outer_changes(self, quote, session, history_repository):
+        """Test que revertir un savepoint solo descarta sus propios cambios."""
+        # Act
+        quote.subject = "Externo"
+        session.flush()
+        savepoint = session.begin_nested()
+        quote.total = Decimal("1.00")
+        session.flush()
+        savepoint.rollback()
+        session.commit()
+
+        # Assert
+        latest = history_repository.get_for_entity("quote", quote.id)[0]
+        assert latest.changes == {"subject": ["Historial", "Externo"]}
+
+
+class TestHistoryWriter:
+    """Tests para la escritura diferida por lotes."""
+
+    def test_worker_writes_in_batches(self, tmp_path, monkeypatch):
+        """Test que el worker inserta las filas encoladas en lotes de batch_size."""
+        # Arrange
+        engine = create_engine(f"sqlite:///{tmp_path / 'history.db'}")
+        Base.metadata.create_all(engine)
+        writer = HistoryWriter(batch_size=2, interval=0.05)
+        batches = []
+        insert = writer._insert
+        monkeypatch.setattr(writer, "_insert", lambda bind, rows: (batches.append(len(rows)), insert(bind, rows)))
+        rows = [
+            {"entity_type": "order", "entity_id": i, "action": "update", "changes": {}, "user_id": 1,
+             "ts": date(2025, 1, 1)}
+            for i in range(5)
+        ]
+
+        # Act
+        writer.start(engine)
+        writer.write(None, rows)
+        writer.stop()
+
+        # Assert
+        with Session(engine) as session:
+            assert session.scalar(select(func.count()).select_from(ChangeHistory)) == 5
+        assert all(size <= 2 for size in batches)
+        assert not writer.running
+        engine.dispose()
+
+    def test_static_pool_writes_inline(self):
+        """Test que con StaticPool no hay worker y el historial va en la transacción de la sesión."""
+        # Arrange
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        with engine.connect() as connection:
+            # Una sola conexión: la cotización no necesita sus lookups
+            connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        writer = HistoryWriter()
+        count = select(func.count()).select_from(ChangeHistory)
+
+        # Act
+        writer.start(engine)
+        with Session(engine) as session:
+            quote = Quote(
+                quote_number="Q-STATIC-001", subject="Static", company_id=1, staff_id=1,
+                currency_id=1, status_id=1, quote_date=date(2025, 1, 1),
+            )
+            session.add(quote)
+            session.flush()
+            inside = session.scalar(count)
+            session.rollback()
+            after_rollback = session.scalar(count)
+
+        # Assert
+        assert not writer.running
+        assert inside == 1
+        assert after_rollback == 0
+        engine.dispose()
+
+
+class TestHistoryService:
+    """Tests para HistoryService."""
+
+    def test_history_newest_first(self, quote, session, history_repository):
+        """Test que el historial se retorna del cambio más reciente al más antiguo."""
+        # Arrange
+        quote.subject = "Segunda versión"
+        session.commit()
+
+        # Act
+        history = HistoryService(history_repository).get_history("quote", quote.id)
+
+        # Assert
+        assert [h.action for h in history] == ["update", "create"]
+        assert history[0].changes["subject"] == ["Historial", "Segunda versión"]
+
+    def test_unknown_entity_type_raises(self, history_repository):
+        """Test que un tipo de entidad sin historial lanza ValidationException."""
+        with pytest.raises(ValidationException):
+            HistoryService(history_repository).get_history("company", 1)
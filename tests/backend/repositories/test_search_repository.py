@@ -0,0 +1,169 @@
+"""
+Tests para SearchRepository y la sincronización del índice full-text.
+
+Valida que el índice se mantiene al día con los eventos del ORM
+(crear, modificar, eliminar, soft delete), la coincidencia por prefijo,
+el ranking y la reconstrucción completa.
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.backend.exceptions.service import ValidationException
+from src.backend.models.core.contacts import Contact
+from src.backend.models.core.products import Product, ProductType
+from src.backend.repositories.search_repository import SearchRepository
+from src.backend.services.search_service import SearchService
+
+
+@pytest.fixture
+def search_repository(session: Session) -> SearchRepository:
+    """Fixture para SearchRepository."""
+    return SearchRepository(session)
+
+
+@pytest.fixture
+def search_products(session: Session, sample_family_type) -> list[Product]:
+    """Crea productos con designaciones para buscar."""
+    products = [
+        Product(
+            product_type=ProductType.ARTICLE,
+            reference="TORN-M6-20",
+            designation_es="Tornillo hexagonal M6 x 20",
+            family_type_id=sample_family_type.id,
+            cost_price=Decimal("0.10"),
+        ),
+        Product(
+            product_type=ProductType.ARTICLE,
+            reference="TUER-M6",
+            designation_es="Tuerca M6 para tornillo",
+            family_type_id=sample_family_type.id,
+            cost_price=Decimal("0.05"),
+        ),
+        Product(
+            product_type=ProductType.ARTICLE,
+            reference="ARAN-M8",
+            designation_es="Arandela plana M8",
+            designation_en="Flat washer",
+            family_type_id=sample_family_type.id,
+            cost_price=Decimal("0.02"),
+        ),
+    ]
+    session.add_all(products)
+    session.commit()
+    return products
+
+
+class TestSearchIndexSync:
+    """Tests de sincronización del índice con el ORM."""
+
+    def test_created_entities_are_indexed(self, search_repository, search_products, sample_company):
+        """Las entidades creadas aparecen en el índice en la misma transacción."""
+        hits = search_repository.search("ak group")
+        assert [(h.entity_type, h.entity_id) for h in hits] == [("company", sample_company.id)]
+
+        hits = search_repository.search("arandela")
+        assert [h.entity_id for h in hits] == [search_products[2].id]
+
+    def test_update_reindexes_document(self, session, search_repository, search_products):
+        """Modificar un campo indexado reemplaza el documento."""
+        product = search_products[2]
+        product.designation_es = "Golilla plana M8"
+        session.commit()
+
+        assert search_repository.search("arandela") == []
+        assert [h.entity_id for h in search_repository.search("golilla")] == [product.id]
+
+    def test_delete_removes_document(self, session, search_repository, search_products):
+        """Eliminar una entidad quita su documento."""
+        product = search_products[2]
+        session.delete(product)
+        session.commit()
+
+        assert search_repository.search("arandela") == []
+        count = session.execute(text("SELECT count(*) FROM search_index")).scalar()
+        assert count == 2
+
+    def test_soft_deleted_company_is_removed(self, session, search_repository, sample_company):
+        """Una empresa con soft delete deja de aparecer en búsquedas."""
+        sample_company.is_deleted = True
+        session.commit()
+
+        assert search_repository.search("providencia") == []
+
+    def test_contact_is_indexed(self, session, search_repository, sample_company):
+        """Los contactos se indexan por nombre y datos de contacto."""
+        contact = Contact(
+            first_name="María",
+            last_name="González",
+            email="mgonzalez@akgroup.cl",
+            company_id=sample_company.id,
+        )
+        session.add(contact)
+        session.commit()
+
+        hits = search_repository.search("maria gonz", entity_types=["contact"])
+        assert [(h.entity_type, h.entity_id) for h in hits] == [("contact", contact.id)]
+
+
+class TestSearchRepositorySearch:
+    """Tests de consulta: prefijos, ranking y filtros."""
+
+    def test_prefix_match(self, search_repository, search_products):
+        """Cada palabra se busca como prefijo y todas deben coincidir."""
+        hits = search_repository.search("torn")
+        assert {h.entity_id for h in hits} == {search_products[0].id, search_products[1].id}
+
+        hits = search_repository.search("torn hexa")
+        assert [h.entity_id for h in hits] == [search_products[0].id]
+
+    def test_title_match_ranks_first(self, search_repository, search_products):
+        """Coincidir en el título (referencia) pesa más que en el cuerpo."""
+        hits = search_repository.search("m6")
+        assert len(hits) == 2
+        assert hits[0].score >= hits[1].score
+
+        hits = search_repository.search("tuer")
+        assert hits[0].entity_id == search_products[1].id
+        assert hits[0].title == "TUER-M6"
+
+    def test_operators_are_not_interpreted(self, search_repository, search_products):
+        """Comillas, asteriscos y operadores FTS se tratan como separadores."""
+        assert len(search_repository.search('"torn*" -(')) == 2
+        assert search_repository.search('"*-') == []
+
+    def test_entity_type_filter_and_limit(self, search_repository, search_products, sample_company):
+        """Filtra por tipo de entidad y respeta el límite."""
+        assert search_repository.search("m6", entity_types=["company"]) == []
+        assert len(search_repository.search("m", entity_types=["product"], limit=1)) == 1
+
+    def test_rebuild(self, session, search_repository, search_products, sample_company):
+        """La reconstrucción reindexa todas las entidades."""
+        session.execute(text("DELETE FROM search_index"))
+        assert search_repository.search("torn") == []
+
+        total = search_repository.rebuild()
+
+        assert total == 4
+        assert len(search_repository.search("torn")) == 2
+
+
+class TestSearchService:
+    """Tests para SearchService."""
+
+    def test_search_returns_schemas(self, search_repository, search_products):
+        """Retorna SearchHit validados."""
+        hits = SearchService(search_repository).search("arandela")
+
+        assert len(hits) == 1
+        assert hits[0].entity_type == "product"
+        assert hits[0].title == "ARAN-M8"
+        assert "Arandela" in hits[0].snippet
+
+    def test_unknown_entity_type(self, search_repository):
+        """Un tipo de entidad no indexado es un error de validación."""
+        with pytest.raises(ValidationException):
+            SearchService(search_repository).search("x", entity_types=["invoice"])
@@ -8,6 +8,7 @@ import pytest
 from unittest.mock import Mock, MagicMock, patch
 from decimal import Decimal
 
+from src.backend.repositories.loading import LoadProfile
 from src.backend.services.base import BaseService
 from src.backend.exceptions.repository import NotFoundException
 from src.backend.exceptions.service import ValidationException
@@ -31,7 +32,7 @@ class TestBaseServiceGetById:
         result = base_company_service.get_by_id(1)
 
         # Assert
-        mock_company_repository.get_by_id.assert_called_once_with(1)
+        mock_company_repository.get_by_id.assert_called_once_with(1, profile=LoadProfile.DETAIL)
         assert result.id == 1
         assert result.name == "Test Company"
 
@@ -47,7 +48,7 @@ class TestBaseServiceGetById:
             base_company_service.get_by_id(99999)
 
         assert "Company no encontrado" in str(exc_info.value)
-        mock_company_repository.get_by_id.assert_called_once_with(99999)
+        mock_company_repository.get_by_id.assert_called_once_with(99999, profile=LoadProfile.DETAIL)
 
     def test_get_by_id_returns_response_schema(
         self, base_company_service, mock_company_repository, sample_company_entity
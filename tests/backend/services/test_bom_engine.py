@@ -0,0 +1,299 @@
+"""
+Tests para BOMEngine, los acumulados materializados y los cálculos de BOM
+de ProductService.
+
+Usa una sesión SQLite real para que el CTE recursivo se ejecute.
+"""
+
+import pytest
+from decimal import Decimal
+from sqlalchemy import delete, select, update
+
+from src.backend.exceptions.repository import NotFoundException
+from src.backend.exceptions.service import BusinessRuleException
+from src.backend.models.core.products import (
+    Product,
+    ProductBOMRollup,
+    ProductComponent,
+    ProductType,
+)
+from src.backend.repositories.core.product_repository import (
+    ProductRepository,
+    ProductComponentRepository,
+)
+from src.backend.services.core.bom_engine import BOMEngine
+from src.backend.services.core.product_service import ProductService
+from src.shared.schemas.core.product import ProductUpdate
+
+
+@pytest.fixture
+def product_service(session):
+    """ProductService sobre la sesión de prueba."""
+    return ProductService(
+        product_repository=ProductRepository(session),
+        component_repository=ProductComponentRepository(session),
+        session=session,
+    )
+
+
+@pytest.fixture
+def bom(session, sample_family_type):
+    """
+    BOM con un sub-ensamble compartido:
+
+        KIT -> 2 x FRAME -> 4 x BOLT
+            -> 1 x PANEL -> 1 x FRAME
+                         -> 3 x BOLT
+    """
+    def product(reference, product_type=ProductType.NOMENCLATURE, **kwargs):
+        p = Product(
+            product_type=product_type,
+            reference=reference,
+            family_type_id=sample_family_type.id,
+            **kwargs,
+        )
+        session.add(p)
+        return p
+
+    kit = product("KIT")
+    frame = product("FRAME")
+    panel = product("PANEL")
+    bolt = product(
+        "BOLT",
+        ProductType.ARTICLE,
+        cost_price=Decimal("1.50"),
+        sale_price=Decimal("2.00"),
+        net_weight=Decimal("0.100"),
+    )
+    session.flush()
+
+    for parent, component, quantity in (
+        (kit, frame, "2"),
+        (kit, panel, "1"),
+        (panel, frame, "1"),
+        (panel, bolt, "3"),
+        (frame, bolt, "4"),
+    ):
+        session.add(
+            ProductComponent(
+                parent_id=parent.id,
+                component_id=component.id,
+                quantity=Decimal(quantity),
+            )
+        )
+    session.commit()
+    return {"kit": kit, "frame": frame, "panel": panel, "bolt": bolt}
+
+
+class TestBOMEngine:
+    """Tests para los acumulados de BOMEngine."""
+
+    def test_rolled_up_values(self, session, bom):
+        """Test costo, precio, peso y niveles acumulados."""
+        kit_id = bom["kit"].id
+        engine = BOMEngine(ProductComponentRepository(session).get_bom_graph(kit_id), kit_id)
+
+        # KIT = 2 FRAME + PANEL = 2*4 BOLT + (4 + 3) BOLT = 15 BOLT
+        assert engine.cost() == Decimal("22.50")
+        assert engine.price() == Decimal("30.00")
+        assert engine.weight() == Decimal("1.500")
+        assert engine.cost(bom["panel"].id) == Decimal("10.50")
+        assert engine.levels() == 3
+
+    def test_flat_quantities_include_shared_subassemblies(self, session, bom):
+        """Test que las cantidades se acumulan por todos los caminos."""
+        kit_id = bom["kit"].id
+        engine = BOMEngine(ProductComponentRepository(session).get_bom_graph(kit_id), kit_id)
+
+        assert engine.flat_quantities() == {
+            bom["frame"].id: Decimal("3"),
+            bom["panel"].id: Decimal("1"),
+            bom["bolt"].id: Decimal("15"),
+        }
+
+    def test_cycle_raises_business_rule(self, session, bom):
+        """Test que un ciclo en los datos se reporta en lugar de recursar."""
+        session.add(
+            ProductComponent(
+                parent_id=bom["frame"].id,
+                component_id=bom["kit"].id,
+                quantity=Decimal("1"),
+            )
+        )
+        session.commit()
+
+        kit_id = bom["kit"].id
+        rows = ProductComponentRepository(session).get_bom_graph(kit_id)
+        with pytest.raises(BusinessRuleException):
+            BOMEngine(rows, kit_id)
+
+    def test_missing_root(self):
+        """Test que un producto inexistente no tiene costo ni componentes."""
+        engine = BOMEngine([], 1)
+
+        assert not engine.exists
+        assert engine.cost() == Decimal("0.00")
+        assert engine.flat_quantities() == {}
+
+
+class TestProductServiceBOM:
+    """Tests para calculate_bom_cost(), get_flat_bom() y get_with_bom()."""
+
+    def test_calculate_bom_cost(self, product_service, bom):
+        """Test costo total del BOM."""
+        assert product_service.calculate_bom_cost(bom["kit"].id) == Decimal("22.50")
+        assert product_service.calculate_bom_cost(bom["bolt"].id) == Decimal("1.50")
+        assert product_service.calculate_bom_cost(99999) == Decimal("0.00")
+
+    def test_get_flat_bom(self, product_service, bom):
+        """Test BOM plano con cantidades y costos unitarios."""
+        flat = {item["reference"]: item for item in product_service.get_flat_bom(bom["kit"].id)}
+
+        assert set(flat) == {"FRAME", "PANEL", "BOLT"}
+        assert flat["BOLT"]["quantity"] == Decimal("15")
+        assert flat["FRAME"]["unit_cost"] == Decimal("6.00")
+
+    def test_get_flat_bom_not_found(self, product_service):
+        """Test que lanza NotFoundException si el producto no existe."""
+        with pytest.raises(NotFoundException):
+            product_service.get_flat_bom(99999)
+
+    def test_get_with_bom(self, product_service, bom):
+        """Test producto con componentes directos y resumen del BOM."""
+        result = product_service.get_with_bom(bom["kit"].id)
+
+        assert len(result.components) == 2
+        assert result.total_components == 3
+        assert result.bom_levels == 3
+        assert result.bom_cost == Decimal("22.50")
+
+
+def _rollup_ids(session):
+    return set(session.execute(select(ProductBOMRollup.product_id)).scalars())
+
+
+class TestProductServiceBOMRollups:
+    """Tests para la materialización e invalidación de acumulados."""
+
+    def test_first_read_materializes_subassemblies(self, product_service, bom, session):
+        """Test que la primera lectura guarda la raíz y cada sub-ensamble."""
+        product_service.calculate_bom_cost(bom["kit"].id)
+
+        assert _rollup_ids(session) == {bom["kit"].id, bom["frame"].id, bom["panel"].id}
+
+    def test_cached_read_does_not_walk_bom(self, product_service, bom, session):
+        """Test que la lectura materializada no recalcula el árbol."""
+        product_service.calculate_bom_cost(bom["kit"].id)
+        # Cambio sin pasar por el servicio: el acumulado no se entera
+        session.execute(
+            update(Product).where(Product.id == bom["bolt"].id).values(cost_price=Decimal("100"))
+        )
+
+        assert product_service.calculate_bom_cost(bom["kit"].id) == Decimal("22.50")
+
+    def test_bulk_cost_update_invalidates_ancestors(self, product_service, bom, session, sample_family_type):
+        """Test que un cambio de costo invalida solo los ensambles que lo usan."""
+        other = Product(
+            product_type=ProductType.NOMENCLATURE,
+            reference="OTHER-KIT",
+            family_type_id=sample_family_type.id,
+        )
+        session.add(other)
+        session.commit()
+        product_service.calculate_bom_cost(bom["kit"].id)
+        product_service.calculate_bom_cost(other.id)
+
+        product_service.bulk_update_cost_prices({bom["bolt"].id: Decimal("2.00")}, user_id=1)
+
+        assert _rollup_ids(session) == {other.id}
+        assert product_service.calculate_bom_cost(bom["kit"].id) == Decimal("30.00")
+
+    def test_component_change_keeps_unaffected_branches(self, product_service, bom, session):
+        """Test que cambiar un componente no invalida sub-ensambles hermanos."""
+        product_service.calculate_bom_cost(bom["kit"].id)
+
+        product_service.update_component(bom["panel"].id, bom["bolt"].id, Decimal("5"), user_id=1)
+
+        assert _rollup_ids(session) == {bom["frame"].id}
+        rows = product_service.component_repo.get_bom_graph(bom["kit"].id, use_rollups=True)
+        frame_rows = [r for r in rows if r.id == bom["frame"].id]
+        assert len(frame_rows) == 1
+        assert frame_rows[0].component_id is None
+        assert frame_rows[0].rollup_cost == Decimal("6.00")
+        # KIT = 2 FRAME + PANEL = 12 + (6 + 7.5)
+        assert product_service.calculate_bom_cost(bom["kit"].id) == Decimal("25.50")
+
+    def test_add_and_remove_component_invalidate(
+        self, product_service, bom, session, sample_family_type
+    ):
+        """Test que agregar y eliminar componentes invalida el padre y sus ancestros."""
+        nut = Product(
+            product_type=ProductType.ARTICLE,
+            reference="NUT",
+            family_type_id=sample_family_type.id,
+            cost_price=Decimal("0.50"),
+        )
+        session.add(nut)
+        session.commit()
+        product_service.calculate_bom_cost(bom["kit"].id)
+
+        product_service.add_component(bom["panel"].id, nut.id, Decimal("2"), user_id=1)
+        assert _rollup_ids(session) == {bom["frame"].id}
+        assert product_service.calculate_bom_cost(bom["kit"].id) == Decimal("23.50")
+
+        product_service.remove_component(bom["panel"].id, bom["bolt"].id, user_id=1)
+        assert _rollup_ids(session) == {bom["frame"].id}
+        assert product_service.calculate_bom_cost(bom["panel"].id) == Decimal("7.00")
+
+    def test_cached_subassembly_gives_same_cost(self, product_service, session, sample_family_type):
+        """Test que un sub-ensamble materializado da el mismo costo que recalculado."""
+        # Arrange - TOP = 1000 x SUB, SUB = 0.333 x ART (0.40959 sin redondear)
+        art = Product(
+            product_type=ProductType.ARTICLE,
+            reference="ART",
+            family_type_id=sample_family_type.id,
+            cost_price=Decimal("1.23"),
+        )
+        sub = Product(product_type=ProductType.NOMENCLATURE, reference="SUB", family_type_id=sample_family_type.id)
+        top = Product(product_type=ProductType.NOMENCLATURE, reference="TOP", family_type_id=sample_family_type.id)
+        session.add_all([art, sub, top])
+        session.flush()
+        session.add_all([
+            ProductComponent(parent_id=sub.id, component_id=art.id, quantity=Decimal("0.333")),
+            ProductComponent(parent_id=top.id, component_id=sub.id, quantity=Decimal("1000")),
+        ])
+        session.commit()
+
+        # Act
+        cold = product_service.calculate_bom_cost(top.id)
+        session.execute(delete(ProductBOMRollup).where(ProductBOMRollup.product_id == top.id))
+        warm = product_service.calculate_bom_cost(top.id)
+
+        # Assert
+        assert str(cold) == str(warm) == "409.59"
+        assert str(product_service.calculate_bom_cost(sub.id)) == "0.41"
+
+    def test_update_price_fields_invalidate(self, product_service, bom, session):
+        """Test que ProductService.update invalida solo si cambian campos acumulados."""
+        product_service.calculate_bom_cost(bom["kit"].id)
+
+        product_service.update(bom["bolt"].id, ProductUpdate(designation_es="Perno"), user_id=1)
+        assert len(_rollup_ids(session)) == 3
+
+        product_service.update(bom["bolt"].id, ProductUpdate(net_weight=Decimal("0.200")), user_id=1)
+        assert _rollup_ids(session) == set()
+
+
+class TestProductServiceCycleDetection:
+    """Tests para la detección de ciclos con el cierre transitivo."""
+
+    def test_add_component_rejects_indirect_cycle(self, product_service, bom):
+        """Test que agregar un ancestro como componente lanza BusinessRuleException."""
+        with pytest.raises(BusinessRuleException):
+            product_service.add_component(bom["frame"].id, bom["kit"].id, Decimal("1"), user_id=1)
+
+    def test_get_where_used(self, product_service, bom):
+        """Test where-used transitivo desde el servicio."""
+        used_in = product_service.get_where_used(bom["bolt"].id)
+
+        assert {p.reference for p in used_in} == {"KIT", "FRAME", "PANEL"}
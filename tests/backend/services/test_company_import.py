@@ -0,0 +1,114 @@
+"""
+Tests para CompanyImportService (importación masiva desde CSV/xlsx).
+"""
+
+import io
+
+import pytest
+from openpyxl import Workbook
+from sqlalchemy import select
+
+from src.backend.exceptions.service import ValidationException
+from src.backend.models.core.companies import Company
+from src.backend.repositories.core.company_repository import CompanyRepository
+from src.backend.repositories.search_repository import SearchRepository
+from src.backend.services.core.company_import_service import CompanyImportService
+
+
+@pytest.fixture
+def import_service(session):
+    """CompanyImportService sobre la sesión de test."""
+    return CompanyImportService(CompanyRepository(session), session)
+
+
+def csv_file(text: str) -> io.BytesIO:
+    return io.BytesIO(text.encode("utf-8"))
+
+
+class TestCompanyImport:
+    """Tests para la importación de empresas."""
+
+    def test_csv_with_lookup_names(self, import_service, session, sample_company_type, sample_country):
+        """Lee CSV con ';', resuelve tipo y país por nombre y crea las empresas."""
+        data = csv_file(
+            "Name;Trigram;Company_Type;Country;Website;Notes\n"
+            "Minera Norte SpA;mno;client;chile;https://mineranorte.cl;vip\n"
+            "Aceros del Sur;ADS;CLIENT;;;\n"
+        )
+
+        result = import_service.import_file(data, "csv", user_id=1)
+
+        assert (result.total_rows, result.created, result.failed) == (2, 2, 0)
+        assert result.ignored_columns == ["notes"]
+        company = session.scalar(select(Company).where(Company.trigram == "MNO"))
+        assert company.company_type_id == sample_company_type.id
+        assert company.country_id == sample_country.id
+        assert company.created_by_id == 1
+        # El INSERT masivo no pasa por el flush: el servicio indexa lo importado
+        assert [row.entity_id for row in SearchRepository(session).search("aceros")] == [
+            session.scalar(select(Company.id).where(Company.trigram == "ADS"))
+        ]
+
+    def test_row_errors_do_not_abort(self, import_service, session, sample_company_type):
+        """Las filas inválidas se informan y el resto se importa."""
+        session.add(Company(name="Existente", trigram="EXI", company_type_id=sample_company_type.id))
+        session.flush()
+        data = csv_file(
+            "name,trigram,company_type_id,website,country\n"
+            f"Empresa Uno,UNO,{sample_company_type.id},,\n"
+            f"Trigram con número,AB1,{sample_company_type.id},,\n"
+            f"Web sin esquema,WEB,{sample_company_type.id},mineranorte.cl,\n"
+            f"País inexistente,PAI,{sample_company_type.id},,Atlantis\n"
+            f"Duplicada en base,exi,{sample_company_type.id},,\n"
+            f"Duplicada en archivo,UNO,{sample_company_type.id},,\n"
+            f"Empresa Dos,DOS,{sample_company_type.id},,\n"
+        )
+
+        result = import_service.import_file(data, "csv", user_id=1)
+
+        assert (result.total_rows, result.created, result.failed) == (7, 2, 5)
+        assert [error.row for error in result.errors] == [3, 4, 5, 6, 7]
+        assert result.errors[0].errors[0].startswith("trigram")
+        assert result.errors[1].errors[0].startswith("website")
+        assert "country" in result.errors[2].errors[0]
+        assert "EXI" in result.errors[3].errors[0]
+        assert result.errors[4].reference == "UNO"
+        assert session.scalar(select(Company).where(Company.trigram == "DOS")) is not None
+
+    def test_database_error_isolated_to_row(self, import_service, session, sample_company_type):
+        """Si la base rechaza un bloque, solo fallan las filas culpables."""
+        data = csv_file(
+            "name,trigram,company_type_id,city_id\n"
+            f"Sin ciudad,SCA,{sample_company_type.id},\n"
+            f"Ciudad inexistente,CIN,{sample_company_type.id},999\n"
+            f"Sin ciudad dos,SCB,{sample_company_type.id},\n"
+        )
+
+        result = import_service.import_file(data, "csv", user_id=1, chunk_size=10)
+
+        assert (result.created, result.failed) == (2, 1)
+        assert result.errors[0].row == 3
+        trigrams = set(session.scalars(select(Company.trigram)))
+        assert {"SCA", "SCB"} <= trigrams
+        assert "CIN" not in trigrams
+
+    def test_xlsx(self, import_service, session, sample_company_type):
+        """Lee xlsx con el tipo de empresa por nombre."""
+        workbook = Workbook()
+        for row in (["name", "trigram", "company_type"], ["Planta Excel", "XLS", "Client"]):
+            workbook.active.append(row)
+        data = io.BytesIO()
+        workbook.save(data)
+        data.seek(0)
+
+        result = import_service.import_file(data, "xlsx", user_id=1)
+
+        assert (result.total_rows, result.created) == (1, 1)
+        assert session.scalar(select(Company).where(Company.trigram == "XLS")).name == "Planta Excel"
+
+    def test_invalid_file(self, import_service):
+        """Formato no soportado o archivo corrupto -> ValidationException."""
+        with pytest.raises(ValidationException):
+            import_service.import_file(csv_file("a,b\n"), "json", user_id=1)
+        with pytest.raises(ValidationException):
+            import_service.import_file(csv_file("no es un xlsx"), "xlsx", user_id=1)
@@ -0,0 +1,108 @@
+"""
+Tests para ExportService (exportación de listados a CSV/xlsx).
+"""
+
+import csv
+import io
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from openpyxl import load_workbook
+from sqlalchemy.orm import Session
+
+from src.backend.exceptions.service import ValidationException
+from src.backend.models.business.quotes import Quote
+from src.backend.models.core.staff import Staff
+from src.backend.models.lookups import QuoteStatus
+from src.backend.services.export_service import ExportService
+
+
+@pytest.fixture
+def quotes(session: Session, sample_company, sample_currency) -> list[Quote]:
+    """Tres cotizaciones: dos en borrador y una enviada."""
+    staff = Staff(username="export", first_name="Ex", last_name="Port", email="export@test.com")
+    draft = QuoteStatus(code="draft", name="Borrador")
+    sent = QuoteStatus(code="sent", name="Enviada")
+    session.add_all([staff, draft, sent])
+    session.flush()
+    quotes = [
+        Quote(
+            quote_number=f"C-EXP-{i}", subject=f"Cotización {i}", company_id=sample_company.id,
+            staff_id=staff.id, status_id=status.id, currency_id=sample_currency.id,
+            quote_date=date(2025, 1, i), total=Decimal(total),
+        )
+        for i, status, total in ((1, draft, "100.00"), (2, draft, "300.50"), (3, sent, "200.00"))
+    ]
+    session.add_all(quotes)
+    session.commit()
+    return quotes
+
+
+def read_csv(chunks) -> list[list[str]]:
+    text = b"".join(chunks).decode("utf-8-sig")
+    return list(csv.reader(io.StringIO(text)))
+
+
+class TestExportService:
+    """Tests para la exportación de listados."""
+
+    def test_csv_honors_filters_and_sort(self, session, quotes, sample_company, sample_currency):
+        """Mismo filtro y orden que el listado, leyendo el cursor por lotes."""
+        draft_id = quotes[0].status_id
+
+        rows = read_csv(ExportService(session).export(
+            "quotes", "csv", filters={"status_id": draft_id, "company_id": None},
+            sort="total", descending=True, batch_size=1,
+        ))
+
+        header = rows[0]
+        assert [row[header.index("quote_number")] for row in rows[1:]] == ["C-EXP-2", "C-EXP-1"]
+        first = dict(zip(header, rows[1]))
+        assert first["company"] == sample_company.name
+        assert first["status"] == "Borrador"
+        assert first["currency"] == sample_currency.code
+        assert first["quote_date"] == "2025-01-02"
+        assert first["total"] == "300.50"
+
+    def test_csv_search(self, session, quotes):
+        """``q`` busca en las mismas columnas que el listado."""
+        rows = read_csv(ExportService(session).export("quotes", "csv", search="exp-3"))
+
+        assert [row[1] for row in rows[1:]] == ["C-EXP-3"]
+
+    def test_xlsx(self, session, quotes):
+        """xlsx con cabecera, fechas y montos como números (orden por defecto: fecha desc)."""
+        data = b"".join(ExportService(session).export("quotes", "xlsx"))
+
+        sheet = load_workbook(io.BytesIO(data), read_only=True).active
+        rows = list(sheet.iter_rows(values_only=True))
+        header = rows[0]
+        assert sheet.title == "quotes"
+        assert [row[header.index("quote_number")] for row in rows[1:]] == ["C-EXP-3", "C-EXP-2", "C-EXP-1"]
+        assert rows[1][header.index("total")] == 200
+        assert rows[1][header.index("quote_date")].date() == date(2025, 1, 3)
+
+    def test_products_use_import_columns(self, session, sample_product, sample_family_type):
+        """Los productos se exportan con las columnas que acepta la importación."""
+        rows = read_csv(ExportService(session).export("products", "csv", filters={"is_active": True}))
+
+        product = dict(zip(rows[0], rows[1]))
+        assert product["reference"] == "PROD-TEST"
+        assert product["product_type"] == "article"
+        assert product["family_type"] == sample_family_type.name
+        assert product["matter"] == ""
+        assert product["is_active"] == "true"
+
+    def test_validation_before_streaming(self, session):
+        """Entidad, formato, filtro u orden inválidos fallan al llamar, no al iterar."""
+        service = ExportService(session)
+
+        with pytest.raises(ValidationException):
+            service.export("staff", "csv")
+        with pytest.raises(ValidationException):
+            service.export("quotes", "pdf")
+        with pytest.raises(ValidationException):
+            service.export("quotes", "csv", filters={"is_active": True})
+        with pytest.raises(ValidationException):
+            service.export("quotes", "csv", sort="internal_notes")
@@ -0,0 +1,181 @@
+"""
+Tests para los lotes de líneas de cotizaciones y órdenes.
+
+Valida que apply_products_batch inserta, actualiza y elimina líneas en
+una sola llamada, numera las nuevas líneas y recalcula los totales.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.backend.exceptions.repository import NotFoundException
+from src.backend.exceptions.service import ValidationException
+from src.backend.models.business.orders import Order
+from src.backend.models.business.quotes import Quote, QuoteProduct
+from src.backend.models.core.staff import Staff
+from src.backend.models.lookups import OrderStatus, PaymentStatus, QuoteStatus
+from src.backend.repositories.business.order_repository import OrderRepository
+from src.backend.repositories.business.quote_repository import QuoteRepository
+from src.backend.services.business.order_service import OrderService
+from src.backend.services.business.quote_service import QuoteService
+from src.shared.schemas.business.order import OrderProductBatch, OrderProductCreate
+from src.shared.schemas.business.quote import (
+    QuoteProductBatch,
+    QuoteProductBatchUpdate,
+    QuoteProductCreate,
+)
+
+
+@pytest.fixture
+def staff(session: Session) -> Staff:
+    """Vendedor para los documentos."""
+    staff = Staff(username="lines", first_name="Line", last_name="Items", email="lines@test.com")
+    session.add(staff)
+    session.commit()
+    return staff
+
+
+@pytest.fixture
+def quote(session: Session, sample_company, sample_currency, staff) -> Quote:
+    """Cotización en borrador sin líneas."""
+    status = QuoteStatus(code="draft", name="Draft")
+    session.add(status)
+    session.flush()
+    quote = Quote(
+        quote_number="C-LINES-1", subject="Lines", company_id=sample_company.id, staff_id=staff.id,
+        status_id=status.id, currency_id=sample_currency.id, quote_date=date(2025, 1, 1),
+    )
+    session.add(quote)
+    session.commit()
+    return quote
+
+
+@pytest.fixture
+def quote_service(session: Session) -> QuoteService:
+    """QuoteService real sobre la sesión de pruebas."""
+    return QuoteService(QuoteRepository(session), session)
+
+
+@pytest.fixture
+def quote_lines(session: Session, quote, sample_product) -> list[QuoteProduct]:
+    """Dos líneas existentes en la cotización."""
+    lines = []
+    for sequence in (1, 2):
+        line = QuoteProduct(
+            quote_id=quote.id, product_id=sample_product.id, sequence=sequence,
+            quantity=Decimal("1"), unit_price=Decimal("100.00"), discount_percentage=Decimal("0"),
+        )
+        line.calculate_subtotal()
+        lines.append(line)
+    session.add_all(lines)
+    session.commit()
+    return lines
+
+
+def _line(product_id: int, quantity: str = "1", price: str = "10.00", **kwargs) -> QuoteProductCreate:
+    """Línea nueva de cotización."""
+    return QuoteProductCreate(product_id=product_id, quantity=Decimal(quantity), unit_price=Decimal(price), **kwargs)
+
+
+class TestQuoteProductsBatch:
+    """Tests para QuoteService.apply_products_batch."""
+
+    def test_creates_lines_and_recalculates_once(self, session, quote_service, quote, sample_product):
+        """200 líneas nuevas se crean y los totales de la cotización se escriben una sola vez."""
+        quote_updates = []
+
+        def count_updates(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE quotes"):
+                quote_updates.append(statement)
+
+        batch = QuoteProductBatch(create=[_line(sample_product.id) for _ in range(200)])
+        event.listen(session.get_bind(), "before_cursor_execute", count_updates)
+        try:
+            result = quote_service.apply_products_batch(quote.id, batch, user_id=1)
+        finally:
+            event.remove(session.get_bind(), "before_cursor_execute", count_updates)
+
+        assert len(result.products) == 200
+        assert result.subtotal == Decimal("2000.00")
+        assert result.total == Decimal("2380.00")
+        assert len(quote_updates) == 1
+
+    def test_numbers_new_lines_after_existing(self, quote_service, quote, quote_lines, sample_product):
+        """Las líneas sin sequence se numeran después de la última, en orden."""
+        batch = QuoteProductBatch(create=[
+            _line(sample_product.id, notes="a"),
+            _line(sample_product.id, notes="b", sequence=10),
+            _line(sample_product.id, notes="c"),
+        ])
+
+        result = quote_service.apply_products_batch(quote.id, batch, user_id=1)
+
+        assert {p.notes: p.sequence for p in result.products if p.notes} == {"a": 3, "b": 10, "c": 11}
+
+    def test_update_and_delete(self, quote_service, quote, quote_lines, sample_product):
+        """Actualiza y elimina en el mismo lote; los totales reflejan ambos cambios."""
+        keep, drop = quote_lines
+        batch = QuoteProductBatch(
+            update=[QuoteProductBatchUpdate(id=keep.id, quantity=Decimal("3"))],
+            delete=[drop.id],
+        )
+
+        result = quote_service.apply_products_batch(quote.id, batch, user_id=1)
+
+        assert [(p.id, p.quantity, p.subtotal) for p in result.products] == [
+            (keep.id, Decimal("3.000"), Decimal("300.00"))
+        ]
+        assert result.subtotal == Decimal("300.00")
+
+    def test_rejects_lines_of_other_documents(self, quote_service, quote, quote_lines):
+        """IDs que no son líneas de la cotización dan NotFound sin cambiar nada."""
+        with pytest.raises(NotFoundException) as exc:
+            quote_service.apply_products_batch(quote.id, QuoteProductBatch(delete=[quote_lines[0].id, 9999]), 1)
+
+        assert exc.value.details["ids"] == [9999]
+
+    def test_rejects_repeated_lines(self, quote_service, quote, quote_lines):
+        """Una línea no puede actualizarse y eliminarse en el mismo lote."""
+        line_id = quote_lines[0].id
+        batch = QuoteProductBatch(update=[QuoteProductBatchUpdate(id=line_id, quantity=Decimal("2"))], delete=[line_id])
+
+        with pytest.raises(ValidationException):
+            quote_service.apply_products_batch(quote.id, batch, user_id=1)
+
+    def test_quote_not_found(self, quote_service):
+        """Cotización inexistente."""
+        with pytest.raises(NotFoundException):
+            quote_service.apply_products_batch(9999, QuoteProductBatch(), user_id=1)
+
+
+class TestOrderProductsBatch:
+    """Tests para OrderService.apply_products_batch."""
+
+    def test_creates_lines_and_totals(self, session, sample_company, sample_currency, staff, sample_product):
+        """Crea líneas de una orden y recalcula totales una vez."""
+        status = OrderStatus(code="pending", name="Pending")
+        payment = PaymentStatus(code="pending", name="Pending")
+        session.add_all([status, payment])
+        session.flush()
+        order = Order(
+            order_number="OC-LINES-1", order_type="sales", company_id=sample_company.id, staff_id=staff.id,
+            status_id=status.id, payment_status_id=payment.id, currency_id=sample_currency.id,
+            order_date=date(2025, 1, 1),
+        )
+        session.add(order)
+        session.commit()
+
+        service = OrderService(OrderRepository(session), session)
+        batch = OrderProductBatch(create=[
+            OrderProductCreate(product_id=sample_product.id, quantity=Decimal("2"), unit_price=Decimal("50.00"))
+            for _ in range(3)
+        ])
+
+        result = service.apply_products_batch(order.id, batch, user_id=1)
+
+        assert [p.sequence for p in result.products] == [1, 2, 3]
+        assert result.subtotal == Decimal("300.00")
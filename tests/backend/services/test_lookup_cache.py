@@ -0,0 +1,101 @@
+"""
+Tests para la caché de lookups.
+
+Valida el ETag por contenido, la invalidación al hacer commit de
+escrituras de lookups y el snapshot versionado.
+"""
+
+from sqlalchemy.orm import Session
+
+from src.backend.models.core.companies import Company
+from src.backend.models.lookups import Country
+from src.backend.services.lookups.lookup_cache import (
+    LookupCache,
+    build_lookup_snapshot,
+    encode_json,
+    lookup_cache,
+)
+from src.shared.schemas.lookups.lookup import CountryResponse
+
+
+class TestLookupCache:
+    """Tests para LookupCache."""
+
+    def test_etag_depends_on_content(self):
+        """Mismo contenido, mismo ETag; contenido distinto, ETag distinto."""
+        chile = CountryResponse(id=1, name="Chile", iso_code_alpha2="CL")
+
+        assert encode_json([chile]).etag == encode_json([chile]).etag
+        assert encode_json([chile]).etag != encode_json([]).etag
+        assert encode_json([chile]).body == b'[{"name":"Chile","iso_code_alpha2":"CL","iso_code_alpha3":null,"id":1}]'
+
+    def test_loads_once_until_invalidated(self):
+        """La factory se llama una vez por clave hasta invalidar."""
+        cache = LookupCache(ttl=60)
+        calls = []
+
+        def load():
+            calls.append(1)
+            return [len(calls)]
+
+        assert cache.get_or_encode("k", load).body == b"[1]"
+        assert cache.get_or_encode("k", load).body == b"[1]"
+        cache.invalidate()
+        assert cache.get_or_encode("k", load).body == b"[2]"
+
+    def test_load_racing_invalidation_is_not_stored(self):
+        """Un resultado calculado antes de una invalidación no se guarda."""
+        cache = LookupCache(ttl=60)
+
+        def stale_load():
+            cache.invalidate()  # Escritura concurrente durante la lectura
+            return ["old"]
+
+        assert cache.get_or_encode("k", stale_load).body == b'["old"]'
+        assert cache.get_or_encode("k", lambda: ["new"]).body == b'["new"]'
+
+
+class TestLookupCacheInvalidation:
+    """Tests para la invalidación por eventos de sesión."""
+
+    def test_commit_of_lookup_write_invalidates(self, session: Session):
+        """Crear un país y hacer commit limpia la caché."""
+        lookup_cache.get_or_encode(("test",), lambda: ["cached"])
+
+        session.add(Country(name="Perú", iso_code_alpha2="PE"))
+        session.commit()
+
+        assert lookup_cache.get_or_encode(("test",), lambda: ["fresh"]).body == b'["fresh"]'
+
+    def test_other_writes_keep_cache(self, session: Session, sample_company_type):
+        """Escrituras que no tocan lookups no invalidan."""
+        lookup_cache.invalidate()
+        lookup_cache.get_or_encode(("test",), lambda: ["cached"])
+
+        session.add(Company(name="Sin Lookups", trigram="SLK", company_type_id=sample_company_type.id))
+        session.commit()
+
+        assert lookup_cache.get_or_encode(("test",), lambda: ["fresh"]).body == b'["cached"]'
+
+
+class TestLookupSnapshot:
+    """Tests para build_lookup_snapshot."""
+
+    def test_contains_all_lookups(self, session: Session, sample_country, sample_currency):
+        """El snapshot incluye las 12 tablas."""
+        snapshot = build_lookup_snapshot(session)
+
+        assert [c.name for c in snapshot.countries] == ["Chile"]
+        assert [c.code for c in snapshot.currencies] == ["CLP"]
+        assert snapshot.cities == []
+        assert snapshot.payment_statuses == []
+
+    def test_version_changes_with_content(self, session: Session, sample_country):
+        """La versión es estable sin cambios y cambia al modificar un lookup."""
+        first = build_lookup_snapshot(session).version
+        assert build_lookup_snapshot(session).version == first
+
+        sample_country.name = "Chile Continental"
+        session.commit()
+
+        assert build_lookup_snapshot(session).version != first
@@ -0,0 +1,124 @@
+"""
+Tests para ProductImportService (importación masiva desde CSV/xlsx).
+"""
+
+import io
+from decimal import Decimal
+
+import pytest
+from openpyxl import Workbook
+from sqlalchemy import select
+
+from src.backend.exceptions.service import ValidationException
+from src.backend.models.core.products import Product
+from src.backend.repositories.core.product_repository import ProductRepository
+from src.backend.repositories.search_repository import SearchRepository
+from src.backend.services.core.product_import_service import ProductImportService
+
+
+@pytest.fixture
+def import_service(session):
+    """ProductImportService sobre la sesión de test."""
+    return ProductImportService(ProductRepository(session), session)
+
+
+def csv_file(text: str) -> io.BytesIO:
+    return io.BytesIO(text.encode("utf-8"))
+
+
+def xlsx_file(rows: list[list]) -> io.BytesIO:
+    workbook = Workbook()
+    for row in rows:
+        workbook.active.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+class TestProductImport:
+    """Tests para la importación de productos."""
+
+    def test_csv_with_lookup_names(self, import_service, session, sample_family_type, sample_matter):
+        """Lee CSV con ';', resuelve lookups por nombre y crea los productos."""
+        data = csv_file(
+            "Reference;Designation_ES;Product_Type;Sale_Price;Family_Type;Matter;Color\n"
+            "imp-001;Tornillo M6;ARTICLE;10.50;mecánico;Acero inoxidable;rojo\n"
+            "IMP-002;Tuerca M6;article;;;;\n"
+        )
+
+        result = import_service.import_file(data, "csv", user_id=1)
+
+        assert (result.total_rows, result.created, result.failed) == (2, 2, 0)
+        assert result.ignored_columns == ["color"]
+        product = session.scalar(select(Product).where(Product.reference == "IMP-001"))
+        assert product.family_type_id == sample_family_type.id
+        assert product.matter_id == sample_matter.id
+        assert product.sale_price == Decimal("10.50")
+        assert product.created_by_id == 1
+        # El INSERT masivo no pasa por el flush: el servicio indexa lo importado
+        assert [row.entity_id for row in SearchRepository(session).search("tuerca")] == [
+            session.scalar(select(Product.id).where(Product.reference == "IMP-002"))
+        ]
+
+    def test_row_errors_do_not_abort(self, import_service, session):
+        """Las filas inválidas se informan y el resto se importa."""
+        session.add(Product(product_type="article", reference="EXISTING", designation_es="Existente"))
+        session.flush()
+        data = csv_file(
+            "reference,designation_es,product_type,sale_price,family_type\n"
+            "OK-1,Producto válido,article,1.00,\n"
+            "BAD-PRICE,Precio negativo,article,-5,\n"
+            "BAD-FAMILY,Familia inexistente,article,,No existe\n"
+            "existing,Duplicado en base,article,,\n"
+            "OK-1,Duplicado en archivo,article,,\n"
+            "OK-2,Otro válido,article,,\n"
+        )
+
+        result = import_service.import_file(data, "csv", user_id=1)
+
+        assert (result.total_rows, result.created, result.failed) == (6, 2, 4)
+        assert [error.row for error in result.errors] == [3, 4, 5, 6]
+        assert result.errors[0].errors[0].startswith("sale_price")
+        assert "family_type" in result.errors[1].errors[0]
+        assert "EXISTING" in result.errors[2].errors[0]
+        assert session.scalar(select(Product).where(Product.reference == "OK-2")) is not None
+
+    def test_database_error_isolated_to_row(self, import_service, session):
+        """Si la base rechaza un bloque, solo fallan las filas culpables."""
+        data = csv_file(
+            "reference,designation_es,product_type,company_id\n"
+            "ROW-1,Sin empresa,article,\n"
+            "ROW-2,Empresa inexistente,article,999\n"
+            "ROW-3,Sin empresa,article,\n"
+        )
+
+        result = import_service.import_file(data, "csv", user_id=1, chunk_size=10)
+
+        assert (result.created, result.failed) == (2, 1)
+        assert result.errors[0].row == 3
+        references = set(session.scalars(select(Product.reference)))
+        assert {"ROW-1", "ROW-3"} <= references
+        assert "ROW-2" not in references
+
+    def test_xlsx(self, import_service, session):
+        """Lee xlsx; las referencias numéricas se guardan como texto."""
+        data = xlsx_file([
+            ["reference", "designation_es", "product_type", "cost_price"],
+            [12345, "Pieza numérica", "article", 7.25],
+            [None, None, None, None],
+            ["XL-2", "Otra pieza", "nomenclature", None],
+        ])
+
+        result = import_service.import_file(data, "xlsx", user_id=1)
+
+        assert (result.total_rows, result.created) == (2, 2)
+        product = session.scalar(select(Product).where(Product.reference == "12345"))
+        assert product.cost_price == Decimal("7.25")
+
+    def test_invalid_file(self, import_service):
+        """Formato no soportado o archivo corrupto -> ValidationException."""
+        with pytest.raises(ValidationException):
+            import_service.import_file(csv_file("a,b\n"), "json", user_id=1)
+        with pytest.raises(ValidationException):
+            import_service.import_file(csv_file("no es un xlsx"), "xlsx", user_id=1)
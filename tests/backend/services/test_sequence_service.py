@@ -0,0 +1,149 @@
+"""
+Tests para SequenceService y el asignador de números por bloques.
+
+Valida el incremento atómico, la política gapless dentro de la transacción
+del llamador, la reserva de bloques por proceso y el fallback en SQLite.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from src.backend.models.base import Base
+from src.backend.models.core.sequences import Sequence
+from src.backend.services.core.sequence_service import (
+    GAP_POLICY_GAPLESS,
+    SequenceAllocator,
+    SequenceService,
+    increment_sequence,
+)
+
+KEY = ("document_sequence", 2025, "C", "AKG")
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    """Engine SQLite en archivo: cada conexión es independiente."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'sequences.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _last_value(engine) -> int:
+    with engine.connect() as connection:
+        return connection.execute(
+            select(Sequence.last_value).where(Sequence.prefix == "C", Sequence.trigram == "AKG")
+        ).scalar_one()
+
+
+class TestIncrementSequence:
+    """Tests para increment_sequence."""
+
+    def test_creates_missing_sequence(self, session: Session):
+        """La primera llamada crea la fila de la secuencia."""
+        assert increment_sequence(session.connection(), KEY) == 1
+        assert increment_sequence(session.connection(), KEY) == 2
+
+        sequence = session.execute(select(Sequence)).scalar_one()
+        assert sequence.last_value == 2
+        assert sequence.prefix == "C"
+
+    def test_reserves_count_numbers(self, session: Session):
+        """count reserva un rango y retorna su último valor."""
+        assert increment_sequence(session.connection(), KEY, count=10) == 10
+        assert increment_sequence(session.connection(), KEY, count=5) == 15
+
+    def test_null_prefix_and_trigram(self, session: Session):
+        """prefix/trigram None identifican su propia secuencia."""
+        key = ("document_sequence", 2025, None, None)
+        assert increment_sequence(session.connection(), key) == 1
+        assert increment_sequence(session.connection(), KEY) == 1
+        assert increment_sequence(session.connection(), key) == 2
+
+
+class TestSequenceService:
+    """Tests para SequenceService."""
+
+    def test_generate_document_number(self, session: Session):
+        """Formato PREFIJO-AÑO-TRIGRAMA-NNN con numeración por prefijo."""
+        service = SequenceService(session)
+
+        first = service.generate_document_number("C", company_trigram="akg")
+        second = service.generate_document_number("C", company_trigram="AKG")
+        order = service.generate_document_number("OC", company_trigram="AKG", padding=2)
+
+        assert first.endswith("-AKG-001")
+        assert second.endswith("-AKG-002")
+        assert order.startswith("OC-") and order.endswith("-AKG-01")
+
+    def test_gapless_rolls_back_with_caller(self, session: Session):
+        """Con gapless el número solo se consume si el llamador hace commit."""
+        service = SequenceService(session, gap_policy=GAP_POLICY_GAPLESS)
+
+        assert service.get_next_number("document_sequence", prefix="C", year=2025) == 1
+        session.commit()
+        assert service.get_next_number("document_sequence", prefix="C", year=2025) == 2
+        session.rollback()
+
+        assert service.get_next_number("document_sequence", prefix="C", year=2025) == 2
+
+    def test_sqlite_falls_back_to_gapless(self, session: Session):
+        """En SQLite las políticas con transacción independiente usan gapless."""
+        service = SequenceService(session, gap_policy="block")
+
+        assert service._effective_policy() == GAP_POLICY_GAPLESS
+        assert service.get_next_number("document_sequence", prefix="C", year=2025) == 1
+
+    def test_unknown_policy(self, session: Session):
+        """Una política desconocida es un error de configuración."""
+        with pytest.raises(ValueError):
+            SequenceService(session, gap_policy="random")
+
+
+class TestSequenceAllocator:
+    """Tests para SequenceAllocator."""
+
+    def test_hands_out_block_from_memory(self, file_engine):
+        """Reserva un bloque completo y lo entrega sin volver a la base."""
+        allocator = SequenceAllocator(file_engine, block_size=5)
+
+        assert [allocator.allocate(KEY) for _ in range(3)] == [1, 2, 3]
+        assert _last_value(file_engine) == 5
+
+        assert [allocator.allocate(KEY) for _ in range(3)] == [4, 5, 6]
+        assert _last_value(file_engine) == 10
+
+    def test_processes_get_disjoint_blocks(self, file_engine):
+        """Dos procesos (allocators) nunca entregan el mismo número."""
+        first = SequenceAllocator(file_engine, block_size=5)
+        second = SequenceAllocator(file_engine, block_size=5)
+
+        assert first.allocate(KEY) == 1
+        assert second.allocate(KEY) == 6
+        assert first.allocate(KEY) == 2
+
+    def test_reset_discards_block(self, file_engine):
+        """Tras reset los números no usados del bloque se pierden."""
+        allocator = SequenceAllocator(file_engine, block_size=5)
+        allocator.allocate(KEY)
+
+        allocator.reset()
+
+        assert allocator.allocate(KEY) == 6
+
+    def test_concurrent_allocations_are_unique(self, file_engine):
+        """Asignaciones desde varios hilos no se repiten ni se saltan."""
+        allocator = SequenceAllocator(file_engine, block_size=7)
+
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            numbers = list(pool.map(lambda _: allocator.allocate(KEY), range(50)))
+
+        assert sorted(numbers) == list(range(1, 51))
+
+    def test_invalid_block_size(self, file_engine):
+        """block_size debe ser positivo."""
+        with pytest.raises(ValueError):
+            SequenceAllocator(file_engine, block_size=0)
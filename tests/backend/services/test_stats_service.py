@@ -0,0 +1,198 @@
+"""
+Tests para StatsService y StatsRepository.
+
+Valida los KPIs del dashboard calculados con queries agrupadas y la
+caché con TTL.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pendulum
+import pytest
+from sqlalchemy.orm import Session
+
+from src.backend.models.business.invoices import InvoiceExport, InvoiceSII
+from src.backend.models.business.orders import Order
+from src.backend.models.business.quotes import Quote
+from src.backend.models.core.companies import Company
+from src.backend.models.core.products import Product, ProductType
+from src.backend.models.core.staff import Staff
+from src.backend.models.lookups import CompanyType, OrderStatus, PaymentStatus, QuoteStatus
+from src.backend.repositories.stats_repository import StatsRepository
+from src.backend.services.stats_service import StatsService
+from src.backend.utils.cache import TTLCache
+from src.shared.providers import FakeTimeProvider
+
+TODAY = pendulum.datetime(2025, 6, 15, tz="UTC")
+
+
+@pytest.fixture
+def dashboard_data(
+    session: Session,
+    sample_company,
+    sample_currency,
+    sample_incoterm,
+    sample_country,
+    sample_family_type,
+):
+    """
+    Datos para el dashboard:
+    - 1 cliente, 2 proveedores (1 eliminado)
+    - 3 productos (1 inactivo)
+    - cotizaciones: 2 draft, 1 sent, 1 accepted
+    - órdenes: 2 pending, 1 delivered, 1 cancelled
+    - facturas: SII vencida pendiente, SII vencida pagada, exportación vencida
+      pendiente en marzo; SII al día en junio
+    """
+    supplier_type = CompanyType(name="Proveedor")
+    staff = Staff(username="stats", first_name="Stats", last_name="User", email="stats@test.com")
+    quote_statuses = {code: QuoteStatus(code=code, name=code) for code in ("draft", "sent", "accepted")}
+    order_statuses = {code: OrderStatus(code=code, name=code) for code in ("pending", "delivered", "cancelled")}
+    payment_statuses = {code: PaymentStatus(code=code, name=code) for code in ("pending", "paid")}
+    session.add_all([supplier_type, staff, *quote_statuses.values(), *order_statuses.values(), *payment_statuses.values()])
+    session.flush()
+    assert sample_company.company_type_id == 1 and supplier_type.id == 2
+
+    session.add_all([
+        Company(name="Proveedor Uno", trigram="PRU", company_type_id=supplier_type.id),
+        Company(name="Proveedor Dos", trigram="PRD", company_type_id=supplier_type.id),
+        Company(name="Proveedor Borrado", trigram="PRB", company_type_id=supplier_type.id, is_deleted=True),
+    ])
+    session.add_all([
+        Product(product_type=ProductType.ARTICLE, reference=f"ST-{i}", family_type_id=sample_family_type.id,
+                is_active=i != 2)
+        for i in range(3)
+    ])
+
+    common = {"company_id": sample_company.id, "staff_id": staff.id, "currency_id": sample_currency.id}
+    for i, code in enumerate(["draft", "draft", "sent", "accepted"]):
+        session.add(Quote(quote_number=f"C-ST-{i}", subject="Stats", status_id=quote_statuses[code].id,
+                          quote_date=date(2025, 6, 1), **common))
+
+    orders = []
+    for i, code in enumerate(["pending", "pending", "delivered", "cancelled"]):
+        order = Order(order_number=f"OC-ST-{i}", order_type="sales", status_id=order_statuses[code].id,
+                      payment_status_id=payment_statuses["pending"].id, order_date=date(2025, 3, 1), **common)
+        orders.append(order)
+    session.add_all(orders)
+    session.flush()
+
+    def sii(number, invoice_date, due_date, total, payment, paid_date=None, exchange_rate=None):
+        return InvoiceSII(
+            invoice_number=number, invoice_type="33", order_id=orders[0].id,
+            payment_status_id=payment_statuses[payment].id, invoice_date=invoice_date, due_date=due_date,
+            paid_date=paid_date, total=Decimal(total), exchange_rate=exchange_rate, **common,
+        )
+
+    session.add_all([
+        sii("F-1", date(2025, 3, 10), date(2025, 4, 10), "1190.00", "pending"),
+        sii("F-2", date(2025, 3, 20), date(2025, 4, 20), "500.00", "paid", paid_date=date(2025, 4, 1)),
+        sii("F-3", date(2025, 6, 1), date(2025, 7, 1), "100.00", "pending", exchange_rate=Decimal("2")),
+        InvoiceExport(
+            invoice_number="FE-1", invoice_type="110", order_id=orders[1].id,
+            payment_status_id=payment_statuses["pending"].id, incoterm_id=sample_incoterm.id,
+            country_id=sample_country.id, invoice_date=date(2025, 3, 15), due_date=date(2025, 5, 15),
+            exchange_rate=Decimal("900"), total=Decimal("1000.00"), total_clp=Decimal("900000.00"),
+            **common,
+        ),
+        # Fuera del período de 12 meses
+        sii("F-OLD", date(2024, 6, 30), date(2024, 7, 30), "999.00", "paid", paid_date=date(2024, 7, 1)),
+    ])
+    session.commit()
+
+
+@pytest.fixture
+def stats_service(session: Session) -> StatsService:
+    """StatsService con fecha fija y caché propia."""
+    return StatsService(StatsRepository(session), FakeTimeProvider(TODAY), cache=TTLCache(ttl=60))
+
+
+class TestStatsServiceDashboard:
+    """Tests para StatsService.get_dashboard."""
+
+    def test_counts(self, stats_service, dashboard_data):
+        """Cuenta empresas por tipo, productos, cotizaciones abiertas y órdenes."""
+        stats = stats_service.get_dashboard()
+
+        assert stats.clients_count == 1
+        assert stats.providers_count == 2
+        assert stats.products_count == 3
+        assert stats.active_products_count == 2
+        assert stats.quotes_count == 3
+        assert {s.code: s.count for s in stats.quotes_by_status} == {"draft": 2, "sent": 1, "accepted": 1}
+        assert stats.orders_count == 4
+        assert stats.open_orders_count == 2
+
+    def test_overdue_invoices(self, stats_service, dashboard_data):
+        """Vencidas = due_date pasada, sin pagar; exportación en CLP."""
+        stats = stats_service.get_dashboard()
+
+        assert stats.overdue_invoices_count == 2
+        assert stats.overdue_invoices_amount == Decimal("901190.00")
+
+    def test_revenue_by_month(self, stats_service, dashboard_data):
+        """12 meses hasta el actual, con ceros en los meses sin facturas."""
+        stats = stats_service.get_dashboard()
+        revenue = {(m.year, m.month): m for m in stats.revenue_by_month}
+
+        assert len(stats.revenue_by_month) == 12
+        assert (stats.revenue_by_month[0].year, stats.revenue_by_month[0].month) == (2024, 7)
+        assert (stats.revenue_by_month[-1].year, stats.revenue_by_month[-1].month) == (2025, 6)
+        assert revenue[(2025, 3)].revenue == Decimal("901690.00")
+        assert revenue[(2025, 3)].invoices == 3
+        assert revenue[(2025, 6)].revenue == Decimal("200.00")
+        assert revenue[(2025, 5)].revenue == Decimal("0.00")
+
+    def test_empty_database(self, stats_service):
+        """Sin datos todos los KPIs son cero."""
+        stats = stats_service.get_dashboard()
+
+        assert stats.clients_count == 0
+        assert stats.orders_count == 0
+        assert stats.overdue_invoices_amount == Decimal("0.00")
+        assert all(m.revenue == 0 for m in stats.revenue_by_month)
+
+    def test_cached_until_refresh(self, session, stats_service, dashboard_data, sample_company_type):
+        """El resultado se sirve de caché hasta que se pide refresh."""
+        first = stats_service.get_dashboard()
+        session.add(Company(name="Cliente Nuevo", trigram="CLN", company_type_id=sample_company_type.id))
+        session.commit()
+
+        assert stats_service.get_dashboard() is first
+        assert stats_service.get_dashboard(refresh=True).clients_count == 2
+
+
+class TestTTLCache:
+    """Tests para TTLCache."""
+
+    def test_expires_after_ttl(self):
+        """Las entradas expiran pasado el TTL."""
+        now = [0.0]
+        cache = TTLCache(ttl=10, clock=lambda: now[0])
+        cache.set("k", 1)
+
+        now[0] = 9.9
+        assert cache.get("k") == 1
+        now[0] = 10.0
+        assert cache.get("k") is None
+
+    def test_get_or_set_and_invalidate(self):
+        """get_or_set calcula una vez; invalidate fuerza recalcular."""
+        calls = []
+        cache = TTLCache(ttl=10)
+
+        def factory():
+            calls.append(1)
+            return len(calls)
+
+        assert cache.get_or_set("k", factory) == 1
+        assert cache.get_or_set("k", factory) == 1
+        cache.invalidate()
+        assert cache.get_or_set("k", factory) == 2
+
+    def test_zero_ttl_disables_cache(self):
+        """ttl=0 no guarda nada."""
+        cache = TTLCache(ttl=0)
+        cache.set("k", 1)
+        assert cache.get("k") is None
@@ -0,0 +1,281 @@
+"""
+Tests para el cliente HTTP compartido.
+
+Usan httpx.MockTransport, no requieren el backend ejecutándose.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.frontend.services.api.base_api_client import APIException, BaseAPIClient
+from src.frontend.services.api.company_api import CompanyAPIService
+from src.frontend.services.api.http_client import HTTPClientManager
+from src.frontend.services.api.response_cache import ResponseCache, response_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_response_cache():
+    """Cada test parte con la caché global de respuestas vacía."""
+    response_cache.clear()
+    yield
+    response_cache.clear()
+
+
+@pytest.fixture
+def requests_seen() -> list[httpx.Request]:
+    """Peticiones recibidas por el transporte falso."""
+    return []
+
+
+@pytest.fixture
+def manager(requests_seen) -> HTTPClientManager:
+    """Administrador con transporte falso que responde el path pedido."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return httpx.Response(200, json={"path": request.url.path})
+
+    return HTTPClientManager(base_url="http://backend", transport=httpx.MockTransport(handler))
+
+
+class TestHTTPClientManager:
+    """Tests para HTTPClientManager."""
+
+    async def test_services_share_one_client(self, manager, requests_seen):
+        """Servicios con distinto base_url usan el mismo cliente y conservan su URL."""
+        companies = BaseAPIClient(base_url="http://backend/api/v1", client_manager=manager)
+        lookups = BaseAPIClient(base_url="http://backend/api/v1/lookups", client_manager=manager)
+
+        assert await companies._get_client() is await lookups._get_client()
+        assert await companies.get("/companies/") == {"path": "/api/v1/companies/"}
+        assert await lookups.get("countries/") == {"path": "/api/v1/lookups/countries/"}
+        assert len(requests_seen) == 2
+
+    async def test_close_keeps_shared_pool(self, manager):
+        """Cerrar un servicio no cierra el pool que usan los demás."""
+        service = BaseAPIClient(base_url="http://backend/api/v1", client_manager=manager)
+        async with service:
+            client = await manager.get_client()
+
+        assert not client.is_closed
+        assert await manager.get_client() is client
+
+    async def test_borrow_does_not_close(self, manager):
+        """borrow() presta el cliente sin cerrarlo al salir del bloque."""
+        async with manager.borrow() as client:
+            response = await client.get("/api/v1/plants/company/1")
+
+        assert response.json() == {"path": "/api/v1/plants/company/1"}
+        assert not client.is_closed
+
+    async def test_aclose_recreates_on_next_use(self, manager):
+        """Después de aclose() el siguiente uso crea un cliente nuevo."""
+        first = await manager.get_client()
+        await manager.aclose()
+
+        assert first.is_closed
+        assert await manager.get_client() is not first
+
+    def test_http2_requires_h2(self, monkeypatch):
+        """Sin el paquete h2 se usa HTTP/1.1 aunque se pida HTTP/2."""
+        monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+
+        assert HTTPClientManager(base_url="http://backend", http2=True).http2 is False
+
+
+class TestDownload:
+    """Tests para BaseAPIClient.download."""
+
+    async def test_writes_stream_to_file(self, tmp_path):
+        """El cuerpo se escribe en el destino y se informan los bytes."""
+        chunks = [b"id,name\n", b"1,uno\n", b"2,dos\n"]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params["status_id"] == "2"
+            return httpx.Response(200, stream=httpx.ByteStream(b"".join(chunks)))
+
+        manager = HTTPClientManager(base_url="http://backend", transport=httpx.MockTransport(handler))
+        client = BaseAPIClient(base_url="http://backend/api/v1", client_manager=manager)
+        destination = tmp_path / "quotes.csv"
+
+        written = await client.download("/export/quotes.csv", destination, params={"status_id": 2})
+
+        assert destination.read_bytes() == b"".join(chunks)
+        assert written == len(b"".join(chunks))
+
+    async def test_error_leaves_no_file(self, tmp_path):
+        """Un error del backend se lanza como APIException y no deja archivos."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, json={"message": "No se puede ordenar por 'x'", "details": {}})
+
+        manager = HTTPClientManager(base_url="http://backend", transport=httpx.MockTransport(handler))
+        client = BaseAPIClient(base_url="http://backend/api/v1", client_manager=manager)
+
+        with pytest.raises(APIException) as exc_info:
+            await client.download("/export/quotes.csv", tmp_path / "quotes.csv")
+
+        assert exc_info.value.status_code == 400
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestResponseCache:
+    """Tests para la caché de respuestas GET de BaseAPIClient."""
+
+    @pytest.fixture
+    def counter_manager(self, requests_seen) -> HTTPClientManager:
+        """Transporte falso que numera sus respuestas GET y acepta escrituras."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_seen.append(request)
+            if request.method != "GET":
+                return httpx.Response(200, json={"ok": True})
+            return httpx.Response(
+                200, json={"version": len(requests_seen)}, headers={"X-Total-Count": "42"}
+            )
+
+        return HTTPClientManager(base_url="http://backend", transport=httpx.MockTransport(handler))
+
+    def make_client(self, manager, cache: ResponseCache) -> BaseAPIClient:
+        return BaseAPIClient(base_url="http://backend/api/v1", client_manager=manager, cache=cache)
+
+    async def test_fresh_hit_skips_request(self, counter_manager, requests_seen):
+        """Volver a pedir lo mismo se sirve desde la caché y cuenta un hit."""
+        cache = ResponseCache(ttl=60)
+        client = self.make_client(counter_manager, cache)
+
+        first = await client.get("/companies/", params={"skip": 0, "q": None})
+        second = await client.get("/companies/", params={"skip": 0})
+
+        assert first == second == {"version": 1}
+        assert len(requests_seen) == 1
+        assert cache.stats() == {"hits": 1, "stale_hits": 0, "misses": 1, "entries": 1}
+
+    async def test_params_are_part_of_key(self, counter_manager, requests_seen):
+        """Páginas distintas no comparten entrada."""
+        client = self.make_client(counter_manager, ResponseCache())
+
+        await client.get("/companies/", params={"skip": 0})
+        await client.get("/companies/", params={"skip": 25})
+
+        assert len(requests_seen) == 2
+
+    async def test_hit_returns_independent_copy(self, counter_manager):
+        """Modificar la respuesta retornada no altera la caché."""
+        client = self.make_client(counter_manager, ResponseCache())
+
+        data = await client.get("/companies/1")
+        data["version"] = "editada"
+
+        assert await client.get("/companies/1") == {"version": 1}
+
+    async def test_stale_served_then_revalidated(self, counter_manager, requests_seen):
+        """Una entrada vencida se sirve al instante y se renueva en segundo plano."""
+        cache = ResponseCache(ttl=0)
+        client = self.make_client(counter_manager, cache)
+        await client.get("/companies/1")
+
+        stale = await client.get("/companies/1")
+        await asyncio.gather(*BaseAPIClient._revalidations.values())
+
+        assert stale == {"version": 1}
+        assert len(requests_seen) == 2
+        assert cache.stale_hits == 1
+        assert cache.get(cache.make_key("GET", "http://backend/api/v1/companies/1"))[0] == {"version": 2}
+
+    async def test_write_clears_cache(self, counter_manager, requests_seen):
+        """Un POST/PUT/DELETE del cliente vacía la caché."""
+        client = self.make_client(counter_manager, ResponseCache())
+        await client.get("/companies/1")
+
+        await client.put("/companies/1", json={"name": "Nueva"})
+        data = await client.get("/companies/1")
+
+        assert data == {"version": 3}
+        assert [r.method for r in requests_seen] == ["GET", "PUT", "GET"]
+
+    async def test_response_from_before_write_is_not_stored(self):
+        """Un GET que termina después de una escritura no guarda su respuesta."""
+        cache = ResponseCache()
+        generation = cache.generation
+
+        cache.clear()
+        cache.put("GET http://backend/api/v1/companies/1", {"id": 1}, generation=generation)
+
+        assert cache.get("GET http://backend/api/v1/companies/1") is None
+
+    async def test_get_with_total_cached(self, counter_manager, requests_seen):
+        """get_with_total cachea datos y total por separado de get."""
+        client = self.make_client(counter_manager, ResponseCache())
+
+        assert await client.get_with_total("/companies/") == ({"version": 1}, 42)
+        assert await client.get_with_total("/companies/") == ({"version": 1}, 42)
+        assert await client.get("/companies/") == {"version": 2}
+        assert len(requests_seen) == 2
+
+    async def test_use_cache_false_always_requests(self, counter_manager, requests_seen):
+        """use_cache=False va siempre al backend."""
+        client = self.make_client(counter_manager, ResponseCache())
+
+        await client.get("/companies/1", use_cache=False)
+        await client.get("/companies/1", use_cache=False)
+
+        assert len(requests_seen) == 2
+
+    async def test_sqlite_persists_between_instances(self, counter_manager, requests_seen, tmp_path):
+        """Con archivo, una caché nueva (reinicio de la app) encuentra las respuestas."""
+        path = tmp_path / "profile" / "api_cache.sqlite3"
+        await self.make_client(counter_manager, ResponseCache(path=path)).get("/companies/1")
+
+        restarted = ResponseCache(path=path)
+        data = await self.make_client(counter_manager, restarted).get("/companies/1")
+
+        assert data == {"version": 1}
+        assert len(requests_seen) == 1
+        assert restarted.hits == 1
+
+    def test_lru_evicts_oldest(self):
+        """Superado max_entries se descarta la entrada usada hace más tiempo."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == (1, True)
+
+    def test_expired_entry_is_discarded(self):
+        """Una entrada más vieja que max_age no se sirve."""
+        cache = ResponseCache(max_age=0)
+        cache.put("a", 1)
+
+        assert cache.get("a") is None
+        assert cache.misses == 1
+
+    async def test_borrowed_write_invalidates_bundle(self):
+        """Una escritura con borrow() (vistas, formularios) invalida el bundle cacheado."""
+        addresses = [{"id": 1, "address": "Calle 1"}]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "PUT":
+                addresses[0] = {"id": 1, **json.loads(request.content)}
+                return httpx.Response(200, json=addresses[0])
+            return httpx.Response(200, json={"company": {"id": 1}, "addresses": list(addresses)})
+
+        manager = HTTPClientManager(
+            base_url="http://backend", transport=httpx.MockTransport(handler), cache=response_cache
+        )
+        service = CompanyAPIService(base_url="http://backend/api/v1")
+        service._client._client_manager = manager
+        await service.get_bundle(1)
+
+        async with manager.borrow() as client:
+            await client.put("/api/v1/addresses/1", json={"address": "Calle 2"})
+        bundle = await service.get_bundle(1)
+
+        assert bundle["addresses"] == [{"id": 1, "address": "Calle 2"}]